@@ -4,7 +4,7 @@ from articles.models import Article
 
 
 class ArticleAdmin(admin.ModelAdmin):
-    readonly_fields = ('id',)
+    readonly_fields = ('id', 'content_hash', 'content_updated_at')
     list_display = ('id', 'title')  # Add other fields as needed
 
 
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_article_author_article_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='Hash of the title, description and content, to detect changes on re-fetch.', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='content_updated_at',
+            field=models.DateTimeField(blank=True, help_text='The date and time when a re-fetch last changed the article.', null=True),
+        ),
+    ]
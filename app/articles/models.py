@@ -1,6 +1,14 @@
+import hashlib
 from django.utils import timezone
 from django.db import models
 
+
+def compute_content_hash(title: str, description: str, content: str) -> str:
+    """SHA-256 of the fields a publisher correction can change, to detect updated articles on re-fetch."""
+    parts = [title or '', description or '', content or '']
+    return hashlib.sha256('\x00'.join(parts).encode('utf-8')).hexdigest()
+
+
 class Article(models.Model):
     """ Article model representing a news article. """
     title = models.CharField(max_length=255, help_text="The title of the article.")
@@ -13,10 +21,24 @@ class Article(models.Model):
     description = models.TextField(blank=True, null=True, help_text="A brief description or summary of the article.")
     news_client_source = models.CharField(max_length=100, help_text="The news client source of the article.")
     created_at = models.DateTimeField(auto_now_add=True, help_text="The date and time when the article was created.")
+    content_hash = models.CharField(
+        max_length=64, blank=True, null=True,
+        help_text="Hash of the title, description and content, to detect changes on re-fetch."
+    )
+    content_updated_at = models.DateTimeField(
+        blank=True, null=True, help_text="The date and time when a re-fetch last changed the article."
+    )
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.content_hash = compute_content_hash(self.title, self.description, self.content)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(update_fields) & {'title', 'description', 'content'}:
+            kwargs['update_fields'] = set(update_fields) | {'content_hash'}
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ['-published_date']
         verbose_name = "Article"
@@ -1,3 +1,4 @@
+from django.test import override_settings
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from django.utils import timezone
@@ -68,6 +69,7 @@ class ArticleSummaryIntegrationTest(APITestCase):
             self.assertEqual(response.status_code, 404)
             self.assertIn('detail', response.data) 
 
+
 class ArticleSummaryAsyncTest(APITestCase):
     @classmethod
     def setUpTestData(cls):
@@ -75,7 +77,10 @@ class ArticleSummaryAsyncTest(APITestCase):
         cls.token = Token.objects.create(user=cls.user)
         cls.article = Article.objects.create(
             title="Async Test Article",
-            content="Async content",
+            content=(
+                "Officials said on Monday that repairs to the bridge would take at least three weeks, "
+                "and traffic is being diverted through the harbour district until inspectors sign off… [+2817 chars]"
+            ),
             url="http://example.com/async-article",
             published_date=timezone.now(),
             author="Async Author",
@@ -129,6 +134,7 @@ class ArticleSummaryAsyncTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         self.assertIn('being processed', response.data['message'].lower())
 
+    @override_settings(SUMMARIZER_EXTRACTIVE_FALLBACK=False)
     @patch('articles.views.SummarizerService')
     def test_summary_async_returns_500_if_failed(self, mock_summarizer_service_class):
         mock_service_instance, _ = self._mock_service(status='failed')
@@ -2,18 +2,57 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from news_service.permissions import IsAuthenticatedReadOnlyOrAdmin
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from rest_framework.authentication import TokenAuthentication
+from rest_framework.renderers import JSONRenderer
 
 from articles.models import Article
 from articles.serializers import ArticleSerializer
+from summarizer import prewarm
 from summarizer.service import SummarizerService
+from summarizer.lengths import resolve_max_words
 from summarizer.serializers import SummarySerializer
+from summarizer.renderers import EventStreamRenderer
+from summarizer.streaming import SummaryStreamer
+from summarizer.views import (
+    allow_stale, extractive_fallback_response, extractive_summary_data, stale_summary_response,
+)
 
+from functools import wraps
 import logging
 
 logger = logging.getLogger(__name__)
+
+
+def record_article_signals(view):
+    """
+    Record article detail views and list impressions for summary prewarming.
+    Applied outside the page cache, so cached responses are counted too.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = view(request, *args, **kwargs)
+        if request.method == 'GET' and response.status_code == 200:
+            try:
+                url_name = request.resolver_match.url_name if request.resolver_match else None
+                if url_name == 'articles-detail':
+                    prewarm.record_view(kwargs['pk'])
+                    prewarm.speculative_prewarm(kwargs['pk'])
+                elif url_name == 'articles-list':
+                    data = getattr(response, 'data', None)
+                    if isinstance(data, dict):
+                        data = data.get('results', [])
+                    article_ids = [item['id'] for item in data] if data is not None else None
+                    prewarm.record_list_page(request.get_full_path(), article_ids)
+            except Exception as e:
+                logger.error(f"Error recording article signals: {str(e)}")
+        return response
+    return wrapper
+
+
 class ArticleViewSet(viewsets.ModelViewSet):
     """
     A viewset for viewing articles.
@@ -34,6 +73,7 @@ class ArticleViewSet(viewsets.ModelViewSet):
     authentication_classes = [TokenAuthentication]
 
     # Cache GET list endpoint (5 minutes)
+    @method_decorator(record_article_signals)
     @method_decorator(cache_page(60 * 5), name='list')
     @method_decorator(cache_page(60 * 5), name='retrieve')
     def dispatch(self, *args, **kwargs):
@@ -42,25 +82,75 @@ class ArticleViewSet(viewsets.ModelViewSet):
     @method_decorator(cache_page(60 * 5))
     @action(detail=True, methods=['get'], url_path='summary')
     def summary(self, request, pk=None):
-        """Fetch or generate a summary of an article asynchronously."""
+        """
+        Fetch or generate a summary of an article asynchronously, optionally at a given `length`.
+        With `stale=1`, a completed summary of another length or model is returned while it is processed.
+        Otherwise a pending response carries an extractive `placeholder`, and a failed summary is replaced
+        by an extractive one.
+        """
         service = SummarizerService()
         # Ensure the article exists before calling the service
         try:
-            Article.objects.get(id=pk)
+            article = Article.objects.get(id=pk)
         except Article.DoesNotExist:
             return Response({'detail': 'Article not found.'}, status=status.HTTP_404_NOT_FOUND)
+        length = request.query_params.get('length')
         try:
-            summary = service.summarize_article_async(article_id=pk, user=request.user if request.user.is_authenticated else None)
+            max_words = resolve_max_words(length)
+            length_kwargs = {'max_words': max_words} if length else {}
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            user = request.user if request.user.is_authenticated else None
+            summary = service.summarize_article_async(article_id=pk, user=user, **length_kwargs)
         except Article.DoesNotExist:
             return Response({'detail': 'Article not found.'}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error in ArticleViewSet.summary: {str(e)}")
             return Response({'error': 'Internal server error.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        prewarm.record_summary_request(summary)
+        if summary.status in ['pending', 'in_progress'] and allow_stale(request.query_params.get('stale')):
+            stale = service.get_stale_summary(pk, summary.ai_model, summary.max_words)
+            if stale:
+                return stale_summary_response(stale, summary)
         serializer = SummarySerializer(summary)
         response_data = serializer.data
         if summary.status in ['pending', 'in_progress']:
-            return Response({'success': True, 'summary': response_data, 'message': 'Summary is being processed.'}, status=status.HTTP_202_ACCEPTED)
+            response_body = {'success': True, 'summary': response_data, 'message': 'Summary is being processed.'}
+            if settings.SUMMARIZER_EXTRACTIVE_PLACEHOLDER:
+                response_body['placeholder'] = extractive_summary_data(article, max_words)
+            return Response(response_body, status=status.HTTP_202_ACCEPTED)
         elif summary.status == 'completed':
             return Response({'success': True, 'summary': response_data}, status=status.HTTP_200_OK)
         elif summary.status == 'failed':
+            if settings.SUMMARIZER_EXTRACTIVE_FALLBACK:
+                return extractive_fallback_response(article, summary)
             return Response({'success': False, 'summary': response_data, 'message': 'Summary generation failed.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @action(
+        detail=True, methods=['get'], url_path='summary/stream', renderer_classes=[JSONRenderer, EventStreamRenderer]
+    )
+    def summary_stream(self, request, pk=None):
+        """Stream the summary of an article as server-sent events while it is generated."""
+        try:
+            article = Article.objects.get(id=pk)
+        except Article.DoesNotExist:
+            return Response({'detail': 'Article not found.'}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            max_words = resolve_max_words(request.query_params.get('length'))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            service = SummarizerService()
+        except Exception as e:
+            logger.error(f"Error in ArticleViewSet.summary_stream: {str(e)}")
+            return Response({'error': 'Internal server error.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        streamer = SummaryStreamer(service)
+        response = StreamingHttpResponse(
+            streamer.stream(article, user=request.user if request.user.is_authenticated else None, max_words=max_words),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
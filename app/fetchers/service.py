@@ -1,19 +1,26 @@
 """NewsAPI fetcher implementation with FetchLog integration."""
 import os
 import json
+import logging
 from typing import Dict, Any, Tuple
 import httpx
+from django.db import transaction
 from django.utils.dateparse import parse_datetime
 from django.utils import timezone
 from .exceptions import ConfigurationError, FetcherError
 from fetchers.models import FetchLog
 
+logger = logging.getLogger(__name__)
+
 
 class NewsApiFetcher():
     """
     Flexible fetcher for NewsAPI.org, driven by JSON config.
     Implements the BaseFetcher interface with integrated FetchLog support.
     """
+    # Fields a re-fetch overwrites when the article content changed
+    UPSERT_FIELDS = ['title', 'content', 'description', 'author', 'image_url', 'published_date', 'content_hash']
+
     def __init__(self, config: Dict[str, Any] = None):
         # Support both environment variable and config parameter
         api_key = None
@@ -117,27 +124,25 @@ class NewsApiFetcher():
             'articles': articles
         }
 
-    def _save_articles(self, articles_data: list) -> Tuple[int, int]:
+    def _save_articles(self, articles_data: list) -> Tuple[int, int, int]:
         """
-        Save the fetched articles to the database.
-        Skip articles that already exist (based on URL).
+        Upsert the fetched articles in bulk, keyed by URL.
+        New articles are created; existing ones are updated only when their content hash
+        changed, and the completed summaries of updated articles are marked stale.
 
         Returns:
-            Tuple[int, int]: (articles_processed, articles_saved)
+            Tuple[int, int, int]: (articles_processed, articles_saved, articles_updated)
         """
-        from articles.models import Article
+        from articles.models import Article, compute_content_hash
+        from summarizer.resummarize import invalidate_article_summaries
 
         articles_processed = 0
-        articles_saved = 0
+        fetched = {}
 
         for article_data in articles_data:
             articles_processed += 1
             try:
-                # Skip if article with this URL already exists
-                if Article.objects.filter(url=article_data.get('url')).exists():
-                    continue
-
-                Article.objects.create(
+                article = Article(
                     title=article_data.get('title', ''),
                     content=article_data.get('content', ''),
                     url=article_data.get('url', ''),
@@ -148,12 +153,61 @@ class NewsApiFetcher():
                     description=article_data.get('description'),
                     news_client_source='NewsAPI'
                 )
-                articles_saved += 1
-
+                article.content_hash = compute_content_hash(article.title, article.description, article.content)
+                # The same URL twice in one response: the last copy wins
+                fetched[article.url] = article
             except Exception as e:
                 print(f"Error saving article: {e}")
 
-        return articles_processed, articles_saved
+        existing = {article.url: article for article in Article.objects.filter(url__in=list(fetched))}
+        now = timezone.now()
+        created = []
+        changed = []
+        for url, article in fetched.items():
+            current = existing.get(url)
+            if current is None:
+                created.append(article)
+                continue
+            current_hash = current.content_hash or compute_content_hash(
+                current.title, current.description, current.content
+            )
+            if current_hash == article.content_hash:
+                continue
+            for field in self.UPSERT_FIELDS:
+                setattr(current, field, getattr(article, field))
+            current.content_updated_at = now
+            changed.append(current)
+
+        articles_saved = self._bulk_create_articles(created)
+        if changed:
+            Article.objects.bulk_update(changed, self.UPSERT_FIELDS + ['content_updated_at'])
+            invalidate_article_summaries(article.id for article in changed)
+
+        return articles_processed, articles_saved, len(changed)
+
+    def _bulk_create_articles(self, articles: list) -> int:
+        """Create new articles in one query, falling back to one by one if a row is rejected."""
+        from articles.models import Article
+
+        if not articles:
+            return 0
+        try:
+            with transaction.atomic():
+                Article.objects.bulk_create(articles)
+            return len(articles)
+        except Exception as e:
+            logger.warning(f"Bulk save failed, saving articles one by one: {e}")
+
+        saved = 0
+        for article in articles:
+            try:
+                with transaction.atomic():
+                    article.pk = None
+                    article.save()
+                saved += 1
+            except Exception as e:
+                logger.error(f"Error saving article: {e}")
+        return saved
 
     def fetch_and_save(self, query_params: Dict[str, Any] = None,
                       source: str = 'NewsClientFetcher'):
@@ -192,18 +246,20 @@ class NewsApiFetcher():
             fetch_log.save(update_fields=['articles_fetched'])
 
             # Save articles to the database and get counts
-            articles_processed, articles_saved = self._save_articles(processed_data['articles'])
+            articles_processed, articles_saved, articles_updated = self._save_articles(processed_data['articles'])
 
             # Add save statistics to the result
             processed_data['articles_processed'] = articles_processed
             processed_data['articles_saved'] = articles_saved
-            processed_data['duplicates_skipped'] = articles_processed - articles_saved
+            processed_data['articles_updated'] = articles_updated
+            processed_data['duplicates_skipped'] = articles_processed - articles_saved - articles_updated
 
             # Update fetch log metadata with additional info
             metadata = {
                 'fetcher_class': 'NewsApiFetcher',
                 'api_status': processed_data.get('status'),
                 'total_results': processed_data.get('totalResults'),
+                'articles_updated': articles_updated,
                 'duplicates_skipped': processed_data['duplicates_skipped']
             }
 
@@ -3,6 +3,10 @@ from unittest.mock import patch, MagicMock
 from fetchers.service import NewsApiFetcher
 from fetchers.models import FetchLog
 from fetchers.exceptions import FetcherError
+from articles.models import Article
+from summarizer.extractive import EXTRACTIVE_MODEL
+from summarizer.models import Summary
+from django.utils import timezone
 import os
 import logging
 
@@ -114,8 +118,7 @@ class NewsApiFetcherIntegrationTest(TestCase):
         self.assertIn('Failed to fetch from NewsAPI', fetch_log.error_message)
 
     @patch('httpx.get')
-    @patch('articles.models.Article.objects')
-    def test_fetch_and_save_with_duplicates(self, mock_article_manager, mock_get):
+    def test_fetch_and_save_with_duplicates(self, mock_get):
         """Test fetch_and_save with duplicate articles."""
         # Mock API response
         mock_response = MagicMock()
@@ -144,16 +147,15 @@ class NewsApiFetcherIntegrationTest(TestCase):
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
-        # Mock article manager - first article exists, second doesn't
-        def filter_side_effect(**kwargs):
-            mock_filter = MagicMock()
-            if kwargs.get('url') == 'http://example.com/1':
-                mock_filter.exists.return_value = True
-            else:
-                mock_filter.exists.return_value = False
-            return mock_filter
-        
-        mock_article_manager.filter.side_effect = filter_side_effect
+        # First article already exists unchanged, second doesn't
+        Article.objects.create(
+            title='Test Article 1',
+            url='http://example.com/1',
+            content='Content 1',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='NewsAPI'
+        )
 
         # Execute fetch_and_save
         fetcher = NewsApiFetcher()
@@ -165,18 +167,59 @@ class NewsApiFetcherIntegrationTest(TestCase):
         # Verify results
         self.assertEqual(result['articles_processed'], 2)
         self.assertEqual(result['articles_saved'], 1)
+        self.assertEqual(result['articles_updated'], 0)
         self.assertEqual(result['duplicates_skipped'], 1)
 
         # Verify fetch log
         fetch_log = FetchLog.objects.first()
         self.assertEqual(fetch_log.articles_fetched, 2)
         self.assertEqual(fetch_log.articles_saved, 1)
+        self.assertEqual(Article.objects.count(), 2)
+
+    @patch('httpx.get')
+    def test_fetch_and_save_with_changed_article(self, mock_get):
+        """Test that a corrected article is updated and its summaries are marked stale."""
+        article = Article.objects.create(
+            title='Test Article 1',
+            url='http://example.com/1',
+            content='Content 1',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='NewsAPI'
+        )
+        summary = Summary.objects.create(article=article, ai_model='gpt-4.1-nano', status='completed',
+                                         answered_by='gpt-4.1-nano', summary_text='Old summary.')
+        extractive = Summary.objects.create(article=article, ai_model=EXTRACTIVE_MODEL, status='completed',
+                                            answered_by=EXTRACTIVE_MODEL, summary_text='Content 1')
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            'status': 'ok',
+            'totalResults': 1,
+            'articles': [
+                {
+                    'title': 'Test Article 1',
+                    'url': 'http://example.com/1',
+                    'content': 'Corrected content 1',
+                    'publishedAt': '2023-01-01T00:00:00Z',
+                    'source': {'name': 'Test Source'}
+                }
+            ]
+        }
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
 
-        # Verify that the filter was called with the correct URLs
-        self.assertEqual(mock_article_manager.filter.call_count, 2)
-        # Check that filter was called with url='http://example.com/1' and url='http://example.com/2'
-        mock_article_manager.filter.assert_any_call(url='http://example.com/1')
-        mock_article_manager.filter.assert_any_call(url='http://example.com/2')
+        result = NewsApiFetcher().fetch_and_save(query_params={'category': 'technology'}, source='TestSource')
+
+        self.assertEqual(result['articles_saved'], 0)
+        self.assertEqual(result['articles_updated'], 1)
+        self.assertEqual(result['duplicates_skipped'], 0)
+        self.assertEqual(FetchLog.objects.get().metadata['articles_updated'], 1)
+        article.refresh_from_db()
+        self.assertEqual(article.content, 'Corrected content 1')
+        summary.refresh_from_db()
+        self.assertEqual(summary.status, 'completed')
+        self.assertIsNotNone(summary.stale_since)
+        self.assertFalse(Summary.objects.filter(pk=extractive.pk).exists())
 
     @patch('httpx.get')
     def test_fetch_and_save_invalid_response(self, mock_get):
@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 from fetchers.service import NewsApiFetcher
 from fetchers.exceptions import ConfigurationError, FetcherError
 from fetchers.models import FetchLog
+from articles.models import Article, compute_content_hash
 import os
 
 
@@ -127,8 +128,7 @@ class NewsApiFetcherTest(TestCase):
         with self.assertRaises(FetcherError):
             fetcher._process_response(response_data)
 
-    @patch('articles.models.Article.objects')
-    def test_save_articles_success(self, mock_article_manager):
+    def test_save_articles_success(self):
         """Test saving articles successfully."""
         fetcher = NewsApiFetcher()
         articles_data = [
@@ -143,19 +143,17 @@ class NewsApiFetcherTest(TestCase):
                 'description': 'Test description'
             }
         ]
-        
-        # Mock that no article exists with this URL
-        mock_article_manager.filter.return_value.exists.return_value = False
-        
-        processed, saved = fetcher._save_articles(articles_data)
-        
+
+        processed, saved, updated = fetcher._save_articles(articles_data)
+
         self.assertEqual(processed, 1)
         self.assertEqual(saved, 1)
-        mock_article_manager.create.assert_called_once()
+        self.assertEqual(updated, 0)
+        article = Article.objects.get(url='http://example.com/test')
+        self.assertEqual(article.content_hash, compute_content_hash('Test Article', 'Test description', 'Test content'))
 
-    @patch('articles.models.Article.objects')
-    def test_save_articles_duplicate_skip(self, mock_article_manager):
-        """Test skipping duplicate articles."""
+    def test_save_articles_duplicate_skip(self):
+        """Test skipping unchanged duplicate articles."""
         fetcher = NewsApiFetcher()
         articles_data = [
             {
@@ -167,12 +165,33 @@ class NewsApiFetcherTest(TestCase):
                 'source': {'name': 'Test Source'}
             }
         ]
-        
-        # Mock that article already exists with this URL
-        mock_article_manager.filter.return_value.exists.return_value = True
-        
-        processed, saved = fetcher._save_articles(articles_data)
-        
+        fetcher._save_articles(articles_data)
+
+        processed, saved, updated = fetcher._save_articles(articles_data)
+
         self.assertEqual(processed, 1)
         self.assertEqual(saved, 0)  # Should skip duplicate
-        mock_article_manager.create.assert_not_called() 
\ No newline at end of file
+        self.assertEqual(updated, 0)
+        self.assertEqual(Article.objects.count(), 1)
+        self.assertIsNone(Article.objects.get().content_updated_at)
+
+    def test_save_articles_updates_changed_content(self):
+        """Test that a re-fetched article with new content is updated in place."""
+        fetcher = NewsApiFetcher()
+        article_data = {
+            'title': 'Test Article',
+            'url': 'http://example.com/test',
+            'content': 'Test content',
+            'publishedAt': '2023-01-01T00:00:00Z',
+            'source': {'name': 'Test Source'}
+        }
+        fetcher._save_articles([article_data])
+        article = Article.objects.get()
+
+        processed, saved, updated = fetcher._save_articles([{**article_data, 'title': 'Corrected Article'}])
+
+        self.assertEqual((processed, saved, updated), (1, 0, 1))
+        article.refresh_from_db()
+        self.assertEqual(article.title, 'Corrected Article')
+        self.assertIsNotNone(article.content_updated_at)
+        self.assertEqual(article.content_hash, compute_content_hash('Corrected Article', None, 'Test content'))
@@ -23,6 +23,48 @@ app.conf.beat_schedule = {
             'expires': 3000,  # Task expires after 50 minutes if not picked up
         },
     },
+    'reap-stale-summaries': {
+        'task': 'summarizer.tasks.reap_stale_summaries_task',
+        'schedule': 60,  # Run every minute
+        'options': {
+            'expires': 60,
+        },
+    },
+    'prewarm-summaries': {
+        'task': 'summarizer.tasks.prewarm_summaries_task',
+        'schedule': 300,  # Run every 5 minutes
+        'options': {
+            'expires': 300,
+        },
+    },
+    'resummarize-stale-summaries': {
+        'task': 'summarizer.tasks.resummarize_stale_summaries_task',
+        'schedule': 600,  # Run every 10 minutes
+        'options': {
+            'expires': 600,
+        },
+    },
+    'drain-parked-summaries': {
+        'task': 'summarizer.tasks.drain_parked_summaries_task',
+        'schedule': 10,  # Run every 10 seconds, matching SUMMARIZER_BREAKER_DRAIN_INTERVAL
+        'options': {
+            'expires': 10,
+        },
+    },
+    'poll-summary-batches': {
+        'task': 'summarizer.tasks.poll_summary_batches_task',
+        'schedule': 300,  # Run every 5 minutes
+        'options': {
+            'expires': 300,
+        },
+    },
+    'deliver-webhooks': {
+        'task': 'summarizer.tasks.deliver_webhooks_task',
+        'schedule': 10,  # Run every 10 seconds, matching SUMMARIZER_WEBHOOK_DELIVERY_INTERVAL
+        'options': {
+            'expires': 10,
+        },
+    },
 
 }
 
@@ -187,6 +187,176 @@ CELERY_TASK_TIME_LIMIT = 600  # 10 minutes
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_TASK_ACKS_LATE = True
 
+# ====== SUMMARIZER CONFIGURATION ======
+# LLM backend: "openai", or "fake" for a deterministic offline stand-in used in load tests
+SUMMARIZER_LLM_BACKEND = os.environ.get('SUMMARIZER_LLM_BACKEND', 'openai')
+SUMMARIZER_FAKE_LLM = {
+    'latency_distribution': os.environ.get('SUMMARIZER_FAKE_LLM_LATENCY_DISTRIBUTION', 'fixed'),  # fixed, uniform, lognormal
+    'latency_mean': float(os.environ.get('SUMMARIZER_FAKE_LLM_LATENCY_MEAN', '0.5')),  # seconds
+    'latency_stddev': float(os.environ.get('SUMMARIZER_FAKE_LLM_LATENCY_STDDEV', '0.2')),  # seconds
+    'error_rate': float(os.environ.get('SUMMARIZER_FAKE_LLM_ERROR_RATE', '0')),
+    'rate_limit_every': int(os.environ.get('SUMMARIZER_FAKE_LLM_RATE_LIMIT_EVERY', '0')),  # calls between 429 bursts
+    'rate_limit_burst': int(os.environ.get('SUMMARIZER_FAKE_LLM_RATE_LIMIT_BURST', '0')),  # 429s per burst
+    'seed': int(os.environ.get('SUMMARIZER_FAKE_LLM_SEED', '0')),
+}
+
+# Model routing: ai_model "auto" picks the cheapest healthy model meeting the latency class,
+# and every model falls back to alternates on provider errors or timeouts
+SUMMARIZER_ROUTER_CANDIDATES = ['gpt-4.1-nano', 'gpt-3.5-turbo', 'gpt-4-turbo']  # cheapest first
+SUMMARIZER_ROUTER_FALLBACKS = {
+    'gpt-4.1-nano': ['gpt-3.5-turbo'],
+    'gpt-3.5-turbo': ['gpt-4.1-nano'],
+    'gpt-4': ['gpt-4-turbo'],
+    'gpt-4-turbo': ['gpt-4', 'gpt-4.1-nano'],
+}
+SUMMARIZER_ROUTER_SHORT_CONTENT_TOKENS = 400  # short stubs always go to the cheapest model
+SUMMARIZER_ROUTER_LATENCY_TARGETS = {'fast': 5, 'standard': 20, 'relaxed': None}  # seconds
+SUMMARIZER_ROUTER_DEFAULT_LATENCY_CLASS = 'standard'
+SUMMARIZER_ROUTER_MAX_ERROR_RATE = 0.5  # models failing more often than this are skipped
+SUMMARIZER_ROUTER_EWMA_ALPHA = 0.2
+SUMMARIZER_ROUTER_HEALTH_TIMEOUT = 300  # seconds; stale health expires so skipped models get probed again
+
+# Per-call LLM timeout, so one slow upstream call cannot pin a request until the task time limit
+SUMMARIZER_LLM_TIMEOUT = float(os.environ.get('SUMMARIZER_LLM_TIMEOUT', '60'))  # seconds
+
+# Hedged requests: interactive summaries send a duplicate call once the first is slower than the model's p95
+SUMMARIZER_HEDGE_ENABLED = os.environ.get('SUMMARIZER_HEDGE_ENABLED', '0').lower() in ('1', 'true', 'yes')
+SUMMARIZER_HEDGE_LATENCY_CLASSES = ['fast']  # latency classes that count as interactive
+SUMMARIZER_HEDGE_BUDGET = float(os.environ.get('SUMMARIZER_HEDGE_BUDGET', '0.05'))  # max share of calls hedged
+SUMMARIZER_HEDGE_BUDGET_WINDOW = 60  # seconds over which the budget is counted
+SUMMARIZER_HEDGE_DEFAULT_DELAY = 5.0  # seconds, until a model has enough latency samples
+SUMMARIZER_HEDGE_MIN_DELAY = 0.5  # seconds; never hedge sooner than this
+SUMMARIZER_HEDGE_MIN_SAMPLES = 20  # completed summaries needed to trust a model's p95
+SUMMARIZER_HEDGE_SAMPLE_SIZE = 200  # most recent summaries the p95 is computed from
+SUMMARIZER_HEDGE_DELAY_CACHE_SECONDS = 60  # how long a computed p95 is reused
+
+# Per-model limiter shared by all workers: AIMD concurrency plus an estimated tokens-per-minute budget
+SUMMARIZER_LIMITER_ENABLED = os.environ.get('SUMMARIZER_LIMITER_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_LIMITER_INITIAL_CONCURRENCY = 4
+SUMMARIZER_LIMITER_MIN_CONCURRENCY = 1
+SUMMARIZER_LIMITER_MAX_CONCURRENCY = int(os.environ.get('SUMMARIZER_LIMITER_MAX_CONCURRENCY', '32'))
+SUMMARIZER_LIMITER_DECREASE_FACTOR = 0.5  # concurrency is multiplied by this on a 429 or timeout
+SUMMARIZER_LIMITER_DECREASE_COOLDOWN = 5  # seconds; one burst of 429s only cuts concurrency once
+SUMMARIZER_LIMITER_TOKENS_PER_MINUTE = {  # provider TPM limits; models not listed are not token-limited
+    'gpt-4.1-nano': 200000,
+    'gpt-3.5-turbo': 200000,
+    'gpt-4': 40000,
+    'gpt-4-turbo': 150000,
+}
+SUMMARIZER_LIMITER_COMPLETION_TOKENS = 400  # completion tokens assumed per call when reserving the budget
+SUMMARIZER_LIMITER_SLOT_TTL = 300  # seconds; slots held by a dead worker are freed after this
+SUMMARIZER_LIMITER_MAX_WAIT = 120  # seconds a call may wait for a slot before giving up
+SUMMARIZER_LIMITER_POLL_INTERVAL = 0.2  # seconds between slot checks while waiting
+
+# Retries of failed summary tasks, by error class (permanent errors are not retried)
+SUMMARIZER_RETRY_BASE_COUNTDOWN = 10  # seconds, doubled per retry with jitter for timeouts and 5xx errors
+SUMMARIZER_RETRY_MAX_COUNTDOWN = 600  # seconds, also caps a provider's Retry-After
+SUMMARIZER_RETRY_DEFAULT_COUNTDOWN = 60  # seconds, for errors that could not be classified
+
+# Prewarming: summaries of trending articles are generated before the first reader asks
+SUMMARIZER_PREWARM_ENABLED = os.environ.get('SUMMARIZER_PREWARM_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_PREWARM_SPECULATIVE = os.environ.get('SUMMARIZER_PREWARM_SPECULATIVE', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_PREWARM_TOP_N = int(os.environ.get('SUMMARIZER_PREWARM_TOP_N', '20'))  # summaries enqueued per run
+SUMMARIZER_PREWARM_TOKEN_BUDGET = int(os.environ.get('SUMMARIZER_PREWARM_TOKEN_BUDGET', '200000'))  # estimated tokens per hour
+SUMMARIZER_PREWARM_LOOKBACK_HOURS = 48  # only articles published this recently are ranked
+SUMMARIZER_PREWARM_CANDIDATES = 500  # most recent articles considered per run
+SUMMARIZER_PREWARM_WEIGHTS = {'view': 1.0, 'impression': 0.1, 'source': 2.0}
+SUMMARIZER_PREWARM_HALF_LIFE_HOURS = 12  # scores halve with every this many hours of article age
+SUMMARIZER_PREWARM_MIN_SCORE = 0.5  # articles scoring lower are not prewarmed
+SUMMARIZER_PREWARM_SIGNAL_TTL = 60 * 60 * 6  # seconds request signals are kept
+SUMMARIZER_PREWARM_SPECULATIVE_COOLDOWN = 600  # seconds between speculative checks of one article
+
+# Stale-while-revalidate: serve a completed summary from another model or length while the requested one generates
+SUMMARIZER_STALE_WHILE_REVALIDATE = os.environ.get('SUMMARIZER_STALE_WHILE_REVALIDATE', '0').lower() in ('1', 'true', 'yes')
+SUMMARIZER_STALE_MODEL_PREFERENCE = ['gpt-4', 'gpt-4-turbo', 'gpt-3.5-turbo', 'gpt-4.1-nano']  # best first
+
+# Quality gate: articles with too little usable content are summarized from their description without an LLM call
+SUMMARIZER_QUALITY_GATE_ENABLED = os.environ.get('SUMMARIZER_QUALITY_GATE_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_QUALITY_MIN_SCORE = int(os.environ.get('SUMMARIZER_QUALITY_MIN_SCORE', '5'))  # content words not already in title/description
+
+# Local extractive summaries (ai_model "extractive"), also shown while an LLM summary is pending or after it failed
+SUMMARIZER_EXTRACTIVE_PLACEHOLDER = os.environ.get('SUMMARIZER_EXTRACTIVE_PLACEHOLDER', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_EXTRACTIVE_FALLBACK = os.environ.get('SUMMARIZER_EXTRACTIVE_FALLBACK', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_EXTRACTIVE_MAX_SENTENCES = 200  # bounds the quadratic sentence similarity matrix
+SUMMARIZER_EXTRACTIVE_CACHE_TIMEOUT = 60 * 60
+
+# Prompt compression: boilerplate and repeated sentences are removed before prompting, and content is cut to the budget
+SUMMARIZER_COMPRESSION_ENABLED = os.environ.get('SUMMARIZER_COMPRESSION_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_COMPRESSION_TOKEN_BUDGET = int(os.environ.get('SUMMARIZER_COMPRESSION_TOKEN_BUDGET', '3000'))
+
+# Regeneration of summaries made with an older prompt version, most read first
+SUMMARIZER_RESUMMARIZE_ENABLED = os.environ.get('SUMMARIZER_RESUMMARIZE_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_RESUMMARIZE_TOKEN_BUDGET = int(os.environ.get('SUMMARIZER_RESUMMARIZE_TOKEN_BUDGET', '100000'))  # estimated tokens per hour
+SUMMARIZER_RESUMMARIZE_TOP_N = int(os.environ.get('SUMMARIZER_RESUMMARIZE_TOP_N', '50'))  # summaries enqueued per run
+SUMMARIZER_RESUMMARIZE_CANDIDATES = 1000  # most recent stale summaries considered per run
+SUMMARIZER_RESUMMARIZE_LOCK_SECONDS = 60 * 60  # a summary is enqueued at most once per this many seconds
+
+# Circuit breaker around LLM calls; while open, new summary requests are parked instead of retried
+SUMMARIZER_BREAKER_ENABLED = os.environ.get('SUMMARIZER_BREAKER_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_BREAKER_FAILURE_THRESHOLD = 5  # consecutive timeouts, connection errors or 5xx responses that open it
+SUMMARIZER_BREAKER_FAILURE_WINDOW = 60  # seconds; failures further apart than this do not add up
+SUMMARIZER_BREAKER_OPEN_SECONDS = 30  # seconds before a probe call is let through
+SUMMARIZER_BREAKER_DRAIN_INTERVAL = 10  # seconds between drain runs (see the beat schedule)
+SUMMARIZER_BREAKER_DRAIN_BATCH = 20  # parked requests re-enqueued per drain run
+
+# Provider Batch API for non-urgent summaries (backfills); 'local' runs an in-process stand-in
+SUMMARIZER_BATCH_BACKEND = os.environ.get('SUMMARIZER_BATCH_BACKEND', 'openai')  # openai, local
+SUMMARIZER_BATCH_MAX_REQUESTS = int(os.environ.get('SUMMARIZER_BATCH_MAX_REQUESTS', '5000'))  # requests per batch job
+SUMMARIZER_BATCH_COMPLETION_WINDOW = '24h'
+SUMMARIZER_BATCH_LEASE_SECONDS = 60 * 60 * 25  # outlasts the completion window, so the reaper leaves batched rows alone
+SUMMARIZER_BATCH_PRICE_RATIO = 0.5  # batch price as a share of the realtime price
+SUMMARIZER_BATCH_BACKFILL_LIMIT = 1000  # articles queued per request for summaries that are missing
+
+# Summary length variants, requested by preset name or exact word budget
+SUMMARIZER_LENGTH_PRESETS = {'short': 50, 'medium': 150, 'long': 300}
+SUMMARIZER_MIN_WORDS = 10
+SUMMARIZER_MAX_WORDS = 1000
+
+# Bulk summary request and status endpoints, for clients showing a list of articles
+SUMMARIZER_BULK_MAX_IDS = 100  # article or summary ids per bulk request
+
+# Micro-batching: short articles are packed into a single LLM request
+SUMMARIZER_MICRO_BATCH_ENABLED = os.environ.get('SUMMARIZER_MICRO_BATCH_ENABLED', '0').lower() in ('1', 'true', 'yes')
+SUMMARIZER_MICRO_BATCH_WINDOW = int(os.environ.get('SUMMARIZER_MICRO_BATCH_WINDOW', '5'))  # seconds
+SUMMARIZER_MICRO_BATCH_SIZE = int(os.environ.get('SUMMARIZER_MICRO_BATCH_SIZE', '8'))
+SUMMARIZER_MICRO_BATCH_MAX_CHARS = 1000  # Articles up to this length count as short
+
+# Content-hash summary cache shared across articles with identical text
+SUMMARIZER_CACHE_ENABLED = os.environ.get('SUMMARIZER_CACHE_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 7 days
+
+# Map-reduce summarization of long articles, budgeted in locally estimated tokens
+SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS = int(os.environ.get('SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS', '6000'))
+SUMMARIZER_CHUNK_TOKENS = int(os.environ.get('SUMMARIZER_CHUNK_TOKENS', '3000'))
+SUMMARIZER_MAP_CONCURRENCY = 8  # Parallel chunk calls per article
+
+# Generation leases: one worker per summary, stuck summaries are re-enqueued by a reaper
+SUMMARIZER_LEASE_SECONDS = 120  # lease length, renewed by a heartbeat while generating
+SUMMARIZER_LEASE_HEARTBEAT_INTERVAL = 30  # seconds between lease renewals
+SUMMARIZER_PENDING_TIMEOUT = 600  # seconds a pending summary may wait before its task counts as lost
+SUMMARIZER_MAX_ATTEMPTS = 5  # generations started before a stuck summary is marked failed
+
+# Server-sent event streaming of summary tokens
+SUMMARIZER_STREAM_TIMEOUT = 120  # seconds a stream may stay open
+SUMMARIZER_STREAM_POLL_INTERVAL = 0.1  # seconds between relay reads for attached clients
+SUMMARIZER_STREAM_DB_POLL_INTERVAL = 1.0  # seconds between status checks for worker-owned summaries
+
+# Push notifications when summaries finish (Redis pub/sub)
+SUMMARIZER_NOTIFICATIONS_REDIS_URL = os.environ.get('SUMMARIZER_NOTIFICATIONS_REDIS_URL', CELERY_BROKER_URL)
+SUMMARIZER_WAIT_MAX_TIMEOUT = 60  # seconds a long-poll or SSE waiter may block
+SUMMARIZER_SSE_KEEPALIVE_INTERVAL = 15  # seconds between SSE keep-alive comments
+
+# Webhook callbacks when summaries finish, sent from an outbox table in signed batches per endpoint
+SUMMARIZER_WEBHOOKS_ENABLED = os.environ.get('SUMMARIZER_WEBHOOKS_ENABLED', '1').lower() in ('1', 'true', 'yes')
+SUMMARIZER_WEBHOOK_BATCH_SIZE = 100  # events per POST to one endpoint
+SUMMARIZER_WEBHOOK_BATCH_WINDOW = 2  # seconds new events wait for others to share their POST
+SUMMARIZER_WEBHOOK_DELIVERY_INTERVAL = 10  # seconds between delivery runs for retries (see the beat schedule)
+SUMMARIZER_WEBHOOK_TIMEOUT = 10  # seconds per delivery request
+SUMMARIZER_WEBHOOK_MAX_ATTEMPTS = 8  # attempts before an event is marked failed
+SUMMARIZER_WEBHOOK_RETRY_BASE = 10  # seconds before the first retry, doubling with every attempt
+SUMMARIZER_WEBHOOK_RETRY_MAX = 60 * 60  # longest wait between retries
+SUMMARIZER_WEBHOOK_SWEEP_AFTER = 60 * 60  # seconds a failed summary may still be retried before its failure is swept
+
 # Logging configuration
 LOGGING = {
     'version': 1,
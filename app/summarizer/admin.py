@@ -1,13 +1,30 @@
+from django import forms
 from django.contrib import admin
-from .models import Summary
+from .models import ParkedSummaryRequest, Summary, SummaryBatchJob, WebhookEndpoint, WebhookEvent
+from .registry import UnknownModelError, canonical_model
+
+
+class CanonicalModelForm(forms.ModelForm):
+    """Stores the canonical name of the AI model entered, and rejects unknown models."""
+
+    def clean_ai_model(self):
+        try:
+            return canonical_model(self.cleaned_data['ai_model'])
+        except UnknownModelError as e:
+            raise forms.ValidationError(str(e))
+
 
 @admin.register(Summary)
 class SummaryAdmin(admin.ModelAdmin):
     """Admin interface for Summary model."""
 
+    form = CanonicalModelForm
+
     list_display = [
         'article_title_short',
         'ai_model',
+        'answered_by',
+        'max_words',
         'status',
         'word_count',
         'tokens_used',
@@ -17,6 +34,8 @@ class SummaryAdmin(admin.ModelAdmin):
 
     list_filter = [
         'ai_model',
+        'answered_by',
+        'prompt_version',
         'status',
         'created_at',
         'completed_at'
@@ -29,23 +48,42 @@ class SummaryAdmin(admin.ModelAdmin):
     ]
 
     readonly_fields = [
+        'answered_by',
+        'prompt_version',
         'created_at',
+        'queued_at',
+        'started_at',
+        'llm_started_at',
+        'llm_finished_at',
         'completed_at',
-        'tokens_used'
+        'stale_since',
+        'tokens_used',
+        'prompt_tokens',
+        'completion_tokens',
+        'lease_owner',
+        'lease_expires_at',
+        'attempts',
+        'metadata'
     ]
 
     fieldsets = (
         ('Article Information', {
-            'fields': ('article', 'ai_model', 'requested_by')
+            'fields': ('article', 'ai_model', 'answered_by', 'max_words', 'requested_by')
         }),
         ('Summary', {
             'fields': ('summary_text', 'word_count', 'status')
         }),
         ('Metadata', {
-            'fields': ('tokens_used', 'created_at', 'completed_at')
+            'fields': ('prompt_version', 'tokens_used', 'prompt_tokens', 'completion_tokens', 'created_at',
+                       'completed_at', 'stale_since')
+        }),
+        ('Timing', {
+            'fields': ('queued_at', 'started_at', 'llm_started_at', 'llm_finished_at',
+                       'lease_owner', 'lease_expires_at', 'attempts'),
+            'classes': ('collapse',)
         }),
         ('Error Information', {
-            'fields': ('error_message',),
+            'fields': ('error_message', 'metadata'),
             'classes': ('collapse',)
         })
     )
@@ -65,7 +103,7 @@ class SummaryAdmin(admin.ModelAdmin):
 
     def mark_as_pending(self, request, queryset):
         """Mark selected summaries as pending."""
-        updated = queryset.update(status='pending', error_message=None)
+        updated = queryset.update(status='pending', error_message=None, lease_owner=None, lease_expires_at=None)
         self.message_user(request, f'{updated} summaries marked as pending.')
     mark_as_pending.short_description = "Mark selected summaries as pending"
 
@@ -73,4 +111,81 @@ class SummaryAdmin(admin.ModelAdmin):
         """Mark selected summaries as failed."""
         updated = queryset.update(status='failed')
         self.message_user(request, f'{updated} summaries marked as failed.')
-    mark_as_failed.short_description = "Mark selected summaries as failed"
\ No newline at end of file
+    mark_as_failed.short_description = "Mark selected summaries as failed"
+
+
+@admin.register(SummaryBatchJob)
+class SummaryBatchJobAdmin(admin.ModelAdmin):
+    """Admin interface for SummaryBatchJob model."""
+
+    form = CanonicalModelForm
+
+    list_display = [
+        'id',
+        'ai_model',
+        'status',
+        'provider_status',
+        'request_count',
+        'completed_count',
+        'failed_count',
+        'created_at',
+        'completed_at'
+    ]
+
+    list_filter = [
+        'ai_model',
+        'status',
+        'created_at'
+    ]
+
+    search_fields = [
+        'provider_batch_id'
+    ]
+
+    readonly_fields = [
+        'provider_batch_id',
+        'provider_status',
+        'input_file_id',
+        'output_file_id',
+        'error_file_id',
+        'prompt_tokens',
+        'completion_tokens',
+        'created_at',
+        'submitted_at',
+        'completed_at'
+    ]
+
+    ordering = ['-created_at']
+
+
+@admin.register(ParkedSummaryRequest)
+class ParkedSummaryRequestAdmin(admin.ModelAdmin):
+    """Admin interface for ParkedSummaryRequest model."""
+
+    list_display = ['summary', 'latency_class', 'parked_at']
+    readonly_fields = ['parked_at']
+    ordering = ['parked_at']
+
+
+@admin.register(WebhookEndpoint)
+class WebhookEndpointAdmin(admin.ModelAdmin):
+    """Admin interface for WebhookEndpoint model."""
+
+    list_display = ['url', 'user', 'all_summaries', 'is_active', 'created_at']
+    list_filter = ['all_summaries', 'is_active']
+    search_fields = ['url', 'user__email']
+    readonly_fields = ['secret', 'created_at']
+    ordering = ['-created_at']
+
+
+@admin.register(WebhookEvent)
+class WebhookEventAdmin(admin.ModelAdmin):
+    """Admin interface for WebhookEvent model."""
+
+    list_display = [
+        'id', 'endpoint', 'event_type', 'status', 'attempts', 'next_attempt_at', 'created_at', 'delivered_at'
+    ]
+    list_filter = ['status', 'event_type']
+    search_fields = ['endpoint__url']
+    readonly_fields = ['payload', 'created_at', 'delivered_at']
+    ordering = ['-created_at']
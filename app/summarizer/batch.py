@@ -0,0 +1,140 @@
+"""
+Non-urgent summaries through the provider's Batch API.
+
+Backfill and other background summaries are written one JSONL request per
+summary, uploaded and submitted as a batch, polled until the provider finishes,
+and ingested back into Summary in bulk. Batch requests are billed at a discount
+and do not count against the realtime rate limits, which stay with interactive
+traffic. SummarizerService builds, submits and ingests the batches; this module
+holds the client and the file formats.
+"""
+import json
+import logging
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import openai
+from django.conf import settings
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+CUSTOM_ID_PREFIX = "summary-"
+LEASE_OWNER_PREFIX = "batch-"
+
+# Provider batch statuses after which nothing more will be produced, mapped to job statuses
+FINAL_PROVIDER_STATUSES = {
+    "completed": "completed",
+    "failed": "failed",
+    "expired": "expired",
+    "cancelled": "cancelled",
+}
+
+_STATUS_ERRORS = {
+    400: openai.BadRequestError,
+    401: openai.AuthenticationError,
+    403: openai.PermissionDeniedError,
+    404: openai.NotFoundError,
+    422: openai.UnprocessableEntityError,
+    429: openai.RateLimitError,
+}
+
+
+def get_batch_client() -> openai.OpenAI:
+    """OpenAI client for batch calls, talking to the local stand-in when configured."""
+    if settings.SUMMARIZER_BATCH_BACKEND == "local":
+        from .fake_batch import local_batch_server
+        return openai.OpenAI(
+            api_key="local",
+            base_url="http://batch.local/v1",
+            http_client=httpx.Client(transport=local_batch_server()),
+        )
+    return openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"), timeout=settings.SUMMARIZER_LLM_TIMEOUT)
+
+
+def lease_owner(job_id: int) -> str:
+    """Lease owner of the summaries a batch job is generating."""
+    return f"{LEASE_OWNER_PREFIX}{job_id}"
+
+
+def request_line(summary_id: int, model: str, messages: List[Dict]) -> str:
+    """One chat completion request of the batch input file."""
+    return json.dumps({
+        "custom_id": f"{CUSTOM_ID_PREFIX}{summary_id}",
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {"model": model, "temperature": 0.3, "messages": messages},
+    })
+
+
+def chat_messages(prompt_messages) -> List[Dict]:
+    """LangChain prompt messages as chat completion messages."""
+    roles = {"system": "system", "human": "user", "ai": "assistant"}
+    return [{"role": roles.get(message.type, message.type), "content": message.content} for message in prompt_messages]
+
+
+def submit(client: openai.OpenAI, lines: List[str], job_id: int) -> Tuple[str, str]:
+    """Upload the request lines and create the batch. Returns the input file id and the batch id."""
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    input_file = client.files.create(file=(f"summary-batch-{job_id}.jsonl", data), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=settings.SUMMARIZER_BATCH_COMPLETION_WINDOW,
+        metadata={"summary_batch_job": str(job_id)},
+    )
+    metrics.incr("batch_requests_submitted", len(lines))
+    return input_file.id, batch.id
+
+
+def read_results(client: openai.OpenAI, file_id: Optional[str]) -> Iterator[Tuple[int, Dict]]:
+    """(summary id, result line) for every line of a batch output or error file."""
+    if not file_id:
+        return
+    for line in client.files.content(file_id).text.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        custom_id = result.get("custom_id") or ""
+        if not custom_id.startswith(CUSTOM_ID_PREFIX):
+            logger.error(f"Unexpected custom_id in batch file {file_id}: {custom_id!r}")
+            continue
+        yield int(custom_id[len(CUSTOM_ID_PREFIX):]), result
+
+
+def result_completion(result: Dict) -> Optional[Dict]:
+    """The chat completion of a successful result line, or None if the request failed."""
+    response = result.get("response") or {}
+    if result.get("error") or response.get("status_code") != 200:
+        return None
+    return response.get("body")
+
+
+def result_error(result: Dict) -> openai.APIStatusError:
+    """A failed result line as the error the realtime client would have raised, for classification."""
+    response = result.get("response") or {}
+    status_code = response.get("status_code") or 500
+    body = (response.get("body") or {}).get("error") or result.get("error") or {}
+    message = body.get("message") or f"Batch request failed with status {status_code}"
+    error_class = _STATUS_ERRORS.get(status_code)
+    if error_class is None:
+        error_class = openai.InternalServerError if status_code >= 500 else openai.APIStatusError
+    request = httpx.Request("POST", f"https://api.openai.com{BATCH_ENDPOINT}")
+    return error_class(message, response=httpx.Response(status_code, request=request), body=body)
+
+
+def batch_stats() -> Dict:
+    counters = metrics.get_counters([
+        "batch_requests_submitted", "batch_requests_completed", "batch_requests_failed", "batch_tokens",
+    ])
+    return {
+        "requests_submitted": counters["batch_requests_submitted"],
+        "requests_completed": counters["batch_requests_completed"],
+        "requests_failed": counters["batch_requests_failed"],
+        "tokens": counters["batch_tokens"],
+        # Tokens that would have been paid at the realtime price
+        "tokens_saved": round(counters["batch_tokens"] * (1 - settings.SUMMARIZER_BATCH_PRICE_RATIO)),
+    }
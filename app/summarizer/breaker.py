@@ -0,0 +1,158 @@
+"""
+Circuit breaker around LLM calls, coordinated through the Django cache (Redis in production).
+
+After SUMMARIZER_BREAKER_FAILURE_THRESHOLD consecutive provider failures (timeouts,
+connection errors, 5xx) the breaker opens. While open, summaries are parked in
+ParkedSummaryRequest instead of calling the provider, so no Celery retries are spent
+and no summary is marked failed. After SUMMARIZER_BREAKER_OPEN_SECONDS a single
+probe call is let through (half-open): its success closes the breaker, its failure
+opens it again. Parked requests are drained by a periodic task at a fixed rate.
+"""
+import logging
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import httpx
+import openai
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from . import metrics
+from .errors import TIMEOUT, TRANSIENT, classify_error
+from .limiter import LimiterTimeout
+from .models import ParkedSummaryRequest, Summary
+
+logger = logging.getLogger(__name__)
+
+BREAKER_PREFIX = "summarizer:breaker:"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Error classes that mean the provider is down rather than rejecting one request
+OUTAGE_CLASSES = (TIMEOUT, TRANSIENT)
+
+# Errors raised by the provider call itself; anything else (a limiter timeout, bad
+# input, a bug) happened on our side and says nothing about the provider
+PROVIDER_ERRORS = (openai.APIError, httpx.HTTPError, TimeoutError)
+
+
+class CircuitBreaker:
+    """
+    Shared breaker for calls to the LLM provider.
+
+        if breaker.allow():
+            with breaker.track():
+                ... call the LLM ...
+    """
+
+    def __init__(self, name: str = "llm"):
+        self.name = name
+
+    def _key(self, suffix: str) -> str:
+        return f"{BREAKER_PREFIX}{self.name}:{suffix}"
+
+    def state(self) -> str:
+        if not settings.SUMMARIZER_BREAKER_ENABLED or not cache.get(self._key("tripped")):
+            return CLOSED
+        return OPEN if cache.get(self._key("open")) else HALF_OPEN
+
+    def is_open(self) -> bool:
+        return self.state() == OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go to the provider now. Half-open lets one probe call through at a time."""
+        state = self.state()
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        return cache.add(self._key("probe"), True, timeout=settings.SUMMARIZER_LLM_TIMEOUT * 2)
+
+    @contextmanager
+    def track(self):
+        """Record the outcome of the call made inside the block."""
+        try:
+            yield
+        except Exception as e:
+            self.record(e)
+            raise
+        else:
+            self.record()
+
+    def record(self, error: Optional[Exception] = None) -> None:
+        """
+        Record a call outcome. Provider errors that are not outages still show the provider
+        is answering; local errors neither count as failures nor reset the breaker.
+        """
+        if not settings.SUMMARIZER_BREAKER_ENABLED:
+            return
+        if error is not None and (isinstance(error, LimiterTimeout) or not isinstance(error, PROVIDER_ERRORS)):
+            # A probe that never reached the provider lets the next call probe instead
+            cache.delete(self._key("probe"))
+            return
+        if error is None or classify_error(error) not in OUTAGE_CLASSES:
+            if cache.get(self._key("tripped")):
+                cache.delete_many([self._key("tripped"), self._key("open"), self._key("probe")])
+                metrics.incr("breaker_closed")
+                logger.warning(f"Circuit breaker {self.name} closed")
+            cache.delete(self._key("failures"))
+            return
+
+        if cache.get(self._key("tripped")):
+            # The probe failed: stay away from the provider for another open period
+            self._open()
+            cache.delete(self._key("probe"))
+            return
+        failures_key = self._key("failures")
+        window = settings.SUMMARIZER_BREAKER_FAILURE_WINDOW
+        if cache.add(failures_key, 1, timeout=window):
+            failures = 1
+        else:
+            try:
+                failures = cache.incr(failures_key)
+            except ValueError:
+                cache.set(failures_key, 1, timeout=window)
+                failures = 1
+        if failures >= settings.SUMMARIZER_BREAKER_FAILURE_THRESHOLD:
+            cache.set(self._key("tripped"), True, timeout=None)
+            cache.delete(failures_key)
+            self._open()
+            metrics.incr("breaker_opened")
+            logger.warning(f"Circuit breaker {self.name} opened after {failures} consecutive provider failures")
+
+    def _open(self) -> None:
+        cache.set(self._key("open"), True, timeout=settings.SUMMARIZER_BREAKER_OPEN_SECONDS)
+
+
+def park_summary(summary: Summary, latency_class: str = None, owner: str = None) -> Summary:
+    """
+    Park a pending summary until the breaker closes. With `owner`, the lease taken on it
+    is released first and the attempt it counted is given back.
+    """
+    if owner:
+        Summary.objects.filter(pk=summary.pk, lease_owner=owner).update(
+            status="pending", lease_owner=None, lease_expires_at=None, attempts=F("attempts") - 1
+        )
+    else:
+        Summary.objects.filter(pk=summary.pk, status="failed").update(status="pending")
+    _, created = ParkedSummaryRequest.objects.get_or_create(summary=summary, defaults={"latency_class": latency_class})
+    if created:
+        metrics.incr("breaker_parked")
+        logger.info(f"Summary {summary.pk} parked while the circuit breaker is open")
+    summary.refresh_from_db()
+    return summary
+
+
+def breaker_stats() -> Dict:
+    counters = metrics.get_counters(["breaker_opened", "breaker_closed", "breaker_parked", "breaker_drained"])
+    return {
+        "state": CircuitBreaker().state(),
+        "parked_now": ParkedSummaryRequest.objects.count(),
+        "opened": counters["breaker_opened"],
+        "closed": counters["breaker_closed"],
+        "parked": counters["breaker_parked"],
+        "drained": counters["breaker_drained"],
+    }
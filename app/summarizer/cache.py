@@ -0,0 +1,67 @@
+"""Content-hash keyed cache of generated summaries, shared across articles."""
+import hashlib
+import re
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import metrics
+
+CACHE_PREFIX = "summarizer:summary_cache:"
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class SummaryCache:
+    """
+    Reuse summaries for syndicated or re-posted articles.
+    Entries are keyed on a normalized hash of the model, prompt version,
+    length budget, title and content, so identical text never pays for a second LLM call.
+    """
+
+    def __init__(self, timeout: int = None):
+        self.timeout = timeout if timeout is not None else settings.SUMMARIZER_CACHE_TIMEOUT
+
+    @staticmethod
+    def normalize(text: Optional[str]) -> str:
+        """Case- and whitespace-insensitive form of the text."""
+        return _WHITESPACE_RE.sub(" ", (text or "").lower()).strip()
+
+    def make_key(self, ai_model: str, prompt_version: str, max_words: int, title: str, content: str) -> str:
+        payload = "\x1f".join([
+            ai_model,
+            prompt_version,
+            str(max_words),
+            self.normalize(title),
+            self.normalize(content),
+        ])
+        return CACHE_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up a cached summary and record the hit or miss."""
+        entry = cache.get(key)
+        if entry is None:
+            metrics.incr("cache_misses")
+            return None
+        metrics.incr("cache_hits")
+        metrics.incr("cache_tokens_saved", entry.get("tokens_used") or 0)
+        return entry
+
+    def set(self, key: str, summary_text: str, tokens_used: int, answered_by: str = None) -> None:
+        cache.set(
+            key,
+            {"summary_text": summary_text, "tokens_used": tokens_used, "answered_by": answered_by},
+            timeout=self.timeout,
+        )
+
+    @staticmethod
+    def stats() -> Dict:
+        counters = metrics.get_counters(["cache_hits", "cache_misses", "cache_tokens_saved"])
+        lookups = counters["cache_hits"] + counters["cache_misses"]
+        return {
+            "hits": counters["cache_hits"],
+            "misses": counters["cache_misses"],
+            "hit_rate": metrics.ratio(counters["cache_hits"], lookups),
+            "llm_calls_avoided": counters["cache_hits"],
+            "tokens_saved": counters["cache_tokens_saved"],
+        }
@@ -0,0 +1,63 @@
+"""Local token estimation and token-budgeted chunking of article text."""
+import math
+import re
+from typing import List
+
+# Average characters per token for English text with OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n|\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap local estimate of the token count of a text.
+    Used for budgeting only, so it never calls the provider or loads a tokenizer.
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _split_oversized(text: str, max_tokens: int) -> List[str]:
+    """Split a single paragraph that exceeds the budget into sentences, then words."""
+    pieces = []
+    for sentence in _SENTENCE_RE.split(text):
+        if estimate_tokens(sentence) <= max_tokens:
+            pieces.append(sentence)
+            continue
+        words = sentence.split()
+        words_per_piece = max(1, (max_tokens * CHARS_PER_TOKEN) // 6)
+        pieces.extend(
+            " ".join(words[i:i + words_per_piece]) for i in range(0, len(words), words_per_piece)
+        )
+    return pieces
+
+
+def split_into_chunks(text: str, max_tokens: int) -> List[str]:
+    """
+    Split text into chunks of at most max_tokens (estimated), preferring
+    paragraph and then sentence boundaries so each chunk stays coherent.
+    """
+    pieces = []
+    for paragraph in _PARAGRAPH_RE.split(text or ""):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+        else:
+            pieces.extend(_split_oversized(paragraph, max_tokens))
+
+    chunks, current, current_tokens = [], [], 0
+    for piece in pieces:
+        piece_tokens = estimate_tokens(piece) + 1
+        if current and current_tokens + piece_tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += piece_tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
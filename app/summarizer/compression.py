@@ -0,0 +1,125 @@
+"""
+Prompt compression run on article text before it is sent to an AI model.
+
+Fetched content carries HTML remnants, the NewsAPI "[+N chars]" marker, bylines,
+cookie banners and sentences repeated by syndication. These are removed, and
+content still over SUMMARIZER_COMPRESSION_TOKEN_BUDGET keeps only its
+best-scoring sentences (see extractive.rank_sentences). Token counts before and
+after are counted so the savings show in the metrics endpoint.
+"""
+import html
+import re
+from typing import Dict, List
+
+import numpy as np
+from django.conf import settings
+
+from . import metrics
+from .chunking import estimate_tokens
+from .extractive import rank_sentences, split_sentences
+
+# Part of the prompt version, so cached summaries of uncompressed text are not reused
+COMPRESSION_VERSION = "1"
+
+_LINE_RE = re.compile(r"\s*\n\s*")
+_BOILERPLATE_RE = re.compile(
+    r"\b(?:we|this (?:site|website)) uses? cookies\b"
+    r"|\baccept (?:all )?cookies\b"
+    r"|\bcookie (?:policy|settings|preferences)\b"
+    r"|\bsubscribe (?:now|today|to (?:our|the) newsletter)\b"
+    r"|\bsign up (?:for|to) (?:our|the) newsletter\b"
+    r"|\ball rights reserved\b"
+    r"|\benable javascript\b"
+    r"|\bclick here\b"
+    r"|\bfollow us on\b"
+    r"|^(?:advertisement|read more|continue reading|related|share this)\b",
+    re.IGNORECASE,
+)
+_BYLINE_RE = re.compile(
+    r"(?:(?:[Ww]ritten |[Rr]eporting |[Pp]hoto(?:graph)? )?[Bb]y|BY)"
+    r"\s+[A-Z][\w.'’-]*(?:\s+(?:and\s+)?[A-Z][\w.'’-]*){0,5}"
+    r"(?:(?:\s*[,|]|\s+[–-])\s*[A-Z][\w.'’-]*(?:\s+[A-Z][\w.'’-]*){0,3})?"
+)
+_WORD_RE = re.compile(r"\w+")
+
+
+def _is_boilerplate(sentence: str) -> bool:
+    if _BOILERPLATE_RE.search(sentence):
+        return True
+    # A byline on its own, e.g. "By Jane Doe | Reuters"; "By Tuesday, the council..." is kept
+    return len(sentence.split()) <= 10 and _BYLINE_RE.fullmatch(sentence.rstrip(".")) is not None
+
+
+def clean_paragraphs(title: str, content: str) -> List[List[str]]:
+    """Sentences of each paragraph, without markup, boilerplate, repeats or a copy of the title."""
+    seen = {" ".join(_WORD_RE.findall((title or "").lower()))}
+    paragraphs = []
+    for line in _LINE_RE.split(html.unescape(content or "")):
+        sentences = []
+        for sentence in split_sentences(line):
+            key = " ".join(_WORD_RE.findall(sentence.lower()))
+            if not key or key in seen or _is_boilerplate(sentence):
+                continue
+            seen.add(key)
+            sentences.append(sentence)
+        if sentences:
+            paragraphs.append(sentences)
+    return paragraphs
+
+
+def compress_text(title: str, content: str, token_budget: int = None) -> str:
+    """
+    Normalized content without boilerplate. With a `token_budget`, the lowest scoring
+    sentences are dropped until it fits; paragraphs and sentence order are kept.
+    """
+    paragraphs = clean_paragraphs(title, content)
+    text = "\n\n".join(" ".join(sentences) for sentences in paragraphs)
+    if not token_budget or estimate_tokens(text) <= token_budget:
+        return text
+
+    located = [(p, sentence) for p, sentences in enumerate(paragraphs) for sentence in sentences]
+    scores = rank_sentences([sentence for _, sentence in located], title)
+    keep, used = set(), 0
+    for index in np.argsort(-scores, kind="stable"):
+        tokens = estimate_tokens(located[index][1]) + 1
+        if used + tokens <= token_budget:
+            keep.add(int(index))
+            used += tokens
+    kept = [[] for _ in paragraphs]
+    for index in sorted(keep):
+        paragraph, sentence = located[index]
+        kept[paragraph].append(sentence)
+    return "\n\n".join(" ".join(sentences) for sentences in kept if sentences)
+
+
+def compress_for_prompt(title: str, content: str) -> str:
+    """
+    Content as it goes into a prompt, counted in the compression metrics.
+    Content long enough for map-reduce is cleaned but not cut to the budget,
+    since it is summarized chunk by chunk anyway.
+    """
+    if not settings.SUMMARIZER_COMPRESSION_ENABLED:
+        return content
+    before = estimate_tokens(content)
+    budget = settings.SUMMARIZER_COMPRESSION_TOKEN_BUDGET
+    if before > settings.SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS:
+        budget = None
+    compressed = compress_text(title, content, budget) or content
+    metrics.incr("compression_prompts")
+    metrics.incr("compression_tokens_before", before)
+    metrics.incr("compression_tokens_after", estimate_tokens(compressed))
+    return compressed
+
+
+def compression_stats() -> Dict:
+    counters = metrics.get_counters(["compression_prompts", "compression_tokens_before", "compression_tokens_after"])
+    prompts = counters["compression_prompts"]
+    before, after = counters["compression_tokens_before"], counters["compression_tokens_after"]
+    return {
+        "prompts": prompts,
+        "tokens_before": before,
+        "tokens_after": after,
+        "avg_tokens_before": round(before / prompts, 1) if prompts else 0.0,
+        "avg_tokens_after": round(after / prompts, 1) if prompts else 0.0,
+        "savings_rate": metrics.ratio(before - after, before),
+    }
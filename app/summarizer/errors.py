@@ -0,0 +1,105 @@
+"""Classification of failed summary generations, and the retry policy for each error class."""
+import random
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+import openai
+from django.conf import settings
+from django.utils import timezone
+
+from .limiter import LimiterTimeout
+
+# Error classes stored on failed summaries
+CONTENT = "content"  # the request itself was rejected (bad request, content policy); fails on every model
+PERMANENT = "permanent"  # bad input or configuration: unknown model or length, bad credentials, exhausted quota
+RATE_LIMIT = "rate_limit"
+TIMEOUT = "timeout"
+TRANSIENT = "transient"  # connection errors and 5xx responses
+UNKNOWN = "unknown"
+
+RETRYABLE_CLASSES = (RATE_LIMIT, TIMEOUT, TRANSIENT, UNKNOWN)
+
+
+class InvalidRequestError(ValueError):
+    """Raised for a summary request the service cannot serve however often it is retried."""
+
+
+def classify_error(error: Exception) -> str:
+    """Classify a summary generation failure by how it should be retried."""
+    if isinstance(error, openai.RateLimitError):
+        # OpenAI reports an exhausted quota as a 429 too, but waiting does not help
+        return PERMANENT if _error_code(error) == "insufficient_quota" else RATE_LIMIT
+    if isinstance(error, (openai.BadRequestError, openai.UnprocessableEntityError)):
+        return CONTENT
+    if isinstance(error, (openai.AuthenticationError, openai.PermissionDeniedError, openai.NotFoundError)):
+        return PERMANENT
+    if isinstance(error, (openai.APITimeoutError, httpx.TimeoutException, TimeoutError, LimiterTimeout)):
+        return TIMEOUT
+    if isinstance(error, (openai.APIConnectionError, openai.InternalServerError)):
+        return TRANSIENT
+    if isinstance(error, openai.APIStatusError):
+        return TRANSIENT if error.status_code >= 500 else PERMANENT
+    if isinstance(error, InvalidRequestError):
+        return PERMANENT
+    # Other errors, e.g. a JSON error from a truncated response, are worth a retry
+    return UNKNOWN
+
+
+def error_metadata(error: Exception) -> Dict:
+    """Error details stored in `Summary.metadata["error"]`."""
+    return {
+        "class": classify_error(error),
+        "type": type(error).__name__,
+        "code": _error_code(error),
+        "at": timezone.now().isoformat(),
+    }
+
+
+def retry_countdown(error: Exception, retries: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying after `error`, or None when retrying cannot help.
+    Rate limits honour the provider's Retry-After; other retryable errors back off
+    exponentially with jitter.
+    """
+    error_class = classify_error(error)
+    if error_class not in RETRYABLE_CLASSES:
+        return None
+    if error_class == UNKNOWN:
+        return settings.SUMMARIZER_RETRY_DEFAULT_COUNTDOWN
+    if error_class == RATE_LIMIT:
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            # A little jitter so workers told the same Retry-After do not return together
+            return min(retry_after + random.uniform(0, 1), settings.SUMMARIZER_RETRY_MAX_COUNTDOWN)
+    delay = min(settings.SUMMARIZER_RETRY_BASE_COUNTDOWN * 2 ** retries, settings.SUMMARIZER_RETRY_MAX_COUNTDOWN)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """The Retry-After of an API error response, in seconds, if the provider sent one."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - timezone.now()).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _error_code(error: Exception) -> Optional[str]:
+    code = getattr(error, "code", None)
+    return code if isinstance(code, str) else None
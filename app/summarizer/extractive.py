@@ -0,0 +1,125 @@
+"""
+Local extractive summarization, used without any AI model.
+
+Sentences are scored with TextRank over their TF-IDF vectors, nudged towards the
+title and the lead of the article, and the best ones that fit the word budget are
+returned in article order. Everything is vectorized with NumPy, so an article is
+summarized in milliseconds on the request path: as the "extractive" pseudo-model,
+as a placeholder while an LLM summary is pending, or as a fallback when it failed.
+"""
+import hashlib
+import re
+from typing import List
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from .quality import usable_text
+
+EXTRACTIVE_MODEL = "extractive"
+CACHE_PREFIX = "summarizer:extractive:"
+
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+TITLE_WEIGHT = 0.5  # bonus for sentences close to the title
+LEAD_WEIGHT = 0.3  # bonus for the opening sentences, decaying with position
+
+_SENTENCE_RE = re.compile(r"(?:(?<=[.!?…])|(?<=[.!?…][\"'”’)\]]))\s+(?=[\"'“‘(\[]*[A-Z0-9])")
+_WORD_RE = re.compile(r"\w+")
+_ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "st", "jr", "sr", "gov", "sen", "rep", "gen", "u.s", "vs"}
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences on terminal punctuation followed by a capitalized word."""
+    sentences = []
+    for part in _SENTENCE_RE.split(usable_text(text)):
+        part = part.strip()
+        if not part:
+            continue
+        if sentences and sentences[-1].rsplit(" ", 1)[-1].rstrip(".").lower() in _ABBREVIATIONS:
+            # "Dr. Smith" and the like do not end a sentence
+            sentences[-1] = f"{sentences[-1]} {part}"
+        else:
+            sentences.append(part)
+    return sentences
+
+
+def _tfidf(documents: List[List[str]], vocabulary: dict) -> np.ndarray:
+    """L2-normalized TF-IDF rows for tokenized documents over `vocabulary`."""
+    rows = np.repeat(np.arange(len(documents)), [len(words) for words in documents])
+    columns = np.fromiter((vocabulary[word] for words in documents for word in words), dtype=np.int64)
+    counts = np.zeros((len(documents), len(vocabulary)))
+    np.add.at(counts, (rows, columns), 1.0)
+    document_frequency = np.count_nonzero(counts, axis=0)
+    counts *= np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+    norms = np.linalg.norm(counts, axis=1, keepdims=True)
+    return np.divide(counts, norms, out=np.zeros_like(counts), where=norms > 0)
+
+
+def rank_sentences(sentences: List[str], title: str = "") -> np.ndarray:
+    """Score of each sentence: TextRank centrality plus title similarity and a lead bonus."""
+    count = len(sentences)
+    if count == 0:
+        return np.zeros(0)
+    tokenized = [[word.lower() for word in _WORD_RE.findall(sentence)] for sentence in sentences]
+    title_words = [word.lower() for word in _WORD_RE.findall(title or "")]
+    vocabulary = {}
+    for words in tokenized + [title_words]:
+        for word in words:
+            vocabulary.setdefault(word, len(vocabulary))
+    if not vocabulary:
+        return np.zeros(count)
+    vectors = _tfidf(tokenized + [title_words], vocabulary)
+    sentence_vectors, title_vector = vectors[:-1], vectors[-1]
+
+    similarity = sentence_vectors @ sentence_vectors.T
+    np.fill_diagonal(similarity, 0.0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # Sentences similar to nothing spread their rank evenly
+    transition = np.divide(similarity, out_weight, out=np.full_like(similarity, 1.0 / count), where=out_weight > 0)
+    scores = np.full(count, 1.0 / count)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1 - DAMPING) / count + DAMPING * (transition.T @ scores)
+        converged = np.abs(updated - scores).sum() < TOLERANCE
+        scores = updated
+        if converged:
+            break
+
+    scores = scores / scores.max()
+    lead = 1.0 / (1.0 + np.arange(count))
+    return scores + TITLE_WEIGHT * (sentence_vectors @ title_vector) + LEAD_WEIGHT * lead
+
+
+def extractive_summary(title: str, content: str, max_words: int) -> str:
+    """
+    The highest scoring sentences that fit in `max_words`, in article order.
+    When not even the best sentence fits, it is cut to the budget.
+    """
+    sentences = split_sentences(content)[:settings.SUMMARIZER_EXTRACTIVE_MAX_SENTENCES]
+    if not sentences:
+        return usable_text(title)
+    scores = rank_sentences(sentences, title)
+    lengths = [len(sentence.split()) for sentence in sentences]
+
+    chosen, used = [], 0
+    for index in np.argsort(-scores, kind="stable"):
+        if used + lengths[index] <= max_words:
+            chosen.append(index)
+            used += lengths[index]
+    if not chosen:
+        words = sentences[int(np.argmax(scores))].split()
+        return " ".join(words[:max_words]).rstrip(",;:") + "…"
+    return " ".join(sentences[index] for index in sorted(chosen))
+
+
+def cached_extractive_summary(article, max_words: int) -> str:
+    """Extractive summary of an article, cached on its text so repeated requests skip the scoring."""
+    digest = hashlib.sha256(f"{max_words}\x1f{article.title}\x1f{article.content}".encode("utf-8")).hexdigest()
+    key = f"{CACHE_PREFIX}{digest}"
+    summary_text = cache.get(key)
+    if summary_text is None:
+        summary_text = extractive_summary(article.title, article.content, max_words)
+        cache.set(key, summary_text, timeout=settings.SUMMARIZER_EXTRACTIVE_CACHE_TIMEOUT)
+    return summary_text
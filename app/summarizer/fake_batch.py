@@ -0,0 +1,173 @@
+"""
+In-process stand-in for the provider's Batch API, used in tests and offline runs.
+Select it with SUMMARIZER_BATCH_BACKEND = "local".
+
+It serves the file and batch endpoints the OpenAI client calls, through an httpx
+transport, so the real client code path is exercised. Requests are answered by
+FakeSummaryChatModel when a batch finishes, which happens after
+`polls_to_complete` status checks.
+"""
+import itertools
+import json
+import threading
+import time
+from typing import Dict, Optional
+
+import httpx
+import openai
+from django.conf import settings
+from langchain_core.messages import convert_to_messages
+
+from .fake_llm import FakeSummaryChatModel
+
+_server = None
+_server_lock = threading.Lock()
+
+
+class LocalBatchServer(httpx.BaseTransport):
+    """Minimal file and batch endpoints of the OpenAI API, kept in memory."""
+
+    def __init__(self, polls_to_complete: int = 1):
+        self.polls_to_complete = polls_to_complete
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict] = {}
+        self._polls: Dict[str, int] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        path = request.url.path.split("/v1", 1)[-1]
+        parts = [part for part in path.split("/") if part]
+        with self._lock:
+            if request.method == "POST" and parts == ["files"]:
+                return self._json(self._upload(request))
+            if request.method == "GET" and len(parts) == 3 and parts[0] == "files" and parts[2] == "content":
+                if parts[1] not in self.files:
+                    return self._not_found(parts[1])
+                return httpx.Response(200, content=self.files[parts[1]])
+            if request.method == "POST" and parts == ["batches"]:
+                return self._json(self._create_batch(json.loads(request.content)))
+            if request.method == "GET" and len(parts) == 2 and parts[0] == "batches":
+                if parts[1] not in self.batches:
+                    return self._not_found(parts[1])
+                return self._json(self._poll(parts[1]))
+        return httpx.Response(404, json={"error": {"message": f"No route for {request.method} {path}"}})
+
+    def set_status(self, batch_id: str, status: str) -> None:
+        """Force a batch into a provider status, e.g. "expired", to test recovery."""
+        with self._lock:
+            self.batches[batch_id]["status"] = status
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}-local-{next(self._ids)}"
+
+    def _upload(self, request: httpx.Request) -> Dict:
+        file_id = self._next_id("file")
+        self.files[file_id] = _multipart_file(request)
+        return {
+            "id": file_id, "object": "file", "bytes": len(self.files[file_id]), "created_at": int(time.time()),
+            "filename": "batch.jsonl", "purpose": "batch", "status": "processed",
+        }
+
+    def _create_batch(self, body: Dict) -> Dict:
+        batch_id = self._next_id("batch")
+        self.batches[batch_id] = {
+            "id": batch_id, "object": "batch", "endpoint": body["endpoint"],
+            "input_file_id": body["input_file_id"], "completion_window": body["completion_window"],
+            "metadata": body.get("metadata"), "status": "validating", "created_at": int(time.time()),
+            "output_file_id": None, "error_file_id": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+        }
+        self._polls[batch_id] = 0
+        return self.batches[batch_id]
+
+    def _poll(self, batch_id: str) -> Dict:
+        batch = self.batches[batch_id]
+        if batch["status"] in ("validating", "in_progress"):
+            self._polls[batch_id] += 1
+            if self._polls[batch_id] >= self.polls_to_complete:
+                self._run(batch)
+            else:
+                batch["status"] = "in_progress"
+        return batch
+
+    def _run(self, batch: Dict) -> None:
+        """Answer every request of a batch and write the output and error files."""
+        llm_options = {**settings.SUMMARIZER_FAKE_LLM, "latency_mean": 0, "latency_stddev": 0}
+        outputs, errors = [], []
+        for line in self.files[batch["input_file_id"]].decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            body = request["body"]
+            llm = FakeSummaryChatModel(model_name=body["model"], **llm_options)
+            try:
+                message = llm.invoke(convert_to_messages(body["messages"]))
+            except openai.APIStatusError as e:
+                errors.append({
+                    "id": self._next_id("batch_req"), "custom_id": request["custom_id"], "error": None,
+                    "response": {"status_code": e.status_code, "body": {"error": {"message": str(e), "code": None}}},
+                })
+                continue
+            usage = message.usage_metadata or {}
+            outputs.append({
+                "id": self._next_id("batch_req"), "custom_id": request["custom_id"], "error": None,
+                "response": {"status_code": 200, "body": {
+                    "object": "chat.completion", "model": body["model"],
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": message.content}}],
+                    "usage": {
+                        "prompt_tokens": usage.get("input_tokens", 0),
+                        "completion_tokens": usage.get("output_tokens", 0),
+                        "total_tokens": usage.get("total_tokens", 0),
+                    },
+                }},
+            })
+        batch["output_file_id"] = self._write(outputs)
+        batch["error_file_id"] = self._write(errors)
+        batch["request_counts"] = {
+            "total": len(outputs) + len(errors), "completed": len(outputs), "failed": len(errors),
+        }
+        batch["status"] = "completed"
+
+    def _write(self, lines) -> Optional[str]:
+        if not lines:
+            return None
+        file_id = self._next_id("file")
+        self.files[file_id] = "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+        return file_id
+
+    @staticmethod
+    def _json(body: Dict) -> httpx.Response:
+        return httpx.Response(200, json=body)
+
+    @staticmethod
+    def _not_found(object_id: str) -> httpx.Response:
+        return httpx.Response(404, json={"error": {"message": f"No such object: {object_id}", "code": None}})
+
+
+def _multipart_file(request: httpx.Request) -> bytes:
+    """Content of the "file" part of a multipart upload."""
+    boundary = request.headers["content-type"].split("boundary=", 1)[1].strip('"').encode("utf-8")
+    for part in request.content.split(b"--" + boundary):
+        head, _, data = part.partition(b"\r\n\r\n")
+        if b'name="file"' in head:
+            return data[:-2] if data.endswith(b"\r\n") else data
+    return b""
+
+
+def local_batch_server() -> LocalBatchServer:
+    """The process-wide local batch server, so state survives between clients."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = LocalBatchServer()
+        return _server
+
+
+def reset_local_batch_server(polls_to_complete: int = 1) -> LocalBatchServer:
+    """Start over with an empty local batch server, e.g. between tests."""
+    global _server
+    with _server_lock:
+        _server = LocalBatchServer(polls_to_complete=polls_to_complete)
+        return _server
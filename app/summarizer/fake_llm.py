@@ -0,0 +1,172 @@
+"""
+Deterministic stand-in for ChatOpenAI, used to load-test the summarization
+pipeline offline. Select it with SUMMARIZER_LLM_BACKEND = "fake".
+"""
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+from typing import Any, Iterator, List, Optional
+
+import httpx
+import openai
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from .chunking import estimate_tokens
+
+_MAX_WORDS_RE = re.compile(r"up to (\d+) words")
+_WORD_LIMITS_RE = re.compile(r"word limits: ([\d, ]+)")
+_BATCH_ARTICLE_RE = re.compile(r"^Article (\d+)\nTitle: (.*?)\nContent: (.*)$", re.DOTALL)
+
+# Calls are numbered per process so rate-limit bursts span LLM instances
+_call_counter = itertools.count(1)
+_call_counter_lock = threading.Lock()
+
+
+def _next_call_number() -> int:
+    with _call_counter_lock:
+        return next(_call_counter)
+
+
+def reset_call_counter() -> None:
+    """Restart call numbering, e.g. between benchmark runs."""
+    global _call_counter
+    with _call_counter_lock:
+        _call_counter = itertools.count(1)
+
+
+def _openai_error(error_class, status_code: int, message: str) -> Exception:
+    """Build an openai error as the real client would raise it."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return error_class(message, response=httpx.Response(status_code, request=request), body=None)
+
+
+class FakeSummaryChatModel(BaseChatModel):
+    """
+    Chat model that answers summarization prompts without network calls.
+
+    Summaries are extractive (the leading words of the article content), so the
+    same input always gives the same output. Latency, failures and 429 bursts are
+    drawn from a generator seeded with `seed` and the call number, so a run is
+    reproducible. Usage metadata is reported like the OpenAI integration does.
+    """
+
+    model_name: str = "fake"
+    latency_distribution: str = "fixed"  # fixed, uniform or lognormal
+    latency_mean: float = 0.0  # seconds
+    latency_stddev: float = 0.0  # seconds, spread for uniform and lognormal
+    error_rate: float = 0.0  # probability of a 500 error per call
+    rate_limit_every: int = 0  # a burst of 429 errors starts every N calls, 0 disables
+    rate_limit_burst: int = 0  # consecutive calls rejected per burst
+    output_words: Optional[int] = None  # summary length, defaults to the prompt's word limit
+    seed: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-summary"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        text = self._respond(messages)
+        message = AIMessage(content=text, usage_metadata=self._usage(messages, text))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        text = self._respond(messages)
+        words = text.split(" ")
+        for index, word in enumerate(words):
+            token = word if index == 0 else f" {word}"
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+        # Like OpenAI with stream_usage=True, the usage comes in a final empty chunk
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=self._usage(messages, text)))
+
+    def _respond(self, messages: List[BaseMessage]) -> str:
+        """Simulate latency and failures for one call, then build the response text."""
+        call_number = _next_call_number()
+        rng = random.Random(f"{self.seed}:{call_number}")
+        time.sleep(self._latency(rng))
+
+        if self.rate_limit_every and self.rate_limit_burst:
+            if (call_number - 1) % self.rate_limit_every < self.rate_limit_burst:
+                raise _openai_error(openai.RateLimitError, 429, "Rate limit reached (simulated)")
+        if rng.random() < self.error_rate:
+            raise _openai_error(openai.InternalServerError, 500, "Server error (simulated)")
+
+        system_text = " ".join(str(m.content) for m in messages if m.type == "system")
+        user_text = str(messages[-1].content) if messages else ""
+        match = _MAX_WORDS_RE.search(system_text)
+        max_words = self.output_words or (int(match.group(1)) if match else 50)
+
+        limits = _WORD_LIMITS_RE.search(system_text)
+        if limits:
+            return self._multi_length_response(user_text, [int(v) for v in limits.group(1).split(",") if v.strip()])
+        if '"summaries"' in system_text:
+            return self._batch_response(user_text, max_words)
+        return self._summarize(user_text, max_words)
+
+    def _latency(self, rng: random.Random) -> float:
+        if self.latency_distribution == "uniform":
+            return max(0.0, rng.uniform(self.latency_mean - self.latency_stddev,
+                                        self.latency_mean + self.latency_stddev))
+        if self.latency_distribution == "lognormal" and self.latency_mean > 0:
+            # Parameters chosen so the samples have the configured mean and standard deviation
+            sigma_squared = math.log(1 + (self.latency_stddev / self.latency_mean) ** 2)
+            mu = math.log(self.latency_mean) - sigma_squared / 2
+            return rng.lognormvariate(mu, math.sqrt(sigma_squared))
+        return max(0.0, self.latency_mean)
+
+    @staticmethod
+    def _summarize(user_text: str, max_words: int) -> str:
+        """The leading words of the content section, or of the whole message."""
+        content = user_text.split("Content:", 1)[-1]
+        content = content.split("Partial summaries:", 1)[-1].rsplit("Summary:", 1)[0]
+        words = content.split()
+        return " ".join(words[:max_words]) or "No content."
+
+    def _batch_response(self, user_text: str, max_words: int) -> str:
+        """JSON answer to the micro-batch prompt, one entry per packed article."""
+        summaries = []
+        for block in user_text.split("\n\n---\n\n"):
+            match = _BATCH_ARTICLE_RE.match(block.strip())
+            if match:
+                summaries.append({
+                    "id": int(match.group(1)),
+                    "summary": self._summarize(match.group(3), max_words),
+                })
+        return json.dumps({"summaries": summaries})
+
+    def _multi_length_response(self, user_text: str, lengths: List[int]) -> str:
+        """JSON answer to the multi-length prompt, one entry per word limit."""
+        return json.dumps({"summaries": [
+            {"max_words": max_words, "summary": self._summarize(user_text, self.output_words or max_words)}
+            for max_words in lengths
+        ]})
+
+    @staticmethod
+    def _usage(messages: List[BaseMessage], text: str) -> dict:
+        input_tokens = sum(estimate_tokens(str(m.content)) for m in messages)
+        output_tokens = estimate_tokens(text)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
@@ -0,0 +1,182 @@
+"""
+Hedged LLM calls for interactive summaries.
+
+If the first call to a model has not returned by that model's observed p95
+latency, a duplicate call is sent and whichever answers first is used. A budget
+caps the share of calls that may be hedged, so the extra spend stays bounded.
+The duplicate takes a slot of the model's rate limiter, and is not sent when no
+slot is free. Attempts are coroutines on a per-process event loop, so the losing
+one is cancelled, which aborts its request to the provider.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from . import metrics
+from .limiter import LimiterTimeout, ModelRateLimiter
+from .models import Summary
+from .telemetry import percentile
+
+logger = logging.getLogger(__name__)
+
+HEDGE_PREFIX = "summarizer:hedge:"
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+_loop_lock = threading.Lock()
+
+
+def should_hedge(latency_class: Optional[str]) -> bool:
+    """Hedging is opt-in and limited to interactive latency classes."""
+    return settings.SUMMARIZER_HEDGE_ENABLED and latency_class in settings.SUMMARIZER_HEDGE_LATENCY_CLASSES
+
+
+def hedge_delay(model: str) -> float:
+    """Seconds to wait before hedging a call to `model`: the p95 of its recent LLM latencies."""
+    key = f"{HEDGE_PREFIX}delay:{model}"
+    delay = cache.get(key)
+    if delay is None:
+        rows = (
+            Summary.objects.filter(
+                Q(answered_by=model) | Q(answered_by__isnull=True, ai_model=model),
+                status="completed",
+                llm_started_at__isnull=False,
+                llm_finished_at__isnull=False,
+            )
+            .order_by("-completed_at")
+            .values_list("llm_started_at", "llm_finished_at")[: settings.SUMMARIZER_HEDGE_SAMPLE_SIZE]
+        )
+        latencies = [(finished - started).total_seconds() for started, finished in rows]
+        if len(latencies) >= settings.SUMMARIZER_HEDGE_MIN_SAMPLES:
+            delay = percentile(latencies, 95)
+        else:
+            delay = settings.SUMMARIZER_HEDGE_DEFAULT_DELAY
+        cache.set(key, delay, timeout=settings.SUMMARIZER_HEDGE_DELAY_CACHE_SECONDS)
+    return max(delay, settings.SUMMARIZER_HEDGE_MIN_DELAY)
+
+
+def _window_key(name: str) -> str:
+    window = int(time.time() // settings.SUMMARIZER_HEDGE_BUDGET_WINDOW)
+    return f"{HEDGE_PREFIX}{name}:{window}"
+
+
+def _incr_window(name: str) -> int:
+    key = _window_key(name)
+    timeout = settings.SUMMARIZER_HEDGE_BUDGET_WINDOW * 2
+    if cache.add(key, 1, timeout=timeout):
+        return 1
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=timeout)
+        return 1
+
+
+def _take_hedge() -> bool:
+    """Spend one hedge from the budget of the current window, if any is left."""
+    # Concurrent callers may overshoot the budget by a call or two, which is acceptable
+    calls = cache.get(_window_key("calls"), 0)
+    hedges = cache.get(_window_key("hedges"), 0)
+    if hedges + 1 > settings.SUMMARIZER_HEDGE_BUDGET * calls:
+        metrics.incr("hedges_over_budget")
+        return False
+    _incr_window("hedges")
+    return True
+
+
+def _give_back_hedge() -> None:
+    """Return a hedge taken from the budget that was not sent after all."""
+    try:
+        cache.decr(_window_key("hedges"))
+    except ValueError:
+        pass
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Event loop the attempts of this process run on, in a daemon thread started on first use."""
+    global _loop, _loop_pid
+    with _loop_lock:
+        # A forked worker does not inherit the loop's thread
+        if _loop is None or _loop_pid != os.getpid():
+            _loop = asyncio.new_event_loop()
+            _loop_pid = os.getpid()
+            threading.Thread(target=_loop.run_forever, name="summary-hedge", daemon=True).start()
+        return _loop
+
+
+def hedged_call(
+    generate: Callable[[], Awaitable[T]],
+    delay: float,
+    limiter: Optional[ModelRateLimiter] = None,
+    tokens: int = 0,
+) -> T:
+    """
+    Run the coroutine `generate()` and, if it has not returned after `delay` seconds,
+    the budget allows and `limiter` has a slot free, run it again concurrently.
+    Returns the first successful result and cancels the other attempt; when both
+    attempts fail the first error is raised.
+    """
+    loop = _event_loop()
+    _incr_window("calls")
+    primary = asyncio.run_coroutine_threadsafe(generate(), loop)
+    attempts = [primary]
+    slot_key = None
+    try:
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        # The budget comes first, so a hedge that is not sent takes no slot or tokens
+        if not _take_hedge():
+            return primary.result()
+        if limiter is not None and settings.SUMMARIZER_LIMITER_ENABLED:
+            try:
+                slot_key = limiter.acquire(tokens, wait=False)
+            except LimiterTimeout:
+                _give_back_hedge()
+                metrics.incr("hedges_no_slot")
+                return primary.result()
+
+        metrics.incr("hedges_sent")
+        hedge = asyncio.run_coroutine_threadsafe(generate(), loop)
+        attempts.append(hedge)
+        pending = {primary, hedge}
+        first_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if future is hedge:
+                        metrics.incr("hedges_won")
+                    return future.result()
+                logger.error(f"Hedged LLM attempt failed: {error}")
+                first_error = first_error or error
+        raise first_error
+    finally:
+        # Cancelling the losing attempt's task aborts its HTTP request
+        for attempt in attempts:
+            attempt.cancel()
+        if slot_key:
+            limiter.release(slot_key)
+
+
+def hedge_stats() -> Dict:
+    counters = metrics.get_counters(["hedges_sent", "hedges_won", "hedges_over_budget", "hedges_no_slot"])
+    return {
+        "enabled": settings.SUMMARIZER_HEDGE_ENABLED,
+        "sent": counters["hedges_sent"],
+        "won": counters["hedges_won"],
+        "win_rate": metrics.ratio(counters["hedges_won"], counters["hedges_sent"]),
+        "over_budget": counters["hedges_over_budget"],
+        "no_slot": counters["hedges_no_slot"],
+    }
@@ -0,0 +1,152 @@
+"""
+Leases on Summary rows, so exactly one worker generates a summary at a time.
+
+A worker claims a summary with a conditional update that records itself as the
+lease owner until `lease_expires_at`, keeps the lease alive with a heartbeat while
+the LLM call runs, and clears it when the summary is saved. Leases that expire
+because a worker died are picked up again by the reaper task.
+"""
+import logging
+import threading
+import uuid
+from datetime import timedelta
+from typing import Iterable
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .errors import error_metadata
+from .models import Summary
+
+logger = logging.getLogger(__name__)
+
+
+def new_lease_owner() -> str:
+    return uuid.uuid4().hex
+
+
+def claimable_q(now=None) -> Q:
+    """Summaries nobody is working on: waiting, failed, or whose lease expired."""
+    now = now or timezone.now()
+    return Q(status__in=["pending", "failed"]) | Q(status="in_progress", lease_expires_at__lt=now)
+
+
+def stale_q(now=None) -> Q:
+    """
+    Summaries that will not finish on their own: expired leases, in-progress rows
+    without a lease that are older than a lease, and pending rows whose task was lost.
+    Pending rows of a batch job that is still to be submitted are left to the batch poller,
+    and parked rows to the drain task.
+    """
+    now = now or timezone.now()
+    lease_cutoff = now - timedelta(seconds=settings.SUMMARIZER_LEASE_SECONDS)
+    pending_cutoff = now - timedelta(seconds=settings.SUMMARIZER_PENDING_TIMEOUT)
+    return (
+        Q(status="in_progress", lease_expires_at__lt=now)
+        | Q(status="in_progress", lease_expires_at__isnull=True, created_at__lt=lease_cutoff)
+        | (
+            (Q(status="pending", queued_at__lt=pending_cutoff)
+             | Q(status="pending", queued_at__isnull=True, created_at__lt=pending_cutoff))
+            & ~Q(batch_job__status="queued")
+            & Q(parked_request__isnull=True)
+        )
+    )
+
+
+def claim_summary(summary_id: int, owner: str, lease_seconds: int = None) -> bool:
+    """
+    Atomically take the lease on a summary. Returns False if someone else holds it.
+    `lease_seconds` overrides SUMMARIZER_LEASE_SECONDS for work that is not heartbeated.
+    """
+    now = timezone.now()
+    return bool(
+        Summary.objects.filter(claimable_q(now), pk=summary_id).update(
+            status="in_progress",
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_seconds or settings.SUMMARIZER_LEASE_SECONDS),
+            started_at=now,
+            attempts=F("attempts") + 1,
+        )
+    )
+
+
+def renew_lease(summary_ids: Iterable[int], owner: str) -> int:
+    """Extend the leases still held by `owner`. Returns how many were renewed."""
+    return Summary.objects.filter(
+        pk__in=list(summary_ids), status="in_progress", lease_owner=owner
+    ).update(lease_expires_at=timezone.now() + timedelta(seconds=settings.SUMMARIZER_LEASE_SECONDS))
+
+
+def release_lease(summary_id: int, owner: str, status: str = "pending") -> bool:
+    """Give up a lease without completing the summary."""
+    return bool(
+        Summary.objects.filter(pk=summary_id, status="in_progress", lease_owner=owner).update(
+            status=status, lease_owner=None, lease_expires_at=None
+        )
+    )
+
+
+def fail_leased(summary_ids: Iterable[int], owner: str, error: Exception) -> int:
+    """
+    Mark the summaries still leased by `owner` failed, storing the error message and
+    its class in `metadata["error"]`. Returns how many were marked.
+    """
+    details = error_metadata(error)
+    failed = 0
+    for summary in Summary.objects.filter(pk__in=list(summary_ids), lease_owner=owner).exclude(status="completed"):
+        failed += Summary.objects.filter(pk=summary.pk, lease_owner=owner).exclude(status="completed").update(
+            status="failed",
+            error_message=str(error),
+            metadata={**summary.metadata, "error": details},
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+    return failed
+
+
+class LeaseHeartbeat:
+    """
+    Context manager that renews leases in a background thread while work is running.
+
+        with LeaseHeartbeat([summary.pk], owner):
+            ... call the LLM ...
+    """
+
+    def __init__(self, summary_ids: Iterable[int], owner: str, interval: float = None):
+        self.summary_ids = list(summary_ids)
+        self.owner = owner
+        self.interval = interval or settings.SUMMARIZER_LEASE_HEARTBEAT_INTERVAL
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "LeaseHeartbeat":
+        self._thread = threading.Thread(target=self._run, name="summary-lease-heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def _run(self):
+        try:
+            while not self._stop.wait(self.interval):
+                try:
+                    renewed = renew_lease(self.summary_ids, self.owner)
+                except Exception as e:
+                    logger.error(f"Lease heartbeat for summaries {self.summary_ids} failed: {e}")
+                    continue
+                if renewed < len(self.summary_ids):
+                    logger.warning(f"Lost lease on {len(self.summary_ids) - renewed} of summaries {self.summary_ids}")
+        finally:
+            connection.close()
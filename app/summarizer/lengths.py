@@ -0,0 +1,43 @@
+"""Summary length variants: presets such as "short" or an exact word budget."""
+from typing import Iterable, List, Union
+
+from django.conf import settings
+
+from .errors import InvalidRequestError
+
+DEFAULT_MAX_WORDS = 150
+
+
+def resolve_max_words(value: Union[str, int, None], default: int = DEFAULT_MAX_WORDS) -> int:
+    """
+    Word budget for a length preset name ("short", "medium", "long") or a number.
+    Raises InvalidRequestError, a ValueError, for unknown presets and budgets outside the allowed range.
+    """
+    if value is None or value == "":
+        return default
+    presets = settings.SUMMARIZER_LENGTH_PRESETS
+    if isinstance(value, str) and value.strip().lower() in presets:
+        return presets[value.strip().lower()]
+    try:
+        max_words = int(value)
+    except (TypeError, ValueError):
+        raise InvalidRequestError(f"Unknown summary length: {value!r}")
+    if not settings.SUMMARIZER_MIN_WORDS <= max_words <= settings.SUMMARIZER_MAX_WORDS:
+        raise InvalidRequestError(
+            f"max_words must be between {settings.SUMMARIZER_MIN_WORDS} and {settings.SUMMARIZER_MAX_WORDS}"
+        )
+    return max_words
+
+
+def resolve_lengths(values: Union[str, Iterable]) -> List[int]:
+    """Distinct word budgets for a list (or comma-separated string) of lengths, in request order."""
+    if isinstance(values, str):
+        values = [value for value in values.split(",") if value.strip()]
+    budgets = []
+    for value in values:
+        max_words = resolve_max_words(value)
+        if max_words not in budgets:
+            budgets.append(max_words)
+    if not budgets:
+        raise InvalidRequestError("At least one summary length is required")
+    return budgets
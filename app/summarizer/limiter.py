@@ -0,0 +1,169 @@
+"""
+Per-model limiter for LLM calls, coordinated through the Django cache (Redis in production).
+
+Each model has a concurrency limit that grows additively while calls succeed and
+is cut multiplicatively on a 429 or timeout (AIMD), so all workers together settle
+at the provider's throughput ceiling. In-flight calls hold slot keys that expire on
+their own if a worker dies. Estimated tokens are also counted per minute against
+the model's tokens-per-minute limit. Calls wait for capacity instead of failing.
+"""
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import httpx
+import openai
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+LIMITER_PREFIX = "summarizer:limiter:"
+
+# Errors that mean the provider is at capacity
+BACKOFF_ERRORS = (openai.RateLimitError, openai.APITimeoutError, httpx.TimeoutException, TimeoutError)
+
+
+class LimiterTimeout(Exception):
+    """No slot or token budget became free within SUMMARIZER_LIMITER_MAX_WAIT."""
+
+
+class ModelRateLimiter:
+    """
+    AIMD concurrency and tokens-per-minute limiter for one model.
+
+        with ModelRateLimiter("gpt-4.1-nano").slot(estimated_tokens):
+            ... call the LLM ...
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self.tokens_per_minute = settings.SUMMARIZER_LIMITER_TOKENS_PER_MINUTE.get(model)
+
+    @contextmanager
+    def slot(self, tokens: int = 0):
+        """Wait for a free slot and token budget, then adjust the limit by the outcome of the call."""
+        if not settings.SUMMARIZER_LIMITER_ENABLED:
+            yield
+            return
+        slot_key = self.acquire(tokens)
+        try:
+            yield
+        except BACKOFF_ERRORS:
+            self.record_backoff()
+            raise
+        else:
+            self.record_success()
+        finally:
+            self.release(slot_key)
+
+    def acquire(self, tokens: int = 0, wait: bool = True) -> str:
+        """
+        Block until a slot and the token budget are available. Returns the slot key to release.
+        With `wait=False`, LimiterTimeout is raised at once when there is no capacity.
+        """
+        max_wait = settings.SUMMARIZER_LIMITER_MAX_WAIT if wait else 0
+        deadline = time.monotonic() + max_wait
+        waited = False
+        while True:
+            slot_key = self._take_slot()
+            if slot_key is not None:
+                if self._reserve_tokens(tokens):
+                    if waited:
+                        logger.info(f"Got an LLM slot for {self.model} after waiting")
+                    return slot_key
+                cache.delete(slot_key)
+            if time.monotonic() >= deadline:
+                raise LimiterTimeout(f"No capacity for model {self.model} within {max_wait}s")
+            waited = True
+            time.sleep(settings.SUMMARIZER_LIMITER_POLL_INTERVAL)
+
+    def release(self, slot_key: str) -> None:
+        cache.delete(slot_key)
+
+    def limit(self) -> float:
+        return self._state()["limit"]
+
+    def in_flight(self) -> int:
+        keys = [self._slot_key(index) for index in range(settings.SUMMARIZER_LIMITER_MAX_CONCURRENCY)]
+        return len(cache.get_many(keys))
+
+    def tokens_this_minute(self) -> int:
+        return cache.get(self._tokens_key(), 0)
+
+    def record_success(self) -> None:
+        # Additive increase: about one extra slot per `limit` successful calls
+        state = self._state()
+        state["limit"] = min(settings.SUMMARIZER_LIMITER_MAX_CONCURRENCY, state["limit"] + 1 / state["limit"])
+        self._save(state)
+
+    def record_backoff(self) -> None:
+        # Multiplicative decrease, at most once per cooldown so one burst of 429s counts once
+        state = self._state()
+        now = time.time()
+        if now - state["decreased_at"] < settings.SUMMARIZER_LIMITER_DECREASE_COOLDOWN:
+            return
+        state["limit"] = max(
+            settings.SUMMARIZER_LIMITER_MIN_CONCURRENCY, state["limit"] * settings.SUMMARIZER_LIMITER_DECREASE_FACTOR
+        )
+        state["decreased_at"] = now
+        self._save(state)
+        logger.warning(f"LLM concurrency for {self.model} cut to {state['limit']:.1f}")
+
+    def stats(self) -> Dict:
+        return {
+            "limit": round(self.limit(), 2),
+            "in_flight": self.in_flight(),
+            "tokens_this_minute": self.tokens_this_minute(),
+            "tokens_per_minute": self.tokens_per_minute,
+        }
+
+    def _take_slot(self) -> Optional[str]:
+        owner = uuid.uuid4().hex
+        for index in range(int(self.limit())):
+            slot_key = self._slot_key(index)
+            if cache.add(slot_key, owner, timeout=settings.SUMMARIZER_LIMITER_SLOT_TTL):
+                return slot_key
+        return None
+
+    def _reserve_tokens(self, tokens: int) -> bool:
+        if not self.tokens_per_minute or not tokens:
+            return True
+        key = self._tokens_key()
+        if cache.add(key, tokens, timeout=120):
+            # The first call of a minute always goes through, even when larger than the budget
+            return True
+        try:
+            used = cache.incr(key, tokens)
+        except ValueError:
+            cache.set(key, tokens, timeout=120)
+            return True
+        if used > self.tokens_per_minute:
+            cache.decr(key, tokens)
+            return False
+        return True
+
+    def _state(self) -> Dict:
+        return cache.get(self._state_key()) or {
+            "limit": float(settings.SUMMARIZER_LIMITER_INITIAL_CONCURRENCY),
+            "decreased_at": 0.0,
+        }
+
+    def _save(self, state: Dict) -> None:
+        # Read-modify-write without a lock: a lost update only delays an adjustment
+        cache.set(self._state_key(), state, timeout=None)
+
+    def _state_key(self) -> str:
+        return f"{LIMITER_PREFIX}{self.model}:state"
+
+    def _slot_key(self, index: int) -> str:
+        return f"{LIMITER_PREFIX}{self.model}:slot:{index}"
+
+    def _tokens_key(self) -> str:
+        return f"{LIMITER_PREFIX}{self.model}:tokens:{int(time.time() // 60)}"
+
+
+def limiter_stats() -> Dict[str, Dict]:
+    return {model: ModelRateLimiter(model).stats() for model in settings.SUMMARIZER_ROUTER_CANDIDATES}
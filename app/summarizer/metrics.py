@@ -0,0 +1,35 @@
+"""Lightweight summarizer counters stored in the Django cache (Redis in production)."""
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+
+METRICS_PREFIX = "summarizer:metrics:"
+
+
+def _key(name: str) -> str:
+    return f"{METRICS_PREFIX}{name}"
+
+
+def incr(name: str, amount: int = 1) -> int:
+    """Atomically increment a counter, creating it on first use."""
+    key = _key(name)
+    if cache.add(key, amount, timeout=None):
+        return amount
+    try:
+        return cache.incr(key, amount)
+    except ValueError:
+        # The key expired or was evicted between add() and incr()
+        cache.set(key, amount, timeout=None)
+        return amount
+
+
+def get_counters(names: Iterable[str]) -> Dict[str, int]:
+    """Return the current value of each counter, defaulting to 0."""
+    names = list(names)
+    values = cache.get_many([_key(name) for name in names])
+    return {name: values.get(_key(name), 0) for name in names}
+
+
+def ratio(numerator: int, denominator: int) -> float:
+    """Safe ratio helper for rate metrics."""
+    return round(numerator / denominator, 4) if denominator else 0.0
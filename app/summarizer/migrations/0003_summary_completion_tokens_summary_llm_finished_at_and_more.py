@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0002_alter_summary_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summary',
+            name='completion_tokens',
+            field=models.IntegerField(blank=True, help_text='Number of completion (output) tokens reported by the AI model', null=True),
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='llm_finished_at',
+            field=models.DateTimeField(blank=True, help_text='When the AI model call returned', null=True),
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='llm_started_at',
+            field=models.DateTimeField(blank=True, help_text='When the AI model call started', null=True),
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='prompt_tokens',
+            field=models.IntegerField(blank=True, help_text='Number of prompt (input) tokens reported by the AI model', null=True),
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='queued_at',
+            field=models.DateTimeField(blank=True, help_text='When the summary was last queued for generation', null=True),
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='started_at',
+            field=models.DateTimeField(blank=True, help_text='When a worker started processing the summary', null=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0003_summary_completion_tokens_summary_llm_finished_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summary',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='Number of times generation was started'),
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, help_text='When the generation lease expires unless renewed', null=True),
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='lease_owner',
+            field=models.CharField(blank=True, help_text='Worker currently holding the generation lease', max_length=64, null=True),
+        ),
+    ]
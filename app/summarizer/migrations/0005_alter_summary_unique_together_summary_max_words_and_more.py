@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_article_author_article_created_at_and_more'),
+        ('summarizer', '0004_summary_attempts_summary_lease_expires_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='summary',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='max_words',
+            field=models.PositiveIntegerField(default=150, help_text='Word budget the summary was generated for'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='summary',
+            unique_together={('article', 'ai_model', 'max_words')},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0005_alter_summary_unique_together_summary_max_words_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summary',
+            name='answered_by',
+            field=models.CharField(blank=True, help_text='The AI model that actually generated the summary, after routing and fallback', max_length=50, null=True),
+        ),
+    ]
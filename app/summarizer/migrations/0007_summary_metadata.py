@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0006_summary_answered_by'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summary',
+            name='metadata',
+            field=models.JSONField(blank=True, default=dict, help_text='Extra generation details, such as the class of the last error'),
+        ),
+    ]
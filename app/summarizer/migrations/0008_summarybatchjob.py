@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0007_summary_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SummaryBatchJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ai_model', models.CharField(help_text='The AI model every request in the batch uses', max_length=50)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('submitted', 'Submitted'), ('completed', 'Completed'), ('failed', 'Failed'), ('expired', 'Expired'), ('cancelled', 'Cancelled')], default='queued', help_text='Current status of the batch', max_length=20)),
+                ('provider_batch_id', models.CharField(blank=True, help_text='Batch id at the provider', max_length=100, null=True)),
+                ('provider_status', models.CharField(blank=True, help_text='Last batch status reported by the provider', max_length=20, null=True)),
+                ('input_file_id', models.CharField(blank=True, max_length=100, null=True)),
+                ('output_file_id', models.CharField(blank=True, max_length=100, null=True)),
+                ('error_file_id', models.CharField(blank=True, max_length=100, null=True)),
+                ('request_count', models.PositiveIntegerField(default=0, help_text='Number of summary requests submitted in the batch')),
+                ('completed_count', models.PositiveIntegerField(default=0, help_text='Number of summaries completed from the batch output')),
+                ('failed_count', models.PositiveIntegerField(default=0, help_text='Number of summaries that failed or were handed back to realtime generation')),
+                ('prompt_tokens', models.PositiveIntegerField(default=0)),
+                ('completion_tokens', models.PositiveIntegerField(default=0)),
+                ('error_message', models.TextField(blank=True, help_text='Error message if submitting or processing the batch failed', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('submitted_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Summary batch job',
+                'verbose_name_plural': 'Summary batch jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='summary',
+            name='batch_job',
+            field=models.ForeignKey(blank=True, help_text='Provider batch the summary was queued in, for non-urgent generation', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='summaries', to='summarizer.summarybatchjob'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0008_summarybatchjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParkedSummaryRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('latency_class', models.CharField(blank=True, help_text='Latency class the summary was requested with', max_length=20, null=True)),
+                ('parked_at', models.DateTimeField(auto_now_add=True)),
+                ('summary', models.OneToOneField(help_text='The pending summary to generate once the provider recovers', on_delete=django.db.models.deletion.CASCADE, related_name='parked_request', to='summarizer.summary')),
+            ],
+            options={
+                'verbose_name': 'Parked summary request',
+                'verbose_name_plural': 'Parked summary requests',
+                'ordering': ['parked_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0009_parkedsummaryrequest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summary',
+            name='prompt_version',
+            field=models.CharField(blank=True, db_index=True, help_text='Version hash of the prompt templates the summary was generated with', max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='summarybatchjob',
+            name='prompt_version',
+            field=models.CharField(blank=True, help_text='Version hash of the prompt templates the batch requests were written with', max_length=32, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0010_summary_prompt_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summary',
+            name='stale_since',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='When a re-fetch changed the article after this summary was completed', null=True),
+        ),
+    ]
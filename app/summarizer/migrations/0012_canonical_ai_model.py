@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:59
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+# The model registry as of this migration, frozen so later registry changes do not alter it
+CANONICAL_MODELS = {'gpt-4.1-nano', 'gpt-3.5-turbo', 'gpt-4', 'gpt-4-turbo', 'auto', 'extractive'}
+LOCAL_ANSWERS = {'quality-gate', 'extractive'}
+DEFAULT_MODEL = 'gpt-4.1-nano'
+ALIASES = {
+    'openai-gpt-4.1-nano': 'gpt-4.1-nano',
+    'gpt-4.1-nano-2025-04-14': 'gpt-4.1-nano',
+    'openai-gpt-3.5-turbo': 'gpt-3.5-turbo',
+    'openai-gpt-4': 'gpt-4',
+    'openai-gpt-4-turbo': 'gpt-4-turbo',
+    'gpt-4-turbo-preview': 'gpt-4-turbo',
+}
+STATUS_RANK = {'completed': 0, 'in_progress': 1, 'pending': 2, 'failed': 3}
+
+
+def canonical(name):
+    """Unknown models were summarized with the default model, so their rows belong to it."""
+    key = (name or '').strip().lower()
+    key = ALIASES.get(key, key)
+    return key if key in CANONICAL_MODELS else DEFAULT_MODEL
+
+
+def merge_model_aliases(apps, schema_editor):
+    """
+    Rename summaries to their canonical model. Where aliases left several rows for one
+    (article, model, length), keep the best one: completed first, then the most recent.
+    """
+    Summary = apps.get_model('summarizer', 'Summary')
+    SummaryBatchJob = apps.get_model('summarizer', 'SummaryBatchJob')
+
+    groups = defaultdict(list)
+    rows = Summary.objects.values_list('id', 'article_id', 'ai_model', 'max_words', 'status', 'completed_at')
+    for pk, article_id, ai_model, max_words, status, completed_at in rows.iterator():
+        groups[(article_id, canonical(ai_model), max_words)].append((pk, ai_model, status, completed_at))
+
+    duplicates = []
+    renamed = defaultdict(list)
+    for (_, model, _), group in groups.items():
+        if all(ai_model == model for _, ai_model, _, _ in group):
+            continue
+        group.sort(key=lambda row: (
+            STATUS_RANK.get(row[2], len(STATUS_RANK)),
+            -row[3].timestamp() if row[3] else 0,
+            row[0],
+        ))
+        keep, *rest = group
+        duplicates.extend(pk for pk, _, _, _ in rest)
+        if keep[1] != model:
+            renamed[model].append(keep[0])
+
+    # Duplicates go first, so the renamed rows do not collide with them
+    Summary.objects.filter(pk__in=duplicates).delete()
+    for model, pks in renamed.items():
+        Summary.objects.filter(pk__in=pks).update(ai_model=model)
+
+    answered = Summary.objects.exclude(answered_by__isnull=True).exclude(answered_by__in=CANONICAL_MODELS | LOCAL_ANSWERS)
+    for answered_by in set(answered.values_list('answered_by', flat=True)):
+        Summary.objects.filter(answered_by=answered_by).update(answered_by=canonical(answered_by))
+    for ai_model in set(SummaryBatchJob.objects.exclude(ai_model__in=CANONICAL_MODELS).values_list('ai_model', flat=True)):
+        SummaryBatchJob.objects.filter(ai_model=ai_model).update(ai_model=canonical(ai_model))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0011_summary_stale_since'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='summary',
+            name='ai_model',
+            field=models.CharField(default='gpt-4.1-nano', help_text='Canonical name of the AI model requested for summarization', max_length=50),
+        ),
+        migrations.RunPython(merge_model_aliases, migrations.RunPython.noop),
+    ]
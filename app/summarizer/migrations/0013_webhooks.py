@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0012_canonical_ai_model'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookEndpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(help_text='URL the events are POSTed to', max_length=500)),
+                ('secret', models.CharField(help_text='Key of the HMAC-SHA256 signature sent with every delivery', max_length=64)),
+                ('all_summaries', models.BooleanField(default=True, help_text='Receive events for every summary the user requests, not only those requested with this callback URL')),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(help_text='The API user the endpoint belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='webhook_endpoints', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Webhook endpoint',
+                'verbose_name_plural': 'Webhook endpoints',
+                'ordering': ['-created_at'],
+                'unique_together': {('user', 'url')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WebhookEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(help_text='summary.completed or summary.failed', max_length=40)),
+                ('payload', models.JSONField(default=dict, help_text='Event body, as of when the summary finished')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('delivered', 'Delivered'), ('failed', 'Failed')], db_index=True, default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Delivery attempts made so far')),
+                ('next_attempt_at', models.DateTimeField(db_index=True, help_text='When the event is due for its next delivery attempt')),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('delivered_at', models.DateTimeField(blank=True, null=True)),
+                ('endpoint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='summarizer.webhookendpoint')),
+                ('summary', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='webhook_events', to='summarizer.summary')),
+            ],
+            options={
+                'verbose_name': 'Webhook event',
+                'verbose_name_plural': 'Webhook events',
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='WebhookSubscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('endpoint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subscriptions', to='summarizer.webhookendpoint')),
+                ('summary', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='webhook_subscriptions', to='summarizer.summary')),
+            ],
+            options={
+                'verbose_name': 'Webhook subscription',
+                'verbose_name_plural': 'Webhook subscriptions',
+                'unique_together': {('endpoint', 'summary')},
+            },
+        ),
+    ]
@@ -28,8 +28,28 @@ class Summary(models.Model):
 
     ai_model = models.CharField(
         max_length=50,
-        default='openai-gpt-4.1-nano',
-        help_text="The AI model used for summarization"
+        default='gpt-4.1-nano',
+        help_text="Canonical name of the AI model requested for summarization"
+    )
+
+    answered_by = models.CharField(
+        max_length=50,
+        blank=True,
+        null=True,
+        help_text="The AI model that actually generated the summary, after routing and fallback"
+    )
+
+    prompt_version = models.CharField(
+        max_length=32,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="Version hash of the prompt templates the summary was generated with"
+    )
+
+    max_words = models.PositiveIntegerField(
+        default=150,
+        help_text="Word budget the summary was generated for"
     )
 
     status = models.CharField(
@@ -51,23 +71,99 @@ class Summary(models.Model):
         help_text="Number of tokens used by the AI model"
     )
 
+    prompt_tokens = models.IntegerField(
+        blank=True,
+        null=True,
+        help_text="Number of prompt (input) tokens reported by the AI model"
+    )
+
+    completion_tokens = models.IntegerField(
+        blank=True,
+        null=True,
+        help_text="Number of completion (output) tokens reported by the AI model"
+    )
+
     error_message = models.TextField(
         blank=True,
         null=True,
         help_text="Error message if summarization failed"
     )
 
+    metadata = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Extra generation details, such as the class of the last error"
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text="When the summary request was created"
     )
 
+    queued_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the summary was last queued for generation"
+    )
+
+    started_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When a worker started processing the summary"
+    )
+
+    llm_started_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the AI model call started"
+    )
+
+    llm_finished_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the AI model call returned"
+    )
+
     completed_at = models.DateTimeField(
         blank=True,
         null=True,
         help_text="When the summary was completed"
     )
 
+    stale_since = models.DateTimeField(
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="When a re-fetch changed the article after this summary was completed"
+    )
+
+    lease_owner = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="Worker currently holding the generation lease"
+    )
+
+    lease_expires_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the generation lease expires unless renewed"
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of times generation was started"
+    )
+
+    batch_job = models.ForeignKey(
+        'SummaryBatchJob',
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='summaries',
+        help_text="Provider batch the summary was queued in, for non-urgent generation"
+    )
+
     # Optional: Track who requested the summary
     requested_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -100,5 +196,259 @@ class Summary(models.Model):
         ordering = ['-created_at']
         verbose_name = "Summary"
         verbose_name_plural = "Summaries"
-        # Prevent duplicate summaries for the same article and model
-        unique_together = ['article', 'ai_model']
\ No newline at end of file
+        # Prevent duplicate summaries for the same article, model and length
+        unique_together = ['article', 'ai_model', 'max_words']
+
+
+class SummaryBatchJob(models.Model):
+    """A group of non-urgent summaries generated through the provider's Batch API."""
+
+    BATCH_STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('submitted', 'Submitted'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+        ('expired', 'Expired'),
+        ('cancelled', 'Cancelled'),
+    ]
+
+    ai_model = models.CharField(
+        max_length=50,
+        help_text="The AI model every request in the batch uses"
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=BATCH_STATUS_CHOICES,
+        default='queued',
+        help_text="Current status of the batch"
+    )
+
+    prompt_version = models.CharField(
+        max_length=32,
+        blank=True,
+        null=True,
+        help_text="Version hash of the prompt templates the batch requests were written with"
+    )
+
+    provider_batch_id = models.CharField(
+        max_length=100,
+        blank=True,
+        null=True,
+        help_text="Batch id at the provider"
+    )
+
+    provider_status = models.CharField(
+        max_length=20,
+        blank=True,
+        null=True,
+        help_text="Last batch status reported by the provider"
+    )
+
+    input_file_id = models.CharField(max_length=100, blank=True, null=True)
+    output_file_id = models.CharField(max_length=100, blank=True, null=True)
+    error_file_id = models.CharField(max_length=100, blank=True, null=True)
+
+    request_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of summary requests submitted in the batch"
+    )
+
+    completed_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of summaries completed from the batch output"
+    )
+
+    failed_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of summaries that failed or were handed back to realtime generation"
+    )
+
+    prompt_tokens = models.PositiveIntegerField(default=0)
+    completion_tokens = models.PositiveIntegerField(default=0)
+
+    error_message = models.TextField(
+        blank=True,
+        null=True,
+        help_text="Error message if submitting or processing the batch failed"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    submitted_at = models.DateTimeField(blank=True, null=True)
+    completed_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f"Batch {self.pk} ({self.ai_model}, {self.status})"
+
+    @property
+    def is_open(self):
+        return self.status in ('queued', 'submitted')
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "Summary batch job"
+        verbose_name_plural = "Summary batch jobs"
+
+
+class ParkedSummaryRequest(models.Model):
+    """A summary request held back while the LLM circuit breaker is open."""
+
+    summary = models.OneToOneField(
+        Summary,
+        on_delete=models.CASCADE,
+        related_name='parked_request',
+        help_text="The pending summary to generate once the provider recovers"
+    )
+
+    latency_class = models.CharField(
+        max_length=20,
+        blank=True,
+        null=True,
+        help_text="Latency class the summary was requested with"
+    )
+
+    parked_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Parked summary {self.summary_id}"
+
+    class Meta:
+        ordering = ['parked_at']
+        verbose_name = "Parked summary request"
+        verbose_name_plural = "Parked summary requests"
+
+
+class WebhookEndpoint(models.Model):
+    """A URL of an API user that summary completion events are delivered to, signed with its secret."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='webhook_endpoints',
+        help_text="The API user the endpoint belongs to"
+    )
+
+    url = models.URLField(
+        max_length=500,
+        help_text="URL the events are POSTed to"
+    )
+
+    secret = models.CharField(
+        max_length=64,
+        help_text="Key of the HMAC-SHA256 signature sent with every delivery"
+    )
+
+    all_summaries = models.BooleanField(
+        default=True,
+        help_text="Receive events for every summary the user requests, not only those requested with this callback URL"
+    )
+
+    is_active = models.BooleanField(default=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Webhook {self.url} ({self.user})"
+
+    class Meta:
+        ordering = ['-created_at']
+        unique_together = ['user', 'url']
+        verbose_name = "Webhook endpoint"
+        verbose_name_plural = "Webhook endpoints"
+
+
+class WebhookSubscription(models.Model):
+    """An endpoint waiting for a summary to finish; turned into an event when it does."""
+
+    endpoint = models.ForeignKey(
+        WebhookEndpoint,
+        on_delete=models.CASCADE,
+        related_name='subscriptions'
+    )
+
+    summary = models.ForeignKey(
+        Summary,
+        on_delete=models.CASCADE,
+        related_name='webhook_subscriptions'
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Summary {self.summary_id} -> {self.endpoint_id}"
+
+    class Meta:
+        unique_together = ['endpoint', 'summary']
+        verbose_name = "Webhook subscription"
+        verbose_name_plural = "Webhook subscriptions"
+
+
+class WebhookEvent(models.Model):
+    """Outbox row for a summary completion event, delivered in batches per endpoint."""
+
+    EVENT_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('delivered', 'Delivered'),
+        ('failed', 'Failed'),
+    ]
+
+    endpoint = models.ForeignKey(
+        WebhookEndpoint,
+        on_delete=models.CASCADE,
+        related_name='events'
+    )
+
+    summary = models.ForeignKey(
+        Summary,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='webhook_events'
+    )
+
+    event_type = models.CharField(
+        max_length=40,
+        help_text="summary.completed or summary.failed"
+    )
+
+    payload = models.JSONField(
+        default=dict,
+        help_text="Event body, as of when the summary finished"
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=EVENT_STATUS_CHOICES,
+        default='pending',
+        db_index=True
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="Delivery attempts made so far"
+    )
+
+    next_attempt_at = models.DateTimeField(
+        db_index=True,
+        help_text="When the event is due for its next delivery attempt"
+    )
+
+    last_error = models.TextField(
+        blank=True,
+        null=True
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    delivered_at = models.DateTimeField(
+        blank=True,
+        null=True
+    )
+
+    def __str__(self):
+        return f"{self.event_type} for summary {self.summary_id} ({self.status})"
+
+    class Meta:
+        ordering = ['created_at']
+        verbose_name = "Webhook event"
+        verbose_name_plural = "Webhook events"
@@ -0,0 +1,134 @@
+"""Push notifications for finished summaries over Redis pub/sub."""
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Set
+
+import redis
+from django.conf import settings
+
+from .webhooks import emit_summary_event
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "summarizer:summary_finished:"
+
+_redis_client = None
+
+
+def get_redis_client():
+    """Shared Redis client for summary notifications."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.SUMMARIZER_NOTIFICATIONS_REDIS_URL)
+    return _redis_client
+
+
+def publish_summary_finished(summary_id: int, status: str) -> None:
+    """
+    Publish that a summary reached a final state, to waiting requests and to the webhook
+    outbox. Failures are logged, never raised.
+    """
+    try:
+        get_redis_client().publish(
+            f"{CHANNEL_PREFIX}{summary_id}",
+            json.dumps({"summary_id": summary_id, "status": status}),
+        )
+    except Exception as e:
+        logger.error(f"Could not publish completion of summary {summary_id}: {e}")
+    try:
+        emit_summary_event(summary_id, status)
+    except Exception as e:
+        logger.error(f"Could not record webhook events for summary {summary_id}: {e}")
+
+
+class SummaryNotificationHub:
+    """
+    Multiplexes waiting requests onto a single pattern subscription per process.
+    Each waiter registers an Event for its summary id; one listener thread wakes
+    all waiters of a summary when its completion message arrives.
+    """
+
+    def __init__(self, redis_client=None):
+        self._redis_client = redis_client
+        self._waiters: Dict[int, Set[threading.Event]] = {}
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+
+    @contextmanager
+    def subscribe(self, summary_id: int):
+        """
+        Register interest in a summary and yield the Event that is set when it finishes.
+        Callers should re-check the summary after subscribing to avoid missing a
+        completion that happened just before.
+        """
+        self._ensure_listener()
+        event = threading.Event()
+        with self._lock:
+            self._waiters.setdefault(summary_id, set()).add(event)
+        try:
+            yield event
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(summary_id)
+                if waiters is not None:
+                    waiters.discard(event)
+                    if not waiters:
+                        del self._waiters[summary_id]
+
+    def wait(self, summary_id: int, timeout: float) -> bool:
+        """Block until the summary finishes or the timeout elapses."""
+        with self.subscribe(summary_id) as event:
+            return event.wait(timeout)
+
+    def waiter_count(self) -> int:
+        with self._lock:
+            return sum(len(waiters) for waiters in self._waiters.values())
+
+    def _dispatch(self, message: Dict) -> None:
+        """Wake every waiter of the summary named in a pub/sub message."""
+        channel = message.get("channel")
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8")
+        try:
+            summary_id = int(str(channel).removeprefix(CHANNEL_PREFIX))
+        except ValueError:
+            return
+        with self._lock:
+            waiters = list(self._waiters.get(summary_id, ()))
+        for event in waiters:
+            event.set()
+
+    def _ensure_listener(self) -> None:
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen, name="summary-notification-hub", daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = (self._redis_client or get_redis_client()).pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                for message in pubsub.listen():
+                    self._dispatch(message)
+            except Exception as e:
+                logger.error(f"Summary notification listener error, reconnecting: {e}")
+                time.sleep(1)
+
+
+_hub = None
+_hub_lock = threading.Lock()
+
+
+def get_notification_hub() -> SummaryNotificationHub:
+    """The per-process notification hub."""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = SummaryNotificationHub()
+        return _hub
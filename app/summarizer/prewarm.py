@@ -0,0 +1,227 @@
+"""
+Summary prewarming for articles readers are likely to open.
+
+Request signals (detail views and list impressions) are counted per article in the
+Django cache. A periodic task ranks recent articles by those signals, the
+popularity of their source and their age, and enqueues summaries for the top
+ones, so the first reader finds the summary already completed. Opening an
+article's detail page also enqueues its summary speculatively. Both spend from a
+shared hourly budget of estimated tokens.
+"""
+import logging
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from . import metrics
+from .chunking import estimate_tokens
+from .lengths import DEFAULT_MAX_WORDS
+from .models import Summary
+from .service import SummarizerService
+from articles.models import Article
+
+logger = logging.getLogger(__name__)
+
+PREWARM_PREFIX = "summarizer:prewarm:"
+VIEW = "view"
+IMPRESSION = "impression"
+
+
+def _signal_key(kind: str, article_id) -> str:
+    return f"{PREWARM_PREFIX}{kind}:{article_id}"
+
+
+def _incr(key: str, amount: int = 1) -> None:
+    timeout = settings.SUMMARIZER_PREWARM_SIGNAL_TTL
+    if cache.add(key, amount, timeout=timeout):
+        return
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        cache.set(key, amount, timeout=timeout)
+
+
+def record_view(article_id) -> None:
+    """Count a detail view of an article."""
+    _incr(_signal_key(VIEW, article_id))
+
+
+def record_impressions(article_ids: Iterable) -> None:
+    """Count an appearance of each article in a list response."""
+    for article_id in article_ids:
+        _incr(_signal_key(IMPRESSION, article_id))
+
+
+def record_list_page(path: str, article_ids: Optional[List] = None) -> None:
+    """
+    Count impressions for a page of the article list. Pages served from the page
+    cache carry no data, so the ids of each page are remembered when it is rendered.
+    """
+    page_key = f"{PREWARM_PREFIX}page:{path}"
+    if article_ids is not None:
+        cache.set(page_key, article_ids, timeout=settings.SUMMARIZER_PREWARM_SIGNAL_TTL)
+    else:
+        article_ids = cache.get(page_key, [])
+    record_impressions(article_ids)
+
+
+def record_summary_request(summary) -> None:
+    """
+    Count the first summary request of each article, and whether its summary was
+    already completed then. Later requests would count cache hits, not prewarming.
+    """
+    # Articles older than the lookback are not prewarmed, so their first hits need not be remembered
+    timeout = settings.SUMMARIZER_PREWARM_LOOKBACK_HOURS * 3600
+    if not cache.add(_signal_key("first_hit", summary.article_id), 1, timeout=timeout):
+        return
+    metrics.incr("summary_first_requests")
+    if summary.status == "completed":
+        metrics.incr("summary_first_requests_completed")
+
+
+def rank_articles(limit: int = None) -> List[Tuple[Article, float]]:
+    """Recent articles ordered by prewarm score (see score_articles), highest first."""
+    since = timezone.now() - timedelta(hours=settings.SUMMARIZER_PREWARM_LOOKBACK_HOURS)
+    articles = list(
+        Article.objects.filter(published_date__gte=since)
+        .order_by("-published_date")
+        .only("id", "source", "published_date", "content")[: settings.SUMMARIZER_PREWARM_CANDIDATES]
+    )
+    scores = score_articles(articles)
+    ranked = [
+        (article, scores[article.id]) for article in articles
+        if scores[article.id] >= settings.SUMMARIZER_PREWARM_MIN_SCORE
+    ]
+    ranked.sort(key=lambda item: item[1], reverse=True)
+    return ranked[:limit] if limit else ranked
+
+
+def score_articles(articles: List[Article]) -> Dict[int, float]:
+    """
+    Score of each article by how likely readers are to open it. The score weighs
+    detail views, list impressions and the share of views that went to the
+    article's source, and halves every SUMMARIZER_PREWARM_HALF_LIFE_HOURS of article age.
+    """
+    if not articles:
+        return {}
+    now = timezone.now()
+    keys = [_signal_key(kind, article.id) for article in articles for kind in (VIEW, IMPRESSION)]
+    signals = cache.get_many(keys)
+    views = {article.id: signals.get(_signal_key(VIEW, article.id), 0) for article in articles}
+    impressions = {article.id: signals.get(_signal_key(IMPRESSION, article.id), 0) for article in articles}
+
+    source_views = defaultdict(int)
+    for article in articles:
+        source_views[article.source] += views[article.id]
+    total_views = sum(source_views.values())
+
+    weights = settings.SUMMARIZER_PREWARM_WEIGHTS
+    scores = {}
+    for article in articles:
+        source_share = source_views[article.source] / total_views if total_views else 0.0
+        score = (
+            weights["view"] * views[article.id]
+            + weights["impression"] * impressions[article.id]
+            + weights["source"] * source_share
+        )
+        age_hours = max((now - article.published_date).total_seconds() / 3600, 0.0)
+        score *= 0.5 ** (age_hours / settings.SUMMARIZER_PREWARM_HALF_LIFE_HOURS)
+        scores[article.id] = round(score, 4)
+    return scores
+
+
+def take_budget(tokens: int, prefix: str = PREWARM_PREFIX, budget: int = None) -> bool:
+    """
+    Spend estimated tokens from this hour's budget, if enough is left. Defaults to
+    the prewarm budget; other background work passes its own prefix and budget.
+    """
+    budget = budget or settings.SUMMARIZER_PREWARM_TOKEN_BUDGET
+    key = f"{prefix}budget:{int(time.time() // 3600)}"
+    if cache.add(key, tokens, timeout=2 * 3600):
+        spent = tokens
+    else:
+        try:
+            spent = cache.incr(key, tokens)
+        except ValueError:
+            cache.set(key, tokens, timeout=2 * 3600)
+            spent = tokens
+    if spent > budget:
+        cache.decr(key, tokens)
+        return False
+    return True
+
+
+def _estimated_tokens(article: Article) -> int:
+    return estimate_tokens(article.content) + settings.SUMMARIZER_LIMITER_COMPLETION_TOKENS
+
+
+def prewarm_summaries(service: SummarizerService = None, top_n: int = None) -> Dict[str, int]:
+    """Enqueue default summaries for the top-ranked articles that have none yet, within the budget."""
+    service = service or SummarizerService()
+    top_n = top_n or settings.SUMMARIZER_PREWARM_TOP_N
+    ranked = rank_articles()
+    existing = set(
+        Summary.objects.filter(
+            article_id__in=[article.id for article, _ in ranked],
+            ai_model=service.default_model,
+            max_words=DEFAULT_MAX_WORDS,
+        ).values_list("article_id", flat=True)
+    )
+    enqueued = over_budget = 0
+    for article, score in ranked:
+        if enqueued >= top_n:
+            break
+        if article.id in existing:
+            continue
+        if not take_budget(_estimated_tokens(article)):
+            over_budget += 1
+            break
+        service.summarize_article_async(article.id)
+        enqueued += 1
+    metrics.incr("prewarm_enqueued", enqueued)
+    if over_budget:
+        logger.warning(f"Summary prewarm stopped at the hourly token budget after {enqueued} summaries")
+    return {"ranked": len(ranked), "enqueued": enqueued, "over_budget": over_budget}
+
+
+def speculative_prewarm(article_id) -> bool:
+    """
+    Enqueue the default summary of an article whose detail page was just opened.
+    Each article is checked at most once per SUMMARIZER_PREWARM_SPECULATIVE_COOLDOWN.
+    """
+    if not settings.SUMMARIZER_PREWARM_SPECULATIVE:
+        return False
+    if not cache.add(f"{PREWARM_PREFIX}speculative:{article_id}", 1,
+                     timeout=settings.SUMMARIZER_PREWARM_SPECULATIVE_COOLDOWN):
+        return False
+    service = SummarizerService()
+    if Summary.objects.filter(article_id=article_id, ai_model=service.default_model,
+                              max_words=DEFAULT_MAX_WORDS).exists():
+        return False
+    try:
+        article = Article.objects.only("id", "content").get(id=article_id)
+    except Article.DoesNotExist:
+        return False
+    if not take_budget(_estimated_tokens(article)):
+        return False
+    service.summarize_article_async(article.id)
+    metrics.incr("prewarm_speculative")
+    return True
+
+
+def prewarm_stats() -> Dict:
+    counters = metrics.get_counters([
+        "prewarm_enqueued", "prewarm_speculative", "summary_first_requests", "summary_first_requests_completed",
+    ])
+    return {
+        "enqueued": counters["prewarm_enqueued"],
+        "speculative": counters["prewarm_speculative"],
+        "first_hit_completed_rate": metrics.ratio(
+            counters["summary_first_requests_completed"], counters["summary_first_requests"]
+        ),
+    }
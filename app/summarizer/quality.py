@@ -0,0 +1,71 @@
+"""
+Content-quality gate run before summarization.
+
+Many fetched articles have empty or truncated content, or content that only
+repeats the description. Such articles are not worth an LLM call: they get a
+deterministic summary built from the description or title instead, stored with
+`answered_by` set to QUALITY_GATE_MODEL.
+"""
+import re
+from typing import Dict
+
+from django.conf import settings
+
+from . import metrics
+
+QUALITY_GATE_MODEL = "quality-gate"
+
+# NewsAPI cuts content off with a marker such as "… [+2345 chars]"
+_TRUNCATION_RE = re.compile(r"\s*(…|\.\.\.)?\s*\[\+\d+ chars\]\s*$")
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w+")
+
+
+def usable_text(text: str) -> str:
+    """Article text without HTML tags, the truncation marker and surplus whitespace."""
+    text = _TAG_RE.sub(" ", text or "")
+    text = _TRUNCATION_RE.sub("", text)
+    return " ".join(text.split())
+
+
+def _words(text: str):
+    return [word.lower() for word in _WORD_RE.findall(text)]
+
+
+def content_score(article) -> int:
+    """
+    Number of usable content words that add something to the title and description.
+    Content that only repeats the description scores close to zero.
+    """
+    content_words = _words(usable_text(article.content))
+    known = set(_words(usable_text(article.title)) + _words(usable_text(article.description)))
+    return sum(1 for word in content_words if word not in known)
+
+
+def passes_quality_gate(article) -> bool:
+    """Whether an article has enough usable content to be worth an LLM call. Counted in the gate metrics."""
+    if not settings.SUMMARIZER_QUALITY_GATE_ENABLED:
+        return True
+    passed = content_score(article) >= settings.SUMMARIZER_QUALITY_MIN_SCORE
+    metrics.incr("quality_gate_checked")
+    if not passed:
+        metrics.incr("quality_gate_skipped")
+    return passed
+
+
+def trivial_summary(article, max_words: int) -> str:
+    """Deterministic summary of a trivial article: its description, or else its title, cut to `max_words`."""
+    text = usable_text(article.description) or usable_text(article.content) or usable_text(article.title)
+    words = text.split()
+    if len(words) <= max_words:
+        return text
+    return " ".join(words[:max_words]).rstrip(",;:") + "…"
+
+
+def quality_gate_stats() -> Dict:
+    counters = metrics.get_counters(["quality_gate_checked", "quality_gate_skipped"])
+    return {
+        "checked": counters["quality_gate_checked"],
+        "llm_calls_avoided": counters["quality_gate_skipped"],
+        "skip_rate": metrics.ratio(counters["quality_gate_skipped"], counters["quality_gate_checked"]),
+    }
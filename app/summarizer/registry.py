@@ -0,0 +1,72 @@
+"""
+Registry of the AI models summaries can be requested with.
+
+Every entry point (views, service, tasks, admin) resolves the requested model to
+its canonical name, so aliases of one model share their summary rows and cache
+entries and each (article, model, length) is generated once. Unknown models are
+rejected instead of being summarized with the default model under their own name.
+
+"auto" stays a key of its own rather than being keyed by the model the router picks:
+that choice depends on the latency class and on model health at generation time, and
+a fallback can hand the call to yet another model, so it is not known when the row
+is created. All "auto" requests share one row and cache entry; the model that wrote
+the summary is recorded in `answered_by`.
+"""
+from typing import List, Optional
+
+from .errors import InvalidRequestError
+from .extractive import EXTRACTIVE_MODEL
+from .router import AUTO_MODEL
+
+DEFAULT_MODEL = "gpt-4.1-nano"
+
+# Canonical name -> model id sent to the provider
+PROVIDER_MODELS = {
+    "gpt-4.1-nano": "gpt-4.1-nano",
+    "gpt-3.5-turbo": "gpt-3.5-turbo",
+    "gpt-4": "gpt-4",
+    "gpt-4-turbo": "gpt-4-turbo-preview",
+}
+
+# Models answered without a provider model of their own: the router and the local summarizer
+PSEUDO_MODELS = (AUTO_MODEL, EXTRACTIVE_MODEL)
+
+# Other names callers use for a canonical model
+ALIASES = {
+    "openai-gpt-4.1-nano": "gpt-4.1-nano",
+    "gpt-4.1-nano-2025-04-14": "gpt-4.1-nano",
+    "openai-gpt-3.5-turbo": "gpt-3.5-turbo",
+    "openai-gpt-4": "gpt-4",
+    "openai-gpt-4-turbo": "gpt-4-turbo",
+    "gpt-4-turbo-preview": "gpt-4-turbo",
+}
+
+
+class UnknownModelError(InvalidRequestError):
+    """Raised for a model name that is neither a registered model nor an alias of one."""
+
+
+def canonical_model(name: Optional[str], default: str = DEFAULT_MODEL) -> str:
+    """Canonical name of a model or alias, case-insensitively; `default` when no model is given."""
+    if name is None or (isinstance(name, str) and not name.strip()):
+        return default
+    if not isinstance(name, str):
+        raise UnknownModelError(f"Unknown AI model: {name!r}")
+    key = name.strip().lower()
+    key = ALIASES.get(key, key)
+    if key not in PROVIDER_MODELS and key not in PSEUDO_MODELS:
+        raise UnknownModelError(f"Unknown AI model: {name!r}")
+    return key
+
+
+def provider_model(name: Optional[str], default: str = DEFAULT_MODEL) -> str:
+    """Model id the provider is called with for a model or alias. Pseudo models have none."""
+    model = canonical_model(name, default)
+    if model not in PROVIDER_MODELS:
+        raise UnknownModelError(f"{name!r} is not a provider model")
+    return PROVIDER_MODELS[model]
+
+
+def model_names() -> List[str]:
+    """Canonical names of every model that can be requested."""
+    return list(PROVIDER_MODELS) + list(PSEUDO_MODELS)
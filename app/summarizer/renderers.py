@@ -0,0 +1,19 @@
+"""Renderers for the summarizer app."""
+from rest_framework.renderers import BaseRenderer
+
+from .streaming import format_sse
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Accepts `text/event-stream` for streaming endpoints.
+    Streaming responses bypass rendering; regular responses (errors) become a single `error` event.
+    """
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return format_sse('error', data).encode(self.charset)
@@ -0,0 +1,134 @@
+"""
+Selective re-summarization after a prompt change.
+
+Every summary records the version hash of the prompt templates it was generated
+with (SummarizerService.prompt_version). The planner picks completed summaries made
+with another version, ranks them by the same traffic signals and age decay as
+prewarming, and enqueues regenerations within an hourly token budget. A prompt
+upgrade so reaches the most read summaries first, without a pass over the whole
+corpus. Old summaries keep being served until their regeneration replaces them.
+
+Summaries of articles a re-fetch found changed are marked stale (stale_since) and
+take the same path, ahead of prompt upgrades, so publisher corrections propagate.
+"""
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Q, QuerySet
+from django.utils import timezone
+
+from . import metrics
+from .chunking import estimate_tokens
+from .models import Summary
+from .prewarm import score_articles, take_budget
+from .service import LOCAL_MODELS, SummarizerService
+
+logger = logging.getLogger(__name__)
+
+RESUMMARIZE_PREFIX = "summarizer:resummarize:"
+
+
+def stale_summaries(prompt_version: str) -> QuerySet:
+    """
+    Completed summaries generated with another prompt version, or before versions were
+    recorded, or whose article changed since.
+    """
+    return (
+        Summary.objects.filter(status="completed")
+        .filter(~Q(prompt_version=prompt_version) | Q(stale_since__isnull=False))
+        .exclude(answered_by__in=LOCAL_MODELS)
+    )
+
+
+def invalidate_article_summaries(article_ids: Iterable[int]) -> Dict[str, int]:
+    """
+    Mark the completed summaries of changed articles stale, for background regeneration.
+    Summaries made without the LLM are deleted instead: they are cheap to make again
+    on the next read. Summaries still being generated re-check the article when they
+    complete (SummarizerService._apply_completed).
+    """
+    article_ids = list(article_ids)
+    if not article_ids:
+        return {"stale": 0, "deleted": 0}
+    completed = Summary.objects.filter(article_id__in=article_ids, status="completed")
+    deleted, _ = completed.filter(answered_by__in=LOCAL_MODELS).delete()
+    stale_ids = list(completed.exclude(answered_by__in=LOCAL_MODELS).values_list("pk", flat=True))
+    Summary.objects.filter(pk__in=stale_ids).update(stale_since=timezone.now())
+    # A regeneration enqueued before the change would be refused, so allow a new one
+    cache.delete_many([f"{RESUMMARIZE_PREFIX}enqueued:{pk}" for pk in stale_ids])
+    metrics.incr("resummarize_invalidated", len(stale_ids))
+    return {"stale": len(stale_ids), "deleted": deleted}
+
+
+def plan_resummarization(service: SummarizerService = None, limit: int = None) -> List[Tuple[Summary, float]]:
+    """
+    Stale summaries in the order they should be regenerated: those of changed articles
+    first, then by the score of their article (traffic, decayed by age), then the most
+    recently published first.
+    """
+    service = service or SummarizerService()
+    candidates = list(
+        stale_summaries(service.prompt_version)
+        .select_related("article")
+        .order_by(F("stale_since").desc(nulls_last=True), "-article__published_date")
+        [: settings.SUMMARIZER_RESUMMARIZE_CANDIDATES]
+    )
+    scores = score_articles(list({summary.article_id: summary.article for summary in candidates}.values()))
+    candidates.sort(
+        key=lambda summary: (
+            summary.stale_since is not None, scores[summary.article_id], summary.article.published_date
+        ),
+        reverse=True,
+    )
+    planned = [(summary, scores[summary.article_id]) for summary in candidates]
+    return planned[:limit] if limit else planned
+
+
+def resummarize_stale_summaries(service: SummarizerService = None, top_n: int = None) -> Dict[str, int]:
+    """Enqueue regeneration of the highest ranked stale summaries, within the hourly token budget."""
+    from .tasks import resummarize_summary_task
+    service = service or SummarizerService()
+    top_n = top_n or settings.SUMMARIZER_RESUMMARIZE_TOP_N
+    planned = plan_resummarization(service)
+    enqueued = over_budget = 0
+    for summary, score in planned:
+        if enqueued >= top_n:
+            break
+        # Enqueued once per lock period, so slow regenerations are not piled up
+        lock_key = f"{RESUMMARIZE_PREFIX}enqueued:{summary.pk}"
+        if not cache.add(lock_key, 1, timeout=settings.SUMMARIZER_RESUMMARIZE_LOCK_SECONDS):
+            continue
+        tokens = estimate_tokens(summary.article.content) + settings.SUMMARIZER_LIMITER_COMPLETION_TOKENS
+        if not take_budget(tokens, RESUMMARIZE_PREFIX, settings.SUMMARIZER_RESUMMARIZE_TOKEN_BUDGET):
+            cache.delete(lock_key)
+            over_budget += 1
+            break
+        resummarize_summary_task.delay(summary.pk)
+        enqueued += 1
+    metrics.incr("resummarize_enqueued", enqueued)
+    if over_budget:
+        logger.warning(f"Re-summarization stopped at the hourly token budget after {enqueued} summaries")
+    return {"planned": len(planned), "enqueued": enqueued, "over_budget": over_budget}
+
+
+def prompt_version_counts() -> Dict[str, int]:
+    """Completed summaries per prompt version; summaries made without a prompt are left out."""
+    rows = (
+        Summary.objects.filter(status="completed")
+        .exclude(answered_by__in=LOCAL_MODELS)
+        .values("prompt_version")
+        .annotate(count=Count("id"))
+    )
+    return {row["prompt_version"] or "unknown": row["count"] for row in rows}
+
+
+def resummarize_stats() -> Dict:
+    counters = metrics.get_counters(["resummarize_enqueued", "resummarize_regenerated", "resummarize_invalidated"])
+    return {
+        "enqueued": counters["resummarize_enqueued"],
+        "regenerated": counters["resummarize_regenerated"],
+        "invalidated": counters["resummarize_invalidated"],
+        "stale_content": Summary.objects.filter(status="completed", stale_since__isnull=False).count(),
+    }
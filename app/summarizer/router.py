@@ -0,0 +1,150 @@
+"""
+Latency- and cost-aware routing of summaries across AI models.
+
+Each model's recent latency and error rate are tracked as exponentially weighted
+moving averages in the Django cache, so every web process and worker shares them.
+"""
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+import openai
+from django.conf import settings
+from django.core.cache import cache
+
+from .chunking import estimate_tokens
+from .errors import CONTENT, InvalidRequestError, classify_error
+from .limiter import ModelRateLimiter
+
+logger = logging.getLogger(__name__)
+
+AUTO_MODEL = "auto"
+HEALTH_PREFIX = "summarizer:router:health:"
+
+# Provider-side failures worth retrying on another model; other errors are raised as is
+FALLBACK_ERRORS = (openai.APIError, httpx.TimeoutException, TimeoutError)
+
+
+class ModelRouter:
+    """
+    Picks the model for a summary and the models to fall back to.
+
+    Candidates are tried cheapest first. Short articles always go to the cheapest
+    model. Otherwise a model is skipped while its error rate is above
+    SUMMARIZER_ROUTER_MAX_ERROR_RATE or its recent latency misses the target of
+    the requested latency class, so traffic moves away from a degraded model.
+    """
+
+    def __init__(self, model_map: Optional[Dict[str, str]] = None):
+        self.model_map = model_map
+
+    def route(self, ai_model: str, content: str = "", latency_class: str = None) -> List[str]:
+        """Models to try in order: the chosen model followed by its fallbacks."""
+        if ai_model == AUTO_MODEL:
+            primary = self.choose(content, latency_class)
+        else:
+            primary = ai_model
+        fallbacks = [primary] + [
+            model for model in settings.SUMMARIZER_ROUTER_FALLBACKS.get(primary, [])
+            if model != primary and self._known(model)
+        ]
+        if ai_model == AUTO_MODEL:
+            fallbacks += [model for model in self._candidates() if model not in fallbacks]
+        return fallbacks
+
+    def choose(self, content: str = "", latency_class: str = None) -> str:
+        """The cheapest healthy model that meets the latency class."""
+        candidates = self._candidates()
+        if estimate_tokens(content) <= settings.SUMMARIZER_ROUTER_SHORT_CONTENT_TOKENS:
+            short_model = candidates[0]
+            if self.is_healthy(short_model):
+                return short_model
+
+        target = settings.SUMMARIZER_ROUTER_LATENCY_TARGETS.get(
+            latency_class or settings.SUMMARIZER_ROUTER_DEFAULT_LATENCY_CLASS
+        )
+        for model in candidates:
+            health = self.health(model)
+            if not self.is_healthy(model):
+                continue
+            if target is not None and health["latency"] is not None and health["latency"] > target:
+                continue
+            return model
+
+        # Everything is degraded: take the model failing least often
+        return min(candidates, key=lambda model: self.health(model)["error_rate"])
+
+    def call(
+        self, ai_model: str, content: str, latency_class: str, generate: Callable[[str], object]
+    ) -> Tuple[object, str]:
+        """
+        Run `generate(model)` on the routed models until one succeeds, recording
+        latency and errors. Returns the result and the model that answered.
+        """
+        last_error = None
+        tokens = self.estimated_tokens(content)
+        for model in self.route(ai_model, content, latency_class):
+            try:
+                with ModelRateLimiter(model).slot(tokens):
+                    started = time.monotonic()
+                    result = generate(model)
+            except FALLBACK_ERRORS as e:
+                if classify_error(e) == CONTENT:
+                    # The request itself was rejected, so another model would reject it too
+                    raise
+                self.record_failure(model)
+                logger.error(f"Model {model} failed, trying fallback: {e}")
+                last_error = e
+                continue
+            self.record_success(model, time.monotonic() - started)
+            return result, model
+        raise last_error
+
+    @staticmethod
+    def estimated_tokens(content: str) -> int:
+        """Tokens a call is expected to use, reserved against the model's tokens-per-minute limit."""
+        return estimate_tokens(content) + settings.SUMMARIZER_LIMITER_COMPLETION_TOKENS
+
+    def health(self, model: str) -> Dict:
+        return cache.get(self._health_key(model)) or {"latency": None, "error_rate": 0.0, "samples": 0}
+
+    def is_healthy(self, model: str) -> bool:
+        return self.health(model)["error_rate"] <= settings.SUMMARIZER_ROUTER_MAX_ERROR_RATE
+
+    def record_success(self, model: str, latency: float) -> None:
+        self._record(model, latency=latency, error=0.0)
+
+    def record_failure(self, model: str) -> None:
+        self._record(model, latency=None, error=1.0)
+
+    def stats(self) -> Dict[str, Dict]:
+        return {model: self.health(model) for model in self._candidates()}
+
+    def _record(self, model: str, latency: Optional[float], error: float) -> None:
+        # Read-modify-write without a lock: a lost update only skews an average slightly
+        alpha = settings.SUMMARIZER_ROUTER_EWMA_ALPHA
+        health = self.health(model)
+        health["error_rate"] = round((1 - alpha) * health["error_rate"] + alpha * error, 4)
+        if latency is not None:
+            previous = health["latency"]
+            health["latency"] = round(latency if previous is None else (1 - alpha) * previous + alpha * latency, 3)
+        health["samples"] += 1
+        cache.set(self._health_key(model), health, timeout=settings.SUMMARIZER_ROUTER_HEALTH_TIMEOUT)
+
+    def _candidates(self) -> List[str]:
+        return [model for model in settings.SUMMARIZER_ROUTER_CANDIDATES if self._known(model)]
+
+    def _known(self, model: str) -> bool:
+        return self.model_map is None or model in self.model_map
+
+    @staticmethod
+    def _health_key(model: str) -> str:
+        return f"{HEALTH_PREFIX}{model}"
+
+
+def validate_latency_class(latency_class: Optional[str]) -> Optional[str]:
+    """Raise InvalidRequestError, a ValueError, for latency classes that are not configured."""
+    if latency_class and latency_class not in settings.SUMMARIZER_ROUTER_LATENCY_TARGETS:
+        raise InvalidRequestError(f"Unknown latency class: {latency_class!r}")
+    return latency_class or None
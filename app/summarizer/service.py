@@ -1,10 +1,44 @@
+import hashlib
+import json
 import logging
 import os
-from typing import Dict, Optional
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Length
 from django.utils import timezone
 
-from .models import Summary
+from . import metrics
+from .batch import (
+    FINAL_PROVIDER_STATUSES,
+    LEASE_OWNER_PREFIX,
+    chat_messages,
+    get_batch_client,
+    lease_owner,
+    read_results as read_batch_results,
+    request_line,
+    result_completion,
+    result_error,
+    submit as submit_batch,
+)
+from .breaker import CircuitBreaker, park_summary
+from .cache import SummaryCache
+from .compression import COMPRESSION_VERSION, compress_for_prompt
+from .errors import CONTENT, RETRYABLE_CLASSES, InvalidRequestError, classify_error, error_metadata
+from .extractive import EXTRACTIVE_MODEL, cached_extractive_summary
+from .fake_llm import FakeSummaryChatModel
+from .hedging import hedge_delay, hedged_call, should_hedge
+from .lengths import resolve_lengths, resolve_max_words
+from .limiter import ModelRateLimiter
+from .registry import DEFAULT_MODEL, PROVIDER_MODELS, canonical_model, provider_model
+from .router import FALLBACK_ERRORS, ModelRouter, validate_latency_class
+from .leases import LeaseHeartbeat, claim_summary, fail_leased, new_lease_owner, release_lease
+from .chunking import estimate_tokens, split_into_chunks
+from .models import Summary, SummaryBatchJob
+from .quality import QUALITY_GATE_MODEL, passes_quality_gate, trivial_summary
 from articles.models import Article
 
 from langchain_openai import ChatOpenAI
@@ -12,25 +46,34 @@ from langchain.prompts import ChatPromptTemplate
 
 logger = logging.getLogger(__name__)
 
+# Summaries answered without an AI model, and so without a prompt
+LOCAL_MODELS = (QUALITY_GATE_MODEL, EXTRACTIVE_MODEL)
+
+# Summary fields written when batch results are ingested
+BATCH_RESULT_FIELDS = [
+    "summary_text", "answered_by", "prompt_version", "tokens_used", "prompt_tokens", "completion_tokens",
+    "word_count", "status", "completed_at", "stale_since", "error_message", "metadata", "lease_owner",
+    "lease_expires_at",
+]
+
+# Summary fields written when a summary is regenerated with the current prompt
+RESUMMARIZE_FIELDS = BATCH_RESULT_FIELDS + ["llm_started_at", "llm_finished_at"]
+
 class SummarizerService:
     """Service for generating article summaries using OpenAI models via LangChain."""
 
     def __init__(self):
-        # Prepare model mapping for future flexibility
-        self.model_map = {
-            "gpt-4.1-nano": "gpt-4.1-nano",
-            "gpt-3.5-turbo": "gpt-3.5-turbo",
-            "gpt-4": "gpt-4",
-            "gpt-4-turbo": "gpt-4-turbo-preview",
-        }
-        self.default_model = "gpt-4.1-nano"
+        # Canonical model names and the provider models they call
+        self.model_map = dict(PROVIDER_MODELS)
+        self.default_model = DEFAULT_MODEL
         self.openai_api_key = os.environ.get("OPENAI_API_KEY", None)
+        self.llm_backend = settings.SUMMARIZER_LLM_BACKEND
 
-        if not self.openai_api_key:
+        if not self.openai_api_key and self.llm_backend != "fake":
             raise ValueError("OPENAI_API_KEY must be set in Django settings")
 
         # Chat prompt template for summarization
-        self.summarization_prompt = ChatPromptTemplate.from_messages([
+        summarization_messages = [
             (
                 "system",
                 (
@@ -47,14 +90,122 @@ class SummarizerService:
                     "Summary:"
                 ),
             ),
-        ])
+        ]
+        self.summarization_prompt = ChatPromptTemplate.from_messages(summarization_messages)
+
+        # Chat prompt template for micro-batches of short articles
+        batch_summarization_messages = [
+            (
+                "system",
+                (
+                    "You are an expert news summarizer. "
+                    "Summarize each of the following articles in up to {max_words} words, "
+                    "focusing on the main points and key facts. "
+                    "Respond only with a JSON object of the form "
+                    '{{"summaries": [{{"id": <article id>, "summary": "<summary>"}}]}} '
+                    "containing exactly one entry per article."
+                ),
+            ),
+            ("user", "{articles}"),
+        ]
+        self.batch_summarization_prompt = ChatPromptTemplate.from_messages(batch_summarization_messages)
+
+        # Chat prompt templates for map-reduce summarization of long articles
+        chunk_summarization_messages = [
+            (
+                "system",
+                (
+                    "You are an expert news summarizer. "
+                    "The following is part {part} of {parts} of a longer article. "
+                    "Summarize this part in up to {max_words} words, "
+                    "keeping the main points and key facts."
+                ),
+            ),
+            (
+                "user",
+                (
+                    "Title: {title}\n\n"
+                    "Content: {content}\n\n"
+                    "Summary:"
+                ),
+            ),
+        ]
+        self.chunk_summarization_prompt = ChatPromptTemplate.from_messages(chunk_summarization_messages)
+        reduce_summarization_messages = [
+            (
+                "system",
+                (
+                    "You are an expert news summarizer. "
+                    "Combine the following partial summaries of a single article "
+                    "into one summary of up to {max_words} words, "
+                    "focusing on the main points and key facts."
+                ),
+            ),
+            (
+                "user",
+                (
+                    "Title: {title}\n\n"
+                    "Partial summaries:\n{content}\n\n"
+                    "Summary:"
+                ),
+            ),
+        ]
+        self.reduce_summarization_prompt = ChatPromptTemplate.from_messages(reduce_summarization_messages)
+
+        # Chat prompt template for several lengths of one article in a single call
+        multi_length_summarization_messages = [
+            (
+                "system",
+                (
+                    "You are an expert news summarizer. "
+                    "Summarize the following article once for each of these word limits: {lengths}. "
+                    "Each summary must stay within its word limit and focus on the main points and key facts. "
+                    "Respond only with a JSON object of the form "
+                    '{{"summaries": [{{"max_words": <word limit>, "summary": "<summary>"}}]}} '
+                    "containing exactly one entry per word limit."
+                ),
+            ),
+            (
+                "user",
+                (
+                    "Title: {title}\n\n"
+                    "Content: {content}"
+                ),
+            ),
+        ]
+        self.multi_length_summarization_prompt = ChatPromptTemplate.from_messages(multi_length_summarization_messages)
+
+        # Short hash of the prompt text, so cached summaries are invalidated when it changes
+        self.prompt_version = hashlib.sha256(repr([
+            summarization_messages,
+            batch_summarization_messages,
+            chunk_summarization_messages,
+            reduce_summarization_messages,
+            multi_length_summarization_messages,
+            self._compression_version(),
+        ]).encode("utf-8")).hexdigest()[:12]
+        self.summary_cache = SummaryCache()
+        self.router = ModelRouter(self.model_map)
+        self.breaker = CircuitBreaker()
+
+    @staticmethod
+    def _compression_version() -> str:
+        """Compression settings that change what the AI model sees, for the prompt version."""
+        if not settings.SUMMARIZER_COMPRESSION_ENABLED:
+            return ""
+        return f"compression-{COMPRESSION_VERSION}-{settings.SUMMARIZER_COMPRESSION_TOKEN_BUDGET}"
 
     def _get_llm(self, model_name: str = None):
-        model = self.model_map.get(model_name, self.default_model)
+        model = provider_model(model_name, self.default_model)
+        if self.llm_backend == "fake":
+            return FakeSummaryChatModel(model_name=model, **settings.SUMMARIZER_FAKE_LLM)
         return ChatOpenAI(
             api_key=self.openai_api_key,
             model=model,
             temperature=0.3,
+            timeout=settings.SUMMARIZER_LLM_TIMEOUT,
+            # Streamed responses end with a chunk carrying the token usage
+            stream_usage=True,
         )
 
     def summarize_article(
@@ -63,17 +214,23 @@ class SummarizerService:
         ai_model: str = None,
         user=None,
         max_words: int = 150,
+        latency_class: str = None,
     ) -> Summary:
         """
-        Summarize an article using AI.
+        Summarize an article using AI, in up to `max_words` words (or a length preset name).
+        With ai_model "auto" the model is picked by the router for the given latency class;
+        any model falls back to alternates on provider errors.
         """
+        max_words = resolve_max_words(max_words)
         try:
             article = Article.objects.get(id=article_id)
-            model_key = ai_model or self.default_model
+            model_key = canonical_model(ai_model, self.default_model)
 
             # Check for existing completed summary
             summary = (
-                Summary.objects.filter(article=article, ai_model=model_key, status="completed").first()
+                Summary.objects.filter(
+                    article=article, ai_model=model_key, max_words=max_words, status="completed"
+                ).first()
             )
 
             if summary:
@@ -84,46 +241,375 @@ class SummarizerService:
             summary, _ = Summary.objects.get_or_create(
                 article=article,
                 ai_model=model_key,
-                defaults={"status": "pending", "requested_by": user},
-            )
-
-            # Generate summary using LangChain
-            summary_text, token_count = self._generate_summary(
-                title=article.title,
-                content=article.content,
-                ai_model=model_key,
                 max_words=max_words,
+                defaults={"status": "pending", "requested_by": user, "queued_at": timezone.now()},
             )
-            logger.info(f"Summarizing article {article_id} with model {model_key}")
+
+            # Only the lease holder generates, so concurrent requests make a single LLM call
+            owner = new_lease_owner()
+            if not claim_summary(summary.pk, owner):
+                logger.info(f"Summary {summary.pk} is already being generated")
+                summary.refresh_from_db()
+                return summary
+            summary.refresh_from_db()
+
+            answered = self._answer_without_llm(summary, article, model_key, latency_class, owner)
+            if answered is not None:
+                return answered
+
+            # Generate summary using LangChain, renewing the lease while the call runs
+            usage = {}
+            summary.llm_started_at = timezone.now()
+            with LeaseHeartbeat([summary.pk], owner), self.breaker.track():
+                (summary_text, token_count), answered_by = self.router.call(
+                    model_key,
+                    article.content,
+                    latency_class,
+                    lambda model: self._generate_hedged(
+                        model,
+                        latency_class,
+                        usage,
+                        title=article.title,
+                        content=article.content,
+                        max_words=max_words,
+                    ),
+                )
+            summary.llm_finished_at = timezone.now()
+            logger.info(f"Summarized article {article_id} with model {answered_by} (requested {model_key})")
 
             # Save result
-            summary.summary_text = summary_text
-            summary.tokens_used = token_count
-            summary.word_count = len(summary_text.split())
-            summary.status = "completed"
-            summary.completed_at = timezone.now()
-            summary.save()
-            return summary
+            cache_key = self._cache_key(article, model_key, max_words)
+            if cache_key:
+                self.summary_cache.set(cache_key, summary_text, token_count, answered_by)
+            return self._save_completed(summary, summary_text, token_count, usage, answered_by, article)
 
         except Article.DoesNotExist:
             logger.error(f"Article {article_id} not found")
             raise
         except Exception as e:
             logger.error(f"Error summarizing article {article_id}: {e}")
-            if "summary" in locals():
-                summary.status = "failed"
-                summary.error_message = str(e)
-                summary.save()
+            if "owner" in locals():
+                fail_leased([summary.pk], owner, e)
             raise
 
+    def _answer_without_llm(
+        self,
+        summary: Summary,
+        article: Article,
+        model_key: str,
+        latency_class: str,
+        owner: str,
+    ) -> Optional[Summary]:
+        """
+        Checks made on a leased summary before its LLM call. Trivial articles, the extractive
+        model and content-hash cache hits are completed here, and while the circuit breaker
+        is open the summary is parked. Returns None when the LLM has to be called.
+        """
+        # Trivial articles get a deterministic summary without an LLM call
+        if not passes_quality_gate(article):
+            logger.info(f"Article {article.id} did not pass the quality gate, summarized without an AI model")
+            return self._save_trivial(summary, article)
+
+        # The extractive pseudo-model is computed locally, in the request path
+        if model_key == EXTRACTIVE_MODEL:
+            return self._save_extractive(summary, article)
+
+        # Reuse a summary generated for identical text, if any
+        cache_key = self._cache_key(article, model_key, summary.max_words)
+        cached = self.summary_cache.get(cache_key) if cache_key else None
+        if cached:
+            logger.info(f"Summary cache hit for article {article.id} with model {model_key}")
+            return self._save_completed(summary, cached["summary_text"], 0, answered_by=cached.get("answered_by"))
+
+        # While the provider is down the request waits in the parked queue
+        if not self.breaker.allow():
+            return park_summary(summary, latency_class, owner)
+        return None
+
+    def summarize_article_lengths(
+        self,
+        article_id: int,
+        ai_model: str = None,
+        user=None,
+        lengths=(150,),
+    ) -> List[Summary]:
+        """
+        Summarize an article at several lengths (word budgets or preset names).
+        Lengths that still need generating are produced together in one LLM call,
+        and each length is stored as its own Summary. Returned in request order.
+        """
+        budgets = resolve_lengths(lengths)
+        model_key = canonical_model(ai_model, self.default_model)
+        if len(budgets) == 1 or model_key == EXTRACTIVE_MODEL:
+            return [
+                self.summarize_article(article_id, ai_model=model_key, user=user, max_words=max_words)
+                for max_words in budgets
+            ]
+        try:
+            article = Article.objects.get(id=article_id)
+        except Article.DoesNotExist:
+            logger.error(f"Article {article_id} not found")
+            raise
+
+        owner = new_lease_owner()
+        summaries = {}
+        claimed = []
+        trivial = None
+        for max_words in budgets:
+            summary, _ = Summary.objects.get_or_create(
+                article=article,
+                ai_model=model_key,
+                max_words=max_words,
+                defaults={"status": "pending", "requested_by": user, "queued_at": timezone.now()},
+            )
+            if summary.status != "completed" and claim_summary(summary.pk, owner):
+                summary.refresh_from_db()
+                if trivial is None:
+                    trivial = not passes_quality_gate(article)
+                if trivial:
+                    summaries[max_words] = self._save_trivial(summary, article)
+                    continue
+                cache_key = self._cache_key(article, model_key, max_words)
+                cached = self.summary_cache.get(cache_key) if cache_key else None
+                if cached:
+                    summary = self._save_completed(
+                        summary, cached["summary_text"], 0, answered_by=cached.get("answered_by")
+                    )
+                else:
+                    claimed.append(summary)
+            summaries[max_words] = summary
+
+        too_long = estimate_tokens(article.content) > settings.SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS
+        if len(claimed) == 1 or too_long:
+            # One length left, or content needing map-reduce: summarize each length on its own
+            for summary in claimed:
+                release_lease(summary.pk, owner)
+                summaries[summary.max_words] = self.summarize_article(
+                    article_id, ai_model=model_key, user=user, max_words=summary.max_words
+                )
+        elif claimed:
+            summaries.update(self._summarize_lengths_together(article, model_key, user, claimed, owner))
+        return [summaries[max_words] for max_words in budgets]
+
+    def _summarize_lengths_together(
+        self,
+        article: Article,
+        model_key: str,
+        user,
+        claimed: List[Summary],
+        owner: str,
+    ) -> Dict[int, Summary]:
+        """Generate all claimed lengths in one call; lengths missing from the output are retried alone."""
+        if not self.breaker.allow():
+            return {summary.max_words: park_summary(summary, owner=owner) for summary in claimed}
+        usage = {}
+        llm_started_at = timezone.now()
+        try:
+            with LeaseHeartbeat([summary.pk for summary in claimed], owner), self.breaker.track():
+                (texts_by_length, token_count), answered_by = self.router.call(
+                    model_key,
+                    article.content,
+                    None,
+                    lambda model: self._generate_multi_length_summaries(
+                        article, model, [summary.max_words for summary in claimed], usage
+                    ),
+                )
+        except Exception as e:
+            logger.error(f"Error summarizing article {article.id} at several lengths: {e}")
+            fail_leased([summary.pk for summary in claimed], owner, e)
+            raise
+        llm_finished_at = timezone.now()
+
+        # Token usage of the shared call is split evenly across the lengths
+        tokens_per_item = token_count // len(claimed)
+        usage_per_item = {key: value // len(claimed) for key, value in usage.items()}
+        results = {}
+        for summary in claimed:
+            summary_text = texts_by_length.get(summary.max_words)
+            if summary_text:
+                cache_key = self._cache_key(article, model_key, summary.max_words)
+                if cache_key:
+                    self.summary_cache.set(cache_key, summary_text, tokens_per_item, answered_by)
+                summary.llm_started_at = llm_started_at
+                summary.llm_finished_at = llm_finished_at
+                results[summary.max_words] = self._save_completed(
+                    summary, summary_text, tokens_per_item, usage_per_item, answered_by, article
+                )
+                continue
+
+            release_lease(summary.pk, owner)
+            results[summary.max_words] = self.summarize_article(
+                article.id, ai_model=model_key, user=user, max_words=summary.max_words
+            )
+        return results
+
+    def _generate_multi_length_summaries(
+        self,
+        article: Article,
+        ai_model: str,
+        lengths: List[int],
+        usage: Optional[Dict] = None,
+    ) -> tuple[Dict[int, str], int]:
+        """Summarize one article at several word budgets in one structured prompt, keyed by budget."""
+        llm = self._get_llm(ai_model)
+        chain = self.multi_length_summarization_prompt | llm
+        result = chain.invoke({
+            "title": article.title,
+            "content": compress_for_prompt(article.title, article.content),
+            "lengths": ", ".join(str(max_words) for max_words in lengths),
+        })
+        output = self._result_text(result)
+
+        texts_by_length = self._parse_batch_output(output, set(lengths), key="max_words")
+        token_count = self._token_count(result, " ".join(texts_by_length.values()), usage)
+        return texts_by_length, token_count
+
+    def _cache_key(self, article: Article, model_key: str, max_words: int) -> Optional[str]:
+        """Content-hash cache key for this article, or None when the cache is disabled."""
+        if not settings.SUMMARIZER_CACHE_ENABLED:
+            return None
+        return self.summary_cache.make_key(
+            model_key, self.prompt_version, max_words, article.title, article.content
+        )
+
+    def _save_completed(
+        self,
+        summary: Summary,
+        summary_text: str,
+        token_count: int,
+        usage: Optional[Dict] = None,
+        answered_by: str = None,
+        generated_from: Article = None,
+    ) -> Summary:
+        """Persist a generated summary and mark it completed."""
+        self._apply_completed(summary, summary_text, token_count, usage, answered_by, generated_from=generated_from)
+        summary.save()
+        return summary
+
+    def _apply_completed(
+        self,
+        summary: Summary,
+        summary_text: str,
+        token_count: int,
+        usage: Optional[Dict] = None,
+        answered_by: str = None,
+        prompt_version: str = None,
+        generated_from: Article = None,
+    ) -> None:
+        """
+        Set the fields of a completed summary without saving, e.g. for a bulk update.
+        Summaries made without a prompt (quality gate, extractive) carry no prompt version.
+        With `generated_from`, the article as loaded before generation, the summary stays
+        stale if a re-fetch changed the article meanwhile.
+        """
+        usage = usage or {}
+        summary.summary_text = summary_text
+        summary.answered_by = answered_by or summary.ai_model
+        if summary.answered_by in LOCAL_MODELS:
+            summary.prompt_version = None
+        else:
+            summary.prompt_version = prompt_version or self.prompt_version
+        summary.tokens_used = token_count
+        summary.prompt_tokens = usage.get("prompt_tokens", 0)
+        summary.completion_tokens = usage.get("completion_tokens", 0)
+        summary.word_count = len(summary_text.split())
+        summary.status = "completed"
+        summary.completed_at = timezone.now()
+        summary.stale_since = None
+        if generated_from is not None and self._article_changed(generated_from):
+            summary.stale_since = summary.completed_at
+        summary.lease_owner = None
+        summary.lease_expires_at = None
+        summary.metadata.pop("error", None)
+
+    @staticmethod
+    def _article_changed(article: Article) -> bool:
+        """Whether a re-fetch changed the article since this copy of it was loaded."""
+        return Article.objects.filter(pk=article.pk).exclude(content_hash=article.content_hash).exists()
+
+    def resummarize_summary(self, summary_id: int) -> Optional[Summary]:
+        """
+        Regenerate a completed summary made with another prompt version, or whose article
+        changed since. The old text is served until the new one replaces it, so readers
+        never find the summary pending. Returns None if there was nothing to do: the
+        summary is current or changed meanwhile, or the circuit breaker is open.
+        """
+        summary = Summary.objects.select_related("article").get(pk=summary_id)
+        if summary.status != "completed":
+            return None
+        if summary.prompt_version == self.prompt_version and summary.stale_since is None:
+            return None
+        if summary.answered_by in LOCAL_MODELS or not self.breaker.allow():
+            return None
+        article = summary.article
+        old_version, old_stale_since = summary.prompt_version, summary.stale_since
+
+        cache_key = self._cache_key(article, summary.ai_model, summary.max_words)
+        cached = self.summary_cache.get(cache_key) if cache_key else None
+        usage = {}
+        if cached:
+            summary_text, token_count, answered_by = cached["summary_text"], 0, cached.get("answered_by")
+        else:
+            summary.llm_started_at = timezone.now()
+            with self.breaker.track():
+                (summary_text, token_count), answered_by = self.router.call(
+                    summary.ai_model,
+                    article.content,
+                    None,
+                    lambda model: self._generate_summary(
+                        title=article.title,
+                        content=article.content,
+                        ai_model=model,
+                        max_words=summary.max_words,
+                        usage=usage,
+                    ),
+                )
+            summary.llm_finished_at = timezone.now()
+            if cache_key:
+                self.summary_cache.set(cache_key, summary_text, token_count, answered_by)
+
+        self._apply_completed(summary, summary_text, token_count, usage, answered_by)
+        # Conditional, so a summary regenerated elsewhere in the meantime is not overwritten
+        updated = Summary.objects.filter(
+            pk=summary.pk, status="completed", prompt_version=old_version, stale_since=old_stale_since
+        ).update(
+            **{field: getattr(summary, field) for field in RESUMMARIZE_FIELDS}
+        )
+        if not updated:
+            return None
+        metrics.incr("resummarize_regenerated")
+        logger.info(f"Re-summarized summary {summary.pk} with prompt version {self.prompt_version}")
+        return summary
+
+    def _save_trivial(self, summary: Summary, article: Article) -> Summary:
+        """Complete a leased summary of a trivial article from its description or title."""
+        return self._save_completed(
+            summary, trivial_summary(article, summary.max_words), 0, answered_by=QUALITY_GATE_MODEL
+        )
+
+    def _save_extractive(self, summary: Summary, article: Article) -> Summary:
+        """Complete a leased summary with the local extractive summarizer."""
+        return self._save_completed(
+            summary, cached_extractive_summary(article, summary.max_words), 0, answered_by=EXTRACTIVE_MODEL
+        )
+
     def _generate_summary(
         self,
         title: str,
         content: str,
         ai_model: str,
         max_words: int,
+        usage: Optional[Dict] = None,
     ) -> tuple[str, int]:
-        """Use latest LangChain chain pattern for summarization."""
+        """
+        Use latest LangChain chain pattern for summarization.
+        Prompt and completion token counts are accumulated into `usage` when given.
+        """
+        content = compress_for_prompt(title, content)
+        # Long content is split and summarized with map-reduce to stay within the context budget
+        if estimate_tokens(content) > settings.SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS:
+            return self._generate_map_reduce_summary(title, content, ai_model, max_words, usage)
+
         llm = self._get_llm(ai_model)
         prompt = self.summarization_prompt
 
@@ -134,19 +620,250 @@ class SummarizerService:
         result = chain.invoke(inputs)
 
         # For ChatOpenAI, result.content holds the text
-        summary_text = result.content if hasattr(result, "content") else str(result)
+        summary_text = self._result_text(result)
+        token_count = self._token_count(result, summary_text, usage)
+
+        return summary_text.strip(), token_count
+
+    def _generate_hedged(self, model: str, latency_class: Optional[str], usage: Dict, **inputs) -> tuple[str, int]:
+        """
+        Generate a summary from `inputs` (title, content, max_words), hedged with a duplicate
+        call for interactive latency classes when enabled. Only the winning attempt's token
+        usage is recorded.
+        """
+        if not should_hedge(latency_class):
+            return self._generate_summary(ai_model=model, usage=usage, **inputs)
+
+        async def attempt():
+            attempt_usage = {}
+            result = await self._agenerate_summary(ai_model=model, usage=attempt_usage, **inputs)
+            return result, attempt_usage
 
-        # Get token usage if available
-        token_count = getattr(result, "usage", {}).get("total_tokens", len(summary_text.split()))
+        tokens = self.router.estimated_tokens(inputs["content"])
+        result, attempt_usage = hedged_call(attempt, hedge_delay(model), ModelRateLimiter(model), tokens)
+        for key, value in attempt_usage.items():
+            usage[key] = usage.get(key, 0) + value
+        return result
+
+    async def _agenerate_summary(
+        self,
+        title: str,
+        content: str,
+        ai_model: str,
+        max_words: int,
+        usage: Optional[Dict] = None,
+    ) -> tuple[str, int]:
+        """
+        _generate_summary with async calls, for hedged attempts: cancelling the task
+        aborts the request to the provider.
+        """
+        content = compress_for_prompt(title, content)
+        llm = self._get_llm(ai_model)
+        chain = self.summarization_prompt | llm
+        token_count = 0
+        if estimate_tokens(content) > settings.SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS:
+            map_results = await (self.chunk_summarization_prompt | llm).abatch(
+                self._chunk_inputs(title, content, ai_model, max_words),
+                config={"max_concurrency": settings.SUMMARIZER_MAP_CONCURRENCY},
+            )
+            partial_summaries, token_count = self._partial_summaries(map_results, usage)
+            chain = self.reduce_summarization_prompt | llm
+            content = "\n\n".join(partial_summaries)
 
+        result = await chain.ainvoke({"title": title, "content": content, "max_words": max_words})
+        summary_text = self._result_text(result)
+        token_count += self._token_count(result, summary_text, usage)
         return summary_text.strip(), token_count
 
-    def summarize_article_async(self, article_id: int, ai_model: str = None, user=None, max_words: int = 150) -> Summary:
+    def _generate_map_reduce_summary(
+        self,
+        title: str,
+        content: str,
+        ai_model: str,
+        max_words: int,
+        usage: Optional[Dict] = None,
+    ) -> tuple[str, int]:
+        """
+        Summarize token-budgeted chunks in parallel (map), then merge the partial
+        summaries with a single reduce call.
+        """
+        llm = self._get_llm(ai_model)
+        partial_summaries, token_count = self._summarize_chunks(llm, title, content, ai_model, max_words, usage)
+
+        # Reduce: merge partial summaries into the final summary
+        reduce_chain = self.reduce_summarization_prompt | llm
+        result = reduce_chain.invoke({
+            "title": title,
+            "content": "\n\n".join(partial_summaries),
+            "max_words": max_words,
+        })
+        summary_text = self._result_text(result)
+        token_count += self._token_count(result, summary_text, usage)
+
+        return summary_text.strip(), token_count
+
+    def _summarize_chunks(
+        self,
+        llm,
+        title: str,
+        content: str,
+        ai_model: str,
+        max_words: int,
+        usage: Optional[Dict] = None,
+    ) -> tuple[List[str], int]:
+        """Map step: summarize token-budgeted chunks of the content concurrently."""
+        # Chunk calls run concurrently, so latency stays close to a single call
+        map_chain = self.chunk_summarization_prompt | llm
+        map_results = map_chain.batch(
+            self._chunk_inputs(title, content, ai_model, max_words),
+            config={"max_concurrency": settings.SUMMARIZER_MAP_CONCURRENCY},
+        )
+        return self._partial_summaries(map_results, usage)
+
+    @staticmethod
+    def _chunk_inputs(title: str, content: str, ai_model: str, max_words: int) -> List[Dict]:
+        """Map step inputs: one per token-budgeted chunk of the content."""
+        chunks = split_into_chunks(content, settings.SUMMARIZER_CHUNK_TOKENS)
+        logger.info(f"Map-reduce summarization over {len(chunks)} chunks with model {ai_model}")
+        return [
+            {
+                "title": title,
+                "content": chunk,
+                "part": index,
+                "parts": len(chunks),
+                "max_words": max_words,
+            }
+            for index, chunk in enumerate(chunks, start=1)
+        ]
+
+    def _partial_summaries(self, map_results, usage: Optional[Dict] = None) -> tuple[List[str], int]:
+        """Texts and total tokens of the map step responses."""
+        partial_summaries = [self._result_text(result).strip() for result in map_results]
+        token_count = sum(
+            self._token_count(result, text, usage) for result, text in zip(map_results, partial_summaries)
+        )
+        return partial_summaries, token_count
+
+    def stream_summary_tokens(
+        self,
+        title: str,
+        content: str,
+        ai_model: str,
+        max_words: int,
+        latency_class: str = "fast",
+        routing: Optional[Dict] = None,
+        usage: Optional[Dict] = None,
+    ) -> Iterator[str]:
+        """
+        Yield summary text as the model generates it. A model failing before its
+        first token falls back to the next routed model; the model that answered
+        is stored in `routing["answered_by"]` when given. Prompt and completion
+        token counts are accumulated into `usage` once the stream ends.
+        """
+        last_error = None
+        tokens = self.router.estimated_tokens(content)
+        for model in self.router.route(ai_model, content, latency_class):
+            streamed = False
+            try:
+                with ModelRateLimiter(model).slot(tokens):
+                    started = time.monotonic()
+                    for text in self._stream_model_tokens(title, content, model, max_words, usage):
+                        streamed = True
+                        yield text
+            except FALLBACK_ERRORS as e:
+                if streamed or classify_error(e) == CONTENT:
+                    raise
+                self.router.record_failure(model)
+                logger.error(f"Model {model} failed before streaming, trying fallback: {e}")
+                last_error = e
+                continue
+            self.router.record_success(model, time.monotonic() - started)
+            if routing is not None:
+                routing["answered_by"] = model
+            return
+        raise last_error
+
+    def _stream_model_tokens(
+        self,
+        title: str,
+        content: str,
+        ai_model: str,
+        max_words: int,
+        usage: Optional[Dict] = None,
+    ) -> Iterator[str]:
+        llm = self._get_llm(ai_model)
+        content = compress_for_prompt(title, content)
+        if estimate_tokens(content) > settings.SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS:
+            # Only the reduce step produces the final text, so the map step runs up front
+            partial_summaries, _ = self._summarize_chunks(llm, title, content, ai_model, max_words, usage)
+            chain = self.reduce_summarization_prompt | llm
+            content = "\n\n".join(partial_summaries)
+        else:
+            chain = self.summarization_prompt | llm
+
+        # Chunks add up to the whole response, usage metadata included
+        response = None
+        for chunk in chain.stream({"title": title, "content": content, "max_words": max_words}):
+            response = chunk if response is None else response + chunk
+            text = self._result_text(chunk)
+            if text:
+                yield text
+        if response is not None:
+            self._token_count(response, self._result_text(response), usage)
+
+    @staticmethod
+    def _result_text(result) -> str:
+        return result.content if hasattr(result, "content") else str(result)
+
+    @staticmethod
+    def _token_usage(result, summary_text: str) -> Dict[str, int]:
+        """
+        Prompt, completion and total tokens from the response usage metadata,
+        falling back to the summary's word count when the provider reports none.
+        """
+        usage_metadata = getattr(result, "usage_metadata", None)
+        if usage_metadata:
+            return {
+                "prompt_tokens": usage_metadata.get("input_tokens", 0),
+                "completion_tokens": usage_metadata.get("output_tokens", 0),
+                "total_tokens": usage_metadata.get("total_tokens", 0),
+            }
+        token_usage = (getattr(result, "response_metadata", None) or {}).get("token_usage")
+        if token_usage:
+            return {
+                "prompt_tokens": token_usage.get("prompt_tokens", 0),
+                "completion_tokens": token_usage.get("completion_tokens", 0),
+                "total_tokens": token_usage.get("total_tokens", 0),
+            }
+        word_count = len(summary_text.split())
+        return {"prompt_tokens": 0, "completion_tokens": word_count, "total_tokens": word_count}
+
+    def _token_count(self, result, summary_text: str, usage: Optional[Dict] = None) -> int:
+        """Total tokens of a response, accumulating prompt and completion tokens into `usage`."""
+        token_usage = self._token_usage(result, summary_text)
+        if usage is not None:
+            usage["prompt_tokens"] = usage.get("prompt_tokens", 0) + token_usage["prompt_tokens"]
+            usage["completion_tokens"] = usage.get("completion_tokens", 0) + token_usage["completion_tokens"]
+        return token_usage["total_tokens"]
+
+    def summarize_article_async(
+        self,
+        article_id: int,
+        ai_model: str = None,
+        user=None,
+        max_words: int = 150,
+        latency_class: str = None,
+    ) -> Summary:
         """
         Asynchronously summarize an article by enqueuing a Celery task.
         Returns the Summary object (status will be 'pending' or 'in_progress').
         """
-        model_key = ai_model or self.default_model
+        model_key = canonical_model(ai_model, self.default_model)
+        max_words = resolve_max_words(max_words)
+        latency_class = validate_latency_class(latency_class)
+        if model_key == EXTRACTIVE_MODEL:
+            # Fast enough to answer in the request, nothing to enqueue
+            return self.summarize_article(article_id, ai_model=model_key, user=user, max_words=max_words)
         # Ensure the article exists, or raise Article.DoesNotExist
         try:
             article = Article.objects.get(id=article_id)
@@ -154,32 +871,623 @@ class SummarizerService:
             logger.error(f"Article {article_id} not found (async)")
             raise
         # Check for existing completed summary
-        summary = Summary.objects.filter(article=article, ai_model=model_key, status="completed").first()
+        summary = Summary.objects.filter(
+            article=article, ai_model=model_key, max_words=max_words, status="completed"
+        ).first()
         if summary:
             return summary
         summary, created = Summary.objects.get_or_create(
             article=article,
             ai_model=model_key,
+            max_words=max_words,
             defaults={
                 'status': 'pending',
-                'requested_by': user
+                'requested_by': user,
+                'queued_at': timezone.now(),
             }
         )
+        return self._enqueue_summary(summary, article, created, user, latency_class)
+
+    def _enqueue_summary(
+        self,
+        summary: Summary,
+        article: Article,
+        created: bool,
+        user=None,
+        latency_class: str = None,
+    ) -> Summary:
+        """
+        Start generation of a summary a reader asked for: enqueue it, unless it is already
+        queued or done, needs no LLM call, or must wait for the circuit breaker.
+        """
+        model_key, max_words = summary.ai_model, summary.max_words
+        # A reader is waiting now, so a summary still in a batch job is generated in realtime
+        if not created and summary.batch_job_id and summary.status in ['pending', 'in_progress']:
+            return self._escalate_from_batch(summary, latency_class)
         # If already being processed or completed, return existing summary
         if not created and summary.status in ['pending', 'in_progress', 'completed']:
             return summary
+        if not created:
+            summary.queued_at = timezone.now()
+            summary.save(update_fields=['queued_at'])
+        if not passes_quality_gate(article):
+            # Nothing to queue: the summary is built without an LLM call
+            owner = new_lease_owner()
+            if claim_summary(summary.pk, owner):
+                summary.refresh_from_db()
+                return self._save_trivial(summary, article)
+            summary.refresh_from_db()
+            return summary
+        if self.breaker.is_open():
+            # No task to enqueue until the provider recovers; the drain task picks it up
+            return park_summary(summary, latency_class)
+        if created and self._should_micro_batch(article):
+            self._schedule_micro_batch(model_key, max_words)
+            return summary
+        from .tasks import summarize_article_task
+        task_kwargs = {"latency_class": latency_class} if latency_class else {}
+        summarize_article_task.delay(article.id, model_key, user.id if user else None, max_words, **task_kwargs)
+        return summary
+
+    def summarize_articles_async(
+        self,
+        article_ids: Iterable[int],
+        ai_model: str = None,
+        user=None,
+        max_words: int = 150,
+        latency_class: str = None,
+    ) -> Dict[int, Summary]:
+        """
+        Asynchronously summarize several articles at once. The articles and their summaries
+        are read with one query each, and the missing summaries are created with a single
+        insert before being enqueued. Returns the summaries by article id in request order;
+        articles that do not exist are left out.
+        """
+        model_key = canonical_model(ai_model, self.default_model)
+        max_words = resolve_max_words(max_words)
+        latency_class = validate_latency_class(latency_class)
+        article_ids = list(dict.fromkeys(int(article_id) for article_id in article_ids))
+        if model_key == EXTRACTIVE_MODEL:
+            summaries = {}
+            for article_id in article_ids:
+                try:
+                    summaries[article_id] = self.summarize_article(
+                        article_id, ai_model=model_key, user=user, max_words=max_words
+                    )
+                except Article.DoesNotExist:
+                    continue
+            return summaries
+
+        articles = Article.objects.in_bulk(article_ids)
+        existing = {
+            summary.article_id: summary
+            for summary in Summary.objects.filter(
+                article_id__in=list(articles), ai_model=model_key, max_words=max_words
+            )
+        }
+        missing = [article_id for article_id in articles if article_id not in existing]
+        created = {}
+        if missing:
+            now = timezone.now()
+            Summary.objects.bulk_create(
+                [
+                    Summary(article_id=article_id, ai_model=model_key, max_words=max_words, status="pending",
+                            requested_by=user, queued_at=now)
+                    for article_id in missing
+                ],
+                ignore_conflicts=True,
+            )
+            # Read back for the primary keys; a row a concurrent request inserted is enqueued twice at worst
+            created = {
+                summary.article_id: summary
+                for summary in Summary.objects.filter(article_id__in=missing, ai_model=model_key, max_words=max_words)
+            }
+
+        summaries = {}
+        for article_id in article_ids:
+            if article_id not in articles:
+                continue
+            if article_id in existing:
+                summary = existing[article_id]
+                if summary.status != "completed":
+                    summary = self._enqueue_summary(summary, articles[article_id], False, user, latency_class)
+            else:
+                summary = self._enqueue_summary(created[article_id], articles[article_id], True, user, latency_class)
+            summaries[article_id] = summary
+        return summaries
+
+    def summarize_article_lengths_async(
+        self,
+        article_id: int,
+        ai_model: str = None,
+        user=None,
+        lengths=(150,),
+    ) -> List[Summary]:
+        """
+        Asynchronously summarize an article at several lengths with a single task,
+        so the lengths still missing are generated in one LLM call.
+        Returns the Summary objects in request order.
+        """
+        budgets = resolve_lengths(lengths)
+        model_key = canonical_model(ai_model, self.default_model)
+        if len(budgets) == 1 or model_key == EXTRACTIVE_MODEL:
+            return [
+                self.summarize_article_async(article_id, ai_model=model_key, user=user, max_words=max_words)
+                for max_words in budgets
+            ]
+        try:
+            article = Article.objects.get(id=article_id)
+        except Article.DoesNotExist:
+            logger.error(f"Article {article_id} not found (async)")
+            raise
+
+        summaries = []
+        to_generate = []
+        for max_words in budgets:
+            summary, created = Summary.objects.get_or_create(
+                article=article,
+                ai_model=model_key,
+                max_words=max_words,
+                defaults={'status': 'pending', 'requested_by': user, 'queued_at': timezone.now()},
+            )
+            if created or summary.status == 'failed':
+                if not created:
+                    summary.queued_at = timezone.now()
+                    summary.save(update_fields=['queued_at'])
+                to_generate.append(max_words)
+            summaries.append(summary)
+
+        if to_generate:
+            from .tasks import summarize_lengths_task
+            summarize_lengths_task.delay(article_id, model_key, user.id if user else None, to_generate)
+        return summaries
+
+    def _should_micro_batch(self, article: Article) -> bool:
+        """Short articles are collected into micro-batches when batching is enabled."""
+        return (
+            settings.SUMMARIZER_MICRO_BATCH_ENABLED
+            and len(article.content or "") <= settings.SUMMARIZER_MICRO_BATCH_MAX_CHARS
+        )
+
+    def _schedule_micro_batch(self, model_key: str, max_words: int) -> None:
+        """
+        Schedule a flush of the micro-batch for this model and length, once per window.
+        Pending Summary rows act as the buffer, so only the flush itself is enqueued.
+        """
+        window = settings.SUMMARIZER_MICRO_BATCH_WINDOW
+        flush_key = f"summarizer:micro_batch:{model_key}:{max_words}"
+        if cache.add(flush_key, True, timeout=window):
+            from .tasks import summarize_batch_task
+            summarize_batch_task.apply_async(args=[model_key, max_words], countdown=window)
+
+    def summarize_pending_batch(self, ai_model: str = None, max_words: int = 150) -> List[Summary]:
+        """
+        Summarize pending short articles for a model with a single LLM call.
+        Items missing or malformed in the batch output are retried individually.
+        """
+        model_key = canonical_model(ai_model, self.default_model)
+        candidates = (
+            Summary.objects.select_related("article")
+            .annotate(content_length=Length("article__content"))
+            .filter(
+                ai_model=model_key,
+                max_words=max_words,
+                status="pending",
+                content_length__lte=settings.SUMMARIZER_MICRO_BATCH_MAX_CHARS,
+            )
+            .order_by("created_at")[: settings.SUMMARIZER_MICRO_BATCH_SIZE]
+        )
+
+        if not self.breaker.allow():
+            for summary in candidates:
+                park_summary(summary)
+            return []
+
+        # Claim rows so a concurrent flush or worker does not summarize them twice
+        owner = new_lease_owner()
+        batch = [summary for summary in candidates if claim_summary(summary.pk, owner)]
+        if not batch:
+            return []
+        for summary in batch:
+            summary.refresh_from_db(fields=["status", "lease_owner", "lease_expires_at", "started_at", "attempts"])
+
+        results = []
+        cache_keys = {}
+        for summary in list(batch):
+            cache_key = self._cache_key(summary.article, model_key, max_words)
+            cached = self.summary_cache.get(cache_key) if cache_key else None
+            if cached:
+                results.append(
+                    self._save_completed(summary, cached["summary_text"], 0, answered_by=cached.get("answered_by"))
+                )
+                batch.remove(summary)
+            else:
+                cache_keys[summary.pk] = cache_key
+        if not batch:
+            return results
+
+        articles = [summary.article for summary in batch]
+        usage = {}
+        llm_started_at = timezone.now()
+        answered_by = None
+        try:
+            with LeaseHeartbeat([summary.pk for summary in batch], owner), self.breaker.track():
+                # Short articles only, so routing does not depend on the content
+                (summaries_by_id, token_count), answered_by = self.router.call(
+                    model_key,
+                    "",
+                    None,
+                    lambda model: self._generate_batch_summaries(articles, model, max_words, usage),
+                )
+        except Exception as e:
+            logger.error(f"Micro-batch summarization failed for model {model_key}: {e}")
+            summaries_by_id, token_count = {}, 0
+        llm_finished_at = timezone.now()
+        logger.info(
+            f"Micro-batch for model {model_key}: {len(summaries_by_id)}/{len(batch)} summaries parsed"
+        )
+
+        # Token usage of the shared call is split evenly across the batch
+        tokens_per_item = token_count // len(batch)
+        usage_per_item = {key: value // len(batch) for key, value in usage.items()}
+        for summary in batch:
+            summary_text = summaries_by_id.get(summary.article_id)
+            if summary_text:
+                if cache_keys[summary.pk]:
+                    self.summary_cache.set(cache_keys[summary.pk], summary_text, tokens_per_item, answered_by)
+                summary.started_at = llm_started_at
+                summary.llm_started_at = llm_started_at
+                summary.llm_finished_at = llm_finished_at
+                results.append(
+                    self._save_completed(
+                        summary, summary_text, tokens_per_item, usage_per_item, answered_by, summary.article
+                    )
+                )
+                continue
+
+            # Malformed or missing output: retry this article on its own
+            release_lease(summary.pk, owner)
+            try:
+                results.append(
+                    self.summarize_article(summary.article_id, ai_model=model_key, max_words=max_words)
+                )
+            except Exception as e:
+                logger.error(f"Retry of article {summary.article_id} from micro-batch failed: {e}")
+        return results
+
+    def _generate_batch_summaries(
+        self,
+        articles: List[Article],
+        ai_model: str,
+        max_words: int,
+        usage: Optional[Dict] = None,
+    ) -> tuple[Dict[int, str], int]:
+        """Summarize several short articles in one structured prompt, keyed by article id."""
+        llm = self._get_llm(ai_model)
+        chain = self.batch_summarization_prompt | llm
+
+        packed = "\n\n---\n\n".join(
+            f"Article {article.id}\nTitle: {article.title}\n"
+            f"Content: {compress_for_prompt(article.title, article.content)}"
+            for article in articles
+        )
+        result = chain.invoke({"articles": packed, "max_words": max_words})
+        output = self._result_text(result)
+
+        summaries_by_id = self._parse_batch_output(output, {article.id for article in articles})
+        token_count = self._token_count(result, " ".join(summaries_by_id.values()), usage)
+        return summaries_by_id, token_count
+
+    @staticmethod
+    def _parse_batch_output(output: str, expected_ids: set, key: str = "id") -> Dict[int, str]:
+        """
+        Parse the JSON batch output, keeping only well-formed entries for expected
+        ids (article ids, or word budgets for multi-length output).
+        """
+        text = output.strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json").strip()
+        try:
+            items = json.loads(text).get("summaries", [])
+        except (ValueError, AttributeError):
+            return {}
+
+        summaries_by_id = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                item_id = int(item.get(key))
+            except (TypeError, ValueError):
+                continue
+            summary_text = item.get("summary")
+            if item_id in expected_ids and isinstance(summary_text, str) and summary_text.strip():
+                summaries_by_id[item_id] = summary_text.strip()
+        return summaries_by_id
+
+    def queue_batch_summaries(
+        self,
+        article_ids: List[int],
+        ai_model: str = None,
+        max_words: int = 150,
+        user=None,
+    ) -> List[SummaryBatchJob]:
+        """
+        Queue non-urgent summaries for the provider's Batch API, in jobs of at most
+        SUMMARIZER_BATCH_MAX_REQUESTS requests per provider model. Summaries that
+        already exist are skipped unless they failed. Content long enough for
+        map-reduce needs several dependent calls, so it is enqueued for realtime
+        generation instead. Returns the created jobs, which are submitted by a task.
+        """
+        model_key = canonical_model(ai_model, self.default_model)
+        if model_key == EXTRACTIVE_MODEL:
+            raise InvalidRequestError("The extractive model runs locally and cannot be batched")
+        max_words = resolve_max_words(max_words)
+        from .tasks import submit_summary_batch_task, summarize_article_task
+
+        now = timezone.now()
+        by_model: Dict[str, List[int]] = {}
+        for article in Article.objects.filter(id__in=article_ids):
+            summary, created = Summary.objects.get_or_create(
+                article=article,
+                ai_model=model_key,
+                max_words=max_words,
+                defaults={"status": "pending", "requested_by": user, "queued_at": now},
+            )
+            if not created:
+                if summary.status != "failed":
+                    continue
+                summary.status = "pending"
+                summary.queued_at = now
+                summary.save(update_fields=["status", "queued_at"])
+            if estimate_tokens(article.content or "") > settings.SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS:
+                summarize_article_task.delay(article.id, model_key, user.id if user else None, max_words)
+                continue
+            # Batches have a day to finish, so "auto" routes for the relaxed latency class
+            model = self.router.choose(article.content, "relaxed") if model_key == "auto" else model_key
+            by_model.setdefault(model, []).append(summary.pk)
+
+        jobs = []
+        size = settings.SUMMARIZER_BATCH_MAX_REQUESTS
+        for model, summary_ids in by_model.items():
+            for start in range(0, len(summary_ids), size):
+                chunk = summary_ids[start:start + size]
+                job = SummaryBatchJob.objects.create(ai_model=model, request_count=len(chunk))
+                Summary.objects.filter(pk__in=chunk).update(batch_job=job)
+                jobs.append(job)
+        for job in jobs:
+            submit_summary_batch_task.delay(job.pk)
+        logger.info(f"Queued {sum(job.request_count for job in jobs)} summaries in {len(jobs)} batch jobs")
+        return jobs
+
+    def missing_summary_article_ids(self, ai_model: str = None, max_words: int = 150, limit: int = None) -> List[int]:
+        """Newest articles without a summary of this model and length, or whose summary failed."""
+        model_key = canonical_model(ai_model, self.default_model)
+        existing = Summary.objects.filter(
+            article=OuterRef("pk"), ai_model=model_key, max_words=resolve_max_words(max_words)
+        ).exclude(status="failed")
+        articles = Article.objects.filter(~Exists(existing)).order_by("-published_date")
+        return list(articles.values_list("id", flat=True)[: limit or settings.SUMMARIZER_BATCH_BACKFILL_LIMIT])
+
+    def submit_batch_job(self, job: SummaryBatchJob, client=None) -> List[Summary]:
+        """
+        Write the pending summaries of a queued job into a batch input file and submit it.
+        Summaries that need no AI model (trivial articles, cache hits) are completed
+        right away and returned. If submitting fails, the job stays queued and is
+        retried by the batch poller.
+        """
+        if job.status != "queued":
+            return []
+        owner = lease_owner(job.pk)
+        # The lease covers the whole completion window, since nothing heartbeats it
+        claimed = [
+            summary
+            for summary in job.summaries.select_related("article").filter(status="pending")
+            if claim_summary(summary.pk, owner, settings.SUMMARIZER_BATCH_LEASE_SECONDS)
+        ]
+
+        finished, lines = [], []
+        for summary in claimed:
+            summary.refresh_from_db(fields=["status", "lease_owner", "lease_expires_at", "started_at", "attempts"])
+            article = summary.article
+            if not passes_quality_gate(article):
+                finished.append(self._save_trivial(summary, article))
+                continue
+            cache_key = self._cache_key(article, summary.ai_model, summary.max_words)
+            cached = self.summary_cache.get(cache_key) if cache_key else None
+            if cached:
+                finished.append(
+                    self._save_completed(summary, cached["summary_text"], 0, answered_by=cached.get("answered_by"))
+                )
+                continue
+            messages = self.summarization_prompt.format_messages(
+                title=article.title,
+                content=compress_for_prompt(article.title, article.content),
+                max_words=summary.max_words,
+            )
+            provider_model = self.model_map.get(job.ai_model, job.ai_model)
+            lines.append(request_line(summary.pk, provider_model, chat_messages(messages)))
+
+        if not lines:
+            job.status = "completed"
+            job.completed_count = len(finished)
+            job.completed_at = timezone.now()
+            job.save()
+            return finished
+
+        try:
+            job.input_file_id, job.provider_batch_id = submit_batch(client or get_batch_client(), lines, job.pk)
+        except Exception as e:
+            logger.error(f"Submitting summary batch {job.pk} failed: {e}")
+            for summary in claimed:
+                release_lease(summary.pk, owner)
+            job.error_message = str(e)
+            job.save(update_fields=["error_message"])
+            return finished
+        job.status = "submitted"
+        job.prompt_version = self.prompt_version
+        job.request_count = len(lines)
+        job.completed_count = len(finished)
+        job.submitted_at = timezone.now()
+        job.error_message = None
+        job.save()
+        logger.info(f"Submitted summary batch {job.pk} as {job.provider_batch_id} with {len(lines)} requests")
+        return finished
+
+    def poll_batch_job(self, job: SummaryBatchJob, client=None) -> List[Summary]:
+        """
+        Check a submitted job and, once the provider has finished it, ingest the output
+        and error files into its summaries in bulk. Summaries without a result (an
+        expired or cancelled batch) or with a retryable error (a rate limit or 5xx
+        line) are handed back to realtime generation. Returns the summaries that
+        completed or failed.
+        """
+        if job.status != "submitted":
+            return []
+        client = client or get_batch_client()
+        provider_batch = client.batches.retrieve(job.provider_batch_id)
+        job.provider_status = provider_batch.status
+        final_status = FINAL_PROVIDER_STATUSES.get(provider_batch.status)
+        if final_status is None:
+            job.save(update_fields=["provider_status"])
+            return []
+
+        owner = lease_owner(job.pk)
+        leased = {
+            summary.pk: summary
+            for summary in job.summaries.select_related("article").filter(status="in_progress", lease_owner=owner)
+        }
+        finished = {}
+        prompt_tokens = completion_tokens = 0
+        for file_id in (provider_batch.output_file_id, provider_batch.error_file_id):
+            for summary_id, result in read_batch_results(client, file_id):
+                summary = leased.get(summary_id)
+                if summary is None or summary_id in finished:
+                    continue
+                completion = result_completion(result)
+                if completion is None:
+                    error = result_error(result)
+                    if classify_error(error) in RETRYABLE_CLASSES:
+                        # Rate-limited and 5xx lines stay unanswered and are retried in realtime below
+                        continue
+                    summary.status = "failed"
+                    summary.error_message = str(error)
+                    summary.metadata = {**summary.metadata, "error": error_metadata(error)}
+                    summary.lease_owner = None
+                    summary.lease_expires_at = None
+                    finished[summary_id] = summary
+                    continue
+                summary_text = (completion["choices"][0]["message"]["content"] or "").strip()
+                usage = completion.get("usage") or {}
+                token_count = usage.get("total_tokens", 0)
+                self._apply_completed(summary, summary_text, token_count, usage, job.ai_model, job.prompt_version)
+                cache_key = self._cache_key(summary.article, summary.ai_model, summary.max_words)
+                if cache_key:
+                    self.summary_cache.set(cache_key, summary_text, token_count, job.ai_model)
+                prompt_tokens += usage.get("prompt_tokens", 0)
+                completion_tokens += usage.get("completion_tokens", 0)
+                finished[summary_id] = summary
+
+        with transaction.atomic():
+            # Summaries taken over by realtime generation meanwhile keep their own result
+            still_leased = set(
+                Summary.objects.select_for_update()
+                .filter(pk__in=list(finished), lease_owner=owner)
+                .values_list("pk", flat=True)
+            )
+            ingested = [summary for pk, summary in finished.items() if pk in still_leased]
+            Summary.objects.bulk_update(ingested, BATCH_RESULT_FIELDS)
+
+        leftover = [summary for pk, summary in leased.items() if pk not in finished]
+        requeued = self._requeue_from_batch(leftover, owner)
+
+        completed = [summary for summary in ingested if summary.status == "completed"]
+        job.status = final_status
+        job.output_file_id = provider_batch.output_file_id
+        job.error_file_id = provider_batch.error_file_id
+        job.completed_count += len(completed)
+        job.failed_count = len(ingested) - len(completed) + requeued
+        job.prompt_tokens = prompt_tokens
+        job.completion_tokens = completion_tokens
+        job.completed_at = timezone.now()
+        if final_status != "completed":
+            job.error_message = (
+                f"Batch {provider_batch.status}; {requeued} summaries handed back to realtime generation"
+            )
+        job.save()
+        metrics.incr("batch_requests_completed", len(completed))
+        metrics.incr("batch_requests_failed", len(ingested) - len(completed))
+        metrics.incr("batch_tokens", prompt_tokens + completion_tokens)
+        logger.info(
+            f"Summary batch {job.pk} {provider_batch.status}: {len(completed)} completed, "
+            f"{len(ingested) - len(completed)} failed, {requeued} handed back to realtime generation"
+        )
+        return ingested
+
+    def _requeue_from_batch(self, summaries: List[Summary], owner: str) -> int:
+        """Release summaries a batch did not answer and enqueue them for realtime generation."""
         from .tasks import summarize_article_task
-        summarize_article_task.delay(article_id, model_key, user.id if user else None, max_words)
+        requeued = 0
+        for summary in summaries:
+            if Summary.objects.filter(pk=summary.pk, lease_owner=owner).update(
+                status="pending", lease_owner=None, lease_expires_at=None, queued_at=timezone.now()
+            ):
+                summarize_article_task.delay(
+                    summary.article_id, summary.ai_model, summary.requested_by_id, summary.max_words
+                )
+                requeued += 1
+        return requeued
+
+    def _escalate_from_batch(self, summary: Summary, latency_class: str = None) -> Summary:
+        """
+        Take a summary out of its batch job when a reader asks for it, and enqueue it for
+        realtime generation. The batch result, if it arrives, is then ignored.
+        """
+        if summary.status == "in_progress" and not (summary.lease_owner or "").startswith(LEASE_OWNER_PREFIX):
+            return summary
+        escalated = Summary.objects.filter(
+            pk=summary.pk, status=summary.status, lease_owner=summary.lease_owner
+        ).update(status="pending", lease_owner=None, lease_expires_at=None, batch_job=None, queued_at=timezone.now())
+        if escalated:
+            from .tasks import summarize_article_task
+            task_kwargs = {"latency_class": latency_class} if latency_class else {}
+            summarize_article_task.delay(
+                summary.article_id, summary.ai_model, summary.requested_by_id, summary.max_words, **task_kwargs
+            )
+            logger.info(f"Summary {summary.pk} taken out of its batch for realtime generation")
+        summary.refresh_from_db()
         return summary
 
-    def get_article_summary(self, article_id: int, ai_model: str = None) -> Optional[Summary]:
-        model_key = ai_model or self.default_model
+    def get_article_summary(self, article_id: int, ai_model: str = None, max_words: int = 150) -> Optional[Summary]:
+        model_key = canonical_model(ai_model, self.default_model)
         return Summary.objects.filter(
             article_id=article_id,
             ai_model=model_key,
+            max_words=resolve_max_words(max_words),
             status="completed"
         ).first()
 
+    def get_stale_summary(self, article_id: int, ai_model: str = None, max_words: int = 150) -> Optional[Summary]:
+        """
+        Best completed summary of an article from another model or length, to serve while
+        the requested one is generated. Prefers the closest length, then the model ranked
+        highest in SUMMARIZER_STALE_MODEL_PREFERENCE, then the most recent.
+        """
+        model_key = canonical_model(ai_model, self.default_model)
+        max_words = resolve_max_words(max_words)
+        candidates = Summary.objects.filter(article_id=article_id, status="completed").exclude(
+            ai_model=model_key, max_words=max_words
+        )
+        preference = settings.SUMMARIZER_STALE_MODEL_PREFERENCE
+
+        def rank(summary):
+            model = summary.answered_by or summary.ai_model
+            model_rank = preference.index(model) if model in preference else len(preference)
+            completed = summary.completed_at.timestamp() if summary.completed_at else 0
+            return abs(summary.max_words - max_words), model_rank, -completed
+
+        return min(candidates, key=rank, default=None)
+
     def get_article_summaries(self, article_id: int) -> Dict:
         summaries = Summary.objects.filter(article_id=article_id)
         return {
@@ -188,6 +1496,8 @@ class SummarizerService:
                 {
                     "id": s.id,
                     "ai_model": s.ai_model,
+                    "answered_by": s.answered_by,
+                    "max_words": s.max_words,
                     "status": s.status,
                     "summary_text": s.summary_text,
                     "word_count": s.word_count,
@@ -0,0 +1,213 @@
+"""Server-sent event (SSE) streaming of summary tokens as they are generated."""
+import json
+import logging
+import time
+from typing import Dict, Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from articles.models import Article
+from .lengths import resolve_max_words
+from .leases import LeaseHeartbeat, claim_summary, fail_leased, new_lease_owner, release_lease
+from .models import Summary
+from .notifications import get_notification_hub, publish_summary_finished
+from .registry import canonical_model
+from .serializers import SummarySerializer
+from .service import RESUMMARIZE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+RELAY_PREFIX = "summarizer:stream:relay:"
+
+# A client is waiting on the stream, so models are routed as for interactive requests
+STREAM_LATENCY_CLASS = "fast"
+
+
+def format_sse(event: str, data) -> str:
+    """Format a single server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class SummaryStreamer:
+    """
+    Streams a summary to the client as server-sent events.
+
+    The first client to ask for a summary that is not yet generated takes the
+    generation lease and becomes the producer: it streams tokens straight from the LLM and relays them through the
+    cache, so later clients can attach to the same generation instead of starting
+    another one. A generation already running in a Celery worker is attached to by
+    waiting for its completion notification. The final text is persisted to Summary exactly once.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self.timeout = settings.SUMMARIZER_STREAM_TIMEOUT
+        self.poll_interval = settings.SUMMARIZER_STREAM_POLL_INTERVAL
+        self.db_poll_interval = settings.SUMMARIZER_STREAM_DB_POLL_INTERVAL
+
+    def stream(self, article: Article, ai_model: str = None, user=None, max_words: int = 150) -> Iterator[str]:
+        model_key = canonical_model(ai_model, self.service.default_model)
+        max_words = resolve_max_words(max_words)
+
+        summary = Summary.objects.filter(
+            article=article, ai_model=model_key, max_words=max_words, status="completed"
+        ).first()
+        if summary:
+            yield format_sse("summary", SummarySerializer(summary).data)
+            return
+
+        summary, created = Summary.objects.get_or_create(
+            article=article,
+            ai_model=model_key,
+            max_words=max_words,
+            defaults={"status": "pending", "requested_by": user},
+        )
+
+        # Pending rows that we did not create already have a Celery task queued for them
+        queued_elsewhere = not created and summary.status == "pending"
+        owner = new_lease_owner()
+        if queued_elsewhere or not claim_summary(summary.pk, owner):
+            yield from self._attach(summary)
+            return
+        summary.refresh_from_db()
+
+        # The same checks as summarize_article: no LLM call for trivial articles, cache hits or an open breaker
+        try:
+            answered = self.service._answer_without_llm(summary, article, model_key, STREAM_LATENCY_CLASS, owner)
+        except Exception as e:
+            logger.error(f"Error summarizing article {article.id} for streaming: {e}")
+            if fail_leased([summary.pk], owner, e):
+                publish_summary_finished(summary.pk, "failed")
+            yield format_sse("error", {"message": "Summary generation failed."})
+            return
+        if answered is None:
+            yield from self._produce(summary, article, model_key, max_words, owner)
+        elif answered.status == "completed":
+            publish_summary_finished(answered.pk, answered.status)
+            yield format_sse("summary", SummarySerializer(answered).data)
+        else:
+            # Parked until the provider recovers; the drain publishes its completion
+            yield from self._attach(answered)
+
+    def _produce(
+        self,
+        summary: Summary,
+        article: Article,
+        model_key: str,
+        max_words: int,
+        owner: str,
+    ) -> Iterator[str]:
+        """Generate the summary, streaming tokens to this client and relaying them to attached ones."""
+        relay_key = self._relay_key(summary.pk)
+        relay = {"tokens": [], "done": False, "error": None}
+        cache.set(relay_key, relay, timeout=self.timeout)
+        llm_started_at = timezone.now()
+        heartbeat = LeaseHeartbeat([summary.pk], owner).start()
+
+        routing = {}
+        usage = {}
+        try:
+            last_relay = time.monotonic()
+            with self.service.breaker.track():
+                for token in self.service.stream_summary_tokens(
+                    title=article.title,
+                    content=article.content,
+                    ai_model=model_key,
+                    max_words=max_words,
+                    latency_class=STREAM_LATENCY_CLASS,
+                    routing=routing,
+                    usage=usage,
+                ):
+                    relay["tokens"].append(token)
+                    if time.monotonic() - last_relay >= self.poll_interval:
+                        cache.set(relay_key, relay, timeout=self.timeout)
+                        last_relay = time.monotonic()
+                    yield format_sse("token", {"text": token})
+
+            summary_text = "".join(relay["tokens"]).strip()
+            answered_by = routing.get("answered_by", model_key)
+            self._persist(summary, summary_text, model_key, max_words, article, llm_started_at, answered_by, usage)
+            relay["done"] = True
+            cache.set(relay_key, relay, timeout=self.timeout)
+            summary.refresh_from_db()
+            publish_summary_finished(summary.pk, summary.status)
+            yield format_sse("summary", SummarySerializer(summary).data)
+        except Exception as e:
+            logger.error(f"Error streaming summary {summary.pk}: {e}")
+            if fail_leased([summary.pk], owner, e):
+                publish_summary_finished(summary.pk, "failed")
+            relay.update(done=True, error="Summary generation failed.")
+            cache.set(relay_key, relay, timeout=self.timeout)
+            yield format_sse("error", {"message": "Summary generation failed."})
+        finally:
+            heartbeat.stop()
+            # The client went away mid-generation: hand the summary over to a worker
+            if release_lease(summary.pk, owner):
+                cache.delete(relay_key)
+                from .tasks import summarize_article_task
+                summarize_article_task.delay(article.id, model_key, summary.requested_by_id, max_words)
+
+    def _persist(
+        self,
+        summary: Summary,
+        summary_text: str,
+        model_key: str,
+        max_words: int,
+        article: Article,
+        llm_started_at,
+        answered_by: str,
+        usage: Dict,
+    ):
+        """Save the final text once; a summary completed elsewhere in the meantime is left as is."""
+        token_count = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+        summary.llm_started_at = llm_started_at
+        summary.llm_finished_at = timezone.now()
+        summary.error_message = None
+        self.service._apply_completed(summary, summary_text, token_count, usage, answered_by, generated_from=article)
+        updated = Summary.objects.filter(pk=summary.pk).exclude(status="completed").update(
+            **{field: getattr(summary, field) for field in RESUMMARIZE_FIELDS}
+        )
+        cache_key = self.service._cache_key(article, model_key, max_words)
+        if updated and cache_key:
+            self.service.summary_cache.set(cache_key, summary_text, token_count, answered_by)
+
+    def _attach(self, summary: Summary) -> Iterator[str]:
+        """Follow a generation that another request or worker is already running."""
+        relay_key = self._relay_key(summary.pk)
+        sent = 0
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            relay: Dict = cache.get(relay_key)
+            if relay is not None:
+                for token in relay["tokens"][sent:]:
+                    yield format_sse("token", {"text": token})
+                sent = len(relay["tokens"])
+                if relay["error"]:
+                    yield format_sse("error", {"message": relay["error"]})
+                    return
+                if relay["done"]:
+                    summary.refresh_from_db()
+                    yield format_sse("summary", SummarySerializer(summary).data)
+                    return
+            else:
+                # No relay: the summary is generated by a Celery worker, wait for its result
+                summary.refresh_from_db()
+                if summary.status == "completed":
+                    yield format_sse("summary", SummarySerializer(summary).data)
+                    return
+                if summary.status == "failed":
+                    yield format_sse("error", {"message": "Summary generation failed."})
+                    return
+                # Comment line keeps the connection alive through proxies
+                yield ": keep-alive\n\n"
+                # Wakes up as soon as the worker publishes completion
+                get_notification_hub().wait(summary.pk, self.db_poll_interval)
+                continue
+            time.sleep(self.poll_interval)
+        yield format_sse("timeout", {"message": "Summary is still being processed."})
+
+    @staticmethod
+    def _relay_key(summary_id: int) -> str:
+        return f"{RELAY_PREFIX}{summary_id}"
@@ -1,20 +1,35 @@
 from celery import shared_task
+from django.conf import settings
 from django.utils import timezone
-from .models import Summary
+from .models import ParkedSummaryRequest, Summary, SummaryBatchJob
 from articles.models import Article
+from .breaker import HALF_OPEN, OPEN, CircuitBreaker
+from .leases import stale_q
+from . import metrics
+from .errors import classify_error, retry_countdown
+from .notifications import publish_summary_finished
+from .prewarm import prewarm_summaries
+from .registry import UnknownModelError, canonical_model
+from .resummarize import resummarize_stale_summaries
 from .service import SummarizerService
+from .webhooks import deliver_webhooks, sweep_finished_subscriptions
 import logging
 from django.contrib.auth import get_user_model
 
 logger = logging.getLogger(__name__)
 
 @shared_task(bind=True, max_retries=3)
-def summarize_article_task(self, article_id, ai_model=None, user_id=None, max_words=150):
+def summarize_article_task(self, article_id, ai_model=None, user_id=None, max_words=150, latency_class=None):
     """
     Celery task to summarize an article using AI in the background.
     Delegates all Summary model handling to the service layer.
     """
     from django.contrib.auth import get_user_model
+    try:
+        ai_model = canonical_model(ai_model)
+    except UnknownModelError as e:
+        logger.error(f"Not summarizing article {article_id}: {e}")
+        return
     user = None
     if user_id:
         User = get_user_model()
@@ -24,16 +39,268 @@ def summarize_article_task(self, article_id, ai_model=None, user_id=None, max_wo
             user = None
     try:
         service = SummarizerService()
-        service.summarize_article(
+        summary = service.summarize_article(
             article_id=article_id,
             ai_model=ai_model,
             user=user,
-            max_words=max_words
+            max_words=max_words,
+            latency_class=latency_class
         )
-        logger.info(f"Summary completed for article {article_id}")
+        if summary.status in ["completed", "failed"]:
+            logger.info(f"Summary completed for article {article_id}")
+            publish_summary_finished(summary.id, summary.status)
+        elif summary.status == "pending":
+            logger.info(f"Summary for article {article_id} parked until the LLM provider recovers")
+        else:
+            # Another worker holds the lease and will publish when it finishes
+            logger.info(f"Summary for article {article_id} is already being generated")
     except Article.DoesNotExist:
         logger.error(f"Article {article_id} not found for summarization task.")
         # The service should handle status update if needed
     except Exception as e:
         logger.error(f"Error in summarize_article_task for article {article_id}: {e}")
-        raise self.retry(exc=e, countdown=60) 
\ No newline at end of file
+        countdown = retry_countdown(e, self.request.retries)
+        if countdown is None or self.request.retries >= self.max_retries:
+            # No retries left or retrying cannot help, so the failure is final: wake up any waiters
+            _publish_failed(article_id, ai_model)
+        if countdown is None:
+            logger.error(f"Not retrying article {article_id} after a {classify_error(e)} error")
+            raise
+        raise self.retry(exc=e, countdown=countdown)
+
+
+@shared_task(bind=True, max_retries=3)
+def summarize_lengths_task(self, article_id, ai_model=None, user_id=None, lengths=(150,)):
+    """
+    Celery task to summarize an article at several lengths with one LLM call.
+    """
+    try:
+        ai_model = canonical_model(ai_model)
+    except UnknownModelError as e:
+        logger.error(f"Not summarizing article {article_id}: {e}")
+        return
+    user = None
+    if user_id:
+        User = get_user_model()
+        try:
+            user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
+            user = None
+    try:
+        service = SummarizerService()
+        summaries = service.summarize_article_lengths(
+            article_id=article_id,
+            ai_model=ai_model,
+            user=user,
+            lengths=lengths
+        )
+        logger.info(f"Summaries of {len(summaries)} lengths completed for article {article_id}")
+        for summary in summaries:
+            if summary.status in ["completed", "failed"]:
+                publish_summary_finished(summary.id, summary.status)
+    except Article.DoesNotExist:
+        logger.error(f"Article {article_id} not found for summarization task.")
+    except Exception as e:
+        logger.error(f"Error in summarize_lengths_task for article {article_id}: {e}")
+        countdown = retry_countdown(e, self.request.retries)
+        if countdown is None or self.request.retries >= self.max_retries:
+            _publish_failed(article_id, ai_model)
+        if countdown is None:
+            logger.error(f"Not retrying article {article_id} after a {classify_error(e)} error")
+            raise
+        raise self.retry(exc=e, countdown=countdown)
+
+
+def _publish_failed(article_id, ai_model=None):
+    failed = Summary.objects.filter(article_id=article_id, status="failed")
+    if ai_model:
+        failed = failed.filter(ai_model=ai_model)
+    for summary_id in failed.values_list("id", flat=True):
+        publish_summary_finished(summary_id, "failed")
+
+
+@shared_task(bind=True, max_retries=3)
+def summarize_batch_task(self, ai_model=None, max_words=150):
+    """
+    Celery task to flush a micro-batch of pending short articles.
+    Reschedules itself while full batches are still waiting.
+    """
+    try:
+        service = SummarizerService()
+        summaries = service.summarize_pending_batch(ai_model=ai_model, max_words=max_words)
+        logger.info(f"Micro-batch completed {len(summaries)} summaries for model {ai_model}")
+        for summary in summaries:
+            publish_summary_finished(summary.id, summary.status)
+    except Exception as e:
+        logger.error(f"Error in summarize_batch_task for model {ai_model}: {e}")
+        countdown = retry_countdown(e, self.request.retries)
+        if countdown is None:
+            raise
+        raise self.retry(exc=e, countdown=countdown)
+
+    if len(summaries) >= settings.SUMMARIZER_MICRO_BATCH_SIZE:
+        summarize_batch_task.delay(ai_model, max_words)
+
+
+@shared_task
+def reap_stale_summaries_task():
+    """
+    Periodic task that recovers summaries that would otherwise never finish:
+    expired leases of crashed workers and pending rows whose task was lost.
+    They are re-enqueued, or marked failed once they used up their attempts.
+    """
+    now = timezone.now()
+    requeued = failed = 0
+    for summary in Summary.objects.filter(stale_q(now)):
+        # Conditional updates, so a worker that claims the row meanwhile keeps it
+        still_stale = Summary.objects.filter(stale_q(now), pk=summary.pk)
+        if summary.attempts >= settings.SUMMARIZER_MAX_ATTEMPTS:
+            if still_stale.update(
+                status="failed",
+                error_message="Summary generation did not finish after repeated attempts.",
+                lease_owner=None,
+                lease_expires_at=None,
+            ):
+                publish_summary_finished(summary.id, "failed")
+                failed += 1
+            continue
+        if still_stale.update(status="pending", lease_owner=None, lease_expires_at=None, queued_at=now):
+            summarize_article_task.delay(
+                summary.article_id, summary.ai_model, summary.requested_by_id, summary.max_words
+            )
+            requeued += 1
+    if requeued or failed:
+        logger.warning(f"Reaper re-enqueued {requeued} and failed {failed} stale summaries")
+    return {"requeued": requeued, "failed": failed}
+
+
+@shared_task
+def drain_parked_summaries_task():
+    """
+    Periodic task that re-enqueues summaries parked while the circuit breaker was open.
+    Half-open lets one through as the probe; once closed, at most
+    SUMMARIZER_BREAKER_DRAIN_BATCH per run, spread over the run interval, so
+    recovery does not hit the provider with the whole backlog at once.
+    """
+    state = CircuitBreaker().state()
+    if state == OPEN:
+        return {"state": state, "drained": 0}
+    limit = 1 if state == HALF_OPEN else settings.SUMMARIZER_BREAKER_DRAIN_BATCH
+    spacing = settings.SUMMARIZER_BREAKER_DRAIN_INTERVAL / limit
+    drained = 0
+    for parked in ParkedSummaryRequest.objects.select_related("summary")[:limit]:
+        # Deleting claims the request, so overlapping runs do not enqueue it twice
+        deleted, _ = ParkedSummaryRequest.objects.filter(pk=parked.pk).delete()
+        if not deleted:
+            continue
+        summary = parked.summary
+        Summary.objects.filter(pk=summary.pk).update(queued_at=timezone.now())
+        task_kwargs = {"latency_class": parked.latency_class} if parked.latency_class else {}
+        summarize_article_task.apply_async(
+            args=[summary.article_id, summary.ai_model, summary.requested_by_id, summary.max_words],
+            kwargs=task_kwargs,
+            countdown=drained * spacing,
+        )
+        drained += 1
+    if drained:
+        metrics.incr("breaker_drained", drained)
+        logger.info(f"Re-enqueued {drained} parked summaries (circuit breaker {state})")
+    return {"state": state, "drained": drained}
+
+
+@shared_task
+def prewarm_summaries_task():
+    """
+    Periodic task that enqueues summaries of the articles readers are most likely
+    to open next, within the hourly prewarm token budget.
+    """
+    if not settings.SUMMARIZER_PREWARM_ENABLED:
+        return {"ranked": 0, "enqueued": 0, "over_budget": 0}
+    result = prewarm_summaries()
+    logger.info(f"Prewarm enqueued {result['enqueued']} of {result['ranked']} ranked articles")
+    return result
+
+
+@shared_task
+def resummarize_stale_summaries_task():
+    """
+    Periodic task that enqueues regeneration of summaries made with an older prompt,
+    most read first, within the hourly re-summarization token budget.
+    """
+    if not settings.SUMMARIZER_RESUMMARIZE_ENABLED:
+        return {"planned": 0, "enqueued": 0, "over_budget": 0}
+    result = resummarize_stale_summaries()
+    logger.info(f"Re-summarization enqueued {result['enqueued']} of {result['planned']} stale summaries")
+    return result
+
+
+@shared_task(bind=True, max_retries=3)
+def resummarize_summary_task(self, summary_id):
+    """Celery task to regenerate one summary with the current prompt."""
+    try:
+        summary = SummarizerService().resummarize_summary(summary_id)
+        if summary:
+            publish_summary_finished(summary.id, summary.status)
+    except Summary.DoesNotExist:
+        logger.error(f"Summary {summary_id} not found for re-summarization.")
+    except Exception as e:
+        logger.error(f"Error in resummarize_summary_task for summary {summary_id}: {e}")
+        countdown = retry_countdown(e, self.request.retries)
+        if countdown is None:
+            raise
+        raise self.retry(exc=e, countdown=countdown)
+
+
+@shared_task
+def submit_summary_batch_task(job_id):
+    """
+    Celery task to submit a queued batch job to the provider's Batch API.
+    Jobs that fail to submit stay queued and are retried by the batch poller.
+    """
+    try:
+        job = SummaryBatchJob.objects.get(pk=job_id)
+    except SummaryBatchJob.DoesNotExist:
+        logger.error(f"Summary batch {job_id} not found for submission.")
+        return
+    for summary in SummarizerService().submit_batch_job(job):
+        publish_summary_finished(summary.id, summary.status)
+
+
+@shared_task
+def poll_summary_batches_task():
+    """
+    Periodic task that submits batch jobs still queued and ingests the results of
+    submitted jobs the provider has finished.
+    """
+    service = SummarizerService()
+    submitted = polled = 0
+    for job in SummaryBatchJob.objects.filter(status__in=["queued", "submitted"]).order_by("created_at"):
+        try:
+            if job.status == "queued":
+                finished = service.submit_batch_job(job)
+                submitted += job.status == "submitted"
+            else:
+                finished = service.poll_batch_job(job)
+                polled += 1
+        except Exception as e:
+            logger.error(f"Error polling summary batch {job.pk}: {e}")
+            continue
+        for summary in finished:
+            publish_summary_finished(summary.id, summary.status)
+    return {"submitted": submitted, "polled": polled}
+
+
+@shared_task
+def deliver_webhooks_task():
+    """
+    Periodic task, also scheduled when events are written, that sends due webhook events
+    in one batch per endpoint, after sweeping subscriptions of summaries that finished
+    without publishing. Runs again right away while endpoints have more waiting.
+    """
+    if not settings.SUMMARIZER_WEBHOOKS_ENABLED:
+        return {"endpoints": 0, "delivered": 0, "failed": 0, "more": 0}
+    sweep_finished_subscriptions()
+    result = deliver_webhooks()
+    if result["more"]:
+        deliver_webhooks_task.delay()
+    return result
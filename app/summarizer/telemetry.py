@@ -0,0 +1,87 @@
+"""Latency and token telemetry aggregated from completed summaries."""
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.utils import timezone
+
+from .models import Summary
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile of a list of values, or None when empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return round(ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower), 4)
+
+
+def _distribution(values: List[float]) -> Dict:
+    return {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+
+
+def _seconds(start, end) -> Optional[float]:
+    if start is None or end is None:
+        return None
+    return (end - start).total_seconds()
+
+
+def summary_stats(hours: float = 24) -> Dict:
+    """
+    Per-model latency percentiles and token usage for summaries completed in the last `hours`,
+    grouped by the model that answered (which differs from the requested one after routing).
+    Latencies are in seconds: `total` is queued to saved, `queue` is queued to started and
+    `llm` is the model call itself.
+    """
+    since = timezone.now() - timedelta(hours=hours)
+    rows = Summary.objects.filter(status="completed", completed_at__gte=since).values_list(
+        "ai_model",
+        "answered_by",
+        "created_at",
+        "queued_at",
+        "started_at",
+        "llm_started_at",
+        "llm_finished_at",
+        "completed_at",
+        "prompt_tokens",
+        "completion_tokens",
+        "tokens_used",
+    )
+
+    per_model = defaultdict(lambda: defaultdict(list))
+    for (ai_model, answered_by, created_at, queued_at, started_at, llm_started_at, llm_finished_at,
+         completed_at, prompt_tokens, completion_tokens, tokens_used) in rows:
+        samples = per_model[answered_by or ai_model]
+        queued_at = queued_at or created_at
+        for name, value in (
+            ("total", _seconds(queued_at, completed_at)),
+            ("queue", _seconds(queued_at, started_at)),
+            ("llm", _seconds(llm_started_at, llm_finished_at)),
+            ("tokens", tokens_used),
+        ):
+            if value is not None:
+                samples[name].append(value)
+        samples["prompt_tokens"].append(prompt_tokens or 0)
+        samples["completion_tokens"].append(completion_tokens or 0)
+
+    models = {}
+    for ai_model, samples in per_model.items():
+        models[ai_model] = {
+            "count": len(samples["prompt_tokens"]),
+            "latency_seconds": {
+                "total": _distribution(samples["total"]),
+                "queue": _distribution(samples["queue"]),
+                "llm": _distribution(samples["llm"]),
+            },
+            "tokens": {
+                **_distribution(samples["tokens"]),
+                "prompt_total": sum(samples["prompt_tokens"]),
+                "completion_total": sum(samples["completion_tokens"]),
+            },
+        }
+    return {"window_hours": hours, "since": since.isoformat(), "models": models}
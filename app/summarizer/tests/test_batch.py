@@ -0,0 +1,212 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer.batch import batch_stats, lease_owner
+from summarizer.fake_batch import reset_local_batch_server
+from summarizer.models import Summary, SummaryBatchJob
+from summarizer.service import SummarizerService
+from summarizer.tasks import poll_summary_batches_task, reap_stale_summaries_task
+from articles.models import Article
+import httpx
+import json
+import logging
+import openai
+
+FAKE_LLM = {'latency_mean': 0, 'latency_stddev': 0, 'error_rate': 0, 'seed': 0}
+
+
+@override_settings(SUMMARIZER_LLM_BACKEND='fake', SUMMARIZER_BATCH_BACKEND='local', SUMMARIZER_FAKE_LLM=FAKE_LLM,
+                   SUMMARIZER_QUALITY_GATE_ENABLED=False)
+@patch('summarizer.tasks.submit_summary_batch_task.delay')
+class BatchJobTest(TestCase):
+    """Test cases for summaries generated through the local stand-in Batch API."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.server = reset_local_batch_server()
+        self.articles = [
+            Article.objects.create(
+                title=f'Batch article {i}',
+                content=f'Article {i} reports that the council approved the transit budget on Tuesday.',
+                url=f'http://example.com/batch-{i}',
+                published_date=timezone.now(),
+                source='Test Source',
+                news_client_source='TestAPI'
+            )
+            for i in range(3)
+        ]
+        with patch.dict('os.environ', {}, clear=True):
+            self.service = SummarizerService()
+
+    def _queue_and_submit(self):
+        jobs = self.service.queue_batch_summaries([article.id for article in self.articles], max_words=10)
+        self.assertEqual(len(jobs), 1)
+        job = jobs[0]
+        self.service.submit_batch_job(job)
+        job.refresh_from_db()
+        return job
+
+    def test_submit_writes_batch_file(self, mock_submit_delay):
+        job = self._queue_and_submit()
+        mock_submit_delay.assert_called_once_with(job.pk)
+        self.assertEqual(job.status, 'submitted')
+        self.assertEqual(job.request_count, 3)
+        lines = [json.loads(line) for line in self.server.files[job.input_file_id].decode().splitlines()]
+        summary_ids = sorted(summary.pk for summary in job.summaries.all())
+        self.assertEqual(sorted(int(line['custom_id'].split('-')[1]) for line in lines), summary_ids)
+        self.assertEqual(lines[0]['url'], '/v1/chat/completions')
+        self.assertEqual(lines[0]['body']['model'], 'gpt-4.1-nano')
+        self.assertEqual([message['role'] for message in lines[0]['body']['messages']], ['system', 'user'])
+        for summary in job.summaries.all():
+            self.assertEqual(summary.status, 'in_progress')
+            self.assertEqual(summary.lease_owner, lease_owner(job.pk))
+
+    def test_results_are_ingested_when_batch_completes(self, mock_submit_delay):
+        self.server.polls_to_complete = 2
+        job = self._queue_and_submit()
+        self.assertEqual(self.service.poll_batch_job(job), [])
+        self.assertEqual(job.provider_status, 'in_progress')
+
+        finished = self.service.poll_batch_job(job)
+        job.refresh_from_db()
+        self.assertEqual(len(finished), 3)
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.completed_count, 3)
+        self.assertGreater(job.prompt_tokens, 0)
+        for summary in job.summaries.all():
+            self.assertEqual(summary.status, 'completed')
+            self.assertEqual(summary.answered_by, 'gpt-4.1-nano')
+            self.assertTrue(summary.summary_text.startswith(f'Article {summary.article.title[-1]} reports'))
+            self.assertEqual(summary.tokens_used, summary.prompt_tokens + summary.completion_tokens)
+            self.assertIsNone(summary.lease_owner)
+        stats = batch_stats()
+        self.assertEqual(stats['requests_submitted'], 3)
+        self.assertEqual(stats['requests_completed'], 3)
+        self.assertEqual(stats['tokens_saved'], stats['tokens'] // 2)
+
+    @override_settings(SUMMARIZER_FAKE_LLM={**FAKE_LLM, 'error_rate': 1.0})
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_retryable_error_lines_go_back_to_realtime(self, mock_delay, mock_submit_delay):
+        job = self._queue_and_submit()
+        self.assertEqual(self.service.poll_batch_job(job), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.failed_count, 3)
+        self.assertEqual(mock_delay.call_count, 3)
+        self.assertEqual(set(job.summaries.values_list('status', flat=True)), {'pending'})
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_permanent_error_lines_fail_their_summaries(self, mock_delay, mock_submit_delay):
+        job = self._queue_and_submit()
+        request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+        error = openai.BadRequestError('Bad request', response=httpx.Response(400, request=request), body=None)
+        with patch('summarizer.fake_batch.FakeSummaryChatModel.invoke', side_effect=error):
+            self.service.poll_batch_job(job)
+        job.refresh_from_db()
+        self.assertEqual(job.failed_count, 3)
+        mock_delay.assert_not_called()
+        for summary in job.summaries.all():
+            self.assertEqual(summary.status, 'failed')
+            self.assertEqual(summary.metadata['error']['class'], 'content')
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_expired_batch_hands_summaries_to_realtime(self, mock_delay, mock_submit_delay):
+        job = self._queue_and_submit()
+        self.server.set_status(job.provider_batch_id, 'expired')
+        self.assertEqual(self.service.poll_batch_job(job), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'expired')
+        self.assertEqual(job.failed_count, 3)
+        self.assertEqual(mock_delay.call_count, 3)
+        self.assertEqual(set(job.summaries.values_list('status', flat=True)), {'pending'})
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_reader_request_takes_summary_out_of_batch(self, mock_delay, mock_submit_delay):
+        job = self._queue_and_submit()
+        summary = self.service.summarize_article_async(self.articles[0].id, max_words=10)
+        self.assertEqual(summary.status, 'pending')
+        self.assertIsNone(summary.batch_job_id)
+        mock_delay.assert_called_once()
+
+        self.service.poll_batch_job(job)
+        summary.refresh_from_db()
+        self.assertEqual(summary.status, 'pending')
+        self.assertEqual(job.summaries.filter(status='completed').count(), 2)
+
+    def test_failed_submission_is_retried_by_poller(self, mock_submit_delay):
+        job = self.service.queue_batch_summaries([article.id for article in self.articles], max_words=10)[0]
+        with patch('summarizer.service.submit_batch', side_effect=ConnectionError('provider unreachable')):
+            self.service.submit_batch_job(job)
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'queued')
+        self.assertEqual(job.error_message, 'provider unreachable')
+        self.assertEqual(set(job.summaries.values_list('status', flat=True)), {'pending'})
+
+        # Waiting pending rows of a queued job are not the reaper's to requeue
+        job.summaries.update(queued_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(reap_stale_summaries_task(), {'requeued': 0, 'failed': 0})
+
+        with patch.dict('os.environ', {}, clear=True):
+            self.assertEqual(poll_summary_batches_task(), {'submitted': 1, 'polled': 0})
+            self.assertEqual(poll_summary_batches_task(), {'submitted': 0, 'polled': 1})
+        self.assertEqual(set(job.summaries.values_list('status', flat=True)), {'completed'})
+
+    def test_only_new_or_failed_summaries_are_queued(self, mock_submit_delay):
+        Summary.objects.create(article=self.articles[0], ai_model='gpt-4.1-nano', max_words=10, status='completed')
+        Summary.objects.create(article=self.articles[1], ai_model='gpt-4.1-nano', max_words=10, status='failed')
+        jobs = self.service.queue_batch_summaries([article.id for article in self.articles], max_words=10)
+        self.assertEqual(jobs[0].request_count, 2)
+        with self.assertRaises(ValueError):
+            self.service.queue_batch_summaries([self.articles[0].id], ai_model='extractive')
+
+
+@override_settings(SUMMARIZER_BATCH_BACKEND='local', SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class SummaryBatchViewTest(APITestCase):
+    """Test cases for the batch summary endpoint."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        self.admin = get_user_model().objects.create_superuser(
+            email='admin@example.com',
+            password='adminpass'
+        )
+        self.token = Token.objects.create(user=self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('summarizer:summary_batch')
+        self.articles = [
+            Article.objects.create(
+                title=f'Backfill article {i}',
+                content='The council approved the transit budget on Tuesday.',
+                url=f'http://example.com/backfill-{i}',
+                published_date=timezone.now() - timedelta(hours=i),
+                source='Test Source',
+                news_client_source='TestAPI'
+            )
+            for i in range(3)
+        ]
+
+    @patch('summarizer.tasks.submit_summary_batch_task.delay')
+    def test_queue_missing_summaries(self, mock_submit_delay):
+        Summary.objects.create(article=self.articles[0], ai_model='gpt-4.1-nano', max_words=50, status='completed')
+        response = self.client.post(self.url, {'missing': True, 'length': 'short'}, format='json')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['queued'], 2)
+        job = SummaryBatchJob.objects.get()
+        self.assertEqual(
+            set(job.summaries.values_list('article_id', flat=True)), {self.articles[1].id, self.articles[2].id}
+        )
+        mock_submit_delay.assert_called_once_with(job.pk)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['jobs'][0]['id'], job.pk)
+
+    def test_requires_articles(self):
+        response = self.client.post(self.url, {}, format='json')
+        self.assertEqual(response.status_code, 400)
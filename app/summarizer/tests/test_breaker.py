@@ -0,0 +1,163 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from summarizer.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, breaker_stats
+from summarizer.errors import InvalidRequestError
+from summarizer.fake_llm import _openai_error
+from summarizer.limiter import LimiterTimeout
+from summarizer.models import ParkedSummaryRequest, Summary
+from summarizer.service import SummarizerService
+from summarizer.tasks import drain_parked_summaries_task, reap_stale_summaries_task
+from articles.models import Article
+import logging
+import openai
+
+FAKE_LLM = {'latency_mean': 0, 'latency_stddev': 0, 'error_rate': 0, 'seed': 0}
+
+
+def outage_error():
+    return _openai_error(openai.InternalServerError, 500, 'Service unavailable')
+
+
+def reopen_probe(breaker):
+    """Let the open period run out."""
+    cache.delete(breaker._key('open'))
+
+
+@override_settings(SUMMARIZER_BREAKER_ENABLED=True, SUMMARIZER_BREAKER_FAILURE_THRESHOLD=3)
+class CircuitBreakerTest(TestCase):
+    """Test cases for the LLM circuit breaker states."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.breaker = CircuitBreaker()
+
+    def _fail(self, times, error=None):
+        for _ in range(times):
+            self.breaker.record(error or outage_error())
+
+    def test_opens_after_consecutive_outage_errors(self):
+        self._fail(2)
+        self.assertEqual(self.breaker.state(), CLOSED)
+        self._fail(1)
+        self.assertEqual(self.breaker.state(), OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(breaker_stats()['opened'], 1)
+
+    def test_success_and_request_errors_reset_the_count(self):
+        self._fail(2)
+        self.breaker.record()
+        self._fail(2)
+        self.breaker.record(_openai_error(openai.BadRequestError, 400, 'Bad request'))
+        self._fail(2)
+        self.assertEqual(self.breaker.state(), CLOSED)
+
+    def test_half_open_lets_one_probe_through(self):
+        self._fail(3)
+        reopen_probe(self.breaker)
+        self.assertEqual(self.breaker.state(), HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+        # A failed probe opens it again, a successful one closes it
+        self.breaker.record(outage_error())
+        self.assertEqual(self.breaker.state(), OPEN)
+        reopen_probe(self.breaker)
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record()
+        self.assertEqual(self.breaker.state(), CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_local_errors_are_ignored(self):
+        self._fail(2)
+        self.breaker.record(LimiterTimeout('no slot'))
+        self.breaker.record(InvalidRequestError('unknown model'))
+        self.breaker.record(KeyError('summary'))
+        self._fail(1)
+        self.assertEqual(self.breaker.state(), OPEN)
+
+        # Nor do they close the breaker, though a probe that never reached the provider is given back
+        reopen_probe(self.breaker)
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record(LimiterTimeout('no slot'))
+        self.assertEqual(self.breaker.state(), HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+
+    @override_settings(SUMMARIZER_BREAKER_ENABLED=False)
+    def test_disabled(self):
+        self._fail(5)
+        self.assertEqual(self.breaker.state(), CLOSED)
+
+
+@override_settings(SUMMARIZER_LLM_BACKEND='fake', SUMMARIZER_FAKE_LLM=FAKE_LLM, SUMMARIZER_QUALITY_GATE_ENABLED=False,
+                   SUMMARIZER_BREAKER_ENABLED=True, SUMMARIZER_BREAKER_FAILURE_THRESHOLD=2,
+                   SUMMARIZER_BREAKER_DRAIN_BATCH=2, SUMMARIZER_BREAKER_DRAIN_INTERVAL=10)
+class ParkedRequestTest(TestCase):
+    """Test cases for parking summary requests while the breaker is open, and draining them."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.articles = [
+            Article.objects.create(
+                title=f'Outage article {i}',
+                content=f'Article {i} reports that the council approved the transit budget on Tuesday.',
+                url=f'http://example.com/outage-{i}',
+                published_date=timezone.now(),
+                source='Test Source',
+                news_client_source='TestAPI'
+            )
+            for i in range(4)
+        ]
+        with patch.dict('os.environ', {}, clear=True):
+            self.service = SummarizerService()
+
+    def test_outage_parks_requests_instead_of_failing_them(self):
+        with self.settings(SUMMARIZER_FAKE_LLM={**FAKE_LLM, 'error_rate': 1.0}):
+            for article in self.articles[:2]:
+                with self.assertRaises(openai.InternalServerError):
+                    self.service.summarize_article(article.id, ai_model='gpt-4.1-nano')
+            with patch('summarizer.service.SummarizerService._generate_summary') as mock_generate:
+                summary = self.service.summarize_article(self.articles[2].id, ai_model='gpt-4.1-nano')
+            mock_generate.assert_not_called()
+        self.assertEqual(summary.status, 'pending')
+        self.assertEqual(summary.attempts, 0)
+        self.assertTrue(ParkedSummaryRequest.objects.filter(summary=summary).exists())
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_async_request_is_parked_without_a_task(self, mock_delay):
+        self.service.breaker.record(outage_error())
+        self.service.breaker.record(outage_error())
+        summary = self.service.summarize_article_async(self.articles[0].id, latency_class='fast')
+        mock_delay.assert_not_called()
+        self.assertEqual(summary.status, 'pending')
+        self.assertEqual(summary.parked_request.latency_class, 'fast')
+
+    @patch('summarizer.tasks.summarize_article_task.apply_async')
+    def test_drain_waits_probes_then_paces(self, mock_apply_async):
+        self.service.breaker.record(outage_error())
+        self.service.breaker.record(outage_error())
+        for article in self.articles:
+            self.service.summarize_article_async(article.id)
+        self.assertEqual(ParkedSummaryRequest.objects.count(), 4)
+
+        self.assertEqual(drain_parked_summaries_task(), {'state': OPEN, 'drained': 0})
+        reopen_probe(self.service.breaker)
+        self.assertEqual(drain_parked_summaries_task(), {'state': HALF_OPEN, 'drained': 1})
+        self.service.breaker.record()
+        self.assertEqual(drain_parked_summaries_task(), {'state': CLOSED, 'drained': 2})
+        self.assertEqual(ParkedSummaryRequest.objects.count(), 1)
+        self.assertEqual([call.kwargs['countdown'] for call in mock_apply_async.call_args_list], [0, 0, 5.0])
+        self.assertEqual(mock_apply_async.call_args_list[0].kwargs['args'][0], self.articles[0].id)
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_reaper_leaves_parked_requests_alone(self, mock_delay):
+        self.service.breaker.record(outage_error())
+        self.service.breaker.record(outage_error())
+        summary = self.service.summarize_article_async(self.articles[0].id)
+        Summary.objects.filter(pk=summary.pk).update(queued_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(reap_stale_summaries_task(), {'requeued': 0, 'failed': 0})
+        mock_delay.assert_not_called()
@@ -0,0 +1,108 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer.models import Summary
+from articles.models import Article
+import logging
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False, SUMMARIZER_MICRO_BATCH_ENABLED=False)
+@patch('summarizer.tasks.summarize_article_task.delay')
+class BulkSummaryViewTest(APITestCase):
+    """Test cases for the bulk summary request and status endpoints."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.admin = get_user_model().objects.create_superuser(
+            email='admin@example.com',
+            password='adminpass'
+        )
+        self.token = Token.objects.create(user=self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('summarizer:bulk_summarize')
+        self.status_url = reverse('summarizer:bulk_summary_status')
+        self.articles = [
+            Article.objects.create(
+                title=f'Bulk article {i}',
+                content='The council approved the transit budget on Tuesday after a long debate.',
+                url=f'http://example.com/bulk-{i}',
+                published_date=timezone.now(),
+                source='Test Source',
+                news_client_source='TestAPI'
+            )
+            for i in range(6)
+        ]
+
+    def _ids(self, articles):
+        return [article.id for article in articles]
+
+    def test_missing_summaries_are_created_and_enqueued(self, mock_delay):
+        completed = Summary.objects.create(article=self.articles[0], ai_model='gpt-4.1-nano', max_words=150,
+                                           status='completed', summary_text='Done.')
+        failed = Summary.objects.create(article=self.articles[1], ai_model='gpt-4.1-nano', max_words=150,
+                                        status='failed')
+        article_ids = self._ids(self.articles[:3]) + [999999]
+
+        response = self.client.post(self.url, {'article_ids': article_ids, 'ai_model': 'openai-gpt-4.1-nano'},
+                                    format='json')
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual([item['article_id'] for item in response.data['summaries']], article_ids[:3])
+        self.assertEqual([item['status'] for item in response.data['summaries']], ['completed', 'failed', 'pending'])
+        self.assertEqual(response.data['summaries'][0]['id'], completed.id)
+        self.assertEqual(response.data['not_found'], [999999])
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_delay.call_args_list), [failed.article_id, self.articles[2].id]
+        )
+        new = Summary.objects.get(article=self.articles[2])
+        self.assertEqual((new.ai_model, new.requested_by), ('gpt-4.1-nano', self.admin))
+
+        # Asking again only retries the summary that is still failed
+        mock_delay.reset_mock()
+        self.client.post(self.url, {'article_ids': article_ids}, format='json')
+        self.assertEqual([call.args[0] for call in mock_delay.call_args_list], [failed.article_id])
+
+    def test_query_count_does_not_grow_with_articles(self, mock_delay):
+        with CaptureQueriesContext(connection) as few:
+            self.client.post(self.url, {'article_ids': self._ids(self.articles[:2])}, format='json')
+        with CaptureQueriesContext(connection) as many:
+            self.client.post(self.url, {'article_ids': self._ids(self.articles[2:])}, format='json')
+        self.assertEqual(len(many), len(few))
+        self.assertEqual(Summary.objects.count(), 6)
+
+    def test_status_reads_all_summaries_in_one_query(self, mock_delay):
+        summaries = [
+            Summary.objects.create(article=article, ai_model='gpt-4.1-nano', status='pending')
+            for article in self.articles[:3]
+        ]
+        ids = ','.join(str(summary.id) for summary in summaries) + ',999999'
+        # One query authenticates the token, one reads the summaries
+        with self.assertNumQueries(2):
+            response = self.client.get(self.status_url, {'ids': ids})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in response.data['statuses']], [summary.id for summary in summaries])
+        self.assertEqual(response.data['statuses'][0]['article_id'], self.articles[0].id)
+        self.assertEqual(response.data['not_found'], [999999])
+
+    def test_invalid_requests(self, mock_delay):
+        self.assertEqual(self.client.post(self.url, {}, format='json').status_code, 400)
+        self.assertEqual(
+            self.client.post(self.url, {'article_ids': ['one']}, format='json').status_code, 400
+        )
+        response = self.client.post(self.url, {'article_ids': [self.articles[0].id], 'ai_model': 'gpt-5-ultra'},
+                                    format='json')
+        self.assertEqual(response.status_code, 400)
+        with self.settings(SUMMARIZER_BULK_MAX_IDS=2):
+            response = self.client.post(self.url, {'article_ids': self._ids(self.articles[:3])}, format='json')
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(self.client.get(self.status_url, {'ids': '1,2,3'}).status_code, 400)
+        self.assertEqual(self.client.get(self.status_url).status_code, 400)
+        mock_delay.assert_not_called()
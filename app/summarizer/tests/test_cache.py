@@ -0,0 +1,114 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer.cache import SummaryCache
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from articles.models import Article
+import logging
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class SummaryCacheTest(TestCase):
+    """Test cases for the content-hash summary cache."""
+
+    def setUp(self):
+        """Set up test data."""
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.summary_cache = SummaryCache()
+        self.original = Article.objects.create(
+            title='Syndicated Story',
+            content='The same wire story, published by many outlets.',
+            url='http://example.com/original',
+            published_date=timezone.now(),
+            source='Wire',
+            news_client_source='TestAPI'
+        )
+        self.copy = Article.objects.create(
+            title='  syndicated story ',
+            content='The same  wire story,\npublished by many outlets.',
+            url='http://example.org/copy',
+            published_date=timezone.now(),
+            source='Outlet',
+            news_client_source='TestAPI'
+        )
+
+    def test_key_ignores_case_and_whitespace(self):
+        """Near-identical copies of the same text share a cache key."""
+        key_a = self.summary_cache.make_key('gpt-4.1-nano', 'v1', 150, self.original.title, self.original.content)
+        key_b = self.summary_cache.make_key('gpt-4.1-nano', 'v1', 150, self.copy.title, self.copy.content)
+        self.assertEqual(key_a, key_b)
+
+    def test_key_depends_on_model_prompt_and_length(self):
+        """Model, prompt version and max_words are all part of the key."""
+        base = ('gpt-4.1-nano', 'v1', 150, 'Title', 'Content')
+        key = self.summary_cache.make_key(*base)
+        self.assertNotEqual(key, self.summary_cache.make_key('gpt-4', 'v1', 150, 'Title', 'Content'))
+        self.assertNotEqual(key, self.summary_cache.make_key('gpt-4.1-nano', 'v2', 150, 'Title', 'Content'))
+        self.assertNotEqual(key, self.summary_cache.make_key('gpt-4.1-nano', 'v1', 50, 'Title', 'Content'))
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_summarize_article_reuses_cached_summary(self, mock_generate_summary):
+        """A syndicated copy is served from the cache without another LLM call."""
+        mock_generate_summary.return_value = ('Wire story summary.', 42)
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            service = SummarizerService()
+            service.summarize_article(self.original.id, ai_model='gpt-4.1-nano')
+            summary = service.summarize_article(self.copy.id, ai_model='gpt-4.1-nano')
+
+        mock_generate_summary.assert_called_once()
+        self.assertEqual(summary.article, self.copy)
+        self.assertEqual(summary.status, 'completed')
+        self.assertEqual(summary.summary_text, 'Wire story summary.')
+        self.assertEqual(summary.tokens_used, 0)
+
+        stats = SummaryCache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_rate'], 0.5)
+        self.assertEqual(stats['tokens_saved'], 42)
+
+    @override_settings(SUMMARIZER_CACHE_ENABLED=False)
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_cache_disabled(self, mock_generate_summary):
+        """With the cache disabled every article calls the LLM."""
+        mock_generate_summary.return_value = ('Wire story summary.', 42)
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            service = SummarizerService()
+            service.summarize_article(self.original.id, ai_model='gpt-4.1-nano')
+            service.summarize_article(self.copy.id, ai_model='gpt-4.1-nano')
+
+        self.assertEqual(mock_generate_summary.call_count, 2)
+        self.assertEqual(Summary.objects.filter(status='completed').count(), 2)
+
+
+class SummarizerMetricsViewTest(APITestCase):
+    """Test cases for the summarizer metrics endpoint."""
+
+    def setUp(self):
+        cache.clear()
+        self.admin_user = get_user_model().objects.create_user(
+            email='admin@example.com',
+            name='Admin User',
+            password='adminpass',
+            is_staff=True
+        )
+        self.admin_token = Token.objects.create(user=self.admin_user)
+
+    def test_metrics_admin(self):
+        """Admins can read cache metrics."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        response = self.client.get(reverse('summarizer:summarizer_metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('hit_rate', response.data['metrics']['cache'])
+
+    def test_metrics_unauthenticated(self):
+        """Metrics require authentication."""
+        response = self.client.get(reverse('summarizer:summarizer_metrics'))
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,80 @@
+from django.test import TestCase, override_settings
+from unittest.mock import patch
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from summarizer.chunking import estimate_tokens, split_into_chunks
+from summarizer.service import SummarizerService
+import logging
+
+
+class ChunkingTest(TestCase):
+    """Test cases for local token estimation and chunking."""
+
+    def test_estimate_tokens(self):
+        """Token estimates scale with text length."""
+        self.assertEqual(estimate_tokens(''), 0)
+        self.assertEqual(estimate_tokens(None), 0)
+        self.assertEqual(estimate_tokens('abcd'), 1)
+        self.assertEqual(estimate_tokens('a' * 400), 100)
+
+    def test_short_text_is_one_chunk(self):
+        """Text within budget is returned as a single chunk."""
+        self.assertEqual(split_into_chunks('One paragraph.', 100), ['One paragraph.'])
+
+    def test_chunks_respect_budget_and_order(self):
+        """Paragraphs are packed greedily into chunks within the budget, in order."""
+        paragraphs = [f'Paragraph {i} ' + 'word ' * 30 for i in range(10)]
+        chunks = split_into_chunks('\n\n'.join(paragraphs), 100)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(estimate_tokens(chunk), 100)
+        joined = ' '.join(chunks)
+        positions = [joined.index(f'Paragraph {i} ') for i in range(10)]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_oversized_paragraph_is_split(self):
+        """A single paragraph larger than the budget is split on sentences and words."""
+        paragraph = ' '.join(['This is a fairly ordinary sentence.'] * 50) + ' ' + 'x ' * 500
+        chunks = split_into_chunks(paragraph, 50)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(estimate_tokens(chunk), 50)
+
+
+@override_settings(
+    SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS=100,
+    SUMMARIZER_CHUNK_TOKENS=100,
+    SUMMARIZER_MAP_CONCURRENCY=1,
+)
+class MapReduceSummaryTest(TestCase):
+    """Test cases for map-reduce summarization of long content."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    def test_short_content_uses_single_call(self):
+        """Content under the threshold keeps the single-call fast path."""
+        llm = FakeListChatModel(responses=['Short summary.'])
+        with patch.object(self.service, '_get_llm', return_value=llm), \
+                patch.object(self.service, '_generate_map_reduce_summary') as mock_map_reduce:
+            summary_text, _ = self.service._generate_summary('Title', 'Short content.', 'gpt-4.1-nano', 50)
+
+        self.assertEqual(summary_text, 'Short summary.')
+        mock_map_reduce.assert_not_called()
+
+    def test_long_content_is_mapped_and_reduced(self):
+        """Long content is summarized per chunk and merged in a reduce step."""
+        content = '\n\n'.join(f'Paragraph {i} ' + 'word ' * 60 for i in range(3))
+        chunk_count = len(split_into_chunks(content, 100))
+        responses = [f'Part {i}.' for i in range(chunk_count)] + ['Final merged summary.']
+        llm = FakeListChatModel(responses=responses)
+
+        with patch.object(self.service, '_get_llm', return_value=llm):
+            summary_text, token_count = self.service._generate_summary('Title', content, 'gpt-4.1-nano', 50)
+
+        self.assertEqual(chunk_count, 3)
+        self.assertEqual(summary_text, 'Final merged summary.')
+        # Word-count fallback: two words per partial summary plus the final summary
+        self.assertEqual(token_count, 2 * chunk_count + 3)
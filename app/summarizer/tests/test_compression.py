@@ -0,0 +1,117 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from summarizer.chunking import estimate_tokens
+from summarizer.compression import compress_for_prompt, compress_text, compression_stats
+from summarizer.service import SummarizerService
+from articles.models import Article
+import logging
+
+TITLE = 'Council approves transit budget'
+CONTENT = (
+    '<p>By Jane Doe | Reuters</p>\n'
+    'We use cookies to improve your experience. Accept all cookies.\n'
+    'The city council approved a new transit budget on Tuesday. '
+    'By Tuesday evening, officials had &quot;celebrated&quot; the vote.\n'
+    'Advertisement\n'
+    'The city council approved a new transit budget on Tuesday.\n'
+    'Bus routes in the north will run more often. Sign up for our newsletter today! … [+2345 chars]'
+)
+FAKE_LLM = {'latency_mean': 0, 'latency_stddev': 0, 'error_rate': 0, 'seed': 0}
+
+
+class CompressTextTest(TestCase):
+    """Test cases for removing boilerplate and redundancy from article text."""
+
+    def test_boilerplate_markup_and_repeats_are_removed(self):
+        self.assertEqual(compress_text(TITLE, CONTENT), (
+            'The city council approved a new transit budget on Tuesday. '
+            'By Tuesday evening, officials had "celebrated" the vote.\n\n'
+            'Bus routes in the north will run more often.'
+        ))
+
+    def test_title_copy_is_removed(self):
+        self.assertEqual(compress_text(TITLE, 'Council approves transit budget\nFares stay the same.'),
+                         'Fares stay the same.')
+
+    def test_budget_keeps_best_sentences_in_order(self):
+        content = ' '.join([
+            'The council approved the transit budget.',
+            'Weather was mild across the region that day.',
+            'The transit budget funds new bus routes.',
+            'A bakery opened downtown.',
+        ])
+        compressed = compress_text(TITLE, content, token_budget=25)
+        self.assertLessEqual(estimate_tokens(compressed), 25)
+        self.assertEqual(
+            compressed, 'The council approved the transit budget. The transit budget funds new bus routes.'
+        )
+
+
+@override_settings(SUMMARIZER_COMPRESSION_ENABLED=True, SUMMARIZER_COMPRESSION_TOKEN_BUDGET=20,
+                   SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS=200)
+class CompressForPromptTest(TestCase):
+    """Test cases for compression on the way into a prompt."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_records_tokens_before_and_after(self):
+        compressed = compress_for_prompt(TITLE, CONTENT)
+        stats = compression_stats()
+        self.assertEqual(stats['prompts'], 1)
+        self.assertEqual(stats['tokens_before'], estimate_tokens(CONTENT))
+        self.assertEqual(stats['tokens_after'], estimate_tokens(compressed))
+        self.assertLessEqual(stats['avg_tokens_after'], 20)
+        self.assertGreater(stats['savings_rate'], 0.5)
+
+    def test_map_reduce_content_is_cleaned_but_not_cut(self):
+        content = ' '.join(f'Sentence number {i} adds another detail.' for i in range(40)) + ' Advertisement'
+        compressed = compress_for_prompt(TITLE, content)
+        self.assertNotIn('Advertisement', compressed)
+        self.assertEqual(compressed.count('Sentence number'), 40)
+
+    @override_settings(SUMMARIZER_COMPRESSION_ENABLED=False)
+    def test_disabled(self):
+        self.assertEqual(compress_for_prompt(TITLE, CONTENT), CONTENT)
+        self.assertEqual(compression_stats()['prompts'], 0)
+
+
+@override_settings(SUMMARIZER_LLM_BACKEND='fake', SUMMARIZER_FAKE_LLM=FAKE_LLM,
+                   SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class CompressedPromptServiceTest(TestCase):
+    """Test cases for compressed prompts in the summarizer service."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title=TITLE,
+            content=CONTENT,
+            url='http://example.com/compressed',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    def _summarize(self, **overrides):
+        with self.settings(**overrides), patch.dict('os.environ', {}, clear=True):
+            summary = SummarizerService().summarize_article(self.article.id, max_words=10)
+        summary.delete()
+        return summary
+
+    def test_prompt_gets_compressed_content(self):
+        uncompressed = self._summarize(SUMMARIZER_COMPRESSION_ENABLED=False)
+        compressed = self._summarize(SUMMARIZER_COMPRESSION_ENABLED=True)
+        # The fake model echoes the leading words of the content it was sent
+        self.assertEqual(compressed.summary_text, 'The city council approved a new transit budget on Tuesday.')
+        self.assertLess(compressed.prompt_tokens, uncompressed.prompt_tokens)
+
+    def test_compression_changes_prompt_version(self):
+        with patch.dict('os.environ', {}, clear=True):
+            with self.settings(SUMMARIZER_COMPRESSION_ENABLED=False):
+                plain = SummarizerService().prompt_version
+            with self.settings(SUMMARIZER_COMPRESSION_ENABLED=True):
+                compressed = SummarizerService().prompt_version
+        self.assertNotEqual(plain, compressed)
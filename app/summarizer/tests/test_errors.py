@@ -0,0 +1,151 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from celery.exceptions import Retry
+from summarizer.errors import (
+    CONTENT, PERMANENT, RATE_LIMIT, TIMEOUT, TRANSIENT, UNKNOWN, InvalidRequestError, classify_error,
+    retry_after_seconds, retry_countdown,
+)
+from summarizer.limiter import LimiterTimeout
+from summarizer.models import Summary
+from summarizer.registry import UnknownModelError
+from summarizer.router import ModelRouter
+from summarizer.service import SummarizerService
+from summarizer.tasks import summarize_article_task
+from articles.models import Article
+import httpx
+import json
+import logging
+import openai
+
+
+def _api_error(error_class, status_code, headers=None, code=None):
+    request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+    response = httpx.Response(status_code, request=request, headers=headers or {})
+    body = {'code': code} if code else None
+    return error_class('error', response=response, body=body)
+
+
+class ClassifyErrorTest(TestCase):
+    """Test cases for classifying summary generation errors."""
+
+    def test_classes(self):
+        self.assertEqual(classify_error(_api_error(openai.RateLimitError, 429)), RATE_LIMIT)
+        self.assertEqual(classify_error(_api_error(openai.RateLimitError, 429, code='insufficient_quota')), PERMANENT)
+        self.assertEqual(
+            classify_error(_api_error(openai.BadRequestError, 400, code='content_policy_violation')), CONTENT
+        )
+        self.assertEqual(classify_error(_api_error(openai.NotFoundError, 404, code='model_not_found')), PERMANENT)
+        self.assertEqual(classify_error(_api_error(openai.AuthenticationError, 401)), PERMANENT)
+        self.assertEqual(classify_error(_api_error(openai.InternalServerError, 503)), TRANSIENT)
+        self.assertEqual(classify_error(openai.APITimeoutError(request=httpx.Request('POST', 'https://x'))), TIMEOUT)
+        self.assertEqual(classify_error(httpx.ReadTimeout('slow')), TIMEOUT)
+        self.assertEqual(classify_error(LimiterTimeout('busy')), TIMEOUT)
+        self.assertEqual(classify_error(InvalidRequestError('Unknown latency class')), PERMANENT)
+        self.assertEqual(classify_error(UnknownModelError('Unknown AI model')), PERMANENT)
+        # A truncated model response is worth another try
+        self.assertEqual(classify_error(json.JSONDecodeError('Unterminated string', '{"summaries": [', 14)), UNKNOWN)
+        self.assertIsNotNone(retry_countdown(ValueError('Malformed response'), 0))
+        self.assertEqual(classify_error(RuntimeError('boom')), UNKNOWN)
+
+
+@override_settings(SUMMARIZER_RETRY_BASE_COUNTDOWN=10, SUMMARIZER_RETRY_MAX_COUNTDOWN=600,
+                   SUMMARIZER_RETRY_DEFAULT_COUNTDOWN=60)
+class RetryCountdownTest(TestCase):
+    """Test cases for the retry delay of each error class."""
+
+    def test_permanent_errors_are_not_retried(self):
+        self.assertIsNone(retry_countdown(_api_error(openai.BadRequestError, 400), 0))
+        self.assertIsNone(retry_countdown(_api_error(openai.NotFoundError, 404), 0))
+
+    def test_rate_limit_honours_retry_after(self):
+        error = _api_error(openai.RateLimitError, 429, headers={'retry-after': '7'})
+        self.assertEqual(retry_after_seconds(error), 7)
+        self.assertTrue(7 <= retry_countdown(error, 0) <= 8)
+        error = _api_error(openai.RateLimitError, 429, headers={'retry-after-ms': '2500'})
+        self.assertEqual(retry_after_seconds(error), 2.5)
+        error = _api_error(openai.RateLimitError, 429, headers={'retry-after': '3600'})
+        self.assertEqual(retry_countdown(error, 0), 600)
+
+    def test_timeouts_back_off_exponentially_with_jitter(self):
+        error = httpx.ReadTimeout('slow')
+        for retries, low, high in [(0, 5, 10), (2, 20, 40), (10, 300, 600)]:
+            countdown = retry_countdown(error, retries)
+            self.assertTrue(low <= countdown <= high, (retries, countdown))
+
+    def test_unknown_errors_keep_default_countdown(self):
+        self.assertEqual(retry_countdown(RuntimeError('boom'), 2), 60)
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class ClassifiedFailureTest(TestCase):
+    """Test cases for recording and acting on classified failures."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title='Failing Article',
+            content='Failing content.',
+            url='http://example.com/failing',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_failure_stores_error_class(self, mock_generate_summary):
+        mock_generate_summary.side_effect = _api_error(openai.BadRequestError, 400, code='content_policy_violation')
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            with self.assertRaises(openai.BadRequestError):
+                SummarizerService().summarize_article(self.article.id, ai_model='gpt-4.1-nano')
+        summary = Summary.objects.get(article=self.article)
+        self.assertEqual(summary.status, 'failed')
+        self.assertEqual(summary.metadata['error']['class'], CONTENT)
+        self.assertEqual(summary.metadata['error']['code'], 'content_policy_violation')
+        # Content errors are not retried on another model
+        mock_generate_summary.assert_called_once()
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_success_clears_error(self, mock_generate_summary):
+        Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', status='failed',
+                               metadata={'error': {'class': TIMEOUT}})
+        mock_generate_summary.return_value = ('Summary.', 5)
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            summary = SummarizerService().summarize_article(self.article.id, ai_model='gpt-4.1-nano')
+        self.assertEqual(summary.status, 'completed')
+        self.assertNotIn('error', summary.metadata)
+
+    @patch('summarizer.tasks.publish_summary_finished')
+    @patch('summarizer.tasks.SummarizerService')
+    def test_task_fails_fast_on_permanent_error(self, mock_service_class, mock_publish):
+        """A permanent error is not retried and waiters are told at once."""
+        mock_service_class.return_value.summarize_article.side_effect = _api_error(openai.NotFoundError, 404)
+        Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', status='failed')
+        with patch.object(summarize_article_task, 'retry') as mock_retry:
+            with self.assertRaises(openai.NotFoundError):
+                summarize_article_task.apply(args=[self.article.id, 'gpt-4.1-nano'], throw=True)
+        mock_retry.assert_not_called()
+        mock_publish.assert_called_once()
+
+    @patch('summarizer.tasks.SummarizerService')
+    def test_task_retries_rate_limit_after_retry_after(self, mock_service_class):
+        mock_service_class.return_value.summarize_article.side_effect = _api_error(
+            openai.RateLimitError, 429, headers={'retry-after': '20'}
+        )
+        with patch.object(summarize_article_task, 'retry', side_effect=Retry()) as mock_retry:
+            with self.assertRaises(Retry):
+                summarize_article_task.apply(args=[self.article.id, 'gpt-4.1-nano'], throw=True)
+        self.assertTrue(20 <= mock_retry.call_args.kwargs['countdown'] <= 21)
+
+    def test_router_does_not_fall_back_on_content_error(self):
+        calls = []
+
+        def generate(model):
+            calls.append(model)
+            raise _api_error(openai.BadRequestError, 400)
+
+        with self.assertRaises(openai.BadRequestError):
+            ModelRouter().call('auto', 'Short.', None, generate)
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,141 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer.extractive import EXTRACTIVE_MODEL, extractive_summary, rank_sentences, split_sentences
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from articles.models import Article
+import logging
+import time
+
+TITLE = 'Council approves transit budget'
+CONTENT = (
+    'The city council approved a new transit budget on Tuesday. '
+    'It was raining in the morning. '
+    'The transit budget adds bus routes and two tram lines to the city. '
+    'Officials said the council vote on the budget was close. '
+    'A local bakery opened a new branch.'
+)
+
+
+class ExtractiveSummaryTest(TestCase):
+    """Test cases for the local extractive summarizer."""
+
+    def test_split_sentences(self):
+        text = 'Critics said it "relies on forecasts." Dr. Smith disagreed. Prices rose 3.5 percent.'
+        self.assertEqual(split_sentences(text), [
+            'Critics said it "relies on forecasts."', 'Dr. Smith disagreed.', 'Prices rose 3.5 percent.',
+        ])
+
+    def test_central_and_title_sentences_rank_highest(self):
+        sentences = split_sentences(CONTENT)
+        scores = rank_sentences(sentences, TITLE)
+        ranked = sorted(range(len(sentences)), key=lambda index: -scores[index])
+        self.assertEqual(ranked[0], 0)
+        self.assertEqual(set(ranked[-2:]), {1, 4})
+
+    def test_summary_fits_budget_in_article_order(self):
+        summary = extractive_summary(TITLE, CONTENT, 25)
+        self.assertLessEqual(len(summary.split()), 25)
+        self.assertTrue(summary.startswith('The city council approved'))
+        self.assertNotIn('bakery', summary)
+
+    def test_long_sentence_is_cut_to_budget(self):
+        self.assertEqual(extractive_summary(TITLE, 'One two three four five six.', 3), 'One two three…')
+        self.assertEqual(extractive_summary(TITLE, '', 50), TITLE)
+
+    def test_long_article_is_fast(self):
+        content = ' '.join(
+            f'Sentence {i} mentions topic {i % 17} and detail {i % 29} of the story.' for i in range(1000)
+        )
+        started = time.perf_counter()
+        extractive_summary(TITLE, content, 150)
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class ExtractiveModelTest(TestCase):
+    """Test cases for the extractive pseudo-model in the summarizer service."""
+
+    def setUp(self):
+        cache.clear()
+        self.article = Article.objects.create(
+            title=TITLE,
+            content=CONTENT,
+            url='http://example.com/extractive',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_summarized_without_llm(self, mock_generate_summary):
+        summary = self.service.summarize_article(self.article.id, ai_model=EXTRACTIVE_MODEL, max_words=25)
+        mock_generate_summary.assert_not_called()
+        self.assertEqual(summary.status, 'completed')
+        self.assertEqual(summary.answered_by, EXTRACTIVE_MODEL)
+        self.assertEqual(summary.summary_text, extractive_summary(TITLE, CONTENT, 25))
+
+    @patch('summarizer.tasks.summarize_lengths_task.delay')
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_async_completes_in_request(self, mock_delay, mock_lengths_delay):
+        summary = self.service.summarize_article_async(self.article.id, ai_model=EXTRACTIVE_MODEL)
+        self.assertEqual(summary.status, 'completed')
+        summaries = self.service.summarize_article_lengths_async(
+            self.article.id, ai_model=EXTRACTIVE_MODEL, lengths=['short', 'long']
+        )
+        self.assertEqual([s.status for s in summaries], ['completed', 'completed'])
+        mock_delay.assert_not_called()
+        mock_lengths_delay.assert_not_called()
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False, SUMMARIZER_MICRO_BATCH_ENABLED=False)
+class ExtractiveViewTest(APITestCase):
+    """Test cases for extractive placeholders and fallbacks in the article summary endpoint."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='reader@example.com',
+            name='Reader',
+            password='readerpass'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.article = Article.objects.create(
+            title=TITLE,
+            content=CONTENT,
+            url='http://example.com/extractive-view',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        self.url = reverse('articles:articles-summary', args=[self.article.id])
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_pending_response_has_placeholder(self, mock_delay):
+        response = self.client.get(self.url, {'length': 'short'})
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['placeholder']['answered_by'], EXTRACTIVE_MODEL)
+        self.assertEqual(response.data['placeholder']['summary_text'], extractive_summary(TITLE, CONTENT, 50))
+        mock_delay.assert_called_once()
+        with self.settings(SUMMARIZER_EXTRACTIVE_PLACEHOLDER=False):
+            self.assertNotIn('placeholder', self.client.get(self.url).data)
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_failed_summary_falls_back_to_extractive(self, mock_delay):
+        Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', status='failed')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['fallback'])
+        self.assertEqual(response.data['summary']['answered_by'], EXTRACTIVE_MODEL)
+        self.assertEqual(response.data['requested']['status'], 'failed')
+        self.assertIn('no-cache', response['Cache-Control'])
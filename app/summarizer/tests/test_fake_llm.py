@@ -0,0 +1,122 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from summarizer.fake_llm import FakeSummaryChatModel, reset_call_counter
+from summarizer.service import SummarizerService
+from articles.models import Article
+import logging
+import openai
+import random
+
+
+FAKE_LLM = {'latency_mean': 0, 'latency_stddev': 0, 'error_rate': 0, 'seed': 0}
+
+
+class FakeSummaryChatModelTest(TestCase):
+    """Test cases for the deterministic offline chat model."""
+
+    def setUp(self):
+        reset_call_counter()
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    def _invoke(self, llm, content='One two three four five six.', max_words=3):
+        chain = self.service.summarization_prompt | llm
+        return chain.invoke({'title': 'Title', 'content': content, 'max_words': max_words})
+
+    def test_deterministic_summary_with_usage(self):
+        """The same prompt yields the same summary, limited to max_words, with usage metadata."""
+        llm = FakeSummaryChatModel()
+        first = self._invoke(llm)
+        second = self._invoke(llm)
+        self.assertEqual(first.content, 'One two three')
+        self.assertEqual(first.content, second.content)
+        self.assertGreater(first.usage_metadata['input_tokens'], 0)
+        self.assertEqual(
+            first.usage_metadata['total_tokens'],
+            first.usage_metadata['input_tokens'] + first.usage_metadata['output_tokens'],
+        )
+
+    def test_rate_limit_bursts(self):
+        """Every Nth call starts a burst of 429 errors."""
+        llm = FakeSummaryChatModel(rate_limit_every=4, rate_limit_burst=2)
+        outcomes = []
+        for _ in range(8):
+            try:
+                self._invoke(llm)
+                outcomes.append('ok')
+            except openai.RateLimitError as e:
+                self.assertEqual(e.status_code, 429)
+                outcomes.append('429')
+        self.assertEqual(outcomes, ['429', '429', 'ok', 'ok', '429', '429', 'ok', 'ok'])
+
+    def test_error_rate(self):
+        """Errors are raised at the configured rate, reproducibly for a seed."""
+        llm = FakeSummaryChatModel(error_rate=1.0)
+        with self.assertRaises(openai.InternalServerError):
+            self._invoke(llm)
+
+    def test_latency_distributions(self):
+        """Sampled latencies follow the configured distribution."""
+        rng = random.Random(1)
+        fixed = FakeSummaryChatModel(latency_mean=0.25)
+        self.assertEqual(fixed._latency(rng), 0.25)
+        uniform = FakeSummaryChatModel(latency_distribution='uniform', latency_mean=1.0, latency_stddev=0.5)
+        self.assertTrue(all(0.5 <= uniform._latency(rng) <= 1.5 for _ in range(100)))
+        lognormal = FakeSummaryChatModel(latency_distribution='lognormal', latency_mean=1.0, latency_stddev=0.5)
+        samples = [lognormal._latency(rng) for _ in range(5000)]
+        self.assertAlmostEqual(sum(samples) / len(samples), 1.0, delta=0.05)
+
+    def test_batch_prompt_returns_json(self):
+        """Micro-batch prompts are answered with parseable JSON."""
+        chain = self.service.batch_summarization_prompt | FakeSummaryChatModel()
+        packed = 'Article 1\nTitle: A\nContent: Alpha text.\n\n---\n\nArticle 2\nTitle: B\nContent: Beta text.'
+        result = chain.invoke({'articles': packed, 'max_words': 10})
+        self.assertEqual(
+            SummarizerService._parse_batch_output(result.content, {1, 2}),
+            {1: 'Alpha text.', 2: 'Beta text.'},
+        )
+
+    def test_stream(self):
+        """Streaming yields the same text word by word, then a chunk with the usage metadata."""
+        chain = self.service.summarization_prompt | FakeSummaryChatModel()
+        chunks = list(chain.stream({'title': 'Title', 'content': 'One two three.', 'max_words': 10}))
+        self.assertEqual([chunk.content for chunk in chunks], ['One', ' two', ' three.', ''])
+        usage = chunks[-1].usage_metadata
+        self.assertGreater(usage['input_tokens'], 0)
+        self.assertEqual(usage['total_tokens'], usage['input_tokens'] + usage['output_tokens'])
+
+
+@override_settings(SUMMARIZER_LLM_BACKEND='fake', SUMMARIZER_FAKE_LLM=FAKE_LLM,
+                   SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class FakeBackendServiceTest(TestCase):
+    """Test cases for running the summarizer service on the fake backend."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title='Offline Article',
+            content='The pipeline runs end to end without calling OpenAI at any point of the run.',
+            url='http://example.com/offline',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    def test_no_api_key_required(self):
+        """The fake backend does not need an OpenAI key."""
+        with patch.dict('os.environ', {}, clear=True):
+            service = SummarizerService()
+        self.assertIsInstance(service._get_llm('gpt-4.1-nano'), FakeSummaryChatModel)
+
+    def test_summarize_article_end_to_end(self):
+        """summarize_article completes with real token accounting from the fake model."""
+        with patch.dict('os.environ', {}, clear=True):
+            service = SummarizerService()
+        summary = service.summarize_article(self.article.id, max_words=10)
+        self.assertEqual(summary.status, 'completed')
+        self.assertEqual(summary.summary_text, 'The pipeline runs end to end without calling OpenAI at')
+        self.assertGreater(summary.prompt_tokens, 0)
+        self.assertEqual(summary.tokens_used, summary.prompt_tokens + summary.completion_tokens)
@@ -0,0 +1,225 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from summarizer import metrics
+from summarizer.hedging import hedge_delay, hedged_call, should_hedge
+from summarizer.limiter import ModelRateLimiter
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from articles.models import Article
+import asyncio
+import logging
+import threading
+import time
+
+
+@override_settings(SUMMARIZER_HEDGE_ENABLED=True, SUMMARIZER_HEDGE_BUDGET=1.0)
+class HedgedCallTest(TestCase):
+    """Test cases for hedging slow LLM calls with a duplicate request."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+
+    def test_fast_call_is_not_hedged(self):
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            return 'done'
+
+        result = hedged_call(generate, delay=1)
+        self.assertEqual(result, 'done')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(metrics.get_counters(['hedges_sent'])['hedges_sent'], 0)
+
+    def test_slow_call_is_hedged_and_loser_cancelled(self):
+        """A duplicate is sent after the delay, the first answer is used and the slow attempt is cancelled."""
+        cancelled = threading.Event()
+        attempts = []
+
+        async def generate():
+            attempts.append(1)
+            if len(attempts) == 1:
+                try:
+                    await asyncio.sleep(2)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return 'slow'
+            return 'hedge'
+
+        started = time.monotonic()
+        result = hedged_call(generate, delay=0.05)
+        self.assertEqual(result, 'hedge')
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertTrue(cancelled.wait(1))
+        counters = metrics.get_counters(['hedges_sent', 'hedges_won'])
+        self.assertEqual(counters, {'hedges_sent': 1, 'hedges_won': 1})
+
+    def test_failed_attempt_waits_for_the_other(self):
+        """A failing attempt does not win; the other attempt's answer is used."""
+        attempts = []
+
+        async def generate():
+            attempts.append(1)
+            if len(attempts) == 1:
+                await asyncio.sleep(0.1)
+                return 'primary'
+            raise TimeoutError('hedge timed out')
+
+        self.assertEqual(hedged_call(generate, delay=0.02), 'primary')
+
+    def test_both_attempts_failing_raises(self):
+        async def generate():
+            await asyncio.sleep(0.05)
+            raise TimeoutError('upstream timeout')
+
+        with self.assertRaises(TimeoutError):
+            hedged_call(generate, delay=0.01)
+
+    @override_settings(SUMMARIZER_HEDGE_BUDGET=0.0)
+    def test_budget_limits_hedges(self):
+        attempts = []
+
+        async def generate():
+            attempts.append(1)
+            await asyncio.sleep(0.05)
+            return 'slow'
+
+        self.assertEqual(hedged_call(generate, delay=0.01), 'slow')
+        self.assertEqual(len(attempts), 1)
+        self.assertEqual(metrics.get_counters(['hedges_over_budget'])['hedges_over_budget'], 1)
+
+    @override_settings(SUMMARIZER_LIMITER_ENABLED=True, SUMMARIZER_LIMITER_INITIAL_CONCURRENCY=2)
+    def test_hedge_takes_a_limiter_slot(self):
+        """The duplicate holds a slot of the model's limiter, and is not sent when none is free."""
+        limiter = ModelRateLimiter('gpt-4.1-nano')
+        in_flight = []
+
+        async def generate():
+            in_flight.append(limiter.in_flight())
+            await asyncio.sleep(0.05)
+            return 'slow'
+
+        held = limiter.acquire()
+        self.assertEqual(hedged_call(generate, delay=0.01, limiter=limiter), 'slow')
+        self.assertEqual(in_flight, [1, 2])
+        self.assertEqual(limiter.in_flight(), 1)
+
+        in_flight.clear()
+        other = limiter.acquire()
+        self.assertEqual(hedged_call(generate, delay=0.01, limiter=limiter), 'slow')
+        self.assertEqual(len(in_flight), 1)
+        self.assertEqual(metrics.get_counters(['hedges_no_slot'])['hedges_no_slot'], 1)
+        limiter.release(held)
+        limiter.release(other)
+
+    @override_settings(SUMMARIZER_HEDGE_BUDGET=0.0, SUMMARIZER_LIMITER_ENABLED=True)
+    def test_over_budget_call_takes_no_limiter_slot(self):
+        limiter = ModelRateLimiter('gpt-4.1-nano')
+        in_flight = []
+
+        async def generate():
+            await asyncio.sleep(0.05)
+            # Checked while the primary is still running, after the hedge was refused
+            in_flight.append(limiter.in_flight())
+            return 'slow'
+
+        self.assertEqual(hedged_call(generate, delay=0.01, limiter=limiter, tokens=500), 'slow')
+        self.assertEqual(in_flight, [0])
+        self.assertEqual(limiter.tokens_this_minute(), 0)
+        self.assertEqual(metrics.get_counters(['hedges_no_slot'])['hedges_no_slot'], 0)
+
+    def test_should_hedge_only_interactive_classes(self):
+        self.assertTrue(should_hedge('fast'))
+        self.assertFalse(should_hedge('standard'))
+        self.assertFalse(should_hedge(None))
+        with self.settings(SUMMARIZER_HEDGE_ENABLED=False):
+            self.assertFalse(should_hedge('fast'))
+
+
+@override_settings(SUMMARIZER_HEDGE_MIN_SAMPLES=5, SUMMARIZER_HEDGE_DEFAULT_DELAY=5.0, SUMMARIZER_HEDGE_MIN_DELAY=0.5)
+class HedgeDelayTest(TestCase):
+    """Test cases for deriving the hedge delay from observed latencies."""
+
+    def setUp(self):
+        cache.clear()
+        self.now = timezone.now()
+
+    def _completed(self, index, latency, model='gpt-4.1-nano'):
+        article = Article.objects.create(
+            title=f'Hedge Article {index}',
+            content='Content.',
+            url=f'http://example.com/hedge-{model}-{index}',
+            published_date=self.now,
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        Summary.objects.create(
+            article=article, ai_model='auto', answered_by=model, status='completed', completed_at=self.now,
+            llm_started_at=self.now, llm_finished_at=self.now + timedelta(seconds=latency),
+        )
+
+    def test_default_delay_without_enough_samples(self):
+        self._completed(0, 1.0)
+        self.assertEqual(hedge_delay('gpt-4.1-nano'), 5.0)
+
+    def test_delay_is_observed_p95(self):
+        for index in range(20):
+            self._completed(index, index + 1)
+        self.assertAlmostEqual(hedge_delay('gpt-4.1-nano'), 19.05)
+        self.assertEqual(hedge_delay('gpt-3.5-turbo'), 5.0)
+
+    def test_delay_has_a_floor(self):
+        for index in range(5):
+            self._completed(index, 0.01)
+        self.assertEqual(hedge_delay('gpt-4.1-nano'), 0.5)
+
+
+@override_settings(SUMMARIZER_HEDGE_ENABLED=True, SUMMARIZER_HEDGE_BUDGET=1.0,
+                   SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class HedgedSummaryServiceTest(TestCase):
+    """Test cases for hedged interactive summaries."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title='Hedged Article',
+            content='Hedged content.',
+            url='http://example.com/hedged',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    @patch('summarizer.service.hedge_delay', return_value=0.02)
+    def test_fast_lane_records_winning_attempt_usage(self, mock_delay):
+        attempts = []
+
+        async def generate_summary(title, content, ai_model, max_words, usage):
+            attempts.append(ai_model)
+            usage['prompt_tokens'] = usage.get('prompt_tokens', 0) + 10 * len(attempts)
+            usage['completion_tokens'] = usage.get('completion_tokens', 0) + 1
+            if len(attempts) == 1:
+                await asyncio.sleep(0.3)
+                return 'Slow summary.', 11
+            return 'Hedged summary.', 21
+
+        with patch.object(self.service, '_agenerate_summary', side_effect=generate_summary):
+            summary = self.service.summarize_article(self.article.id, ai_model='gpt-4.1-nano', latency_class='fast')
+        self.assertEqual(summary.summary_text, 'Hedged summary.')
+        self.assertEqual((summary.prompt_tokens, summary.completion_tokens), (20, 1))
+        self.assertEqual(attempts, ['gpt-4.1-nano', 'gpt-4.1-nano'])
+
+    @patch('summarizer.service.hedged_call')
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_standard_lane_is_not_hedged(self, mock_generate_summary, mock_hedged_call):
+        mock_generate_summary.return_value = ('Summary.', 5)
+        self.service.summarize_article(self.article.id, ai_model='gpt-4.1-nano', latency_class='standard')
+        mock_hedged_call.assert_not_called()
@@ -0,0 +1,154 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from summarizer.leases import LeaseHeartbeat, claim_summary, release_lease, renew_lease
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from summarizer.tasks import reap_stale_summaries_task
+from articles.models import Article
+import logging
+import time
+
+
+class SummaryLeaseTest(TestCase):
+    """Test cases for claiming and renewing summary generation leases."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title='Lease Article',
+            content='Lease content.',
+            url='http://example.com/lease',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        self.summary = Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', status='pending')
+
+    def test_claim_is_exclusive(self):
+        """Only the first claimant gets the lease."""
+        self.assertTrue(claim_summary(self.summary.pk, 'worker-a'))
+        self.assertFalse(claim_summary(self.summary.pk, 'worker-b'))
+        self.summary.refresh_from_db()
+        self.assertEqual(self.summary.status, 'in_progress')
+        self.assertEqual(self.summary.lease_owner, 'worker-a')
+        self.assertEqual(self.summary.attempts, 1)
+        self.assertIsNotNone(self.summary.started_at)
+
+    def test_expired_lease_can_be_claimed(self):
+        """A lease that was not renewed in time is taken over."""
+        claim_summary(self.summary.pk, 'worker-a')
+        Summary.objects.filter(pk=self.summary.pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertTrue(claim_summary(self.summary.pk, 'worker-b'))
+        self.summary.refresh_from_db()
+        self.assertEqual(self.summary.lease_owner, 'worker-b')
+        self.assertEqual(self.summary.attempts, 2)
+
+    def test_completed_summary_cannot_be_claimed(self):
+        Summary.objects.filter(pk=self.summary.pk).update(status='completed')
+        self.assertFalse(claim_summary(self.summary.pk, 'worker-a'))
+
+    def test_renew_and_release_require_ownership(self):
+        """Only the lease owner can renew or release it."""
+        claim_summary(self.summary.pk, 'worker-a')
+        self.assertEqual(renew_lease([self.summary.pk], 'worker-b'), 0)
+        self.assertEqual(renew_lease([self.summary.pk], 'worker-a'), 1)
+        self.assertFalse(release_lease(self.summary.pk, 'worker-b'))
+        self.assertTrue(release_lease(self.summary.pk, 'worker-a'))
+        self.summary.refresh_from_db()
+        self.assertEqual(self.summary.status, 'pending')
+        self.assertIsNone(self.summary.lease_owner)
+
+    @patch('summarizer.leases.renew_lease')
+    def test_heartbeat_renews_until_stopped(self, mock_renew):
+        """The heartbeat renews the lease periodically while work runs."""
+        mock_renew.return_value = 1
+        with LeaseHeartbeat([self.summary.pk], 'worker-a', interval=0.01):
+            time.sleep(0.1)
+        calls = mock_renew.call_count
+        self.assertGreater(calls, 1)
+        time.sleep(0.05)
+        self.assertEqual(mock_renew.call_count, calls)
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_summarize_article_skips_leased_summary(self, mock_generate_summary):
+        """A summary leased by another worker is not generated again."""
+        claim_summary(self.summary.pk, 'other-worker')
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            summary = SummarizerService().summarize_article(self.article.id, ai_model='gpt-4.1-nano')
+        mock_generate_summary.assert_not_called()
+        self.assertEqual(summary.status, 'in_progress')
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_summarize_article_clears_lease(self, mock_generate_summary):
+        """A completed summary no longer holds a lease."""
+        mock_generate_summary.return_value = ('Summary.', 5)
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            summary = SummarizerService().summarize_article(self.article.id, ai_model='gpt-4.1-nano')
+        self.assertEqual(summary.status, 'completed')
+        self.assertIsNone(summary.lease_owner)
+        self.assertIsNone(summary.lease_expires_at)
+        self.assertEqual(summary.attempts, 1)
+
+
+@override_settings(SUMMARIZER_LEASE_SECONDS=120, SUMMARIZER_PENDING_TIMEOUT=600, SUMMARIZER_MAX_ATTEMPTS=3)
+class ReapStaleSummariesTaskTest(TestCase):
+    """Test cases for the periodic reaper of stuck summaries."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        self.now = timezone.now()
+        self.articles = [
+            Article.objects.create(
+                title=f'Reaper Article {i}',
+                content='Content.',
+                url=f'http://example.com/reaper-{i}',
+                published_date=self.now,
+                source='Test Source',
+                news_client_source='TestAPI'
+            )
+            for i in range(3)
+        ]
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_requeues_expired_lease(self, mock_delay):
+        """A summary whose worker died is put back to pending and re-enqueued."""
+        summary = Summary.objects.create(
+            article=self.articles[0], ai_model='gpt-4.1-nano', status='in_progress',
+            lease_owner='dead-worker', lease_expires_at=self.now - timedelta(seconds=5), attempts=1,
+        )
+        result = reap_stale_summaries_task()
+        summary.refresh_from_db()
+        self.assertEqual(result, {'requeued': 1, 'failed': 0})
+        self.assertEqual(summary.status, 'pending')
+        self.assertIsNone(summary.lease_owner)
+        mock_delay.assert_called_once_with(self.articles[0].id, 'gpt-4.1-nano', None, 150)
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_requeues_lost_pending_task(self, mock_delay):
+        """A pending summary waiting longer than the timeout is re-enqueued; fresh ones are left alone."""
+        Summary.objects.create(article=self.articles[0], ai_model='gpt-4.1-nano', status='pending',
+                               queued_at=self.now - timedelta(seconds=601))
+        Summary.objects.create(article=self.articles[1], ai_model='gpt-4.1-nano', status='pending',
+                               queued_at=self.now)
+        Summary.objects.create(article=self.articles[2], ai_model='gpt-4.1-nano', status='in_progress',
+                               lease_owner='live-worker', lease_expires_at=self.now + timedelta(seconds=60))
+        self.assertEqual(reap_stale_summaries_task(), {'requeued': 1, 'failed': 0})
+        mock_delay.assert_called_once_with(self.articles[0].id, 'gpt-4.1-nano', None, 150)
+
+    @patch('summarizer.tasks.publish_summary_finished')
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_fails_after_max_attempts(self, mock_delay, mock_publish):
+        """A summary that keeps getting stuck is eventually marked failed."""
+        summary = Summary.objects.create(
+            article=self.articles[0], ai_model='gpt-4.1-nano', status='in_progress',
+            lease_owner='dead-worker', lease_expires_at=self.now - timedelta(seconds=5), attempts=3,
+        )
+        self.assertEqual(reap_stale_summaries_task(), {'requeued': 0, 'failed': 1})
+        summary.refresh_from_db()
+        self.assertEqual(summary.status, 'failed')
+        mock_delay.assert_not_called()
+        mock_publish.assert_called_once_with(summary.id, 'failed')
@@ -0,0 +1,169 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from summarizer.fake_llm import FakeSummaryChatModel
+from summarizer.lengths import resolve_lengths, resolve_max_words
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from articles.models import Article
+import json
+import logging
+
+
+class ResolveLengthTest(TestCase):
+    """Test cases for length presets and word budgets."""
+
+    def test_presets_and_budgets(self):
+        self.assertEqual(resolve_max_words('short'), 50)
+        self.assertEqual(resolve_max_words('LONG'), 300)
+        self.assertEqual(resolve_max_words('80'), 80)
+        self.assertEqual(resolve_max_words(None), 150)
+
+    def test_invalid_lengths(self):
+        for value in ['tiny', '5', 5000, 'abc']:
+            with self.assertRaises(ValueError):
+                resolve_max_words(value)
+
+    def test_resolve_lengths_deduplicates_in_order(self):
+        self.assertEqual(resolve_lengths('long,short,50'), [300, 50])
+        self.assertEqual(resolve_lengths(['medium', 80]), [150, 80])
+        with self.assertRaises(ValueError):
+            resolve_lengths([])
+
+
+class LengthVariantServiceTest(TestCase):
+    """Test cases for summaries keyed by max_words."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title='Length Article',
+            content=' '.join(f'word{i}' for i in range(400)),
+            url='http://example.com/lengths',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_lengths_are_separate_summaries(self, mock_generate_summary):
+        """A short summary is not served from an existing medium one."""
+        mock_generate_summary.return_value = ('Summary.', 5)
+        medium = self.service.summarize_article(self.article.id, ai_model='gpt-4.1-nano')
+        short = self.service.summarize_article(self.article.id, ai_model='gpt-4.1-nano', max_words='short')
+        self.assertNotEqual(medium.pk, short.pk)
+        self.assertEqual((medium.max_words, short.max_words), (150, 50))
+        self.assertEqual(mock_generate_summary.call_count, 2)
+        self.assertEqual(mock_generate_summary.call_args.kwargs['max_words'], 50)
+
+    def test_multiple_lengths_in_one_call(self):
+        """Several missing lengths are generated with a single LLM call."""
+        llm = FakeSummaryChatModel()
+        with patch.object(self.service, '_get_llm', return_value=llm) as mock_get_llm:
+            summaries = self.service.summarize_article_lengths(
+                self.article.id, ai_model='gpt-4.1-nano', lengths=['long', 'short', 'medium']
+            )
+        mock_get_llm.assert_called_once()
+        self.assertEqual([s.max_words for s in summaries], [300, 50, 150])
+        for summary in summaries:
+            self.assertEqual(summary.status, 'completed')
+            self.assertEqual(summary.word_count, summary.max_words)
+            self.assertIsNone(summary.lease_owner)
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_multiple_lengths_reuses_completed(self, mock_generate_summary):
+        """Completed lengths are returned as is and a single missing one is generated alone."""
+        Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', max_words=50,
+                               status='completed', summary_text='Existing.')
+        mock_generate_summary.return_value = ('Generated.', 5)
+        summaries = self.service.summarize_article_lengths(
+            self.article.id, ai_model='gpt-4.1-nano', lengths=['short', 'long']
+        )
+        self.assertEqual([s.summary_text for s in summaries], ['Existing.', 'Generated.'])
+        mock_generate_summary.assert_called_once()
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_missing_lengths_are_retried_individually(self, mock_generate_summary):
+        """Lengths absent from the multi-length output fall back to a single call each."""
+        mock_generate_summary.return_value = ('Individual.', 5)
+        output = json.dumps({'summaries': [{'max_words': 50, 'summary': 'Short one.'}]})
+        with patch.object(self.service, '_get_llm', return_value=FakeListChatModel(responses=[output])):
+            summaries = self.service.summarize_article_lengths(
+                self.article.id, ai_model='gpt-4.1-nano', lengths=[50, 300]
+            )
+        self.assertEqual([s.summary_text for s in summaries], ['Short one.', 'Individual.'])
+        self.assertEqual(mock_generate_summary.call_args.kwargs['max_words'], 300)
+
+    @patch('summarizer.tasks.summarize_lengths_task.delay')
+    def test_lengths_async_enqueues_one_task(self, mock_delay):
+        """Async multi-length requests enqueue a single task for the missing lengths."""
+        Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', max_words=150, status='completed')
+        summaries = self.service.summarize_article_lengths_async(
+            self.article.id, ai_model='gpt-4.1-nano', lengths=['short', 'medium', 'long']
+        )
+        self.assertEqual([s.status for s in summaries], ['pending', 'completed', 'pending'])
+        mock_delay.assert_called_once_with(self.article.id, 'gpt-4.1-nano', None, [50, 300])
+
+
+class LengthVariantViewTest(APITestCase):
+    """Test cases for requesting summary lengths through the API."""
+
+    def setUp(self):
+        cache.clear()
+        self.admin_user = get_user_model().objects.create_user(
+            email='admin@example.com',
+            name='Admin User',
+            password='adminpass',
+            is_staff=True
+        )
+        self.admin_token = Token.objects.create(user=self.admin_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        self.article = Article.objects.create(
+            title='Length Article',
+            content='Content.',
+            url='http://example.com/lengths-view',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    @patch('summarizer.tasks.summarize_lengths_task.delay')
+    def test_summarize_several_lengths(self, mock_delay):
+        url = reverse('summarizer:summarize_article')
+        response = self.client.post(url, {'article_id': self.article.id, 'lengths': ['short', 'long']}, format='json')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual([s['max_words'] for s in response.data['summaries']], [50, 300])
+        mock_delay.assert_called_once()
+
+    def test_summarize_invalid_length(self):
+        url = reverse('summarizer:summarize_article')
+        response = self.client.post(url, {'article_id': self.article.id, 'length': 'huge'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_summary_by_length(self):
+        Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', max_words=50,
+                               status='completed', summary_text='Short.')
+        url = reverse('summarizer:get_summary', kwargs={'article_id': self.article.id})
+        response = self.client.get(url, {'length': 'short'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['summary']['max_words'], 50)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    @patch('summarizer.service.SummarizerService.summarize_article_async')
+    def test_article_summary_length_param(self, mock_summarize_async):
+        mock_summarize_async.return_value = Summary.objects.create(
+            article=self.article, ai_model='gpt-4.1-nano', max_words=50, status='pending'
+        )
+        url = reverse('articles:articles-summary', args=[self.article.id])
+        response = self.client.get(url, {'length': 'short'})
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(mock_summarize_async.call_args.kwargs['max_words'], 50)
@@ -0,0 +1,96 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from summarizer.fake_llm import _openai_error
+from summarizer.limiter import LimiterTimeout, ModelRateLimiter
+from summarizer.router import ModelRouter
+import logging
+import openai
+import threading
+import time
+
+
+@override_settings(
+    SUMMARIZER_LIMITER_ENABLED=True,
+    SUMMARIZER_LIMITER_INITIAL_CONCURRENCY=2,
+    SUMMARIZER_LIMITER_MAX_CONCURRENCY=4,
+    SUMMARIZER_LIMITER_DECREASE_COOLDOWN=5,
+    SUMMARIZER_LIMITER_MAX_WAIT=1,
+    SUMMARIZER_LIMITER_POLL_INTERVAL=0.01,
+    SUMMARIZER_LIMITER_TOKENS_PER_MINUTE={'gpt-4.1-nano': 1000},
+)
+class ModelRateLimiterTest(TestCase):
+    """Test cases for the AIMD concurrency and tokens-per-minute limiter."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.limiter = ModelRateLimiter('gpt-4.1-nano')
+
+    def test_success_increases_limit_additively(self):
+        for _ in range(2):
+            with self.limiter.slot():
+                pass
+        self.assertAlmostEqual(self.limiter.limit(), 2.9, places=2)
+        for _ in range(50):
+            self.limiter.record_success()
+        self.assertEqual(self.limiter.limit(), 4)
+
+    def test_rate_limit_cuts_limit_once_per_cooldown(self):
+        """A burst of 429s halves the limit once rather than collapsing it."""
+        for _ in range(3):
+            with self.assertRaises(openai.RateLimitError):
+                with self.limiter.slot():
+                    raise _openai_error(openai.RateLimitError, 429, 'slow down')
+        self.assertEqual(self.limiter.limit(), 1)
+        self.assertEqual(self.limiter.in_flight(), 0)
+
+    def test_other_errors_leave_limit_alone(self):
+        with self.assertRaises(ValueError):
+            with self.limiter.slot():
+                raise ValueError('bad output')
+        self.assertEqual(self.limiter.limit(), 2)
+
+    def test_waits_for_a_free_slot(self):
+        """A call beyond the limit waits until a slot is released instead of failing."""
+        held = [self.limiter.acquire(), self.limiter.acquire()]
+        self.assertEqual(self.limiter.in_flight(), 2)
+        threading.Timer(0.05, cache.delete, args=[held[0]]).start()
+        started = time.monotonic()
+        with self.limiter.slot():
+            self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        cache.delete(held[1])
+
+    def test_gives_up_after_max_wait(self):
+        self.limiter.acquire()
+        self.limiter.acquire()
+        with self.settings(SUMMARIZER_LIMITER_MAX_WAIT=0.05):
+            with self.assertRaises(LimiterTimeout):
+                self.limiter.acquire()
+
+    def test_tokens_per_minute_budget(self):
+        """Calls that would exceed the minute's token budget wait; the first call always goes."""
+        with self.limiter.slot(tokens=1500):
+            pass
+        with self.settings(SUMMARIZER_LIMITER_MAX_WAIT=0.05):
+            with self.assertRaises(LimiterTimeout):
+                self.limiter.acquire(tokens=100)
+        self.assertEqual(self.limiter.tokens_this_minute(), 1500)
+        self.assertEqual(self.limiter.in_flight(), 0)
+
+    def test_router_uses_limiter(self):
+        """Router calls take a slot and a timeout on one model cuts its limit."""
+        def generate(model):
+            if model == 'gpt-4.1-nano':
+                raise TimeoutError('upstream timeout')
+            return 'ok'
+
+        result, answered_by = ModelRouter().call('gpt-4.1-nano', 'Short.', None, generate)
+        self.assertEqual(result, 'ok')
+        self.assertEqual(self.limiter.limit(), 1)
+        self.assertGreater(ModelRateLimiter(answered_by).limit(), 2)
+
+    @override_settings(SUMMARIZER_LIMITER_ENABLED=False)
+    def test_disabled_limiter_does_not_track(self):
+        with self.limiter.slot(tokens=5000):
+            pass
+        self.assertEqual(self.limiter.tokens_this_minute(), 0)
@@ -0,0 +1,124 @@
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.utils import timezone
+from unittest.mock import patch
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from articles.models import Article
+import json
+import logging
+
+
+@override_settings(SUMMARIZER_MICRO_BATCH_ENABLED=True, SUMMARIZER_MICRO_BATCH_SIZE=8,
+                   SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class MicroBatchTest(TestCase):
+    """Test cases for micro-batched summarization of short articles."""
+
+    def setUp(self):
+        """Set up test data."""
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.articles = [
+            Article.objects.create(
+                title=f'Short Article {i}',
+                content=f'Short content number {i}.',
+                url=f'http://example.com/short-{i}',
+                published_date=timezone.now(),
+                source='Test Source',
+                news_client_source='TestAPI'
+            )
+            for i in range(3)
+        ]
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    def _create_pending(self):
+        return [
+            Summary.objects.create(article=article, ai_model='gpt-4.1-nano', max_words=50, status='pending')
+            for article in self.articles
+        ]
+
+    def test_parse_batch_output_skips_malformed_items(self):
+        """Only well-formed entries for expected articles are kept."""
+        output = json.dumps({'summaries': [
+            {'id': 1, 'summary': 'First summary.'},
+            {'id': 2, 'summary': ''},
+            {'id': 'x', 'summary': 'Bad id.'},
+            {'id': 99, 'summary': 'Unexpected article.'},
+        ]})
+        parsed = SummarizerService._parse_batch_output(output, {1, 2})
+        self.assertEqual(parsed, {1: 'First summary.'})
+
+    def test_parse_batch_output_invalid_json(self):
+        """Unparseable output yields no summaries."""
+        self.assertEqual(SummarizerService._parse_batch_output('not json', {1}), {})
+
+    def test_parse_batch_output_code_fence(self):
+        """JSON wrapped in a markdown code fence is accepted."""
+        output = '```json\n{"summaries": [{"id": 1, "summary": "Fenced."}]}\n```'
+        self.assertEqual(SummarizerService._parse_batch_output(output, {1}), {1: 'Fenced.'})
+
+    def test_summarize_pending_batch_single_call(self):
+        """All pending short articles are summarized from one LLM response."""
+        self._create_pending()
+        output = json.dumps({'summaries': [
+            {'id': article.id, 'summary': f'Summary of {article.id}.'} for article in self.articles
+        ]})
+        llm = FakeListChatModel(responses=[output])
+        with patch.object(self.service, '_get_llm', return_value=llm) as mock_get_llm:
+            results = self.service.summarize_pending_batch('gpt-4.1-nano', max_words=50)
+
+        self.assertEqual(len(results), 3)
+        mock_get_llm.assert_called_once()
+        for article in self.articles:
+            summary = Summary.objects.get(article=article, ai_model='gpt-4.1-nano')
+            self.assertEqual(summary.status, 'completed')
+            self.assertEqual(summary.summary_text, f'Summary of {article.id}.')
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_summarize_pending_batch_retries_malformed_items(self, mock_generate_summary):
+        """Articles missing from the batch output are retried individually."""
+        self._create_pending()
+        mock_generate_summary.return_value = ('Individual summary.', 10)
+        output = json.dumps({'summaries': [{'id': self.articles[0].id, 'summary': 'Batched.'}]})
+        llm = FakeListChatModel(responses=[output])
+        with patch.object(self.service, '_get_llm', return_value=llm):
+            results = self.service.summarize_pending_batch('gpt-4.1-nano', max_words=50)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(mock_generate_summary.call_count, 2)
+        texts = {s.article_id: s.summary_text for s in Summary.objects.all()}
+        self.assertEqual(texts[self.articles[0].id], 'Batched.')
+        self.assertEqual(texts[self.articles[1].id], 'Individual summary.')
+
+    @override_settings(SUMMARIZER_MICRO_BATCH_MAX_CHARS=10)
+    def test_summarize_pending_batch_ignores_long_articles(self):
+        """Articles over the short-article threshold are left for the regular path."""
+        self._create_pending()
+        with patch.object(self.service, '_generate_batch_summaries') as mock_batch:
+            results = self.service.summarize_pending_batch('gpt-4.1-nano')
+        self.assertEqual(results, [])
+        mock_batch.assert_not_called()
+        self.assertFalse(Summary.objects.exclude(status='pending').exists())
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    @patch('summarizer.tasks.summarize_batch_task.apply_async')
+    def test_async_schedules_one_flush_per_window(self, mock_apply_async, mock_delay):
+        """Short articles schedule a single batch flush instead of individual tasks."""
+        for article in self.articles:
+            summary = self.service.summarize_article_async(article.id, ai_model='gpt-4.1-nano')
+            self.assertEqual(summary.status, 'pending')
+
+        mock_apply_async.assert_called_once()
+        mock_delay.assert_not_called()
+
+    @override_settings(SUMMARIZER_MICRO_BATCH_ENABLED=False)
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    @patch('summarizer.tasks.summarize_batch_task.apply_async')
+    def test_async_without_batching_enqueues_individually(self, mock_apply_async, mock_delay):
+        """With batching disabled every article gets its own task."""
+        for article in self.articles:
+            self.service.summarize_article_async(article.id, ai_model='gpt-4.1-nano')
+        mock_apply_async.assert_not_called()
+        self.assertEqual(mock_delay.call_count, 3)
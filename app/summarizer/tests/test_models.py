@@ -53,7 +53,7 @@ class SummaryModelTest(TestCase):
             article=self.article
         )
         
-        self.assertEqual(summary.ai_model, 'openai-gpt-4.1-nano')
+        self.assertEqual(summary.ai_model, 'gpt-4.1-nano')
         self.assertEqual(summary.status, 'pending')
         self.assertIsNone(summary.summary_text)
         self.assertIsNone(summary.word_count)
@@ -0,0 +1,166 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITransactionTestCase
+from unittest.mock import patch, MagicMock
+from summarizer.models import Summary
+from summarizer.notifications import CHANNEL_PREFIX, SummaryNotificationHub, publish_summary_finished
+from summarizer.tasks import summarize_article_task
+from articles.models import Article
+import json
+import logging
+import threading
+
+
+class SummaryNotificationHubTest(TestCase):
+    """Test cases for the per-process summary notification hub."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        self.hub = SummaryNotificationHub(redis_client=MagicMock())
+        patcher = patch.object(self.hub, '_ensure_listener')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('summarizer.notifications.get_redis_client')
+    def test_publish_summary_finished(self, mock_get_client):
+        """Completion is published on the summary's channel."""
+        publish_summary_finished(7, 'completed')
+        mock_get_client.return_value.publish.assert_called_once_with(
+            f'{CHANNEL_PREFIX}7', json.dumps({'summary_id': 7, 'status': 'completed'})
+        )
+
+    @patch('summarizer.notifications.get_redis_client')
+    def test_publish_errors_are_swallowed(self, mock_get_client):
+        """A Redis outage never breaks the caller."""
+        mock_get_client.return_value.publish.side_effect = ConnectionError('down')
+        publish_summary_finished(7, 'completed')
+
+    def test_dispatch_wakes_only_matching_waiters(self):
+        """A message wakes the waiters of its summary and no others."""
+        with self.hub.subscribe(1) as first, self.hub.subscribe(2) as second:
+            self.hub._dispatch({'channel': f'{CHANNEL_PREFIX}1'.encode(), 'data': b'{}'})
+            self.assertTrue(first.is_set())
+            self.assertFalse(second.is_set())
+
+    def test_waiters_are_removed_after_exit(self):
+        """Waiter registrations are cleaned up when the wait ends."""
+        with self.hub.subscribe(1):
+            with self.hub.subscribe(1):
+                self.assertEqual(self.hub.waiter_count(), 2)
+        self.assertEqual(self.hub.waiter_count(), 0)
+
+    def test_wait_returns_when_notified(self):
+        """wait() returns True as soon as the completion message arrives."""
+        timer = threading.Timer(0.05, self.hub._dispatch, args=[{'channel': f'{CHANNEL_PREFIX}3'}])
+        timer.start()
+        self.assertTrue(self.hub.wait(3, timeout=5))
+
+    def test_wait_times_out(self):
+        """wait() returns False when nothing is published."""
+        self.assertFalse(self.hub.wait(4, timeout=0.01))
+
+
+class SummaryTaskNotificationTest(TestCase):
+    """Test cases for completion publishing from summarize_article_task."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        self.article = Article.objects.create(
+            title='Task Article',
+            content='Task content.',
+            url='http://example.com/task',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    @patch('summarizer.tasks.publish_summary_finished')
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_task_publishes_on_completion(self, mock_generate_summary, mock_publish):
+        """The task publishes once the summary is completed."""
+        mock_generate_summary.return_value = ('Task summary.', 10)
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            summarize_article_task.apply(args=[self.article.id, 'gpt-4.1-nano'])
+        summary = Summary.objects.get(article=self.article)
+        mock_publish.assert_called_once_with(summary.id, 'completed')
+
+
+class SummaryWaitViewTest(APITransactionTestCase):
+    """Test cases for the long-poll and SSE completion endpoints."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        self.admin_user = get_user_model().objects.create_user(
+            email='admin@example.com',
+            name='Admin User',
+            password='adminpass',
+            is_staff=True
+        )
+        self.admin_token = Token.objects.create(user=self.admin_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        self.article = Article.objects.create(
+            title='Wait Article',
+            content='Wait content.',
+            url='http://example.com/wait',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        self.summary = Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', status='pending')
+        self.hub = SummaryNotificationHub(redis_client=MagicMock())
+        patcher = patch('summarizer.views.get_notification_hub', return_value=self.hub)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(self.hub, '_ensure_listener')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _complete_later(self):
+        def complete():
+            Summary.objects.filter(pk=self.summary.pk).update(status='completed', completed_at=timezone.now())
+            self.hub._dispatch({'channel': f'{CHANNEL_PREFIX}{self.summary.pk}'})
+        timer = threading.Timer(0.05, complete)
+        timer.start()
+        self.addCleanup(timer.join)
+
+    def test_wait_returns_on_completion(self):
+        """The long-poll returns once the completion is published."""
+        self._complete_later()
+        url = reverse('summarizer:wait_summary_status', kwargs={'summary_id': self.summary.id})
+        response = self.client.get(url, {'timeout': 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['timed_out'])
+        self.assertEqual(response.data['status']['status'], 'completed')
+
+    def test_wait_times_out(self):
+        """The long-poll returns the current status after the timeout."""
+        url = reverse('summarizer:wait_summary_status', kwargs={'summary_id': self.summary.id})
+        response = self.client.get(url, {'timeout': 0.01})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['timed_out'])
+        self.assertEqual(response.data['status']['status'], 'pending')
+
+    def test_wait_invalid_timeout(self):
+        """A non-numeric timeout is rejected."""
+        url = reverse('summarizer:wait_summary_status', kwargs={'summary_id': self.summary.id})
+        response = self.client.get(url, {'timeout': 'soon'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_wait_not_found(self):
+        """Waiting on an unknown summary returns 404."""
+        url = reverse('summarizer:wait_summary_status', kwargs={'summary_id': 999})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_events_stream_status(self):
+        """The SSE endpoint sends a status event when the summary finishes."""
+        self._complete_later()
+        url = reverse('summarizer:summary_status_events', kwargs={'summary_id': self.summary.id})
+        response = self.client.get(url, {'timeout': 5}, HTTP_ACCEPT='text/event-stream')
+        body = b''.join(response.streaming_content).decode()
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertIn('event: status', body)
+        self.assertIn('"completed"', body)
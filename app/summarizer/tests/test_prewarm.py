@@ -0,0 +1,140 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer import prewarm
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from summarizer.tasks import prewarm_summaries_task
+from articles.models import Article
+import logging
+
+
+@override_settings(
+    SUMMARIZER_QUALITY_GATE_ENABLED=False,
+    SUMMARIZER_PREWARM_WEIGHTS={'view': 1.0, 'impression': 0.1, 'source': 2.0},
+    SUMMARIZER_PREWARM_HALF_LIFE_HOURS=12,
+    SUMMARIZER_PREWARM_MIN_SCORE=0.5,
+    SUMMARIZER_PREWARM_TOKEN_BUDGET=100000,
+    SUMMARIZER_MICRO_BATCH_ENABLED=False,
+)
+class PrewarmRankingTest(TestCase):
+    """Test cases for ranking articles by request signals and prewarming their summaries."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        now = timezone.now()
+        self.articles = [
+            Article.objects.create(
+                title=f'Prewarm Article {i}',
+                content='Content.',
+                url=f'http://example.com/prewarm-{i}',
+                published_date=now - timedelta(hours=hours),
+                source=source,
+                news_client_source='TestAPI'
+            )
+            for i, (hours, source) in enumerate([(1, 'Wire'), (1, 'Wire'), (1, 'Blog'), (36, 'Blog')])
+        ]
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    def _view(self, article, times):
+        for _ in range(times):
+            prewarm.record_view(article.id)
+
+    def test_rank_by_views_impressions_and_source(self):
+        self._view(self.articles[2], 3)
+        self._view(self.articles[0], 2)
+        prewarm.record_impressions([self.articles[1].id] * 20)
+        ranked = [article.id for article, _ in prewarm.rank_articles()]
+        # Article 1 has no views of its own but shares its source with a viewed article
+        self.assertEqual(ranked, [self.articles[2].id, self.articles[0].id, self.articles[1].id])
+
+    def test_old_articles_decay(self):
+        """The same signals count for less on an older article."""
+        self._view(self.articles[2], 4)
+        self._view(self.articles[3], 4)
+        scores = dict((article.id, score) for article, score in prewarm.rank_articles())
+        self.assertGreater(scores[self.articles[2].id], 4 * scores[self.articles[3].id])
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_prewarm_enqueues_top_articles_without_summary(self, mock_delay):
+        self._view(self.articles[0], 5)
+        self._view(self.articles[1], 4)
+        self._view(self.articles[2], 3)
+        Summary.objects.create(article=self.articles[0], ai_model='gpt-4.1-nano', status='completed')
+        result = prewarm.prewarm_summaries(self.service, top_n=1)
+        self.assertEqual(result['enqueued'], 1)
+        mock_delay.assert_called_once_with(self.articles[1].id, 'gpt-4.1-nano', None, 150)
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_prewarm_stops_at_budget(self, mock_delay):
+        self._view(self.articles[0], 5)
+        self._view(self.articles[1], 4)
+        with self.settings(SUMMARIZER_PREWARM_TOKEN_BUDGET=500):
+            result = prewarm.prewarm_summaries(self.service)
+        self.assertEqual((result['enqueued'], result['over_budget']), (1, 1))
+        mock_delay.assert_called_once()
+
+    def test_first_hit_rate_counts_first_request_per_article(self):
+        """Repeated requests for an article do not inflate the first-hit completed rate."""
+        completed = Summary.objects.create(article=self.articles[0], ai_model='gpt-4.1-nano', status='completed')
+        pending = Summary.objects.create(article=self.articles[1], ai_model='gpt-4.1-nano', status='pending')
+        for _ in range(3):
+            prewarm.record_summary_request(completed)
+        prewarm.record_summary_request(pending)
+        pending.status = 'completed'
+        prewarm.record_summary_request(pending)
+        self.assertEqual(prewarm.prewarm_stats()['first_hit_completed_rate'], 0.5)
+
+    @override_settings(SUMMARIZER_PREWARM_ENABLED=False)
+    @patch('summarizer.tasks.prewarm_summaries')
+    def test_task_respects_setting(self, mock_prewarm):
+        self.assertEqual(prewarm_summaries_task()['enqueued'], 0)
+        mock_prewarm.assert_not_called()
+
+
+@override_settings(SUMMARIZER_PREWARM_SPECULATIVE=True, SUMMARIZER_PREWARM_TOKEN_BUDGET=100000,
+                   SUMMARIZER_MICRO_BATCH_ENABLED=False, SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class PrewarmSignalViewTest(APITestCase):
+    """Test cases for recording signals from the article endpoints."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='reader@example.com',
+            name='Reader',
+            password='readerpass'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.article = Article.objects.create(
+            title='Signal Article',
+            content='Content.',
+            url='http://example.com/signal',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_detail_view_enqueues_summary_once(self, mock_delay):
+        url = reverse('articles:articles-detail', args=[self.article.id])
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(self.client.get(url).status_code, 200)
+        mock_delay.assert_called_once_with(self.article.id, 'gpt-4.1-nano', None, 150)
+        # The second request came from the page cache and was still counted
+        self.assertEqual(cache.get(prewarm._signal_key(prewarm.VIEW, self.article.id)), 2)
+
+    def test_list_impressions_counted_from_page_cache(self):
+        url = reverse('articles:articles-list')
+        self.client.get(url)
+        self.client.get(url)
+        self.assertEqual(cache.get(prewarm._signal_key(prewarm.IMPRESSION, self.article.id)), 2)
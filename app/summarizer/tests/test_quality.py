@@ -0,0 +1,99 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from summarizer.models import Summary
+from summarizer.quality import (
+    QUALITY_GATE_MODEL, content_score, passes_quality_gate, quality_gate_stats, trivial_summary, usable_text,
+)
+from summarizer.service import SummarizerService
+from articles.models import Article
+import logging
+
+RICH_CONTENT = (
+    'The city council approved a new transit budget on Tuesday after months of debate. '
+    'Bus routes across the northern districts will run more often, and two tram lines '
+    'are scheduled to open next spring. Opponents argued the plan relies on optimistic '
+    'ridership forecasts and raises parking fees downtown.'
+)
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=True)
+class QualityGateTest(TestCase):
+    """Test cases for skipping the LLM on articles without usable content."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    def _article(self, content, description='Council passes transit budget.', slug='quality'):
+        return Article.objects.create(
+            title='Transit Budget Approved',
+            description=description,
+            content=content,
+            url=f'http://example.com/{slug}',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    def test_truncation_marker_and_tags_are_not_content(self):
+        self.assertEqual(usable_text('<p>Council  passes budget</p>… [+2345 chars]'), 'Council passes budget')
+
+    def test_content_repeating_description_scores_low(self):
+        article = self._article('Council passes transit budget. [+1200 chars]')
+        self.assertEqual(content_score(article), 0)
+        self.assertFalse(passes_quality_gate(article))
+        self.assertTrue(passes_quality_gate(self._article(RICH_CONTENT, slug='rich')))
+
+    def test_truncated_newsapi_content_passes(self):
+        """NewsAPI cuts content at about 200 characters; such an item is still worth summarizing."""
+        article = Article.objects.create(
+            title='Storm forces closure of coastal highway as crews clear debris',
+            description='Transport officials closed a stretch of the coastal highway on Sunday after a storm '
+                        'brought down trees and power lines.',
+            content='Transport officials closed a stretch of the coastal highway on Sunday after a storm brought '
+                    'down trees and power lines. Crews expect to reopen one lane by Tuesday, while residents of '
+                    'three villages… [+3412 chars]',
+            url='http://example.com/newsapi-truncated',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='NewsAPI'
+        )
+        self.assertLess(len(usable_text(article.content)), 260)
+        self.assertTrue(passes_quality_gate(article))
+
+    def test_trivial_summary_falls_back_to_title(self):
+        article = self._article('', description='')
+        self.assertEqual(trivial_summary(article, 150), 'Transit Budget Approved')
+        self.assertEqual(trivial_summary(self._article('', description='one two three four', slug='cut'), 2),
+                         'one two…')
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_trivial_article_is_summarized_without_llm(self, mock_generate_summary):
+        article = self._article('Council passes transit budget…')
+        summary = self.service.summarize_article(article.id, ai_model='gpt-4.1-nano')
+        mock_generate_summary.assert_not_called()
+        self.assertEqual(summary.status, 'completed')
+        self.assertEqual(summary.summary_text, 'Council passes transit budget.')
+        self.assertEqual(summary.ai_model, 'gpt-4.1-nano')
+        self.assertEqual(summary.answered_by, QUALITY_GATE_MODEL)
+        # Later requests for the same model are served from the stored summary
+        self.assertEqual(self.service.summarize_article(article.id, ai_model='gpt-4.1-nano').id, summary.id)
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_async_trivial_article_completes_without_task(self, mock_delay):
+        article = self._article('')
+        summary = self.service.summarize_article_async(article.id, ai_model='gpt-4.1-nano')
+        mock_delay.assert_not_called()
+        self.assertEqual(Summary.objects.get(pk=summary.pk).status, 'completed')
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_rich_article_goes_to_llm_and_is_counted(self, mock_generate_summary):
+        mock_generate_summary.return_value = ('Council approves transit budget.', 4)
+        self.service.summarize_article(self._article(RICH_CONTENT, slug='rich').id, ai_model='gpt-4.1-nano')
+        self.service.summarize_article(self._article('').id, ai_model='gpt-4.1-nano')
+        mock_generate_summary.assert_called_once()
+        self.assertEqual(quality_gate_stats(), {'checked': 2, 'llm_calls_avoided': 1, 'skip_rate': 0.5})
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from importlib import import_module
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer.admin import CanonicalModelForm
+from summarizer.models import Summary, SummaryBatchJob
+from summarizer.registry import PROVIDER_MODELS, UnknownModelError, canonical_model, provider_model
+from summarizer.service import SummarizerService
+from articles.models import Article
+import logging
+
+FAKE_LLM = {'latency_mean': 0, 'latency_stddev': 0, 'error_rate': 0, 'seed': 0}
+
+
+class ModelRegistryTest(TestCase):
+    """Test cases for canonical model names."""
+
+    def test_aliases_resolve_to_canonical_names(self):
+        self.assertEqual(canonical_model('openai-gpt-4.1-nano'), 'gpt-4.1-nano')
+        self.assertEqual(canonical_model(' GPT-4-Turbo-Preview '), 'gpt-4-turbo')
+        self.assertEqual(canonical_model('extractive'), 'extractive')
+        self.assertEqual(canonical_model(None), 'gpt-4.1-nano')
+        self.assertEqual(canonical_model(''), 'gpt-4.1-nano')
+        self.assertEqual(provider_model('gpt-4-turbo'), 'gpt-4-turbo-preview')
+
+    def test_unknown_models_are_rejected(self):
+        for name in ('gpt-5-ultra', 'quality-gate', 42):
+            with self.assertRaises(UnknownModelError):
+                canonical_model(name)
+        with self.assertRaises(UnknownModelError):
+            provider_model('auto')
+
+    def test_admin_form_stores_canonical_name(self):
+        form_class = type('SummaryForm', (CanonicalModelForm,), {
+            'Meta': type('Meta', (), {'model': Summary, 'fields': ['ai_model']})
+        })
+        form = form_class(data={'ai_model': 'openai-gpt-4'})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['ai_model'], 'gpt-4')
+        self.assertFalse(form_class(data={'ai_model': 'gpt-5-ultra'}).is_valid())
+
+
+@override_settings(SUMMARIZER_LLM_BACKEND='fake', SUMMARIZER_FAKE_LLM=FAKE_LLM, SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class CanonicalSummaryTest(APITestCase):
+    """Test cases for aliases sharing one summary row."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title='Alias article',
+            content='The council approved the transit budget on Tuesday after a long debate.',
+            url='http://example.com/alias',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        with patch.dict('os.environ', {}, clear=True):
+            self.service = SummarizerService()
+
+    @patch('summarizer.service.SummarizerService._generate_summary', return_value=('A summary.', 10))
+    def test_aliases_share_one_summary(self, mock_generate):
+        first = self.service.summarize_article(self.article.id, ai_model='openai-gpt-4.1-nano')
+        second = self.service.summarize_article(self.article.id, ai_model='gpt-4.1-nano')
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(first.ai_model, 'gpt-4.1-nano')
+        self.assertEqual(mock_generate.call_count, 1)
+
+    @patch('summarizer.service.SummarizerService._generate_summary', return_value=('A summary.', 10))
+    def test_auto_requests_share_one_summary_keyed_auto(self, mock_generate):
+        first = self.service.summarize_article(self.article.id, ai_model='auto')
+        second = self.service.summarize_article(self.article.id, ai_model='AUTO', latency_class='fast')
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(first.ai_model, 'auto')
+        self.assertIn(first.answered_by, PROVIDER_MODELS)
+        self.assertEqual(mock_generate.call_count, 1)
+        # Asking for the answering model by name is a different request with its own row
+        explicit = self.service.summarize_article(self.article.id, ai_model=first.answered_by)
+        self.assertNotEqual(explicit.pk, first.pk)
+
+    def test_view_rejects_unknown_model(self):
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='adminpass')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=admin).key}')
+        response = self.client.post(
+            reverse('summarizer:summarize_article'), {'article_id': self.article.id, 'ai_model': 'gpt-5-ultra'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('gpt-5-ultra', response.data['error'])
+        self.assertFalse(Summary.objects.exists())
+
+
+class MergeModelAliasesMigrationTest(TestCase):
+    """Test cases for the migration merging summaries stored under model aliases."""
+
+    def setUp(self):
+        self.article = Article.objects.create(
+            title='Merge article',
+            content='The council approved the transit budget on Tuesday.',
+            url='http://example.com/merge',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        self.migration = import_module('summarizer.migrations.0012_canonical_ai_model')
+
+    def _summary(self, ai_model, status='completed', **fields):
+        return Summary.objects.create(article=self.article, ai_model=ai_model, status=status, **fields)
+
+    def test_duplicates_are_merged_into_best_row(self):
+        now = timezone.now()
+        old = self._summary('gpt-4.1-nano', completed_at=now - timedelta(days=1))
+        newer = self._summary('openai-gpt-4.1-nano', completed_at=now, answered_by='openai-gpt-4.1-nano')
+        self._summary('gpt-4.1-nano-error-test', status='failed')
+        turbo = self._summary('gpt-4-turbo-preview', status='pending')
+        job = SummaryBatchJob.objects.create(ai_model='openai-gpt-4')
+
+        self.migration.merge_model_aliases(apps, None)
+
+        self.assertEqual(set(Summary.objects.values_list('pk', 'ai_model')),
+                         {(newer.pk, 'gpt-4.1-nano'), (turbo.pk, 'gpt-4-turbo')})
+        self.assertFalse(Summary.objects.filter(pk=old.pk).exists())
+        newer.refresh_from_db()
+        self.assertEqual(newer.answered_by, 'gpt-4.1-nano')
+        job.refresh_from_db()
+        self.assertEqual(job.ai_model, 'gpt-4')
@@ -0,0 +1,127 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from summarizer.chunking import estimate_tokens
+from summarizer.extractive import EXTRACTIVE_MODEL
+from summarizer.models import Summary
+from summarizer.prewarm import record_view
+from summarizer.resummarize import (
+    invalidate_article_summaries, plan_resummarization, prompt_version_counts, resummarize_stale_summaries
+)
+from summarizer.service import SummarizerService
+from articles.models import Article
+import logging
+
+FAKE_LLM = {'latency_mean': 0, 'latency_stddev': 0, 'error_rate': 0, 'seed': 0}
+
+
+@override_settings(SUMMARIZER_LLM_BACKEND='fake', SUMMARIZER_FAKE_LLM=FAKE_LLM, SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class ResummarizeTest(TestCase):
+    """Test cases for prompt version stamps and selective re-summarization."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        with patch.dict('os.environ', {}, clear=True):
+            self.service = SummarizerService()
+        self.articles = [
+            Article.objects.create(
+                title=f'Prompt article {i}',
+                content=f'Article {i} reports that the council approved the transit budget on Tuesday.',
+                url=f'http://example.com/prompt-{i}',
+                published_date=timezone.now() - timedelta(hours=i),
+                source='Test Source',
+                news_client_source='TestAPI'
+            )
+            for i in range(3)
+        ]
+
+    def _old_summary(self, article, **fields):
+        return Summary.objects.create(
+            article=article, ai_model='gpt-4.1-nano', max_words=150, status='completed',
+            summary_text='Old summary.', prompt_version=fields.pop('prompt_version', 'oldversion'), **fields
+        )
+
+    def test_summaries_are_stamped_with_prompt_version(self):
+        summary = self.service.summarize_article(self.articles[0].id, max_words=10)
+        self.assertEqual(summary.prompt_version, self.service.prompt_version)
+        extractive = self.service.summarize_article(self.articles[0].id, ai_model=EXTRACTIVE_MODEL)
+        self.assertIsNone(extractive.prompt_version)
+
+    def test_plan_orders_stale_summaries_by_traffic_then_recency(self):
+        current = self._old_summary(self.articles[0], prompt_version=self.service.prompt_version)
+        newest = self._old_summary(self.articles[1], prompt_version=None)
+        read = self._old_summary(self.articles[2])
+        Summary.objects.create(article=self.articles[1], ai_model=EXTRACTIVE_MODEL, answered_by=EXTRACTIVE_MODEL,
+                               max_words=150, status='completed')
+        for _ in range(5):
+            record_view(self.articles[2].id)
+
+        planned = [summary for summary, _ in plan_resummarization(self.service)]
+        self.assertEqual(planned, [read, newest])
+        self.assertNotIn(current, planned)
+        self.assertEqual(prompt_version_counts(), {self.service.prompt_version: 1, 'unknown': 1, 'oldversion': 1})
+
+    def test_regeneration_replaces_text_in_place(self):
+        summary = self._old_summary(self.articles[0])
+        regenerated = self.service.resummarize_summary(summary.pk)
+        summary.refresh_from_db()
+        self.assertEqual(regenerated.pk, summary.pk)
+        self.assertEqual(summary.status, 'completed')
+        self.assertEqual(summary.prompt_version, self.service.prompt_version)
+        self.assertTrue(summary.summary_text.startswith('Article 0 reports'))
+        # Current summaries are left alone
+        self.assertIsNone(self.service.resummarize_summary(summary.pk))
+
+    @override_settings(SUMMARIZER_RESUMMARIZE_TOP_N=10)
+    @patch('summarizer.tasks.resummarize_summary_task.delay')
+    def test_enqueue_is_throttled_by_budget_and_lock(self, mock_delay):
+        summaries = [self._old_summary(article) for article in self.articles]
+        tokens = estimate_tokens(self.articles[0].content) + 400
+        with self.settings(SUMMARIZER_RESUMMARIZE_TOKEN_BUDGET=2 * tokens + 1,
+                           SUMMARIZER_LIMITER_COMPLETION_TOKENS=400):
+            result = resummarize_stale_summaries(self.service)
+        self.assertEqual(result, {'planned': 3, 'enqueued': 2, 'over_budget': 1})
+        self.assertEqual([call.args[0] for call in mock_delay.call_args_list], [summaries[0].pk, summaries[1].pk])
+
+        # Already enqueued summaries are skipped until their lock expires
+        with self.settings(SUMMARIZER_RESUMMARIZE_TOKEN_BUDGET=100000):
+            result = resummarize_stale_summaries(self.service)
+        self.assertEqual(result['enqueued'], 1)
+        self.assertEqual(mock_delay.call_args.args[0], summaries[2].pk)
+
+    def test_changed_article_summaries_are_regenerated_first(self):
+        read = self._old_summary(self.articles[1])
+        changed = self._old_summary(self.articles[2], prompt_version=self.service.prompt_version)
+        for _ in range(5):
+            record_view(self.articles[1].id)
+        Article.objects.filter(pk=self.articles[2].pk).update(content='The council rejected the transit budget.')
+        self.assertEqual(invalidate_article_summaries([self.articles[2].id]), {'stale': 1, 'deleted': 0})
+
+        planned = [summary for summary, _ in plan_resummarization(self.service)]
+        self.assertEqual(planned, [changed, read])
+        regenerated = self.service.resummarize_summary(changed.pk)
+        changed.refresh_from_db()
+        self.assertEqual(regenerated.pk, changed.pk)
+        self.assertIsNone(changed.stale_since)
+        self.assertTrue(changed.summary_text.startswith('The council rejected'))
+
+    def test_article_changed_during_generation_stays_stale(self):
+        article = self.articles[0]
+        generate = self.service._generate_hedged
+
+        def refetch_while_generating(*args, **kwargs):
+            article.content = 'The council rejected the transit budget.'
+            article.save()
+            # Nothing completed yet, so the re-fetch has no summary to invalidate
+            self.assertEqual(invalidate_article_summaries([article.id]), {'stale': 0, 'deleted': 0})
+            return generate(*args, **kwargs)
+
+        with patch.object(self.service, '_generate_hedged', side_effect=refetch_while_generating):
+            summary = self.service.summarize_article(article.id, max_words=10)
+        summary.refresh_from_db()
+        self.assertEqual(summary.status, 'completed')
+        self.assertIsNotNone(summary.stale_since)
+        self.assertEqual([stale for stale, _ in plan_resummarization(self.service)], [summary])
@@ -0,0 +1,176 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer.fake_llm import _openai_error
+from summarizer.router import ModelRouter, validate_latency_class
+from summarizer.service import SummarizerService
+from articles.models import Article
+import logging
+import openai
+
+LONG_CONTENT = ' '.join(f'word{i}' for i in range(1000))
+
+
+class ModelRouterTest(TestCase):
+    """Test cases for picking models by latency, cost and health."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.router = ModelRouter()
+
+    def _degrade(self, model, failures=5):
+        for _ in range(failures):
+            self.router.record_failure(model)
+
+    def test_short_content_goes_to_cheapest_model(self):
+        self.assertEqual(self.router.choose('A short article.', 'relaxed'), 'gpt-4.1-nano')
+
+    def test_unhealthy_model_is_skipped(self):
+        """A model with a high error rate loses traffic to the next candidate."""
+        self._degrade('gpt-4.1-nano')
+        self.assertFalse(self.router.is_healthy('gpt-4.1-nano'))
+        self.assertEqual(self.router.choose('A short article.'), 'gpt-3.5-turbo')
+
+    def test_slow_model_is_skipped_for_latency_class(self):
+        """A model whose recent latency misses the target is skipped for that class only."""
+        self.router.record_success('gpt-4.1-nano', 12.0)
+        self.assertEqual(self.router.choose(LONG_CONTENT, 'fast'), 'gpt-3.5-turbo')
+        self.assertEqual(self.router.choose(LONG_CONTENT, 'relaxed'), 'gpt-4.1-nano')
+
+    def test_route_includes_fallbacks(self):
+        route = self.router.route('auto', 'Short.')
+        self.assertEqual(route[0], 'gpt-4.1-nano')
+        self.assertCountEqual(route, ['gpt-4.1-nano', 'gpt-3.5-turbo', 'gpt-4-turbo'])
+        self.assertEqual(ModelRouter({'gpt-4.1-nano': 'x'}).route('gpt-4.1-nano'), ['gpt-4.1-nano'])
+
+    def test_call_falls_back_on_provider_error(self):
+        """A provider error moves on to the next model and is recorded against the failing one."""
+        calls = []
+
+        def generate(model):
+            calls.append(model)
+            if model == 'gpt-4.1-nano':
+                raise _openai_error(openai.InternalServerError, 500, 'down')
+            return 'ok'
+
+        result, answered_by = self.router.call('gpt-4.1-nano', 'Short.', None, generate)
+        self.assertEqual((result, answered_by), ('ok', calls[1]))
+        self.assertEqual(calls[0], 'gpt-4.1-nano')
+        self.assertGreater(self.router.health('gpt-4.1-nano')['error_rate'], 0)
+        self.assertIsNotNone(self.router.health(answered_by)['latency'])
+
+    def test_call_does_not_retry_other_errors(self):
+        """Errors that are not the provider's are raised without trying another model."""
+        calls = []
+
+        def generate(model):
+            calls.append(model)
+            raise KeyError('bad prompt')
+
+        with self.assertRaises(KeyError):
+            self.router.call('auto', 'Short.', None, generate)
+        self.assertEqual(len(calls), 1)
+
+    def test_validate_latency_class(self):
+        self.assertEqual(validate_latency_class('fast'), 'fast')
+        self.assertIsNone(validate_latency_class(''))
+        with self.assertRaises(ValueError):
+            validate_latency_class('instant')
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class RoutedSummaryServiceTest(TestCase):
+    """Test cases for routed summary generation."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title='Routed Article',
+            content='Routed content.',
+            url='http://example.com/routed',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_auto_model_records_answered_by(self, mock_generate_summary):
+        mock_generate_summary.return_value = ('Summary.', 5)
+        summary = self.service.summarize_article(self.article.id, ai_model='auto')
+        self.assertEqual(summary.status, 'completed')
+        self.assertEqual(summary.ai_model, 'auto')
+        self.assertEqual(summary.answered_by, 'gpt-4.1-nano')
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_fallback_model_records_answered_by(self, mock_generate_summary):
+        mock_generate_summary.side_effect = [
+            _openai_error(openai.RateLimitError, 429, 'slow down'),
+            ('Fallback summary.', 5),
+        ]
+        summary = self.service.summarize_article(self.article.id, ai_model='gpt-4.1-nano')
+        self.assertEqual(summary.status, 'completed')
+        self.assertEqual(summary.ai_model, 'gpt-4.1-nano')
+        self.assertNotEqual(summary.answered_by, 'gpt-4.1-nano')
+
+    def test_stream_falls_back_before_first_token(self):
+        """A model failing before streaming anything is replaced by the next one."""
+        def stream(title, content, model, max_words, usage=None):
+            if model == 'gpt-4.1-nano':
+                raise _openai_error(openai.InternalServerError, 503, 'unavailable')
+            yield 'Hello '
+            yield 'world.'
+
+        routing = {}
+        with patch.object(self.service, '_stream_model_tokens', side_effect=stream):
+            text = ''.join(self.service.stream_summary_tokens(
+                'Title', 'Short.', 'gpt-4.1-nano', 150, routing=routing
+            ))
+        self.assertEqual(text, 'Hello world.')
+        self.assertNotEqual(routing['answered_by'], 'gpt-4.1-nano')
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class RoutedSummaryViewTest(APITestCase):
+    """Test cases for routing options in the API."""
+
+    def setUp(self):
+        cache.clear()
+        self.admin_user = get_user_model().objects.create_user(
+            email='admin@example.com',
+            name='Admin User',
+            password='adminpass',
+            is_staff=True
+        )
+        self.admin_token = Token.objects.create(user=self.admin_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        self.article = Article.objects.create(
+            title='Routed Article',
+            content='Content.',
+            url='http://example.com/routed-view',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    def test_invalid_latency_class(self):
+        url = reverse('summarizer:summarize_article')
+        response = self.client.post(url, {'article_id': self.article.id, 'latency': 'instant'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_auto_model_with_latency_class(self, mock_delay):
+        url = reverse('summarizer:summarize_article')
+        response = self.client.post(
+            url, {'article_id': self.article.id, 'ai_model': 'auto', 'latency': 'fast'}, format='json'
+        )
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(mock_delay.call_args.kwargs['latency_class'], 'fast')
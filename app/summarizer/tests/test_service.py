@@ -1,8 +1,10 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from django.core.cache import cache
 from unittest.mock import patch, MagicMock
 from summarizer.models import Summary
+from summarizer.registry import UnknownModelError
 from summarizer.service import SummarizerService
 from articles.models import Article
 import logging
@@ -15,6 +17,7 @@ class SummarizerServiceTest(TestCase):
         """Set up test data."""
         # Suppress summarizer logging during tests
         logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
         
         self.user = get_user_model().objects.create_user(
             email='test@example.com',
@@ -63,7 +66,9 @@ class SummarizerServiceTest(TestCase):
             mock_chat_openai.assert_called_with(
                 api_key='test_key',
                 model='gpt-4.1-nano',
-                temperature=0.3
+                temperature=0.3,
+                timeout=60,
+                stream_usage=True
             )
 
     @patch('summarizer.service.ChatOpenAI')
@@ -77,7 +82,9 @@ class SummarizerServiceTest(TestCase):
             mock_chat_openai.assert_called_with(
                 api_key='test_key',
                 model='gpt-3.5-turbo',
-                temperature=0.3
+                temperature=0.3,
+                timeout=60,
+                stream_usage=True
             )
 
     @patch('summarizer.service.ChatOpenAI')
@@ -86,14 +93,10 @@ class SummarizerServiceTest(TestCase):
         """Test _get_llm method with unknown model."""
         with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
             service = SummarizerService()
-            llm = service._get_llm('unknown-model')
-            
-            # Should use default model
-            mock_chat_openai.assert_called_with(
-                api_key='test_key',
-                model='gpt-4.1-nano',
-                temperature=0.3
-            )
+            # Unknown models are rejected rather than served by the default model
+            with self.assertRaises(UnknownModelError):
+                service._get_llm('unknown-model')
+            mock_chat_openai.assert_not_called()
 
     @patch('summarizer.service.SummarizerService._generate_summary')
     def test_summarize_article_success(self, mock_generate_summary):
@@ -208,8 +211,8 @@ class SummarizerServiceTest(TestCase):
             # Mock the _generate_summary method to raise an exception
             mock_generate_summary.side_effect = Exception('API Error')
             
-            # Use a unique ai_model to avoid unique constraint
-            unique_model = 'gpt-4.1-nano-error-test'
+            # Use a model no other summary of this article uses
+            unique_model = 'gpt-4'
             
             with self.assertRaises(Exception):
                 service.summarize_article(
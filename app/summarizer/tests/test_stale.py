@@ -0,0 +1,114 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from articles.models import Article
+
+
+class StaleSummarySelectionTest(TestCase):
+    """Test cases for picking the summary served while another one is generated."""
+
+    def setUp(self):
+        self.now = timezone.now()
+        self.article = Article.objects.create(
+            title='Stale Article',
+            content='Content.',
+            url='http://example.com/stale',
+            published_date=self.now,
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+
+    def _completed(self, ai_model, max_words, minutes_ago=0, status='completed'):
+        return Summary.objects.create(
+            article=self.article, ai_model=ai_model, max_words=max_words, status=status,
+            summary_text=f'{ai_model} {max_words}', completed_at=self.now - timedelta(minutes=minutes_ago),
+        )
+
+    def test_prefers_closest_length_then_better_model(self):
+        self._completed('gpt-4.1-nano', 300)
+        nano = self._completed('gpt-4.1-nano', 150, minutes_ago=5)
+        self.assertEqual(self.service.get_stale_summary(self.article.id, 'gpt-4', 150), nano)
+        turbo = self._completed('gpt-3.5-turbo', 150, minutes_ago=10)
+        self.assertEqual(self.service.get_stale_summary(self.article.id, 'gpt-4', 150), turbo)
+
+    def test_ignores_requested_and_unfinished_summaries(self):
+        self._completed('gpt-4', 150)
+        self._completed('gpt-3.5-turbo', 150, status='pending')
+        self.assertIsNone(self.service.get_stale_summary(self.article.id, 'gpt-4', 150))
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class StaleWhileRevalidateViewTest(APITestCase):
+    """Test cases for serving stale summaries from the summary endpoints."""
+
+    def setUp(self):
+        cache.clear()
+        self.admin_user = get_user_model().objects.create_user(
+            email='admin@example.com',
+            name='Admin User',
+            password='adminpass',
+            is_staff=True
+        )
+        self.admin_token = Token.objects.create(user=self.admin_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        self.article = Article.objects.create(
+            title='Stale Article',
+            content='Content.',
+            url='http://example.com/stale-view',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        self.nano = Summary.objects.create(
+            article=self.article, ai_model='gpt-4.1-nano', max_words=150, status='completed',
+            summary_text='Nano summary.', completed_at=timezone.now(),
+        )
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_summarize_returns_labelled_stale_summary(self, mock_delay):
+        url = reverse('summarizer:summarize_article')
+        response = self.client.post(url, {'article_id': self.article.id, 'ai_model': 'gpt-4', 'stale': True},
+                                    format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['stale'])
+        self.assertEqual(response.data['summary']['id'], self.nano.id)
+        self.assertEqual(response.data['requested']['ai_model'], 'gpt-4')
+        self.assertEqual(response.data['requested']['status'], 'pending')
+        # The requested model is still generated in the background
+        mock_delay.assert_called_once_with(self.article.id, 'gpt-4', self.admin_user.id, 150)
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_stale_is_opt_in(self, mock_delay):
+        url = reverse('summarizer:summarize_article')
+        response = self.client.post(url, {'article_id': self.article.id, 'ai_model': 'gpt-4'}, format='json')
+        self.assertEqual(response.status_code, 202)
+        with self.settings(SUMMARIZER_STALE_WHILE_REVALIDATE=True):
+            response = self.client.post(url, {'article_id': self.article.id, 'ai_model': 'gpt-4'}, format='json')
+        self.assertTrue(response.data['stale'])
+
+    @override_settings(SUMMARIZER_MICRO_BATCH_ENABLED=False)
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_article_summary_stale_response_is_not_page_cached(self, mock_delay):
+        """Once the requested length completes, the next request gets it rather than a cached stale page."""
+        url = reverse('articles:articles-summary', args=[self.article.id])
+        response = self.client.get(url, {'length': 'short', 'stale': '1'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['stale'])
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        Summary.objects.filter(article=self.article, max_words=50).update(
+            status='completed', summary_text='Short summary.'
+        )
+        response = self.client.get(url, {'length': 'short', 'stale': '1'})
+        self.assertNotIn('stale', response.data)
+        self.assertEqual(response.data['summary']['summary_text'], 'Short summary.')
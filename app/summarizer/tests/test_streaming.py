@@ -0,0 +1,221 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import RunnableGenerator
+from summarizer.breaker import CircuitBreaker
+from summarizer.models import ParkedSummaryRequest, Summary
+from summarizer.service import SummarizerService
+from summarizer.streaming import SummaryStreamer, format_sse
+from articles.models import Article
+from users.models import User
+import json
+import logging
+
+
+def parse_events(body):
+    """Parse an SSE body into a list of (event, data) tuples, skipping comments."""
+    events = []
+    for block in body.strip().split('\n\n'):
+        lines = [line for line in block.split('\n') if line and not line.startswith(':')]
+        if not lines:
+            continue
+        event = lines[0].removeprefix('event: ')
+        data = json.loads(lines[1].removeprefix('data: '))
+        events.append((event, data))
+    return events
+
+
+@override_settings(SUMMARIZER_STREAM_TIMEOUT=1, SUMMARIZER_STREAM_POLL_INTERVAL=0.01,
+                   SUMMARIZER_STREAM_DB_POLL_INTERVAL=0.01)
+class SummaryStreamerTest(TestCase):
+    """Test cases for SSE streaming of summaries."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.article = Article.objects.create(
+            title='Streaming Article',
+            content=('The city council approved a new transit budget on Tuesday after months of debate. '
+                     'Bus routes in the northern districts will run every ten minutes from March, '
+                     'and fares for students and pensioners are frozen until next year.'),
+            url='http://example.com/stream',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+        self.streamer = SummaryStreamer(self.service)
+
+    def test_format_sse(self):
+        """Events are framed as SSE with JSON data."""
+        self.assertEqual(format_sse('token', {'text': 'a'}), 'event: token\ndata: {"text": "a"}\n\n')
+
+    def test_stream_generates_and_persists_once(self):
+        """Tokens are streamed and the final text is saved to the Summary."""
+        llm = FakeListChatModel(responses=['Streamed summary.'])
+        with patch.object(self.service, '_get_llm', return_value=llm):
+            events = parse_events(''.join(self.streamer.stream(self.article, ai_model='gpt-4.1-nano')))
+
+        tokens = ''.join(data['text'] for event, data in events if event == 'token')
+        self.assertEqual(tokens, 'Streamed summary.')
+        self.assertEqual(events[-1][0], 'summary')
+        summary = Summary.objects.get(article=self.article, ai_model='gpt-4.1-nano')
+        self.assertEqual(summary.status, 'completed')
+        self.assertEqual(summary.summary_text, 'Streamed summary.')
+        self.assertIsNone(summary.lease_owner)
+
+    def test_stream_records_token_usage(self):
+        """Token counts come from the usage metadata of the final chunk, not from the word count."""
+        def stream_with_usage(inputs):
+            for _ in inputs:
+                pass
+            yield AIMessageChunk(content='Streamed ')
+            yield AIMessageChunk(content='summary.')
+            yield AIMessageChunk(content='', usage_metadata={
+                'input_tokens': 40, 'output_tokens': 3, 'total_tokens': 43
+            })
+
+        with patch.object(self.service, '_get_llm', return_value=RunnableGenerator(stream_with_usage)):
+            ''.join(self.streamer.stream(self.article, ai_model='gpt-4.1-nano'))
+        summary = Summary.objects.get(article=self.article, ai_model='gpt-4.1-nano')
+        self.assertEqual(summary.summary_text, 'Streamed summary.')
+        self.assertEqual((summary.prompt_tokens, summary.completion_tokens, summary.tokens_used), (40, 3, 43))
+        self.assertEqual(summary.word_count, 2)
+
+    def test_stream_completed_summary(self):
+        """An existing completed summary is sent as a single event without calling the LLM."""
+        Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', status='completed',
+                               summary_text='Done already.')
+        with patch.object(self.service, '_get_llm') as mock_get_llm:
+            events = parse_events(''.join(self.streamer.stream(self.article, ai_model='gpt-4.1-nano')))
+        mock_get_llm.assert_not_called()
+        self.assertEqual(events, [('summary', events[0][1])])
+        self.assertEqual(events[0][1]['summary_text'], 'Done already.')
+
+    def test_stream_cache_hit(self):
+        """A summary cached for identical text is sent as a single event without calling the LLM."""
+        cache_key = self.service._cache_key(self.article, 'gpt-4.1-nano', 150)
+        self.service.summary_cache.set(cache_key, 'Cached summary.', 12, 'gpt-4.1-nano')
+        with patch.object(self.service, '_get_llm') as mock_get_llm:
+            events = parse_events(''.join(self.streamer.stream(self.article, ai_model='gpt-4.1-nano')))
+        mock_get_llm.assert_not_called()
+        self.assertEqual([event for event, _ in events], ['summary'])
+        self.assertEqual(events[0][1]['summary_text'], 'Cached summary.')
+
+    def test_stream_trivial_article(self):
+        """An article without usable content is answered by the quality gate in a single event."""
+        Article.objects.filter(pk=self.article.pk).update(description='Council approves budget.', content='')
+        self.article.refresh_from_db()
+        with patch.object(self.service, '_get_llm') as mock_get_llm:
+            events = parse_events(''.join(self.streamer.stream(self.article, ai_model='gpt-4.1-nano')))
+        mock_get_llm.assert_not_called()
+        self.assertEqual([event for event, _ in events], ['summary'])
+        self.assertEqual(events[0][1]['summary_text'], 'Council approves budget.')
+
+    @override_settings(SUMMARIZER_BREAKER_ENABLED=True)
+    @patch('summarizer.streaming.get_notification_hub')
+    def test_stream_parks_while_breaker_open(self, mock_get_hub):
+        """While the circuit breaker is open the summary is parked instead of streamed from the LLM."""
+        breaker = CircuitBreaker()
+        cache.set(breaker._key('tripped'), True)
+        cache.set(breaker._key('open'), True)
+        with patch.object(self.service, '_get_llm') as mock_get_llm:
+            events = parse_events(''.join(self.streamer.stream(self.article, ai_model='gpt-4.1-nano')))
+        mock_get_llm.assert_not_called()
+        self.assertEqual(events[-1][0], 'timeout')
+        summary = Summary.objects.get(article=self.article, ai_model='gpt-4.1-nano')
+        self.assertEqual(summary.status, 'pending')
+        self.assertTrue(ParkedSummaryRequest.objects.filter(summary=summary).exists())
+
+    def test_attach_to_in_flight_stream(self):
+        """A second client replays the relayed tokens instead of starting a new generation."""
+        summary = Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', status='in_progress')
+        cache.set(SummaryStreamer._relay_key(summary.pk), {'tokens': ['Hel', 'lo'], 'done': True, 'error': None})
+        with patch.object(self.service, '_get_llm') as mock_get_llm:
+            events = parse_events(''.join(self.streamer.stream(self.article, ai_model='gpt-4.1-nano')))
+        mock_get_llm.assert_not_called()
+        self.assertEqual([data['text'] for event, data in events if event == 'token'], ['Hel', 'lo'])
+        self.assertEqual(events[-1][0], 'summary')
+
+    @patch('summarizer.streaming.get_notification_hub')
+    def test_attach_to_worker_generation(self, mock_get_hub):
+        """A summary generated by a Celery worker is waited on and sent when completed."""
+        summary = Summary.objects.create(article=self.article, ai_model='gpt-4.1-nano', status='pending')
+        stream = self.streamer.stream(self.article, ai_model='gpt-4.1-nano')
+        self.assertEqual(next(stream), ': keep-alive\n\n')
+        Summary.objects.filter(pk=summary.pk).update(status='completed', summary_text='From worker.')
+        events = parse_events(''.join(stream))
+        self.assertEqual(events[-1][0], 'summary')
+        self.assertEqual(events[-1][1]['summary_text'], 'From worker.')
+
+    @patch('summarizer.tasks.summarize_article_task.delay')
+    def test_disconnect_hands_over_to_worker(self, mock_delay):
+        """A client leaving mid-stream releases the lease and enqueues a worker."""
+        with patch.object(self.service, 'stream_summary_tokens', return_value=iter(['Hel', 'lo'])):
+            stream = self.streamer.stream(self.article, ai_model='gpt-4.1-nano')
+            next(stream)
+            stream.close()
+        summary = Summary.objects.get(article=self.article, ai_model='gpt-4.1-nano')
+        self.assertEqual(summary.status, 'pending')
+        self.assertIsNone(summary.lease_owner)
+        mock_delay.assert_called_once_with(self.article.id, 'gpt-4.1-nano', None, 150)
+
+    def test_stream_error_marks_failed(self):
+        """A generation error is reported as an event and the summary is marked failed."""
+        with patch.object(self.service, 'stream_summary_tokens', side_effect=Exception('API Error')):
+            events = parse_events(''.join(self.streamer.stream(self.article, ai_model='gpt-4.1-nano')))
+        self.assertEqual(events[-1][0], 'error')
+        summary = Summary.objects.get(article=self.article, ai_model='gpt-4.1-nano')
+        self.assertEqual(summary.status, 'failed')
+
+
+class SummaryStreamViewTest(APITestCase):
+    """Test cases for the article summary streaming endpoint."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='user@example.com', password='userpass', name='User')
+        self.token = Token.objects.create(user=self.user)
+        self.article = Article.objects.create(
+            title='Streaming Article',
+            content=('The city council approved a new transit budget on Tuesday after months of debate. '
+                     'Bus routes in the northern districts will run every ten minutes from March, '
+                     'and fares for students and pensioners are frozen until next year.'),
+            url='http://example.com/stream-view',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    @patch('summarizer.service.SummarizerService.stream_summary_tokens')
+    def test_stream_endpoint(self, mock_stream_tokens):
+        """The endpoint responds with an event stream of tokens."""
+        mock_stream_tokens.return_value = iter(['Hello', ' world'])
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        url = reverse('articles:articles-summary-stream', args=[self.article.id])
+        response = self.client.get(url, HTTP_ACCEPT='text/event-stream')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        events = parse_events(b''.join(response.streaming_content).decode())
+        self.assertEqual([data['text'] for event, data in events if event == 'token'], ['Hello', ' world'])
+
+    def test_stream_endpoint_article_not_found(self):
+        """A missing article returns 404."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        url = reverse('articles:articles-summary-stream', args=[999])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_stream_endpoint_unauthenticated(self):
+        """Streaming requires authentication."""
+        url = reverse('articles:articles-summary-stream', args=[self.article.id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,161 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from langchain_core.messages import AIMessage
+from summarizer.models import Summary
+from summarizer.service import SummarizerService
+from summarizer.telemetry import percentile, summary_stats
+from articles.models import Article
+import logging
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False)
+class TokenUsageTest(TestCase):
+    """Test cases for token accounting from LLM responses."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+            self.service = SummarizerService()
+        self.article = Article.objects.create(
+            title='Telemetry Article',
+            content='Telemetry content.',
+            url='http://example.com/telemetry',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    def test_usage_from_usage_metadata(self):
+        """LangChain usage_metadata is preferred."""
+        message = AIMessage(
+            content='A summary.',
+            usage_metadata={'input_tokens': 120, 'output_tokens': 30, 'total_tokens': 150},
+        )
+        self.assertEqual(
+            SummarizerService._token_usage(message, 'A summary.'),
+            {'prompt_tokens': 120, 'completion_tokens': 30, 'total_tokens': 150},
+        )
+
+    def test_usage_from_response_metadata(self):
+        """OpenAI token_usage in response_metadata is used when usage_metadata is absent."""
+        message = AIMessage(
+            content='A summary.',
+            response_metadata={'token_usage': {'prompt_tokens': 80, 'completion_tokens': 20, 'total_tokens': 100}},
+        )
+        self.assertEqual(SummarizerService._token_usage(message, 'A summary.')['total_tokens'], 100)
+
+    def test_usage_falls_back_to_word_count(self):
+        """Without usage data the summary's word count is used."""
+        usage = SummarizerService._token_usage(AIMessage(content='Three word summary'), 'Three word summary')
+        self.assertEqual(usage, {'prompt_tokens': 0, 'completion_tokens': 3, 'total_tokens': 3})
+
+    def test_token_count_accumulates_usage(self):
+        """Prompt and completion tokens accumulate across calls."""
+        usage = {}
+        message = AIMessage(content='x', usage_metadata={'input_tokens': 10, 'output_tokens': 5, 'total_tokens': 15})
+        self.service._token_count(message, 'x', usage)
+        self.service._token_count(message, 'x', usage)
+        self.assertEqual(usage, {'prompt_tokens': 20, 'completion_tokens': 10})
+
+    @patch('summarizer.service.SummarizerService._generate_summary')
+    def test_summarize_article_persists_usage_and_timestamps(self, mock_generate_summary):
+        """Token counts and timing are saved on the summary."""
+        def generate(title, content, ai_model, max_words, usage=None):
+            usage.update(prompt_tokens=100, completion_tokens=25)
+            return 'Generated summary.', 125
+        mock_generate_summary.side_effect = generate
+
+        summary = self.service.summarize_article(self.article.id, ai_model='gpt-4.1-nano')
+
+        self.assertEqual(summary.tokens_used, 125)
+        self.assertEqual(summary.prompt_tokens, 100)
+        self.assertEqual(summary.completion_tokens, 25)
+        self.assertIsNotNone(summary.queued_at)
+        self.assertLessEqual(summary.started_at, summary.llm_started_at)
+        self.assertLessEqual(summary.llm_started_at, summary.llm_finished_at)
+        self.assertLessEqual(summary.llm_finished_at, summary.completed_at)
+
+
+class SummaryStatsTest(TestCase):
+    """Test cases for latency and token percentiles."""
+
+    def setUp(self):
+        self.now = timezone.now()
+        for i in range(1, 11):
+            article = Article.objects.create(
+                title=f'Article {i}',
+                content='Content.',
+                url=f'http://example.com/stats-{i}',
+                published_date=self.now,
+                source='Test Source',
+                news_client_source='TestAPI'
+            )
+            Summary.objects.create(
+                article=article,
+                ai_model='gpt-4.1-nano',
+                status='completed',
+                queued_at=self.now - timedelta(seconds=i + 1),
+                started_at=self.now - timedelta(seconds=i),
+                llm_started_at=self.now - timedelta(seconds=i),
+                llm_finished_at=self.now,
+                completed_at=self.now,
+                tokens_used=100 * i,
+                prompt_tokens=80 * i,
+                completion_tokens=20 * i,
+            )
+
+    def test_percentile(self):
+        """Percentiles interpolate between ranks."""
+        self.assertIsNone(percentile([], 50))
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+        self.assertEqual(percentile([5], 99), 5)
+        self.assertEqual(percentile(list(range(1, 101)), 95), 95.05)
+
+    def test_summary_stats(self):
+        """Stats are grouped per model with latency and token distributions."""
+        stats = summary_stats(hours=1)
+        model_stats = stats['models']['gpt-4.1-nano']
+        self.assertEqual(model_stats['count'], 10)
+        self.assertEqual(model_stats['latency_seconds']['llm']['p50'], 5.5)
+        self.assertEqual(model_stats['latency_seconds']['queue']['p50'], 1.0)
+        self.assertEqual(model_stats['tokens']['p50'], 550)
+        self.assertEqual(model_stats['tokens']['prompt_total'], 80 * 55)
+
+    def test_summary_stats_excludes_old_summaries(self):
+        """Summaries completed before the window are ignored."""
+        Summary.objects.update(completed_at=self.now - timedelta(hours=2))
+        self.assertEqual(summary_stats(hours=1)['models'], {})
+
+
+class SummarizerStatsViewTest(APITestCase):
+    """Test cases for the stats endpoint."""
+
+    def setUp(self):
+        self.admin_user = get_user_model().objects.create_user(
+            email='admin@example.com',
+            name='Admin User',
+            password='adminpass',
+            is_staff=True
+        )
+        self.admin_token = Token.objects.create(user=self.admin_user)
+
+    def test_stats_admin(self):
+        """Admins can read latency stats."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        response = self.client.get(reverse('summarizer:summarizer_stats'), {'hours': 6})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['stats']['window_hours'], 6)
+
+    def test_stats_invalid_window(self):
+        """A non-positive window is rejected."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        response = self.client.get(reverse('summarizer:summarizer_stats'), {'hours': 0})
+        self.assertEqual(response.status_code, 400)
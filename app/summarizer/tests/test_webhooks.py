@@ -0,0 +1,241 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from summarizer.models import Summary, WebhookEndpoint, WebhookEvent, WebhookSubscription
+from summarizer.notifications import publish_summary_finished
+from summarizer.webhooks import (
+    SIGNATURE_HEADER, TIMESTAMP_HEADER, deliver_webhooks, emit_summary_event, sign, subscribe,
+    sweep_finished_subscriptions, validate_callback_url, webhook_stats,
+)
+from articles.models import Article
+import httpx
+import json
+import logging
+import socket
+
+
+def resolves_to(address):
+    """getaddrinfo result for a host name resolving to `address`."""
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, 0))]
+
+
+@override_settings(SUMMARIZER_WEBHOOK_BATCH_SIZE=2, SUMMARIZER_WEBHOOK_MAX_ATTEMPTS=2)
+@patch('summarizer.tasks.deliver_webhooks_task.apply_async')
+class WebhookDeliveryTest(TestCase):
+    """Test cases for the webhook outbox and its batched delivery."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.user = get_user_model().objects.create_superuser(email='admin@example.com', password='adminpass')
+        self.resolver = patch('summarizer.webhooks.socket.getaddrinfo', return_value=resolves_to('93.184.215.14'))
+        self.resolver.start()
+        self.addCleanup(self.resolver.stop)
+        self.endpoint = WebhookEndpoint.objects.create(user=self.user, url='https://hooks.example.com/a',
+                                                       secret='s3cret')
+        self.summaries = [
+            Summary.objects.create(
+                article=Article.objects.create(
+                    title=f'Webhook article {i}',
+                    content='The council approved the transit budget on Tuesday.',
+                    url=f'http://example.com/webhook-{i}',
+                    published_date=timezone.now(),
+                    source='Test Source',
+                    news_client_source='TestAPI'
+                ),
+                ai_model='gpt-4.1-nano',
+                status='pending'
+            )
+            for i in range(3)
+        ]
+        self.requests = []
+
+    def _client(self, status_code=200):
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(status_code)
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    def _complete(self, summary):
+        Summary.objects.filter(pk=summary.pk).update(status='completed', summary_text='Done.',
+                                                     completed_at=timezone.now())
+        emit_summary_event(summary.pk, 'completed')
+
+    def test_finished_summary_writes_one_event_per_subscriber(self, mock_apply_async):
+        subscribe(self.summaries[:1], self.user)
+        with patch('summarizer.notifications.get_redis_client'):
+            publish_summary_finished(self.summaries[0].pk, 'failed')
+            publish_summary_finished(self.summaries[0].pk, 'failed')
+
+        event = WebhookEvent.objects.get()
+        self.assertEqual((event.endpoint, event.event_type), (self.endpoint, 'summary.failed'))
+        self.assertEqual(event.payload['summary_id'], self.summaries[0].pk)
+        self.assertFalse(WebhookSubscription.objects.exists())
+        mock_apply_async.assert_called_once()
+        # Summaries nobody subscribed to write no events
+        self.assertEqual(emit_summary_event(self.summaries[1].pk, 'completed'), 0)
+
+    def test_events_are_delivered_in_signed_batches(self, mock_apply_async):
+        subscribe(self.summaries, self.user)
+        for summary in self.summaries:
+            self._complete(summary)
+
+        result = deliver_webhooks(self._client())
+        self.assertEqual(result, {'endpoints': 1, 'delivered': 2, 'failed': 0, 'more': 1})
+        request = self.requests[0]
+        # Sent to the address checked on delivery, for the registered host name
+        self.assertEqual(request.url, 'https://93.184.215.14/a')
+        self.assertEqual(request.headers['Host'], 'hooks.example.com')
+        self.assertEqual(request.extensions['sni_hostname'], 'hooks.example.com')
+        body = request.content.decode()
+        self.assertEqual(
+            request.headers[SIGNATURE_HEADER], f"sha256={sign('s3cret', request.headers[TIMESTAMP_HEADER], body)}"
+        )
+        self.assertEqual([event['data']['summary_id'] for event in json.loads(body)['events']],
+                         [summary.pk for summary in self.summaries[:2]])
+
+        self.assertEqual(deliver_webhooks(self._client())['delivered'], 1)
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(WebhookEvent.objects.filter(status='delivered').count(), 3)
+        stats = webhook_stats()
+        self.assertEqual((stats['delivered'], stats['batches'], stats['pending']), (3, 2, 0))
+
+    def test_failed_deliveries_back_off_then_give_up(self, mock_apply_async):
+        subscribe(self.summaries[:1], self.user)
+        self._complete(self.summaries[0])
+
+        self.assertEqual(deliver_webhooks(self._client(503))['failed'], 1)
+        event = WebhookEvent.objects.get()
+        self.assertEqual((event.status, event.attempts), ('pending', 1))
+        self.assertGreater(event.next_attempt_at, timezone.now())
+        # Not due again until its backoff has passed
+        self.assertEqual(deliver_webhooks(self._client(503))['endpoints'], 0)
+
+        WebhookEvent.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+        deliver_webhooks(self._client(503))
+        event.refresh_from_db()
+        self.assertEqual((event.status, event.attempts), ('failed', 2))
+        self.assertIn('503', event.last_error)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_summary_completed_before_subscribing_is_still_delivered(self, mock_apply_async):
+        Summary.objects.filter(pk=self.summaries[0].pk).update(status='completed', summary_text='Done.')
+        self.summaries[0].refresh_from_db()
+        self.summaries[0].status = 'in_progress'
+        subscribe(self.summaries[:1], self.user)
+        self.assertEqual(WebhookEvent.objects.get().event_type, 'summary.completed')
+
+    def test_host_re_pointed_to_private_address_is_not_posted(self, mock_apply_async):
+        subscribe(self.summaries[:1], self.user)
+        self._complete(self.summaries[0])
+
+        with patch('summarizer.webhooks.socket.getaddrinfo', return_value=resolves_to('169.254.169.254')):
+            self.assertEqual(deliver_webhooks(self._client())['failed'], 1)
+        self.assertEqual(self.requests, [])
+        event = WebhookEvent.objects.get()
+        self.assertEqual((event.status, event.attempts), ('failed', 1))
+        self.assertIn('private or local address', event.last_error)
+
+    @override_settings(SUMMARIZER_WEBHOOK_SWEEP_AFTER=60)
+    def test_sweep_writes_events_of_summaries_finished_without_publishing(self, mock_apply_async):
+        subscribe(self.summaries[:2], self.user)
+        # Saved completed and failed, then the worker died before publishing
+        Summary.objects.filter(pk=self.summaries[0].pk).update(status='completed', summary_text='Done.')
+        Summary.objects.filter(pk=self.summaries[1].pk).update(status='failed')
+
+        self.assertEqual(sweep_finished_subscriptions(), 1)
+        self.assertEqual(WebhookEvent.objects.get().event_type, 'summary.completed')
+        # A failed summary may still be retried, so it waits for the sweep delay
+        WebhookSubscription.objects.update(created_at=timezone.now() - timedelta(minutes=2))
+        self.assertEqual(sweep_finished_subscriptions(), 1)
+        self.assertEqual(WebhookEvent.objects.filter(event_type='summary.failed').count(), 1)
+        self.assertFalse(WebhookSubscription.objects.exists())
+        self.assertEqual(webhook_stats()['swept'], 2)
+
+    @override_settings(SUMMARIZER_WEBHOOKS_ENABLED=False)
+    def test_disabled_webhooks_subscribe_nothing(self, mock_apply_async):
+        self.assertEqual(subscribe(self.summaries, self.user), [])
+        self.assertFalse(WebhookSubscription.objects.exists())
+
+
+@override_settings(SUMMARIZER_QUALITY_GATE_ENABLED=False, SUMMARIZER_MICRO_BATCH_ENABLED=False)
+@patch('summarizer.tasks.summarize_article_task.delay')
+class WebhookViewTest(APITestCase):
+    """Test cases for registering webhooks and per-request callback URLs."""
+
+    def setUp(self):
+        logging.getLogger('summarizer').setLevel(logging.CRITICAL)
+        cache.clear()
+        self.admin = get_user_model().objects.create_superuser(email='admin@example.com', password='adminpass')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.admin).key}')
+        resolver = patch('summarizer.webhooks.socket.getaddrinfo', return_value=resolves_to('93.184.215.14'))
+        resolver.start()
+        self.addCleanup(resolver.stop)
+        self.article = Article.objects.create(
+            title='Callback article',
+            content='The council approved the transit budget on Tuesday.',
+            url='http://example.com/callback',
+            published_date=timezone.now(),
+            source='Test Source',
+            news_client_source='TestAPI'
+        )
+
+    def test_register_list_and_delete_endpoints(self, mock_delay):
+        url = reverse('summarizer:webhook_endpoints')
+        response = self.client.post(url, {'url': 'https://hooks.example.com/all'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        endpoint = response.data['endpoint']
+        self.assertTrue(endpoint['secret'])
+        self.assertEqual(self.client.post(url, {'url': 'ftp://hooks.example.com'}, format='json').status_code, 400)
+
+        response = self.client.get(url)
+        self.assertEqual([item['id'] for item in response.data['endpoints']], [endpoint['id']])
+
+        detail = reverse('summarizer:webhook_endpoint_detail', args=[endpoint['id']])
+        self.assertEqual(self.client.delete(detail).status_code, 204)
+        self.assertEqual(self.client.delete(detail).status_code, 404)
+
+    def test_callback_url_subscribes_the_request(self, mock_delay):
+        response = self.client.post(
+            reverse('summarizer:summarize_article'),
+            {'article_id': self.article.id, 'callback_url': 'https://hooks.example.com/once'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 202)
+        subscription = WebhookSubscription.objects.get()
+        self.assertEqual(subscription.summary_id, response.data['summary']['id'])
+        self.assertEqual(subscription.endpoint.url, 'https://hooks.example.com/once')
+        self.assertFalse(subscription.endpoint.all_summaries)
+
+        response = self.client.post(
+            reverse('summarizer:bulk_summarize'),
+            {'article_ids': [self.article.id], 'callback_url': 'not a url'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class CallbackUrlValidationTest(TestCase):
+    """Test cases for rejecting callback URLs that point inside the network."""
+
+    def test_local_and_private_addresses_are_rejected(self):
+        for url in ('http://localhost/hook', 'http://127.0.0.1:8000/hook', 'http://10.0.0.5/hook',
+                    'http://192.168.1.20/hook', 'http://169.254.169.254/latest/meta-data/', 'http://[::1]/hook'):
+            with self.assertRaises(ValueError, msg=url):
+                validate_callback_url(url)
+
+    def test_host_names_are_checked_by_their_addresses(self):
+        with patch('summarizer.webhooks.socket.getaddrinfo', return_value=resolves_to('10.1.2.3')):
+            with self.assertRaises(ValueError):
+                validate_callback_url('https://hooks.internal/a')
+        with patch('summarizer.webhooks.socket.getaddrinfo', side_effect=socket.gaierror('unknown host')):
+            with self.assertRaises(ValueError):
+                validate_callback_url('https://hooks.invalid/a')
+        with patch('summarizer.webhooks.socket.getaddrinfo', return_value=resolves_to('93.184.215.14')):
+            self.assertEqual(validate_callback_url('https://hooks.example.com/a'), 'https://hooks.example.com/a')
@@ -7,12 +7,42 @@ urlpatterns = [
     # POST /summarizer/summarize/ - Create new summary
     path('summarize/', views.SummarizeArticleView.as_view(), name='summarize_article'),
 
+    # POST /summarizer/summarize/bulk/ - Request the summaries of a list of articles
+    path('summarize/bulk/', views.BulkSummarizeView.as_view(), name='bulk_summarize'),
+
     # GET /summarizer/article/<int:article_id>/summary/ - Get specific summary
     path('article/<int:article_id>/summary/', views.GetSummaryView.as_view(), name='get_summary'),
 
     # GET /summarizer/article/<int:article_id>/summaries/ - Get all summaries for article
     path('article/<int:article_id>/summaries/', views.GetAllSummariesView.as_view(), name='get_all_summaries'),
 
+    # GET /summarizer/summary/status/?ids=1,2,3 - Get the status of several summaries
+    path('summary/status/', views.bulk_summary_status, name='bulk_summary_status'),
+
     # GET /summarizer/summary/<int:summary_id>/status/ - Get summary status
     path('summary/<int:summary_id>/status/', views.summary_status, name='summary_status'),
+
+    # GET /summarizer/summary/<int:summary_id>/wait/ - Long-poll until the summary finishes
+    path('summary/<int:summary_id>/wait/', views.wait_summary_status, name='wait_summary_status'),
+
+    # GET /summarizer/summary/<int:summary_id>/events/ - SSE notification when the summary finishes
+    path('summary/<int:summary_id>/events/', views.summary_status_events, name='summary_status_events'),
+
+    # POST /summarizer/batch/ - Queue summaries for the provider Batch API; GET lists batch jobs
+    path('batch/', views.SummaryBatchView.as_view(), name='summary_batch'),
+
+    # GET /summarizer/resummarize/ - Summaries per prompt version; POST enqueues regeneration of stale ones
+    path('resummarize/', views.resummarize_summaries, name='resummarize_summaries'),
+
+    # GET /summarizer/webhooks/ - List the webhook endpoints of the API user; POST registers one
+    path('webhooks/', views.webhook_endpoints, name='webhook_endpoints'),
+
+    # DELETE /summarizer/webhooks/<int:endpoint_id>/ - Remove a webhook endpoint
+    path('webhooks/<int:endpoint_id>/', views.webhook_endpoint_detail, name='webhook_endpoint_detail'),
+
+    # GET /summarizer/metrics/ - Get summarizer efficiency metrics
+    path('metrics/', views.summarizer_metrics, name='summarizer_metrics'),
+
+    # GET /summarizer/stats/?hours=24 - Get latency percentiles and token usage per model
+    path('stats/', views.summarizer_stats, name='summarizer_stats'),
 ]
\ No newline at end of file
@@ -1,20 +1,106 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.cache import add_never_cache_headers
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from rest_framework.views import APIView
-from rest_framework.decorators import api_view, permission_classes, authentication_classes
+from rest_framework.decorators import api_view, permission_classes, authentication_classes, renderer_classes
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAdminUser
 from drf_spectacular.utils import extend_schema
+from .batch import batch_stats
+from .breaker import breaker_stats
+from .cache import SummaryCache
+from .compression import compression_stats
+from .extractive import EXTRACTIVE_MODEL, cached_extractive_summary
+from .hedging import hedge_stats
+from .limiter import limiter_stats
+from .notifications import get_notification_hub
+from .prewarm import prewarm_stats
+from .quality import quality_gate_stats
+from .registry import UnknownModelError, canonical_model
+from .renderers import EventStreamRenderer
+from .resummarize import plan_resummarization, prompt_version_counts, resummarize_stale_summaries, resummarize_stats
+from .router import ModelRouter
 from .service import SummarizerService
-from .models import Summary
+from .models import Summary, SummaryBatchJob, WebhookEndpoint
 from .serializers import SummarySerializer
+from .streaming import format_sse
+from .telemetry import summary_stats
+from .webhooks import new_secret, subscribe, validate_callback_url, webhook_stats
 from articles.models import Article
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+FINAL_STATUSES = ('completed', 'failed')
+
+
+def allow_stale(value) -> bool:
+    """Whether a request accepts a stale summary; SUMMARIZER_STALE_WHILE_REVALIDATE is the default."""
+    if value is None or value == '':
+        return settings.SUMMARIZER_STALE_WHILE_REVALIDATE
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+def stale_summary_response(stale, requested):
+    """
+    Serve a completed summary of another model or length, labelled as stale, while the
+    requested summary is generated. Never stored in the page cache.
+    """
+    summary_data = SummarySerializer(stale).data
+    summary_data['max_words'] = stale.max_words
+    summary_data['answered_by'] = stale.answered_by
+    response = Response({
+        'success': True,
+        'stale': True,
+        'summary': summary_data,
+        'requested': requested_summary_data(requested),
+        'message': 'Showing a summary from another model or length while the requested one is processed.',
+    }, status=status.HTTP_200_OK)
+    add_never_cache_headers(response)
+    return response
+
+
+def requested_summary_data(requested):
+    """Reference to the summary a client asked for, when another one is served in its place."""
+    return {
+        'id': requested.id,
+        'ai_model': requested.ai_model,
+        'max_words': requested.max_words,
+        'status': requested.status,
+    }
+
+
+def extractive_summary_data(article, max_words):
+    """Local extractive summary of an article, shaped like the summary fields clients read."""
+    return {
+        'summary_text': cached_extractive_summary(article, max_words),
+        'ai_model': EXTRACTIVE_MODEL,
+        'answered_by': EXTRACTIVE_MODEL,
+        'max_words': max_words,
+    }
+
+
+def extractive_fallback_response(article, failed):
+    """
+    Serve an extractive summary after the requested summary failed, so readers still get
+    one while the AI model is unavailable. Never stored in the page cache.
+    """
+    response = Response({
+        'success': True,
+        'fallback': True,
+        'summary': extractive_summary_data(article, failed.max_words),
+        'requested': requested_summary_data(failed),
+        'message': 'Summary generation failed; showing an extractive summary instead.',
+    }, status=status.HTTP_200_OK)
+    add_never_cache_headers(response)
+    return response
+
 class SummarizerView(APIView):
     """Base view for summarizer functionality."""
     authentication_classes = [TokenAuthentication]
@@ -31,8 +117,31 @@ class SummarizerView(APIView):
             'type': 'object',
             'properties': {
                 'article_id': {'type': 'integer'},
-                'ai_model': {'type': 'string'},
+                'ai_model': {
+                    'type': 'string',
+                    'description': 'Model name or alias, e.g. gpt-4.1-nano, auto or extractive',
+                },
                 'max_words': {'type': 'integer'},
+                'length': {'type': 'string', 'description': 'Length preset (short, medium, long) or word budget'},
+                'latency': {
+                    'type': 'string',
+                    'description': 'Latency class for ai_model "auto": fast, standard or relaxed',
+                },
+                'callback_url': {
+                    'type': 'string',
+                    'description': 'URL to POST a signed event to when the summary finishes',
+                },
+                'stale': {
+                    'type': 'boolean',
+                    'description': (
+                        'Return a completed summary from another model or length while the requested one is processed'
+                    ),
+                },
+                'lengths': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'description': 'Several lengths, generated together in one AI model call',
+                },
             },
             'required': ['article_id']
         }
@@ -44,20 +153,33 @@ class SummarizeArticleView(SummarizerView):
     def post(self, request):
         """
         Create a new summary for an article. If a summary is being processed, return status 202 and 'in_progress' status.
+        Several lengths can be requested at once with `lengths`.
         """
         article_id = request.data.get('article_id')
-        ai_model = request.data.get('ai_model', 'gpt-4.1-nano')
-        max_words = request.data.get('max_words', 150)
+        max_words = request.data.get('length') or request.data.get('max_words', 150)
+        lengths = request.data.get('lengths')
+        latency_class = request.data.get('latency')
         if not article_id:
             return Response({'error': 'article_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+        callback_url = request.data.get('callback_url')
+        try:
+            ai_model = canonical_model(request.data.get('ai_model'))
+            if callback_url:
+                validate_callback_url(callback_url)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         user = request.user if request.user.is_authenticated else None
 
+        if lengths:
+            return self._summarize_lengths(article_id, ai_model, user, lengths, callback_url)
+
         try:
             summary = self.summarizer_service.summarize_article_async(
                 article_id=article_id,
                 ai_model=ai_model,
                 user=user,
-                max_words=max_words
+                max_words=max_words,
+                latency_class=latency_class
             )
         except Article.DoesNotExist:
             return Response({'error': 'Article not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -67,9 +189,17 @@ class SummarizeArticleView(SummarizerView):
         except Exception as e:
             logger.error(f"Error in summarize view: {str(e)}")
             return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        subscribe_webhooks([summary], user, callback_url)
+
+        if summary.status in ['pending', 'in_progress'] and allow_stale(request.data.get('stale')):
+            stale = self.summarizer_service.get_stale_summary(article_id, summary.ai_model, summary.max_words)
+            if stale:
+                return stale_summary_response(stale, summary)
 
         serializer = SummarySerializer(summary)
         response_data = serializer.data
+        response_data['max_words'] = summary.max_words
+        response_data['answered_by'] = summary.answered_by
 
         if summary.status in ['pending', 'in_progress']:
             return Response({'success': True, 'summary': response_data, 'message': 'Summary is being processed.'}, status=status.HTTP_202_ACCEPTED)
@@ -78,16 +208,150 @@ class SummarizeArticleView(SummarizerView):
         elif summary.status == 'failed':
             return Response({'success': False, 'summary': response_data, 'message': 'Summary generation failed.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _summarize_lengths(self, article_id, ai_model, user, lengths, callback_url=None):
+        """Summarize an article at several lengths with a single background task."""
+        try:
+            summaries = self.summarizer_service.summarize_article_lengths_async(
+                article_id=article_id,
+                ai_model=ai_model,
+                user=user,
+                lengths=lengths
+            )
+        except Article.DoesNotExist:
+            return Response({'error': 'Article not found'}, status=status.HTTP_404_NOT_FOUND)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Validation error: {str(e)}")
+            return Response({'error': 'Invalid input.'}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error in summarize view: {str(e)}")
+            return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        subscribe_webhooks(summaries, user, callback_url)
+
+        response_data = [
+            {**SummarySerializer(summary).data, 'max_words': summary.max_words, 'answered_by': summary.answered_by}
+            for summary in summaries
+        ]
+        statuses = {summary.status for summary in summaries}
+        if statuses & {'pending', 'in_progress'}:
+            return Response(
+                {'success': True, 'summaries': response_data, 'message': 'Summaries are being processed.'},
+                status=status.HTTP_202_ACCEPTED
+            )
+        elif statuses == {'completed'}:
+            return Response({'success': True, 'summaries': response_data}, status=status.HTTP_200_OK)
+        return Response(
+            {'success': False, 'summaries': response_data, 'message': 'Summary generation failed.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+def subscribe_webhooks(summaries, user, callback_url=None):
+    """Subscribe the user's webhooks to the summaries; a failure here must not fail the request."""
+    try:
+        subscribe(summaries, user, callback_url)
+    except Exception as e:
+        logger.error(f"Could not subscribe webhooks: {str(e)}")
+
+
+def parse_ids(value, name):
+    """A list of ids, or a comma-separated string of them, capped at SUMMARIZER_BULK_MAX_IDS."""
+    if isinstance(value, str):
+        value = [item for item in value.split(',') if item.strip()]
+    if not isinstance(value, (list, tuple)) or not value:
+        raise ValueError(f'{name} must be a non-empty list of ids')
+    try:
+        ids = list(dict.fromkeys(int(item) for item in value))
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be a list of integer ids')
+    if len(ids) > settings.SUMMARIZER_BULK_MAX_IDS:
+        raise ValueError(f'At most {settings.SUMMARIZER_BULK_MAX_IDS} {name} per request')
+    return ids
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+@extend_schema(
+    request={
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'article_ids': {'type': 'array', 'items': {'type': 'integer'}},
+                'ai_model': {
+                    'type': 'string',
+                    'description': 'Model name or alias, e.g. gpt-4.1-nano, auto or extractive',
+                },
+                'length': {'type': 'string', 'description': 'Length preset (short, medium, long) or word budget'},
+                'latency': {
+                    'type': 'string',
+                    'description': 'Latency class for ai_model "auto": fast, standard or relaxed',
+                },
+                'callback_url': {
+                    'type': 'string',
+                    'description': 'URL to POST a signed event to when the summary finishes',
+                },
+            },
+            'required': ['article_ids']
+        }
+    },
+    responses={200: {'type': 'object'}, 202: {'type': 'object'}}
+)
+class BulkSummarizeView(SummarizerView):
+    """View to request the summaries of a list of articles in one call."""
+    def post(self, request):
+        """
+        Return the summaries of `article_ids`, enqueueing the missing ones in bulk.
+        Status 202 while any of them is still processed; poll them with `summary/status/`.
+        """
+        try:
+            article_ids = parse_ids(request.data.get('article_ids'), 'article_ids')
+            ai_model = canonical_model(request.data.get('ai_model'))
+            callback_url = request.data.get('callback_url')
+            if callback_url:
+                validate_callback_url(callback_url)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        max_words = request.data.get('length') or request.data.get('max_words', 150)
+        user = request.user if request.user.is_authenticated else None
+
+        try:
+            summaries = self.summarizer_service.summarize_articles_async(
+                article_ids,
+                ai_model=ai_model,
+                user=user,
+                max_words=max_words,
+                latency_class=request.data.get('latency')
+            )
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            return Response({'error': 'Invalid input.'}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error in bulk summarize view: {str(e)}")
+            return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        subscribe_webhooks(summaries.values(), user, callback_url)
+
+        response_data = [
+            {**SummarySerializer(summary).data, 'article_id': article_id, 'max_words': summary.max_words,
+             'answered_by': summary.answered_by}
+            for article_id, summary in summaries.items()
+        ]
+        processing = any(summary.status in ('pending', 'in_progress') for summary in summaries.values())
+        return Response({
+            'success': True,
+            'summaries': response_data,
+            'not_found': [article_id for article_id in article_ids if article_id not in summaries],
+        }, status=status.HTTP_202_ACCEPTED if processing else status.HTTP_200_OK)
+
 @extend_schema(responses={200: {'type': 'object'}})
 class GetSummaryView(SummarizerView):
     """View to retrieve existing summaries."""
     def get(self, request, article_id):
-        """Get summary for a specific article."""
-        ai_model = request.GET.get('ai_model', 'gpt-4.1-nano')
+        """Get summary for a specific article, optionally for a `length` preset or `max_words` budget."""
+        max_words = request.GET.get('length') or request.GET.get('max_words', 150)
         try:
+            ai_model = canonical_model(request.GET.get('ai_model'))
             summary = self.summarizer_service.get_article_summary(
                 article_id=article_id,
-                ai_model=ai_model
+                ai_model=ai_model,
+                max_words=max_words
             )
             if not summary:
                 try:
@@ -104,6 +368,8 @@ class GetSummaryView(SummarizerView):
                     'article_title': summary.article.title,
                     'summary_text': summary.summary_text,
                     'ai_model': summary.ai_model,
+                    'answered_by': summary.answered_by,
+                    'max_words': summary.max_words,
                     'status': summary.status,
                     'word_count': summary.word_count,
                     'tokens_used': summary.tokens_used,
@@ -111,6 +377,8 @@ class GetSummaryView(SummarizerView):
                     'completed_at': summary.completed_at.isoformat() if summary.completed_at else None
                 }
             })
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             logger.error(f"Error in get summary view: {str(e)}")
             return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -132,6 +400,111 @@ class GetAllSummariesView(SummarizerView):
             return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _batch_job_payload(job):
+    return {
+        'id': job.id,
+        'ai_model': job.ai_model,
+        'status': job.status,
+        'provider_status': job.provider_status,
+        'request_count': job.request_count,
+        'completed_count': job.completed_count,
+        'failed_count': job.failed_count,
+        'created_at': job.created_at.isoformat(),
+        'submitted_at': job.submitted_at.isoformat() if job.submitted_at else None,
+        'completed_at': job.completed_at.isoformat() if job.completed_at else None,
+        'error_message': job.error_message,
+    }
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+@extend_schema(
+    request={
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'article_ids': {'type': 'array', 'items': {'type': 'integer'}},
+                'missing': {
+                    'type': 'boolean',
+                    'description': 'Queue the newest articles that have no summary of this model and length yet',
+                },
+                'ai_model': {
+                    'type': 'string',
+                    'description': 'Model name or alias, e.g. gpt-4.1-nano, auto or extractive',
+                },
+                'max_words': {'type': 'integer'},
+                'length': {'type': 'string', 'description': 'Length preset (short, medium, long) or word budget'},
+            },
+        }
+    },
+    responses={200: {'type': 'object'}}
+)
+class SummaryBatchView(SummarizerView):
+    """View to queue non-urgent summaries for the provider's Batch API."""
+    def get(self, request):
+        """List the most recent batch jobs."""
+        try:
+            jobs = SummaryBatchJob.objects.all()[:50]
+            return Response({'success': True, 'jobs': [_batch_job_payload(job) for job in jobs]})
+        except Exception as e:
+            logger.error(f"Error in summary batch view: {str(e)}")
+            return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def post(self, request):
+        """
+        Queue summaries of `article_ids`, or of the articles still missing one with `missing`.
+        Results arrive within the batch completion window; readers asking for one of these
+        summaries meanwhile get it generated in realtime.
+        """
+        article_ids = request.data.get('article_ids')
+        missing = str(request.data.get('missing', '')).lower() in ('1', 'true', 'yes')
+        max_words = request.data.get('length') or request.data.get('max_words', 150)
+        if not article_ids and not missing:
+            return Response({'error': 'article_ids or missing is required'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            ai_model = canonical_model(request.data.get('ai_model'))
+        except UnknownModelError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        user = request.user if request.user.is_authenticated else None
+
+        try:
+            if missing:
+                article_ids = self.summarizer_service.missing_summary_article_ids(ai_model, max_words)
+            jobs = self.summarizer_service.queue_batch_summaries(
+                article_ids, ai_model=ai_model, max_words=max_words, user=user
+            )
+        except (ValueError, TypeError) as e:
+            logger.error(f"Validation error: {str(e)}")
+            return Response({'error': 'Invalid input.'}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error in summary batch view: {str(e)}")
+            return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response({
+            'success': True,
+            'queued': sum(job.request_count for job in jobs),
+            'jobs': [_batch_job_payload(job) for job in jobs],
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+def _status_payload(summary):
+    return {
+        'id': summary.id,
+        'status': summary.status,
+        'created_at': summary.created_at.isoformat(),
+        'completed_at': summary.completed_at.isoformat() if summary.completed_at else None,
+        'error_message': summary.error_message
+    }
+
+
+def _wait_timeout(request):
+    """Requested wait timeout in seconds, capped by SUMMARIZER_WAIT_MAX_TIMEOUT."""
+    try:
+        timeout = float(request.GET.get('timeout', settings.SUMMARIZER_WAIT_MAX_TIMEOUT))
+    except ValueError:
+        raise ValueError('timeout must be a number')
+    return max(0.0, min(timeout, settings.SUMMARIZER_WAIT_MAX_TIMEOUT))
+
+
 @extend_schema(responses={200: {'type': 'object'}})
 @api_view(["GET"])
 @permission_classes([IsAdminUser])
@@ -142,16 +515,265 @@ def summary_status(request, summary_id):
         summary = Summary.objects.get(id=summary_id)
         return Response({
             'success': True,
-            'status': {
-                'id': summary.id,
-                'status': summary.status,
-                'created_at': summary.created_at.isoformat(),
-                'completed_at': summary.completed_at.isoformat() if summary.completed_at else None,
-                'error_message': summary.error_message
-            }
+            'status': _status_payload(summary)
         })
     except Summary.DoesNotExist:
         return Response({'error': 'Summary not found'}, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         logger.error(f"Error in summary status view: {str(e)}")
-        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@extend_schema(responses={200: {'type': 'object'}})
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def bulk_summary_status(request):
+    """Get the status of the summaries in `ids` (comma-separated) with a single query."""
+    try:
+        summary_ids = parse_ids(request.GET.get('ids', ''), 'ids')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        summaries = Summary.objects.in_bulk(summary_ids)
+        return Response({
+            'success': True,
+            'statuses': [
+                {**_status_payload(summaries[summary_id]), 'article_id': summaries[summary_id].article_id}
+                for summary_id in summary_ids if summary_id in summaries
+            ],
+            'not_found': [summary_id for summary_id in summary_ids if summary_id not in summaries],
+        })
+    except Exception as e:
+        logger.error(f"Error in bulk summary status view: {str(e)}")
+        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _webhook_endpoint_payload(endpoint):
+    return {
+        'id': endpoint.id,
+        'url': endpoint.url,
+        'secret': endpoint.secret,
+        'all_summaries': endpoint.all_summaries,
+        'is_active': endpoint.is_active,
+        'created_at': endpoint.created_at.isoformat(),
+    }
+
+
+@extend_schema(
+    request={
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'url': {'type': 'string'},
+                'all_summaries': {
+                    'type': 'boolean',
+                    'description': 'Receive events for every summary requested, default true',
+                },
+            },
+            'required': ['url']
+        }
+    },
+    responses={200: {'type': 'object'}, 201: {'type': 'object'}}
+)
+@api_view(["GET", "POST"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def webhook_endpoints(request):
+    """
+    List the webhook endpoints of the API user, or register one. Completion events are
+    signed with the endpoint's secret; see summarizer/webhooks.py for the scheme.
+    """
+    if request.method == 'GET':
+        endpoints = WebhookEndpoint.objects.filter(user=request.user)
+        return Response({'success': True, 'endpoints': [_webhook_endpoint_payload(endpoint) for endpoint in endpoints]})
+
+    try:
+        url = validate_callback_url(request.data.get('url') or '')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    all_summaries = str(request.data.get('all_summaries', True)).lower() in ('1', 'true', 'yes')
+    try:
+        endpoint, created = WebhookEndpoint.objects.get_or_create(
+            user=request.user, url=url, defaults={'secret': new_secret(), 'all_summaries': all_summaries}
+        )
+        if not created:
+            endpoint.all_summaries = all_summaries
+            endpoint.is_active = True
+            endpoint.save(update_fields=['all_summaries', 'is_active'])
+    except Exception as e:
+        logger.error(f"Error in webhook endpoints view: {str(e)}")
+        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return Response({'success': True, 'endpoint': _webhook_endpoint_payload(endpoint)},
+                    status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+
+@extend_schema(responses={204: None})
+@api_view(["DELETE"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def webhook_endpoint_detail(request, endpoint_id):
+    """Remove a webhook endpoint of the API user, with its undelivered events."""
+    deleted, _ = WebhookEndpoint.objects.filter(pk=endpoint_id, user=request.user).delete()
+    if not deleted:
+        return Response({'error': 'Webhook endpoint not found'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+@extend_schema(responses={200: {'type': 'object'}})
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def summarizer_metrics(request):
+    """Get summarizer efficiency metrics, such as summary cache hit rate."""
+    try:
+        return Response({
+            'success': True,
+            'metrics': {
+                'cache': SummaryCache.stats(),
+                'models': ModelRouter().stats(),
+                'hedging': hedge_stats(),
+                'limiter': limiter_stats(),
+                'prewarm': prewarm_stats(),
+                'quality_gate': quality_gate_stats(),
+                'compression': compression_stats(),
+                'batch': batch_stats(),
+                'breaker': breaker_stats(),
+                'resummarize': resummarize_stats(),
+                'webhooks': webhook_stats(),
+            }
+        })
+    except Exception as e:
+        logger.error(f"Error in summarizer metrics view: {str(e)}")
+        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@extend_schema(responses={200: {'type': 'object'}})
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def wait_summary_status(request, summary_id):
+    """
+    Long-poll for a summary to finish. Returns as soon as it is completed or failed,
+    or with its current status once `timeout` seconds have passed.
+    """
+    try:
+        timeout = _wait_timeout(request)
+        summary = Summary.objects.get(id=summary_id)
+        if summary.status not in FINAL_STATUSES:
+            with get_notification_hub().subscribe(summary.id) as finished:
+                # Re-check after subscribing so a completion in between is not missed
+                summary.refresh_from_db()
+                if summary.status not in FINAL_STATUSES:
+                    finished.wait(timeout)
+            summary.refresh_from_db()
+        return Response({
+            'success': True,
+            'timed_out': summary.status not in FINAL_STATUSES,
+            'status': _status_payload(summary)
+        })
+    except Summary.DoesNotExist:
+        return Response({'error': 'Summary not found'}, status=status.HTTP_404_NOT_FOUND)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Error in wait summary status view: {str(e)}")
+        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _summary_status_events(summary, timeout):
+    deadline = time.monotonic() + timeout
+    with get_notification_hub().subscribe(summary.id) as finished:
+        summary.refresh_from_db()
+        while summary.status not in FINAL_STATUSES and time.monotonic() < deadline:
+            remaining = deadline - time.monotonic()
+            if finished.wait(min(settings.SUMMARIZER_SSE_KEEPALIVE_INTERVAL, remaining)):
+                summary.refresh_from_db()
+                break
+            # Comment line keeps the connection alive through proxies
+            yield ": keep-alive\n\n"
+    event = 'status' if summary.status in FINAL_STATUSES else 'timeout'
+    yield format_sse(event, _status_payload(summary))
+
+
+@extend_schema(responses={200: {'type': 'string'}})
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+@renderer_classes([JSONRenderer, EventStreamRenderer])
+def summary_status_events(request, summary_id):
+    """Server-sent events variant of the long-poll: one `status` event when the summary finishes."""
+    try:
+        timeout = _wait_timeout(request)
+        summary = Summary.objects.get(id=summary_id)
+    except Summary.DoesNotExist:
+        return Response({'error': 'Summary not found'}, status=status.HTTP_404_NOT_FOUND)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    response = StreamingHttpResponse(_summary_status_events(summary, timeout), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@extend_schema(responses={200: {'type': 'object'}})
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def summarizer_stats(request):
+    """Get p50/p95/p99 summary latency and token usage per model over the last `hours` (default 24)."""
+    try:
+        hours = float(request.GET.get('hours', 24))
+        if hours <= 0:
+            raise ValueError
+    except ValueError:
+        return Response({'error': 'hours must be a positive number'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        return Response({'success': True, 'stats': summary_stats(hours)})
+    except Exception as e:
+        logger.error(f"Error in summarizer stats view: {str(e)}")
+        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@extend_schema(
+    request={
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'limit': {'type': 'integer', 'description': 'Most summaries to enqueue now, within the hourly budget'},
+            },
+        }
+    },
+    responses={200: {'type': 'object'}}
+)
+@api_view(["GET", "POST"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def resummarize_summaries(request):
+    """
+    GET: summaries per prompt version and the next stale summaries to be regenerated.
+    POST: enqueue regeneration of the highest ranked stale summaries now.
+    """
+    try:
+        service = SummarizerService()
+        if request.method == 'POST':
+            limit = request.data.get('limit')
+            result = resummarize_stale_summaries(service, top_n=int(limit) if limit else None)
+            return Response({'success': True, **result}, status=status.HTTP_202_ACCEPTED)
+        plan = plan_resummarization(service, limit=20)
+        return Response({
+            'success': True,
+            'prompt_version': service.prompt_version,
+            'versions': prompt_version_counts(),
+            'next': [
+                {'summary_id': summary.id, 'article_id': summary.article_id, 'prompt_version': summary.prompt_version,
+                 'score': score}
+                for summary, score in plan
+            ],
+        })
+    except (ValueError, TypeError) as e:
+        logger.error(f"Validation error: {str(e)}")
+        return Response({'error': 'Invalid input.'}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Error in resummarize view: {str(e)}")
+        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
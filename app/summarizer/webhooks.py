@@ -0,0 +1,331 @@
+"""
+Webhook callbacks when summaries finish, so server-side consumers need not poll.
+
+An API user registers endpoints that receive events for every summary they request,
+or passes a `callback_url` with a single request. Either way the endpoint is
+subscribed to the summary. When the summary reaches a final state,
+publish_summary_finished turns its subscriptions into rows of the WebhookEvent
+outbox. The delivery task sends the due events of each endpoint in one POST, signed
+with the endpoint's secret, retries failed deliveries with exponential backoff,
+and records the time from completion to delivery. It also sweeps subscriptions of
+summaries that finished without publishing, e.g. because the worker died in between.
+
+Callback URLs must resolve to public addresses only, so the service cannot be made
+to POST to itself, the internal network or a cloud metadata endpoint. The host is
+resolved and checked again on every delivery, and the POST goes to the checked
+address, so a name re-pointed after registration (DNS rebinding) is not followed.
+
+Signature: hex HMAC-SHA256 of "<X-Summary-Timestamp>.<body>" with the endpoint
+secret, sent as "sha256=<hex>" in X-Summary-Signature.
+"""
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+import random
+import secrets
+import socket
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, List
+
+import httpx
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db.models import F, Q
+from django.utils import timezone
+
+from . import metrics
+from .models import Summary, WebhookEndpoint, WebhookEvent, WebhookSubscription
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PREFIX = "summarizer:webhooks:"
+SIGNATURE_HEADER = "X-Summary-Signature"
+TIMESTAMP_HEADER = "X-Summary-Timestamp"
+FINAL_STATUSES = ("completed", "failed")
+
+
+class PrivateAddressError(ValueError):
+    """Raised for a callback host that resolves to a loopback, private, link-local or reserved address."""
+
+
+def new_secret() -> str:
+    return secrets.token_hex(32)
+
+
+def validate_callback_url(url: str) -> str:
+    """
+    The URL if it is an http(s) URL whose host resolves to public addresses only;
+    ValueError otherwise. Loopback, private, link-local and reserved addresses are
+    rejected, whether given literally or behind a host name.
+    """
+    try:
+        URLValidator(schemes=["http", "https"])(url)
+    except ValidationError:
+        raise ValueError(f"Invalid callback URL: {url!r}")
+    public_address(httpx.URL(url).host)
+    return url
+
+
+def public_address(host: str) -> str:
+    """
+    An address `host` resolves to, once every address it resolves to is checked to be
+    public; ValueError otherwise.
+    """
+    try:
+        addresses = sorted({info[4][0] for info in socket.getaddrinfo(host, None)})
+    except (socket.gaierror, UnicodeError):
+        raise ValueError(f"Callback host does not resolve: {host!r}")
+    for address in addresses:
+        # Drop the zone of a scoped IPv6 address
+        if not ipaddress.ip_address(address.split("%")[0]).is_global:
+            raise PrivateAddressError(f"Callback host must not resolve to a private or local address: {host!r}")
+    return addresses[0]
+
+
+def sign(secret: str, timestamp: str, body: str) -> str:
+    return hmac.new(secret.encode(), f"{timestamp}.{body}".encode(), hashlib.sha256).hexdigest()
+
+
+def subscribe(summaries: Iterable[Summary], user, callback_url: str = None) -> List[WebhookEndpoint]:
+    """
+    Subscribe the user's standing endpoints, and the endpoint of `callback_url` if given,
+    to the summaries that are still being generated. Returns the subscribed endpoints.
+    """
+    if not settings.SUMMARIZER_WEBHOOKS_ENABLED or user is None:
+        return []
+    summaries = [summary for summary in summaries if summary.status != "completed"]
+    endpoints = list(WebhookEndpoint.objects.filter(user=user, is_active=True, all_summaries=True))
+    if callback_url:
+        # Per-request callbacks get an endpoint too, for their secret and their outbox rows
+        endpoint, _ = WebhookEndpoint.objects.get_or_create(
+            user=user,
+            url=validate_callback_url(callback_url),
+            defaults={"secret": new_secret(), "all_summaries": False},
+        )
+        if endpoint.is_active and endpoint not in endpoints:
+            endpoints.append(endpoint)
+    if not summaries or not endpoints:
+        return endpoints
+    WebhookSubscription.objects.bulk_create(
+        [WebhookSubscription(endpoint=endpoint, summary=summary) for endpoint in endpoints for summary in summaries],
+        ignore_conflicts=True,
+    )
+    # A summary that completed meanwhile published before it had subscribers
+    finished = Summary.objects.filter(pk__in=[summary.pk for summary in summaries], status="completed")
+    for summary_id in finished.values_list("pk", flat=True):
+        emit_summary_event(summary_id, "completed")
+    return endpoints
+
+
+def event_payload(summary: Summary, status: str) -> Dict:
+    return {
+        "summary_id": summary.pk,
+        "article_id": summary.article_id,
+        "ai_model": summary.ai_model,
+        "answered_by": summary.answered_by,
+        "max_words": summary.max_words,
+        "status": status,
+        "summary_text": summary.summary_text if status == "completed" else None,
+        "word_count": summary.word_count,
+        "completed_at": summary.completed_at.isoformat() if summary.completed_at else None,
+        "error_message": summary.error_message if status == "failed" else None,
+    }
+
+
+def emit_summary_event(summary_id: int, status: str) -> int:
+    """
+    Write an event to the outbox for every endpoint subscribed to a finished summary,
+    and schedule their delivery. Returns the number of events written.
+    """
+    if status not in FINAL_STATUSES or not settings.SUMMARIZER_WEBHOOKS_ENABLED:
+        return 0
+    subscriptions = list(WebhookSubscription.objects.filter(summary_id=summary_id).select_related("summary"))
+    if not subscriptions:
+        return 0
+    payload = event_payload(subscriptions[0].summary, status)
+    now = timezone.now()
+    events = []
+    for subscription in subscriptions:
+        # Only the caller that deletes a subscription emits its event, so a summary
+        # published twice is not delivered twice
+        deleted, _ = WebhookSubscription.objects.filter(pk=subscription.pk).delete()
+        if deleted:
+            events.append(WebhookEvent(
+                endpoint_id=subscription.endpoint_id,
+                summary_id=summary_id,
+                event_type=f"summary.{status}",
+                payload=payload,
+                next_attempt_at=now,
+            ))
+    if events:
+        WebhookEvent.objects.bulk_create(events)
+        metrics.incr("webhook_events", len(events))
+        schedule_delivery()
+    return len(events)
+
+
+def sweep_finished_subscriptions() -> int:
+    """
+    Write the events of subscriptions whose summary finished without publishing them.
+    Failed summaries are swept only after SUMMARIZER_WEBHOOK_SWEEP_AFTER, since a retry
+    may still complete them. Returns the number of events written.
+    """
+    if not settings.SUMMARIZER_WEBHOOKS_ENABLED:
+        return 0
+    cutoff = timezone.now() - timedelta(seconds=settings.SUMMARIZER_WEBHOOK_SWEEP_AFTER)
+    finished = (
+        WebhookSubscription.objects.filter(
+            Q(summary__status="completed") | Q(summary__status="failed", created_at__lt=cutoff)
+        )
+        .values_list("summary_id", "summary__status")
+        .distinct()
+    )
+    swept = sum(emit_summary_event(summary_id, status) for summary_id, status in finished)
+    if swept:
+        metrics.incr("webhook_swept", swept)
+        logger.warning(f"Swept {swept} webhook events of summaries that finished without publishing")
+    return swept
+
+
+def schedule_delivery() -> None:
+    """Deliver new events after a short window, once per window, so events finishing together share a POST."""
+    window = settings.SUMMARIZER_WEBHOOK_BATCH_WINDOW
+    if cache.add(f"{WEBHOOK_PREFIX}flush", True, timeout=window):
+        from .tasks import deliver_webhooks_task
+        deliver_webhooks_task.apply_async(countdown=window)
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before the next attempt after `attempts` failed ones, doubling up to the cap, with jitter."""
+    delay = min(
+        settings.SUMMARIZER_WEBHOOK_RETRY_BASE * 2 ** max(attempts - 1, 0),
+        settings.SUMMARIZER_WEBHOOK_RETRY_MAX,
+    )
+    return delay + random.uniform(0, delay * 0.1)
+
+
+def event_body(event: WebhookEvent) -> Dict:
+    return {
+        "id": event.pk,
+        "type": event.event_type,
+        "created_at": event.created_at.isoformat(),
+        "data": event.payload,
+    }
+
+
+def send_batch(client: httpx.Client, endpoint: WebhookEndpoint, events: List[WebhookEvent]) -> None:
+    """
+    POST the events to the endpoint, signed with its secret. Raises on a non-2xx response,
+    and without sending anything when the endpoint's host no longer resolves to a public address.
+    """
+    url = httpx.URL(endpoint.url)
+    # Connect to the address just checked rather than letting the client resolve the name again
+    address = public_address(url.host)
+    body = json.dumps({"events": [event_body(event) for event in events]}, separators=(",", ":"))
+    timestamp = str(int(time.time()))
+    response = client.post(
+        url.copy_with(host=address),
+        content=body,
+        headers={
+            "Host": url.netloc.decode("ascii"),
+            "Content-Type": "application/json",
+            TIMESTAMP_HEADER: timestamp,
+            SIGNATURE_HEADER: f"sha256={sign(endpoint.secret, timestamp, body)}",
+        },
+        # TLS is still negotiated and verified for the host name
+        extensions={"sni_hostname": url.host},
+    )
+    response.raise_for_status()
+
+
+def deliver_webhooks(client: httpx.Client = None) -> Dict[str, int]:
+    """
+    Send the due events of every endpoint, up to SUMMARIZER_WEBHOOK_BATCH_SIZE per endpoint
+    in one POST. One worker sends to an endpoint at a time. `more` counts endpoints with
+    due events left over.
+    """
+    now = timezone.now()
+    due = WebhookEvent.objects.filter(status="pending", next_attempt_at__lte=now, endpoint__is_active=True)
+    endpoint_ids = set(due.values_list("endpoint_id", flat=True))
+    result = {"endpoints": 0, "delivered": 0, "failed": 0, "more": 0}
+    if not endpoint_ids:
+        return result
+    own_client = client is None
+    client = client or httpx.Client(timeout=settings.SUMMARIZER_WEBHOOK_TIMEOUT)
+    try:
+        for endpoint in WebhookEndpoint.objects.filter(pk__in=endpoint_ids):
+            lock_key = f"{WEBHOOK_PREFIX}sending:{endpoint.pk}"
+            if not cache.add(lock_key, True, timeout=settings.SUMMARIZER_WEBHOOK_TIMEOUT * 2):
+                continue
+            try:
+                batch_size = settings.SUMMARIZER_WEBHOOK_BATCH_SIZE
+                events = list(due.filter(endpoint=endpoint).order_by("created_at")[: batch_size + 1])
+                if len(events) > batch_size:
+                    events = events[:batch_size]
+                    result["more"] += 1
+                result["endpoints"] += 1
+                if _deliver_batch(client, endpoint, events):
+                    result["delivered"] += len(events)
+                else:
+                    result["failed"] += len(events)
+            finally:
+                cache.delete(lock_key)
+    finally:
+        if own_client:
+            client.close()
+    return result
+
+
+def _deliver_batch(client: httpx.Client, endpoint: WebhookEndpoint, events: List[WebhookEvent]) -> bool:
+    """Send one batch and record its outcome on the events. Returns whether it was delivered."""
+    try:
+        send_batch(client, endpoint, events)
+    except Exception as e:
+        error = str(e)[:1000]
+        now = timezone.now()
+        for event in events:
+            event.attempts += 1
+            event.last_error = error
+            # An endpoint re-pointed inside the network is not retried
+            if event.attempts >= settings.SUMMARIZER_WEBHOOK_MAX_ATTEMPTS or isinstance(e, PrivateAddressError):
+                event.status = "failed"
+            else:
+                event.next_attempt_at = now + timedelta(seconds=retry_delay(event.attempts))
+        WebhookEvent.objects.bulk_update(events, ["attempts", "last_error", "status", "next_attempt_at"])
+        metrics.incr("webhook_failed_attempts", len(events))
+        logger.warning(f"Webhook delivery of {len(events)} events to {endpoint.url} failed: {error}")
+        return False
+
+    now = timezone.now()
+    WebhookEvent.objects.filter(pk__in=[event.pk for event in events]).update(
+        status="delivered", delivered_at=now, attempts=F("attempts") + 1, last_error=None
+    )
+    latency_ms = sum(int((now - event.created_at).total_seconds() * 1000) for event in events)
+    metrics.incr("webhook_delivered", len(events))
+    metrics.incr("webhook_batches")
+    metrics.incr("webhook_latency_ms", latency_ms)
+    return True
+
+
+def webhook_stats() -> Dict:
+    counters = metrics.get_counters([
+        "webhook_events", "webhook_delivered", "webhook_batches", "webhook_failed_attempts", "webhook_latency_ms",
+        "webhook_swept",
+    ])
+    delivered = counters["webhook_delivered"]
+    return {
+        "events": counters["webhook_events"],
+        "delivered": delivered,
+        "batches": counters["webhook_batches"],
+        "events_per_batch": metrics.ratio(delivered, counters["webhook_batches"]),
+        "failed_attempts": counters["webhook_failed_attempts"],
+        "swept": counters["webhook_swept"],
+        "avg_delivery_latency_ms": round(counters["webhook_latency_ms"] / delivered) if delivered else 0,
+        "pending": WebhookEvent.objects.filter(status="pending").count(),
+        "failed": WebhookEvent.objects.filter(status="failed").count(),
+    }